@@ -0,0 +1,111 @@
+"""
+Compare :class:`pink_doom.playsim.blockmap.Blockmap` with walking the lump.
+
+Generates grid maps of growing size with a cell every 64 units, so a
+block holds four cells, and builds their BLOCKMAP lump. Then times the
+lines of many random 3 x 3 block boxes, the range ``P_CheckPosition``
+covers, gathered once by reading the raw lump with ``validcount`` marks
+like the original does, and once with :meth:`Blockmap.lines_in_box`::
+
+    PYTHONPATH=. python benchmarks/bench_blockmap.py [cells per side...]
+
+Also times decoding the lump and looking up single blocks.
+"""
+
+import os
+import random
+import struct
+import sys
+import tempfile
+import timeit
+
+from pink_doom.doom.data import MapLump
+from pink_doom.playsim.blockmap import Blockmap
+from pink_doom.rendering.level import Level
+from pink_doom.wad import loader, mapgen
+
+BOXES = 2000
+
+
+def _level(n, directory):
+    path = os.path.join(directory, f"grid{n}.wad")
+    mapgen.generate_wad(path, mapgen.MapSpec(n, n, cell_size=64))
+    loader.init_multiple_files([path])
+    level = Level.from_lumps(
+        {kind: loader.cache_lump_num(kind.value - 1) for kind in MapLump}
+    )
+    loader.reset()
+    return level
+
+
+class _LumpWalker:
+    """Block lists read from the raw lump, as ``P_BlockLinesIterator`` does."""
+
+    def __init__(self, lump, numlines):
+        self.words = struct.unpack(f"<{len(lump) // 2}h", lump)
+        self.width, self.height = self.words[2:4]
+        self.validcount = [0] * numlines
+        self.count = 0
+
+    def lines_in_box(self, bx1, by1, bx2, by2):
+        self.count += 1
+        words, validcount, count = self.words, self.validcount, self.count
+        found = []
+        for bx in range(bx1, bx2 + 1):
+            for by in range(by1, by2 + 1):
+                if bx < 0 or by < 0 or bx >= self.width or by >= self.height:
+                    continue
+                position = words[4 + by * self.width + bx] & 0xFFFF
+                while words[position] != -1:
+                    line = words[position] & 0xFFFF
+                    position += 1
+                    if validcount[line] == count:
+                        continue
+                    validcount[line] = count
+                    found.append(line)
+        return found
+
+
+def main(sizes=(32, 64, 112)):
+    """Run the benchmark."""
+    print(
+        f"{'lines':>7} {'blocks':>7} {'decode':>9}"
+        f" {'boxes lump':>11} {'boxes CSR':>10} {'block CSR':>10}"
+    )
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            level = _level(n, directory)
+            lump = Blockmap.build(level).to_lump()
+            blockmap = Blockmap.from_lump(lump)
+            walker = _LumpWalker(lump, len(level.line_v1))
+            boxes = []
+            for _ in range(BOXES):
+                bx = rng.randrange(-1, blockmap.width)
+                by = rng.randrange(-1, blockmap.height)
+                boxes.append((bx, by, bx + 2, by + 2))
+            for box in boxes[:50]:
+                assert list(blockmap.lines_in_box(*box)) == walker.lines_in_box(*box)
+
+            decode = timeit.timeit(lambda: Blockmap.from_lump(lump), number=10) / 10
+            lump_time = timeit.timeit(
+                lambda: [walker.lines_in_box(*box) for box in boxes], number=1
+            )
+            csr_time = timeit.timeit(
+                lambda: [list(blockmap.lines_in_box(*box)) for box in boxes], number=1
+            )
+            block_time = timeit.timeit(
+                lambda: [blockmap.lines_in_block(box[0], box[1]) for box in boxes],
+                number=1,
+            )
+            print(
+                f"{len(level.line_v1):>7} {blockmap.width * blockmap.height:>7}"
+                f" {decode * 1e3:>6.2f} ms"
+                f" {lump_time / BOXES * 1e6:>8.1f} us {csr_time / BOXES * 1e6:>7.1f} us"
+                f" {block_time / BOXES * 1e6:>7.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:])
+    main(sizes) if sizes else main()
@@ -0,0 +1,84 @@
+"""
+Time the fixed point functions of :mod:`pink_doom.misc.fixed`.
+
+Compares the integer division with the floating point one it replaced,
+both with and without :data:`~pink_doom.misc.fixed.vanilla_wraparound`,
+and the element-wise versions in :mod:`pink_doom.misc.fixed_array`, on
+random operands that don't saturate::
+
+    PYTHONPATH=. python benchmarks/bench_fixed.py [count]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from pink_doom.doom.types import MAX_INT, MIN_INT
+from pink_doom.misc import fixed, fixed_array
+
+
+def _float_div(a, b):
+    """fixed_div as it was, through a double."""
+    if (abs(a) >> 14) >= abs(b):
+        return MIN_INT if a ^ b < 0 else MAX_INT
+    c = a / b * fixed.FRAC_UNIT
+    if c > MAX_INT or c < MIN_INT:
+        raise ZeroDivisionError("FixedDiv: divide by zero")
+    return int(c)
+
+
+def _plain_mul(a, b):
+    """fixed_mul as it was, without the vanilla_wraparound check."""
+    return (a * b) >> fixed.FRAC_BITS
+
+
+def _time(function, pairs):
+    elapsed = timeit.timeit(lambda: [function(a, b) for a, b in pairs], number=1)
+    return elapsed / len(pairs) * 1e9
+
+
+def main(count=200000):
+    """Run the benchmark."""
+    rng = np.random.default_rng(0)
+    a = rng.integers(MIN_INT, MAX_INT, count) >> rng.integers(0, 16, count)
+    b = rng.integers(MIN_INT, MAX_INT, count) >> rng.integers(0, 16, count)
+    pairs = list(zip(a.tolist(), b.tolist()))
+    assert [_float_div(*pair) for pair in pairs] == [
+        fixed.fixed_div(*pair) for pair in pairs
+    ]
+
+    print(f"{'':<23} {'python':>10} {'vanilla':>10}")
+    rows = {
+        "fixed_div, before": {},
+        "fixed_div": {},
+        "fixed_mul, before": {},
+        "fixed_mul": {},
+        "array": {},
+    }
+    for vanilla in (False, True):
+        fixed.vanilla_wraparound = vanilla
+        rows["fixed_div, before"][vanilla] = _time(_float_div, pairs)
+        rows["fixed_mul, before"][vanilla] = _time(_plain_mul, pairs)
+        rows["fixed_div"][vanilla] = _time(fixed.fixed_div, pairs)
+        rows["fixed_mul"][vanilla] = _time(fixed.fixed_mul, pairs)
+        rows["array"][vanilla] = (
+            timeit.timeit(
+                lambda: (fixed_array.fixed_div(a, b), fixed_array.fixed_mul(a, b)),
+                number=1,
+            )
+            / count
+            * 1e9
+        )
+    fixed.vanilla_wraparound = False
+    rows["fixed_div, before"][True] = rows["fixed_mul, before"][True] = None
+    for name, times in rows.items():
+        cells = [
+            f"{t:>7.1f} ns" if t is not None else f"{'-':>10}" for t in times.values()
+        ]
+        label = "fixed_div + _mul, array" if name == "array" else name
+        print(f"{label:<23} {cells[0]} {cells[1]}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1])) if len(sys.argv) > 1 else main()
@@ -0,0 +1,199 @@
+"""
+Compare :class:`pink_doom.rendering.level.Level` with the object model.
+
+Builds grid levels of growing size, with a balanced BSP tree over the
+cells, once as linked :mod:`pink_doom.rendering.defines` objects and once
+as a :class:`~pink_doom.rendering.level.Level`. Reports the memory each
+takes, the time of a full front-to-back BSP walk, and the time of
+``point_on_seg_side`` over every seg, one by one and vectorized::
+
+    PYTHONPATH=. python benchmarks/bench_level_store.py [cells per side...]
+
+At most 181 cells per side fit, as a node can't refer to subsector 32768.
+"""
+
+import random
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from pink_doom.doom.data import MAP_DTYPES, MapLump, NodeFlag
+from pink_doom.misc.fixed import FRAC_BITS
+from pink_doom.rendering import main
+from pink_doom.rendering.defines import Node, Seg, SubSector, Vertex
+from pink_doom.rendering.level import Level
+
+CELL = 64
+LEAF = NodeFlag.SUBSECTOR.value
+
+
+def _grid_lumps(n):
+    """Return the map lumps of n x n square cells, a subsector each."""
+    xs, ys = np.meshgrid(np.arange(n + 1) * CELL, np.arange(n + 1) * CELL)
+    vertexes = np.zeros((n + 1) ** 2, MAP_DTYPES[MapLump.VERTEXES])
+    vertexes["x"], vertexes["y"] = xs.ravel(), ys.ravel()
+
+    # Each cell's corners, clockwise so the cell is on the right of its segs.
+    corner = np.arange(n)[None, :] + (n + 1) * np.arange(n)[:, None]
+    corners = np.stack(
+        [corner, corner + n + 1, corner + n + 2, corner + 1], axis=-1
+    ).reshape(-1, 4)
+    segs = np.zeros(4 * n * n, MAP_DTYPES[MapLump.SEGS])
+    segs["v1"] = corners.ravel()
+    segs["v2"] = np.roll(corners, -1, axis=1).ravel()
+    subsectors = np.zeros(n * n, MAP_DTYPES[MapLump.SSECTORS])
+    subsectors["num_segs"] = 4
+    subsectors["first_seg"] = np.arange(0, 4 * n * n, 4)
+
+    nodes = []
+
+    def split(x0, y0, x1, y1):
+        if x1 - x0 == 1 and y1 - y0 == 1:
+            return LEAF | (y0 * n + x0)
+        box = (y1 * CELL, y0 * CELL, x0 * CELL, x1 * CELL)
+        if x1 - x0 >= y1 - y0:
+            # North through the middle column line, east is on the right.
+            xm = (x0 + x1) // 2
+            right = split(xm, y0, x1, y1)
+            left = split(x0, y0, xm, y1)
+            line = (xm * CELL, y0 * CELL, 0, (y1 - y0) * CELL)
+            boxes = (box[:2] + (xm * CELL, box[3]), box[:3] + (xm * CELL,))
+        else:
+            # West through the middle row line, north is on the right.
+            ym = (y0 + y1) // 2
+            right = split(x0, ym, x1, y1)
+            left = split(x0, y0, x1, ym)
+            line = (x1 * CELL, ym * CELL, -(x1 - x0) * CELL, 0)
+            boxes = ((box[0], ym * CELL) + box[2:], (ym * CELL,) + box[1:])
+        nodes.append(line + boxes[0] + boxes[1] + (right, left))
+        return len(nodes) - 1
+
+    split(0, 0, n, n)
+    node_records = np.zeros(len(nodes), MAP_DTYPES[MapLump.NODES])
+    for i, node in enumerate(nodes):
+        node_records[i] = (*node[:4], np.reshape(node[4:12], (2, 4)), node[12:])
+
+    return {
+        MapLump.VERTEXES: vertexes.tobytes(),
+        MapLump.SEGS: segs.tobytes(),
+        MapLump.SSECTORS: subsectors.tobytes(),
+        MapLump.NODES: node_records.tobytes(),
+        MapLump.LINEDEFS: np.zeros(1, MAP_DTYPES[MapLump.LINEDEFS]).tobytes(),
+        MapLump.SIDEDEFS: np.zeros(1, MAP_DTYPES[MapLump.SIDEDEFS]).tobytes(),
+        MapLump.SECTORS: np.zeros(1, MAP_DTYPES[MapLump.SECTORS]).tobytes(),
+    }
+
+
+def _objects(lumps):
+    """Build the object model the way ``P_SetupLevel`` would."""
+    records = {
+        kind: np.frombuffer(data, MAP_DTYPES[kind]) for kind, data in lumps.items()
+    }
+    vertexes = [
+        Vertex(int(x) << FRAC_BITS, int(y) << FRAC_BITS)
+        for x, y in records[MapLump.VERTEXES].tolist()
+    ]
+    segs = [
+        Seg(
+            vertexes[v1],
+            vertexes[v2],
+            offset << FRAC_BITS,
+            angle << 16,
+            None,
+            None,
+            None,
+            None,
+        )
+        for v1, v2, angle, _, _, offset in records[MapLump.SEGS].tolist()
+    ]
+    subsectors = [
+        SubSector(None, count, first)
+        for count, first in records[MapLump.SSECTORS].tolist()
+    ]
+    nodes = [
+        Node(
+            x << FRAC_BITS,
+            y << FRAC_BITS,
+            dx << FRAC_BITS,
+            dy << FRAC_BITS,
+            tuple(tuple(int(v) << FRAC_BITS for v in box) for box in bbox),
+            tuple(int(child) for child in children),
+        )
+        for x, y, dx, dy, bbox, children in records[MapLump.NODES].tolist()
+    ]
+    return vertexes, segs, subsectors, nodes
+
+
+def _walk_objects(nodes, x, y):
+    order = []
+    stack = [len(nodes) - 1]
+    while stack:
+        bspnum = stack.pop()
+        if bspnum & LEAF:
+            order.append(bspnum & ~LEAF)
+            continue
+        node = nodes[bspnum]
+        side = main.point_on_side(x, y, node)
+        stack.append(node.children[side ^ 1])
+        stack.append(node.children[side])
+    return order
+
+
+def _traced(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main_(sizes=(16, 64, 128)):
+    """Run the benchmark."""
+    print(
+        f"{'cells':>7} {'objects':>10} {'arrays':>10}"
+        f" {'walk objects':>13} {'walk arrays':>12}"
+        f" {'segs objects':>13} {'segs arrays':>12}"
+    )
+    rng = random.Random(0)
+    for n in sizes:
+        lumps = _grid_lumps(n)
+        (_, segs, _, nodes), objects_size = _traced(lambda: _objects(lumps))
+        level, level_size = _traced(lambda: Level.from_lumps(lumps))
+        points = [
+            (rng.randrange(n * CELL) << FRAC_BITS, rng.randrange(n * CELL) << FRAC_BITS)
+            for _ in range(3)
+        ]
+        for x, y in points:
+            assert _walk_objects(nodes, x, y) == level.subsectors_front_to_back(x, y)
+
+        def walk_objects():
+            for x, y in points:
+                _walk_objects(nodes, x, y)
+
+        def walk_arrays():
+            for x, y in points:
+                level.subsectors_front_to_back(x, y)
+
+        x, y = points[0]
+        segs_objects = timeit.timeit(
+            lambda: [main.point_on_seg_side(x, y, seg) for seg in segs], number=1
+        )
+        segs_arrays = timeit.timeit(
+            lambda: [level.point_on_seg_side(x, y, seg) for seg in range(len(segs))],
+            number=1,
+        )
+        segs_numpy = timeit.timeit(lambda: level.point_on_seg_sides(x, y), number=1)
+        print(
+            f"{n * n:>7} {objects_size / 2**20:>7.1f} MB {level_size / 2**20:>7.1f} MB"
+            f" {timeit.timeit(walk_objects, number=1) / 3 * 1e3:>10.1f} ms"
+            f" {timeit.timeit(walk_arrays, number=1) / 3 * 1e3:>9.1f} ms"
+            f" {segs_objects * 1e3:>10.1f} ms {segs_arrays * 1e3:>9.1f} ms"
+            f" {segs_numpy * 1e3:>8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:])
+    main_(sizes) if sizes else main_()
@@ -0,0 +1,60 @@
+"""
+Show that :func:`pink_doom.wad.loader.check_num_for_name` stays flat.
+
+Loads WADs of growing size and times name lookups against the
+hashed index, next to the backwards linear scan it replaced::
+
+    PYTHONPATH=. python benchmarks/bench_lump_lookup.py [sizes...]
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import timeit
+from contextlib import redirect_stdout
+
+from pink_doom.wad import loader
+
+
+def _make_wad(path, num_lumps):
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sii", b"PWAD", num_lumps, 12))
+        for i in range(num_lumps):
+            f.write(struct.pack("<ii8s", 12, 0, f"L{i:07d}".encode("ascii")))
+
+
+def _linear_scan(name):
+    for i in range(loader.num_lumps - 1, -1, -1):
+        if loader.lump_info[i].name.lower() == name.lower():
+            return i
+    return -1
+
+
+def main(sizes=(1_000, 10_000, 100_000)):
+    """Run the benchmark."""
+    print(f"{'lumps':>8} {'hashed':>12} {'linear scan':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            filename = os.path.join(tmp, f"{size}.wad")
+            _make_wad(filename, size)
+            with redirect_stdout(open(os.devnull, "w")):
+                loader.init_multiple_files([filename])
+            # Worst case for the scan: the first lump in the directory.
+            name = "l0000000"
+            number = 10_000
+            hashed = timeit.timeit(
+                lambda: loader.check_num_for_name(name), number=number
+            )
+            scans = max(1, number * 1000 // size)
+            linear = timeit.timeit(lambda: _linear_scan(name), number=scans)
+            print(
+                f"{size:>8} {hashed / number * 1e9:>9.0f} ns "
+                f"{linear / scans * 1e9:>11.0f} ns"
+            )
+            loader.reset()
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:])
+    main(sizes) if sizes else main()
@@ -0,0 +1,75 @@
+"""
+Compare decoding map lumps with NumPy against one dataclass per record.
+
+Generates maps of growing size with :mod:`pink_doom.wad.mapgen` and
+times :func:`pink_doom.doom.data.decode_lump` on their LINEDEFS against
+unpacking them into :class:`pink_doom.doom.data.MapLinedef` objects::
+
+    PYTHONPATH=. python benchmarks/bench_map_decode.py [linedefs...]
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+from pink_doom.doom.data import MapLinedef, MapLump, decode_lump
+from pink_doom.wad import mapgen
+
+
+def _linedefs(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    num_lumps, directory = struct.unpack_from("<ii", data, 4)
+    for i in range(num_lumps):
+        position, size, name = struct.unpack_from("<ii8s", data, directory + 16 * i)
+        if name.rstrip(b"\x00") == b"LINEDEFS":
+            return data[position : position + size]
+
+
+def _dataclasses(lump):
+    return [
+        MapLinedef(v1, v2, flags, special, tag, (front, back))
+        for v1, v2, flags, special, tag, front, back in struct.iter_unpack(
+            "<HHhhhHH", lump
+        )
+    ]
+
+
+def _peak(function, lump):
+    tracemalloc.start()
+    result = function(lump)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main(sizes=(1_000, 10_000, 100_000)):
+    """Run the benchmark."""
+    print(f"{'linedefs':>8} {'numpy':>12} {'dataclasses':>14} {'memory':>20}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"{size}.wad")
+            mapgen.generate_wad(path, mapgen.spec_for_linedefs(size))
+            lump = _linedefs(path)
+            number = 20
+            arrays = timeit.timeit(
+                lambda: decode_lump(MapLump.LINEDEFS, lump), number=number
+            )
+            objects = timeit.timeit(lambda: _dataclasses(lump), number=number)
+            memory = (
+                f"{_peak(lambda lump: decode_lump(MapLump.LINEDEFS, lump), lump):>7}"
+                f" / {_peak(_dataclasses, lump):>9} B"
+            )
+            print(
+                f"{len(lump) // 14:>8} {arrays / number * 1e6:>9.1f} us "
+                f"{objects / number * 1e6:>11.0f} us {memory}"
+            )
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:])
+    main(sizes) if sizes else main()
@@ -0,0 +1,87 @@
+"""
+Compare node builder cost models on generated maps.
+
+Builds the BSP tree of grid maps whose vertexes are moved off the grid,
+so partitions split segs, with a few :class:`CostModel` settings. Reports
+the build time, the tree shape, and the time to find the subsector of
+random points by walking the tree with ``point_on_side``::
+
+    PYTHONPATH=. python benchmarks/bench_nodebuild.py [cells per side...]
+"""
+
+import random
+import sys
+import time
+import timeit
+
+import numpy as np
+
+from pink_doom.doom.data import MAP_DTYPES, MapLump, NodeFlag
+from pink_doom.rendering.level import Level
+from pink_doom.wad import mapgen
+from pink_doom.wad.nodebuild import CostModel, build_nodes
+
+POINTS = 1000
+LEAF = NodeFlag.SUBSECTOR.value
+MODELS = {
+    "default": CostModel(),
+    "splits only": CostModel(split_cost=1, balance_cost=0),
+    "balance only": CostModel(split_cost=0, balance_cost=1),
+    "balance x4": CostModel(split_cost=8, balance_cost=4),
+}
+
+
+def _lumps(n):
+    generator = mapgen._Generator(mapgen.MapSpec(n, n, sectors=16))
+    vertexes = np.frombuffer(
+        b"".join(generator.vertexes()), MAP_DTYPES[MapLump.VERTEXES]
+    ).copy()
+    rng = np.random.default_rng(0)
+    vertexes["x"] += rng.integers(-30, 30, len(vertexes))
+    vertexes["y"] += rng.integers(-30, 30, len(vertexes))
+    return {
+        MapLump.VERTEXES: vertexes.tobytes(),
+        MapLump.LINEDEFS: b"".join(generator.linedefs()),
+        MapLump.SIDEDEFS: b"".join(generator.sidedefs()),
+        MapLump.SECTORS: b"".join(generator.sectors()),
+    }
+
+
+def _locate(level, points):
+    children = level.node_children
+    for x, y in points:
+        node = level.numnodes - 1
+        while not node & LEAF:
+            node = children[2 * node + level.point_on_side(x, y, node)]
+
+
+def main(sizes=(10, 20, 40)):
+    """Run the benchmark."""
+    print(
+        f"{'cells':>6} {'model':<13} {'build':>8} {'nodes':>6} {'splits':>6}"
+        f" {'max':>4} {'mean':>5} {'locate':>9}"
+    )
+    rng = random.Random(0)
+    for n in sizes:
+        lumps = _lumps(n)
+        half = n * 64
+        points = [
+            (rng.randrange(-half, half) << 16, rng.randrange(-half, half) << 16)
+            for _ in range(POINTS)
+        ]
+        for name, cost in MODELS.items():
+            start = time.perf_counter()
+            built, stats = build_nodes(lumps, cost)
+            elapsed = time.perf_counter() - start
+            level = Level.from_lumps({**lumps, **built})
+            locate = timeit.timeit(lambda: _locate(level, points), number=1)
+            print(
+                f"{n * n:>6} {name:<13} {elapsed:>6.2f} s {stats.nodes:>6}"
+                f" {stats.splits:>6} {stats.max_depth:>4} {stats.mean_depth:>5.1f}"
+                f" {locate / POINTS * 1e6:>6.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:])
+    main(sizes) if sizes else main()
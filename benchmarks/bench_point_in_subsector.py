@@ -0,0 +1,78 @@
+"""
+Time the ways :class:`pink_doom.rendering.level.Level` finds subsectors.
+
+Builds the BSP tree of generated maps with vertexes moved off the grid,
+then finds the subsector of random points one at a time and all at
+once, each with and without a :class:`SubsectorGrid` of 64 unit cells::
+
+    PYTHONPATH=. python benchmarks/bench_point_in_subsector.py [cells per side...]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from pink_doom.doom.data import MAP_DTYPES, MapLump
+from pink_doom.misc.fixed import FRAC_BITS
+from pink_doom.rendering.level import Level
+from pink_doom.wad import mapgen, nodebuild
+
+POINTS = 20000
+
+
+def _level(n):
+    generator = mapgen._Generator(mapgen.MapSpec(n, n, sectors=16))
+    vertexes = np.frombuffer(
+        b"".join(generator.vertexes()), MAP_DTYPES[MapLump.VERTEXES]
+    ).copy()
+    rng = np.random.default_rng(0)
+    vertexes["x"] += rng.integers(-30, 30, len(vertexes))
+    vertexes["y"] += rng.integers(-30, 30, len(vertexes))
+    lumps = {
+        MapLump.VERTEXES: vertexes.tobytes(),
+        MapLump.LINEDEFS: b"".join(generator.linedefs()),
+        MapLump.SIDEDEFS: b"".join(generator.sidedefs()),
+        MapLump.SECTORS: b"".join(generator.sectors()),
+    }
+    built, stats = nodebuild.build_nodes(lumps)
+    return Level.from_lumps({**lumps, **built}), stats
+
+
+def main(sizes=(10, 20, 40)):
+    """Run the benchmark."""
+    print(
+        f"{'cells':>6} {'depth':>5} {'grid':>8} {'walk':>8} {'walk+grid':>10}"
+        f" {'batch':>8} {'batch+grid':>11}"
+    )
+    rng = np.random.default_rng(1)
+    for n in sizes:
+        level, stats = _level(n)
+        half = n * 64
+        x = rng.integers(-half, half, POINTS) << FRAC_BITS
+        y = rng.integers(-half, half, POINTS) << FRAC_BITS
+        points = list(zip(x.tolist(), y.tolist()))
+
+        grid_time = timeit.timeit(lambda: level.build_grid(64), number=1)
+        grid = level.build_grid(64)
+        walk = timeit.timeit(
+            lambda: [level.point_in_subsector(*point) for point in points], number=1
+        )
+        walk_grid = timeit.timeit(
+            lambda: [level.point_in_subsector(*point, grid) for point in points],
+            number=1,
+        )
+        batch = timeit.timeit(lambda: level.points_in_subsectors(x, y), number=1)
+        batch_grid = timeit.timeit(
+            lambda: level.points_in_subsectors(x, y, grid), number=1
+        )
+        print(
+            f"{n * n:>6} {stats.mean_depth:>5.1f} {grid_time * 1e3:>5.1f} ms"
+            f" {walk / POINTS * 1e6:>5.2f} us {walk_grid / POINTS * 1e6:>7.2f} us"
+            f" {batch / POINTS * 1e6:>5.2f} us {batch_grid / POINTS * 1e6:>8.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:])
+    main(sizes) if sizes else main()
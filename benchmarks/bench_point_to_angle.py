@@ -0,0 +1,54 @@
+"""
+Time :func:`pink_doom.rendering.main.point_to_angle` and ``point_to_dist``.
+
+Gets the angles and distances of random points one at a time, as the
+renderer does for seg vertexes and things, and all at once with
+``points_to_angles`` and ``points_to_dists``::
+
+    PYTHONPATH=. python benchmarks/bench_point_to_angle.py [count...]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from pink_doom.misc.fixed import FRAC_BITS
+from pink_doom.rendering import main as rendering
+
+
+def _per_point(function, count):
+    return timeit.timeit(function, number=1) / count * 1e9
+
+
+def run(count, rng):
+    """Time ``count`` points."""
+    x = rng.integers(-4096, 4096, count) << FRAC_BITS
+    y = rng.integers(-4096, 4096, count) << FRAC_BITS
+    points = list(zip(x.tolist(), y.tolist()))
+    origin = (100 << FRAC_BITS, -(50 << FRAC_BITS))
+    rendering.viewx, rendering.viewy = origin
+    return (
+        _per_point(
+            lambda: [rendering.point_to_angle(*point) for point in points], count
+        ),
+        _per_point(lambda: rendering.points_to_angles(x, y, *origin), count),
+        _per_point(
+            lambda: [rendering.point_to_dist(*point) for point in points], count
+        ),
+        _per_point(lambda: rendering.points_to_dists(x, y, *origin), count),
+    )
+
+
+def main(counts=(100, 1000, 100000)):
+    """Run the benchmark."""
+    print(f"{'points':>7} {'angle':>10} {'angles':>10} {'dist':>10} {'dists':>10}")
+    rng = np.random.default_rng(0)
+    for count in counts:
+        times = " ".join(f"{t:>7.1f} ns" for t in run(count, rng))
+        print(f"{count:>7} {times}")
+
+
+if __name__ == "__main__":
+    counts = tuple(int(arg) for arg in sys.argv[1:])
+    main(counts) if counts else main()
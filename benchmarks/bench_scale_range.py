@@ -0,0 +1,56 @@
+"""
+Time :func:`pink_doom.rendering.main.scale_range`.
+
+Gets the scales of segs of a few widths a column at a time with
+``scale_from_global_angle``, as a per column loop would, and all at once
+with ``scale_range``::
+
+    PYTHONPATH=. python benchmarks/bench_scale_range.py [width...]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from pink_doom.doom.defines import SCREEN_WIDTH
+from pink_doom.misc.fixed import FRAC_BITS
+from pink_doom.rendering import main as rendering
+from pink_doom.rendering import state
+
+SEGS = 1000
+
+
+def _columns(x1, x2):
+    viewangle = state.viewangle
+    return [
+        rendering.scale_from_global_angle((viewangle + angle) & 0xFFFFFFFF)
+        for angle in state.xtoviewangle[x1 : x2 + 1]
+    ]
+
+
+def main(widths=(4, 32, SCREEN_WIDTH)):
+    """Run the benchmark."""
+    rng = np.random.default_rng(0)
+    state.xtoviewangle = rng.integers(0, 1 << 32, SCREEN_WIDTH + 1).tolist()
+    state.viewangle = 0x12345678
+    state.rw_normalangle = 0x9ABCDEF0
+    state.rw_distance = 300 << FRAC_BITS
+    rendering.projection = 160 << FRAC_BITS
+    print(f"{'width':>6} {'columns':>10} {'range':>10}")
+    for width in widths:
+        starts = rng.integers(0, SCREEN_WIDTH - width + 1, SEGS).tolist()
+        times = [
+            timeit.timeit(
+                lambda: [function(x1, x1 + width - 1) for x1 in starts], number=1
+            )
+            / SEGS
+            * 1e6
+            for function in (_columns, rendering.scale_range)
+        ]
+        print(f"{width:>6} {times[0]:>7.2f} us {times[1]:>7.2f} us")
+
+
+if __name__ == "__main__":
+    widths = tuple(int(arg) for arg in sys.argv[1:])
+    main(widths) if widths else main()
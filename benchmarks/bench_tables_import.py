@@ -0,0 +1,79 @@
+"""
+Time importing :mod:`pink_doom.misc.tables`, and the memory its tables take.
+
+Compares the packed tables with a module writing the same values out as
+tuples, the way ``tables.py`` used to, in a fresh interpreter each time.
+Warm imports load cached bytecode, cold ones compile the source, as the
+first start after installing does. The rest of the package is imported
+before the clock starts::
+
+    PYTHONPATH=. python benchmarks/bench_tables_import.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from pink_doom.misc import tables
+
+NAMES = ("fine_sine", "fine_tangent", "tan_to_angle")
+SCRIPT = """
+import time
+import tracemalloc
+import pink_doom.misc.fixed
+tracemalloc.start()
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def _write_tuples(directory):
+    with open(Path(directory) / "tuple_tables.py", "w") as file:
+        for name in NAMES:
+            file.write(f"{name} = (\n")
+            file.writelines(f"    {value},\n" for value in getattr(tables, name))
+            file.write(")\n")
+
+
+def _import(module, path, runs, cold):
+    times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as cache:
+            options = ["-X", f"pycache_prefix={cache}"] if cold else []
+            result = subprocess.run(
+                [sys.executable, *options, "-c", SCRIPT.format(module=module)],
+                capture_output=True,
+                check=True,
+                env={"PYTHONPATH": os.pathsep.join(path)},
+                text=True,
+            )
+        elapsed, size = result.stdout.split()
+        times.append(float(elapsed))
+    return min(times), int(size)
+
+
+def main(runs=10):
+    """Run the benchmark."""
+    package = str(Path(__file__).resolve().parent.parent)
+    with tempfile.TemporaryDirectory() as directory:
+        _write_tuples(directory)
+        modules = {
+            "tuples": ("tuple_tables", (directory, package)),
+            "packed": ("pink_doom.misc.tables", (package,)),
+        }
+        print(f"{'':<8} {'warm':>9} {'cold':>9} {'memory':>9}")
+        for name, (module, path) in modules.items():
+            warm, size = _import(module, path, runs, cold=False)
+            cold, _ = _import(module, path, runs, cold=True)
+            print(
+                f"{name:<8} {warm * 1e3:>6.2f} ms {cold * 1e3:>6.2f} ms"
+                f" {size / 1024:>6.0f} KB"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1])) if len(sys.argv) > 1 else main()
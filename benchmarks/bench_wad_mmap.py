@@ -0,0 +1,69 @@
+"""
+Compare the file-handle and mmap backends of :mod:`pink_doom.wad.loader`.
+
+Builds a stack of large PWADs in a temporary directory, then loads and
+caches every lump in a fresh interpreter for each backend, reporting
+wall time and peak RSS::
+
+    PYTHONPATH=. python benchmarks/bench_wad_mmap.py [wads] [lumps per wad] [lump size]
+"""
+
+import os
+import resource
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _make_wad(path, num_lumps, lump_size):
+    lump = os.urandom(lump_size)
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sii", b"PWAD", num_lumps, 12 + num_lumps * lump_size))
+        for _ in range(num_lumps):
+            f.write(lump)
+        for i in range(num_lumps):
+            name = f"L{i:07d}".encode("ascii")
+            f.write(struct.pack("<ii8s", 12 + i * lump_size, lump_size, name))
+
+
+def _child(use_mmap, filenames):
+    from pink_doom.wad import loader
+
+    loader.use_mmap = use_mmap
+    start = time.perf_counter()
+    loader.init_multiple_files(filenames)
+    for lump in range(loader.num_lumps):
+        loader.cache_lump_num(lump)
+    elapsed = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{elapsed:.3f} {rss}", file=sys.stderr)
+
+
+def main(num_wads=4, lumps_per_wad=5000, lump_size=4096):
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as tmp:
+        filenames = [os.path.join(tmp, f"mod{i}.wad") for i in range(num_wads)]
+        for filename in filenames:
+            _make_wad(filename, lumps_per_wad, lump_size)
+        total = num_wads * lumps_per_wad * lump_size
+        print(f"{num_wads} WADs, {num_wads * lumps_per_wad} lumps, {total >> 20} MiB")
+        for use_mmap in (False, True):
+            result = subprocess.run(
+                [sys.executable, __file__, "--child", str(use_mmap), *filenames],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+                text=True,
+            )
+            elapsed, rss = result.stderr.split()[-2:]
+            backend = "mmap" if use_mmap else "read"
+            print(f"{backend:>5}: {float(elapsed) * 1000:8.1f} ms, peak RSS {rss} KiB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        _child(sys.argv[2] == "True", sys.argv[3:])
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
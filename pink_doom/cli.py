@@ -1,16 +1,96 @@
 """Console script for pink_doom."""
+import json
 import sys
+import time
 
 import click
 
+from pink_doom.wad import mapgen
+from pink_doom.wad.analyze import analyze_corpus, find_wads
+from pink_doom.wad.nodebuild import CostModel
 
-@click.command()
-def main(args=None):
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def main(ctx, args=None):
     """Console script for pink_doom."""
-    click.echo("Replace this message by putting your code into pink_doom.cli.main")
-    click.echo("See click documentation at https://click.palletsprojects.com/")
+    if ctx.invoked_subcommand is None:
+        click.echo("Replace this message by putting your code into pink_doom.cli.main")
+        click.echo("See click documentation at https://click.palletsprojects.com/")
     return 0
 
 
+@main.command()
+@click.argument("roots", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "-j", "--jobs", type=click.IntRange(min=1), help="Worker processes [all CPUs]."
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="Where to write the JSON lines [stdout].",
+)
+def analyze(roots, jobs, output):
+    """
+    Write lump statistics of every WAD below ROOTS as JSON lines.
+
+    Each line describes one file: its lump count, maps, unpaired
+    namespace markers, lumps outside the file, and lumps with the same
+    contents. Throughput is reported on stderr at the end.
+    """
+    count = failed = 0
+    start = time.perf_counter()
+    for result in analyze_corpus(find_wads(roots), jobs):
+        output.write(json.dumps(result) + "\n")
+        count += 1
+        failed += "error" in result
+    elapsed = time.perf_counter() - start
+    click.echo(
+        f"analyzed {count} WADs ({failed} failed) in {elapsed:.2f}s, "
+        f"{count / elapsed if elapsed else 0:.1f} WADs/sec",
+        err=True,
+    )
+
+
+@main.command()
+@click.argument("output", type=click.Path(dir_okay=False, writable=True))
+@click.option("--linedefs", default=1000, show_default=True, help="Map size.")
+@click.option("--sectors", default=64, show_default=True)
+@click.option("--seed", default=0, show_default=True)
+@click.option("--name", default="MAP01", show_default=True, help="Map lump name.")
+@click.option("--nodes", is_flag=True, help="Build the BSP tree too.")
+@click.option(
+    "--split-cost",
+    default=CostModel.split_cost,
+    show_default=True,
+    help="Node builder cost of each split seg.",
+)
+@click.option(
+    "--balance-cost",
+    default=CostModel.balance_cost,
+    show_default=True,
+    help="Node builder cost of each seg of imbalance.",
+)
+def genmap(output, linedefs, sectors, seed, name, nodes, split_cost, balance_cost):
+    """Write a PWAD with a generated map of at least LINEDEFS lines to OUTPUT."""
+    spec = mapgen.spec_for_linedefs(linedefs, sectors=sectors, seed=seed)
+    cost = CostModel(split_cost, balance_cost) if nodes else None
+    stats = mapgen.generate_wad(output, spec, name, cost)
+    click.echo(
+        f"{name}: {spec.width}x{spec.height} cells, {spec.num_linedefs} linedefs,"
+        f" {spec.num_vertexes} vertexes, {spec.sectors} sectors",
+        err=True,
+    )
+    if stats is not None:
+        click.echo(
+            f"{stats.nodes} nodes, {stats.subsectors} subsectors, {stats.segs} segs"
+            f" ({stats.splits} split), depth {stats.max_depth} at most,"
+            f" {stats.mean_depth:.1f} on average",
+            err=True,
+        )
+
+
 if __name__ == "__main__":
     sys.exit(main())  # pragma: no cover
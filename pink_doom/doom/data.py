@@ -3,9 +3,17 @@ Map level types.
 
 The following data structures define the persistent format
 used in the lumps of the WAD files.
+
+Each kind of map lump also has a NumPy structured dtype in
+:data:`MAP_DTYPES`. :func:`decode_lump` reads a whole lump as an array
+of records without copying it, and :func:`lump_records` turns one into
+the dataclasses below for code that prefers them.
 """
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Any, Union
+
+import numpy as np
 
 
 class MapLump(Enum):
@@ -173,7 +181,7 @@ class MapNode:
     y: int
     dx: int
     dy: int
-    bbox: tuple[tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int]]
+    bbox: tuple[tuple[int, int, int, int], tuple[int, int, int, int]]
     """
     Bounding box for each child,
     clip against view frustum.
@@ -198,3 +206,129 @@ class MapThing:
     angle: int
     kind: int
     options: int
+
+
+NO_INDEX = 0xFFFF
+"""
+An unused index, such as ``sidenum[1]`` of a one-sided linedef.
+
+Indexes into other lumps are decoded as unsigned, like limit-removing
+ports do, so big maps can refer to more than 32767 records. In the
+vanilla format this is -1, which :func:`lump_records` gives back.
+"""
+
+MAP_DTYPES: dict[MapLump, np.dtype] = {
+    MapLump.THINGS: np.dtype(
+        [
+            ("x", "<i2"),
+            ("y", "<i2"),
+            ("angle", "<i2"),
+            ("kind", "<i2"),
+            ("options", "<i2"),
+        ]
+    ),
+    MapLump.LINEDEFS: np.dtype(
+        [
+            ("v1", "<u2"),
+            ("v2", "<u2"),
+            ("flags", "<i2"),
+            ("special", "<i2"),
+            ("tag", "<i2"),
+            ("sidenum", "<u2", (2,)),
+        ]
+    ),
+    MapLump.SIDEDEFS: np.dtype(
+        [
+            ("texture_offset", "<i2"),
+            ("row_offset", "<i2"),
+            ("top_texture", "S8"),
+            ("bottom_texture", "S8"),
+            ("mid_texture", "S8"),
+            ("sector", "<u2"),
+        ]
+    ),
+    MapLump.VERTEXES: np.dtype([("x", "<i2"), ("y", "<i2")]),
+    MapLump.SEGS: np.dtype(
+        [
+            ("v1", "<u2"),
+            ("v2", "<u2"),
+            ("angle", "<i2"),
+            ("linedef", "<u2"),
+            ("side", "<i2"),
+            ("offset", "<i2"),
+        ]
+    ),
+    MapLump.SSECTORS: np.dtype([("num_segs", "<u2"), ("first_seg", "<u2")]),
+    MapLump.NODES: np.dtype(
+        [
+            ("x", "<i2"),
+            ("y", "<i2"),
+            ("dx", "<i2"),
+            ("dy", "<i2"),
+            ("bbox", "<i2", (2, 4)),
+            ("children", "<u2", (2,)),
+        ]
+    ),
+    MapLump.SECTORS: np.dtype(
+        [
+            ("floor_height", "<i2"),
+            ("ceiling_height", "<i2"),
+            ("floor_pic", "S8"),
+            ("ceiling_pic", "S8"),
+            ("light_level", "<i2"),
+            ("special", "<i2"),
+            ("tag", "<i2"),
+        ]
+    ),
+    MapLump.REJECT: np.dtype("u1"),
+    MapLump.BLOCKMAP: np.dtype("<i2"),
+}
+"""Layout of the records of each kind of map lump, all but the label."""
+
+MAP_RECORDS: dict[MapLump, type] = {
+    MapLump.THINGS: MapThing,
+    MapLump.LINEDEFS: MapLinedef,
+    MapLump.SIDEDEFS: MapSidedef,
+    MapLump.VERTEXES: MapVertex,
+    MapLump.SEGS: MapSeg,
+    MapLump.SSECTORS: MapSubsector,
+    MapLump.NODES: MapNode,
+    MapLump.SECTORS: MapSector,
+}
+"""The dataclass of each kind of map lump made of records."""
+
+
+def decode_lump(kind: MapLump, data: Union[bytes, memoryview]) -> np.ndarray:
+    """
+    View a map lump as an array of ``MAP_DTYPES[kind]`` records.
+
+    The array shares memory with ``data``, and is read-only if ``data``
+    is, as cached lumps are. A partial record at the end is ignored.
+    """
+    dtype = MAP_DTYPES[kind]
+    return np.frombuffer(data, dtype, len(data) // dtype.itemsize)
+
+
+def _field(value: Any) -> Any:
+    if isinstance(value, bytes):
+        # convert ASCII zero-terminated string to Python string
+        return value.split(b"\x00", 1)[0].decode("latin-1")
+    if isinstance(value, np.ndarray):
+        return tuple(_field(item) for item in value)
+    return int(value)
+
+
+def lump_records(kind: MapLump, data: Union[bytes, memoryview, np.ndarray]) -> list:
+    """
+    Decode a map lump, or an array from :func:`decode_lump`, to dataclasses.
+
+    This copies every record into Python objects, so it is only meant
+    for small lumps or a few records at a time.
+    """
+    records = data if isinstance(data, np.ndarray) else decode_lump(kind, data)
+    cls = MAP_RECORDS[kind]
+    result = [cls(*map(_field, record)) for record in records.tolist()]
+    if kind == MapLump.LINEDEFS:
+        for linedef in result:
+            linedef.sidenum = tuple(-1 if i == NO_INDEX else i for i in linedef.sidenum)
+    return result
@@ -1138,11 +1138,19 @@ class State:
     sprite: SpriteEnum
     frame: int
     tics: int
-    action: Optional[ActionFunction]
+    action_name: Optional[str]
+    """Name of the action function in :mod:`pink_doom.playsim.actions`."""
     next_state: StateEnum
     misc1: int
     misc2: int
 
+    @property
+    def action(self) -> Optional[ActionFunction]:
+        """Look up the action function, which is only done when called for."""
+        if self.action_name is None:
+            return None
+        return getattr(actions, self.action_name)
+
 
 sprnames = (
     "TROO",
@@ -1289,49 +1297,49 @@ states = (
     # S_NULL
     State(SpriteEnum.TROO, 0, -1, None, StateEnum.NULL, 0, 0),
     # S_LIGHTDONE
-    State(SpriteEnum.SHTG, 4, 0, actions.light_0, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.SHTG, 4, 0, "light_0", StateEnum.NULL, 0, 0),
     # S_PUNCH
-    State(SpriteEnum.PUNG, 0, 1, actions.weapon_ready, StateEnum.PUNCH, 0, 0),
+    State(SpriteEnum.PUNG, 0, 1, "weapon_ready", StateEnum.PUNCH, 0, 0),
     # S_PUNCHDOWN
-    State(SpriteEnum.PUNG, 0, 1, actions.lower, StateEnum.PUNCHDOWN, 0, 0),
+    State(SpriteEnum.PUNG, 0, 1, "lower", StateEnum.PUNCHDOWN, 0, 0),
     # S_PUNCHUP
-    State(SpriteEnum.PUNG, 0, 1, actions.raise_weapon, StateEnum.PUNCHUP, 0, 0),
+    State(SpriteEnum.PUNG, 0, 1, "raise_weapon", StateEnum.PUNCHUP, 0, 0),
     # S_PUNCH1
     State(SpriteEnum.PUNG, 1, 4, None, StateEnum.PUNCH2, 0, 0),
     # S_PUNCH2
-    State(SpriteEnum.PUNG, 2, 4, actions.punch, StateEnum.PUNCH3, 0, 0),
+    State(SpriteEnum.PUNG, 2, 4, "punch", StateEnum.PUNCH3, 0, 0),
     # S_PUNCH3
     State(SpriteEnum.PUNG, 3, 5, None, StateEnum.PUNCH4, 0, 0),
     # S_PUNCH4
     State(SpriteEnum.PUNG, 2, 4, None, StateEnum.PUNCH5, 0, 0),
     # S_PUNCH5
-    State(SpriteEnum.PUNG, 1, 5, actions.re_fire, StateEnum.PUNCH, 0, 0),
+    State(SpriteEnum.PUNG, 1, 5, "re_fire", StateEnum.PUNCH, 0, 0),
     # S_PISTOL
-    State(SpriteEnum.PISG, 0, 1, actions.weapon_ready, StateEnum.PISTOL, 0, 0),
+    State(SpriteEnum.PISG, 0, 1, "weapon_ready", StateEnum.PISTOL, 0, 0),
     # S_PISTOLDOWN
-    State(SpriteEnum.PISG, 0, 1, actions.lower, StateEnum.PISTOLDOWN, 0, 0),
+    State(SpriteEnum.PISG, 0, 1, "lower", StateEnum.PISTOLDOWN, 0, 0),
     # S_PISTOLUP
-    State(SpriteEnum.PISG, 0, 1, actions.raise_weapon, StateEnum.PISTOLUP, 0, 0),
+    State(SpriteEnum.PISG, 0, 1, "raise_weapon", StateEnum.PISTOLUP, 0, 0),
     # S_PISTOL1
     State(SpriteEnum.PISG, 0, 4, None, StateEnum.PISTOL2, 0, 0),
     # S_PISTOL2
-    State(SpriteEnum.PISG, 1, 6, actions.fire_pistol, StateEnum.PISTOL3, 0, 0),
+    State(SpriteEnum.PISG, 1, 6, "fire_pistol", StateEnum.PISTOL3, 0, 0),
     # S_PISTOL3
     State(SpriteEnum.PISG, 2, 4, None, StateEnum.PISTOL4, 0, 0),
     # S_PISTOL4
-    State(SpriteEnum.PISG, 1, 5, actions.re_fire, StateEnum.PISTOL, 0, 0),
+    State(SpriteEnum.PISG, 1, 5, "re_fire", StateEnum.PISTOL, 0, 0),
     # S_PISTOLFLASH
-    State(SpriteEnum.PISF, 32768, 7, actions.light_1, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.PISF, 32768, 7, "light_1", StateEnum.LIGHTDONE, 0, 0),
     # S_SGUN
-    State(SpriteEnum.SHTG, 0, 1, actions.weapon_ready, StateEnum.SGUN, 0, 0),
+    State(SpriteEnum.SHTG, 0, 1, "weapon_ready", StateEnum.SGUN, 0, 0),
     # S_SGUNDOWN
-    State(SpriteEnum.SHTG, 0, 1, actions.lower, StateEnum.SGUNDOWN, 0, 0),
+    State(SpriteEnum.SHTG, 0, 1, "lower", StateEnum.SGUNDOWN, 0, 0),
     # S_SGUNUP
-    State(SpriteEnum.SHTG, 0, 1, actions.raise_weapon, StateEnum.SGUNUP, 0, 0),
+    State(SpriteEnum.SHTG, 0, 1, "raise_weapon", StateEnum.SGUNUP, 0, 0),
     # S_SGUN1
     State(SpriteEnum.SHTG, 0, 3, None, StateEnum.SGUN2, 0, 0),
     # S_SGUN2
-    State(SpriteEnum.SHTG, 0, 7, actions.fire_shotgun, StateEnum.SGUN3, 0, 0),
+    State(SpriteEnum.SHTG, 0, 7, "fire_shotgun", StateEnum.SGUN3, 0, 0),
     # S_SGUN3
     State(SpriteEnum.SHTG, 1, 5, None, StateEnum.SGUN4, 0, 0),
     # S_SGUN4
@@ -1345,127 +1353,127 @@ states = (
     # S_SGUN8
     State(SpriteEnum.SHTG, 0, 3, None, StateEnum.SGUN9, 0, 0),
     # S_SGUN9
-    State(SpriteEnum.SHTG, 0, 7, actions.re_fire, StateEnum.SGUN, 0, 0),
+    State(SpriteEnum.SHTG, 0, 7, "re_fire", StateEnum.SGUN, 0, 0),
     # S_SGUNFLASH1
-    State(SpriteEnum.SHTF, 32768, 4, actions.light_1, StateEnum.SGUNFLASH2, 0, 0),
+    State(SpriteEnum.SHTF, 32768, 4, "light_1", StateEnum.SGUNFLASH2, 0, 0),
     # S_SGUNFLASH2
-    State(SpriteEnum.SHTF, 32769, 3, actions.light_2, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.SHTF, 32769, 3, "light_2", StateEnum.LIGHTDONE, 0, 0),
     # S_DSGUN
-    State(SpriteEnum.SHT2, 0, 1, actions.weapon_ready, StateEnum.DSGUN, 0, 0),
+    State(SpriteEnum.SHT2, 0, 1, "weapon_ready", StateEnum.DSGUN, 0, 0),
     # S_DSGUNDOWN
-    State(SpriteEnum.SHT2, 0, 1, actions.lower, StateEnum.DSGUNDOWN, 0, 0),
+    State(SpriteEnum.SHT2, 0, 1, "lower", StateEnum.DSGUNDOWN, 0, 0),
     # S_DSGUNUP
-    State(SpriteEnum.SHT2, 0, 1, actions.raise_weapon, StateEnum.DSGUNUP, 0, 0),
+    State(SpriteEnum.SHT2, 0, 1, "raise_weapon", StateEnum.DSGUNUP, 0, 0),
     # S_DSGUN1
     State(SpriteEnum.SHT2, 0, 3, None, StateEnum.DSGUN2, 0, 0),
     # S_DSGUN2
-    State(SpriteEnum.SHT2, 0, 7, actions.fire_shotgun_2, StateEnum.DSGUN3, 0, 0),
+    State(SpriteEnum.SHT2, 0, 7, "fire_shotgun_2", StateEnum.DSGUN3, 0, 0),
     # S_DSGUN3
     State(SpriteEnum.SHT2, 1, 7, None, StateEnum.DSGUN4, 0, 0),
     # S_DSGUN4
-    State(SpriteEnum.SHT2, 2, 7, actions.check_reload, StateEnum.DSGUN5, 0, 0),
+    State(SpriteEnum.SHT2, 2, 7, "check_reload", StateEnum.DSGUN5, 0, 0),
     # S_DSGUN5
-    State(SpriteEnum.SHT2, 3, 7, actions.open_shotgun_2, StateEnum.DSGUN6, 0, 0),
+    State(SpriteEnum.SHT2, 3, 7, "open_shotgun_2", StateEnum.DSGUN6, 0, 0),
     # S_DSGUN6
     State(SpriteEnum.SHT2, 4, 7, None, StateEnum.DSGUN7, 0, 0),
     # S_DSGUN7
-    State(SpriteEnum.SHT2, 5, 7, actions.load_shotgun_2, StateEnum.DSGUN8, 0, 0),
+    State(SpriteEnum.SHT2, 5, 7, "load_shotgun_2", StateEnum.DSGUN8, 0, 0),
     # S_DSGUN8
     State(SpriteEnum.SHT2, 6, 6, None, StateEnum.DSGUN9, 0, 0),
     # S_DSGUN9
-    State(SpriteEnum.SHT2, 7, 6, actions.close_shotgun_2, StateEnum.DSGUN10, 0, 0),
+    State(SpriteEnum.SHT2, 7, 6, "close_shotgun_2", StateEnum.DSGUN10, 0, 0),
     # S_DSGUN10
-    State(SpriteEnum.SHT2, 0, 5, actions.re_fire, StateEnum.DSGUN, 0, 0),
+    State(SpriteEnum.SHT2, 0, 5, "re_fire", StateEnum.DSGUN, 0, 0),
     # S_DSNR1
     State(SpriteEnum.SHT2, 1, 7, None, StateEnum.DSNR2, 0, 0),
     # S_DSNR2
     State(SpriteEnum.SHT2, 0, 3, None, StateEnum.DSGUNDOWN, 0, 0),
     # S_DSGUNFLASH1
-    State(SpriteEnum.SHT2, 32776, 5, actions.light_1, StateEnum.DSGUNFLASH2, 0, 0),
+    State(SpriteEnum.SHT2, 32776, 5, "light_1", StateEnum.DSGUNFLASH2, 0, 0),
     # S_DSGUNFLASH2
-    State(SpriteEnum.SHT2, 32777, 4, actions.light_2, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.SHT2, 32777, 4, "light_2", StateEnum.LIGHTDONE, 0, 0),
     # S_CHAIN
-    State(SpriteEnum.CHGG, 0, 1, actions.weapon_ready, StateEnum.CHAIN, 0, 0),
+    State(SpriteEnum.CHGG, 0, 1, "weapon_ready", StateEnum.CHAIN, 0, 0),
     # S_CHAINDOWN
-    State(SpriteEnum.CHGG, 0, 1, actions.lower, StateEnum.CHAINDOWN, 0, 0),
+    State(SpriteEnum.CHGG, 0, 1, "lower", StateEnum.CHAINDOWN, 0, 0),
     # S_CHAINUP
-    State(SpriteEnum.CHGG, 0, 1, actions.raise_weapon, StateEnum.CHAINUP, 0, 0),
+    State(SpriteEnum.CHGG, 0, 1, "raise_weapon", StateEnum.CHAINUP, 0, 0),
     # S_CHAIN1
-    State(SpriteEnum.CHGG, 0, 4, actions.fire_c_gun, StateEnum.CHAIN2, 0, 0),
+    State(SpriteEnum.CHGG, 0, 4, "fire_c_gun", StateEnum.CHAIN2, 0, 0),
     # S_CHAIN2
-    State(SpriteEnum.CHGG, 1, 4, actions.fire_c_gun, StateEnum.CHAIN3, 0, 0),
+    State(SpriteEnum.CHGG, 1, 4, "fire_c_gun", StateEnum.CHAIN3, 0, 0),
     # S_CHAIN3
-    State(SpriteEnum.CHGG, 1, 0, actions.re_fire, StateEnum.CHAIN, 0, 0),
+    State(SpriteEnum.CHGG, 1, 0, "re_fire", StateEnum.CHAIN, 0, 0),
     # S_CHAINFLASH1
-    State(SpriteEnum.CHGF, 32768, 5, actions.light_1, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.CHGF, 32768, 5, "light_1", StateEnum.LIGHTDONE, 0, 0),
     # S_CHAINFLASH2
-    State(SpriteEnum.CHGF, 32769, 5, actions.light_2, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.CHGF, 32769, 5, "light_2", StateEnum.LIGHTDONE, 0, 0),
     # S_MISSILE
-    State(SpriteEnum.MISG, 0, 1, actions.weapon_ready, StateEnum.MISSILE, 0, 0),
+    State(SpriteEnum.MISG, 0, 1, "weapon_ready", StateEnum.MISSILE, 0, 0),
     # S_MISSILEDOWN
-    State(SpriteEnum.MISG, 0, 1, actions.lower, StateEnum.MISSILEDOWN, 0, 0),
+    State(SpriteEnum.MISG, 0, 1, "lower", StateEnum.MISSILEDOWN, 0, 0),
     # S_MISSILEUP
-    State(SpriteEnum.MISG, 0, 1, actions.raise_weapon, StateEnum.MISSILEUP, 0, 0),
+    State(SpriteEnum.MISG, 0, 1, "raise_weapon", StateEnum.MISSILEUP, 0, 0),
     # S_MISSILE1
-    State(SpriteEnum.MISG, 1, 8, actions.gun_flash, StateEnum.MISSILE2, 0, 0),
+    State(SpriteEnum.MISG, 1, 8, "gun_flash", StateEnum.MISSILE2, 0, 0),
     # S_MISSILE2
-    State(SpriteEnum.MISG, 1, 12, actions.fire_missile, StateEnum.MISSILE3, 0, 0),
+    State(SpriteEnum.MISG, 1, 12, "fire_missile", StateEnum.MISSILE3, 0, 0),
     # S_MISSILE3
-    State(SpriteEnum.MISG, 1, 0, actions.re_fire, StateEnum.MISSILE, 0, 0),
+    State(SpriteEnum.MISG, 1, 0, "re_fire", StateEnum.MISSILE, 0, 0),
     # S_MISSILEFLASH1
-    State(SpriteEnum.MISF, 32768, 3, actions.light_1, StateEnum.MISSILEFLASH2, 0, 0),
+    State(SpriteEnum.MISF, 32768, 3, "light_1", StateEnum.MISSILEFLASH2, 0, 0),
     # S_MISSILEFLASH2
     State(SpriteEnum.MISF, 32769, 4, None, StateEnum.MISSILEFLASH3, 0, 0),
     # S_MISSILEFLASH3
-    State(SpriteEnum.MISF, 32770, 4, actions.light_2, StateEnum.MISSILEFLASH4, 0, 0),
+    State(SpriteEnum.MISF, 32770, 4, "light_2", StateEnum.MISSILEFLASH4, 0, 0),
     # S_MISSILEFLASH4
-    State(SpriteEnum.MISF, 32771, 4, actions.light_2, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.MISF, 32771, 4, "light_2", StateEnum.LIGHTDONE, 0, 0),
     # S_SAW
-    State(SpriteEnum.SAWG, 2, 4, actions.weapon_ready, StateEnum.SAWB, 0, 0),
+    State(SpriteEnum.SAWG, 2, 4, "weapon_ready", StateEnum.SAWB, 0, 0),
     # S_SAWB
-    State(SpriteEnum.SAWG, 3, 4, actions.weapon_ready, StateEnum.SAW, 0, 0),
+    State(SpriteEnum.SAWG, 3, 4, "weapon_ready", StateEnum.SAW, 0, 0),
     # S_SAWDOWN
-    State(SpriteEnum.SAWG, 2, 1, actions.lower, StateEnum.SAWDOWN, 0, 0),
+    State(SpriteEnum.SAWG, 2, 1, "lower", StateEnum.SAWDOWN, 0, 0),
     # S_SAWUP
-    State(SpriteEnum.SAWG, 2, 1, actions.raise_weapon, StateEnum.SAWUP, 0, 0),
+    State(SpriteEnum.SAWG, 2, 1, "raise_weapon", StateEnum.SAWUP, 0, 0),
     # S_SAW1
-    State(SpriteEnum.SAWG, 0, 4, actions.saw, StateEnum.SAW2, 0, 0),
+    State(SpriteEnum.SAWG, 0, 4, "saw", StateEnum.SAW2, 0, 0),
     # S_SAW2
-    State(SpriteEnum.SAWG, 1, 4, actions.saw, StateEnum.SAW3, 0, 0),
+    State(SpriteEnum.SAWG, 1, 4, "saw", StateEnum.SAW3, 0, 0),
     # S_SAW3
-    State(SpriteEnum.SAWG, 1, 0, actions.re_fire, StateEnum.SAW, 0, 0),
+    State(SpriteEnum.SAWG, 1, 0, "re_fire", StateEnum.SAW, 0, 0),
     # S_PLASMA
-    State(SpriteEnum.PLSG, 0, 1, actions.weapon_ready, StateEnum.PLASMA, 0, 0),
+    State(SpriteEnum.PLSG, 0, 1, "weapon_ready", StateEnum.PLASMA, 0, 0),
     # S_PLASMADOWN
-    State(SpriteEnum.PLSG, 0, 1, actions.lower, StateEnum.PLASMADOWN, 0, 0),
+    State(SpriteEnum.PLSG, 0, 1, "lower", StateEnum.PLASMADOWN, 0, 0),
     # S_PLASMAUP
-    State(SpriteEnum.PLSG, 0, 1, actions.raise_weapon, StateEnum.PLASMAUP, 0, 0),
+    State(SpriteEnum.PLSG, 0, 1, "raise_weapon", StateEnum.PLASMAUP, 0, 0),
     # S_PLASMA1
-    State(SpriteEnum.PLSG, 0, 3, actions.fire_plasma, StateEnum.PLASMA2, 0, 0),
+    State(SpriteEnum.PLSG, 0, 3, "fire_plasma", StateEnum.PLASMA2, 0, 0),
     # S_PLASMA2
-    State(SpriteEnum.PLSG, 1, 20, actions.re_fire, StateEnum.PLASMA, 0, 0),
+    State(SpriteEnum.PLSG, 1, 20, "re_fire", StateEnum.PLASMA, 0, 0),
     # S_PLASMAFLASH1
-    State(SpriteEnum.PLSF, 32768, 4, actions.light_1, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.PLSF, 32768, 4, "light_1", StateEnum.LIGHTDONE, 0, 0),
     # S_PLASMAFLASH2
-    State(SpriteEnum.PLSF, 32769, 4, actions.light_1, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.PLSF, 32769, 4, "light_1", StateEnum.LIGHTDONE, 0, 0),
     # S_BFG
-    State(SpriteEnum.BFGG, 0, 1, actions.weapon_ready, StateEnum.BFG, 0, 0),
+    State(SpriteEnum.BFGG, 0, 1, "weapon_ready", StateEnum.BFG, 0, 0),
     # S_BFGDOWN
-    State(SpriteEnum.BFGG, 0, 1, actions.lower, StateEnum.BFGDOWN, 0, 0),
+    State(SpriteEnum.BFGG, 0, 1, "lower", StateEnum.BFGDOWN, 0, 0),
     # S_BFGUP
-    State(SpriteEnum.BFGG, 0, 1, actions.raise_weapon, StateEnum.BFGUP, 0, 0),
+    State(SpriteEnum.BFGG, 0, 1, "raise_weapon", StateEnum.BFGUP, 0, 0),
     # S_BFG1
-    State(SpriteEnum.BFGG, 0, 20, actions.b_f_gsound, StateEnum.BFG2, 0, 0),
+    State(SpriteEnum.BFGG, 0, 20, "b_f_gsound", StateEnum.BFG2, 0, 0),
     # S_BFG2
-    State(SpriteEnum.BFGG, 1, 10, actions.gun_flash, StateEnum.BFG3, 0, 0),
+    State(SpriteEnum.BFGG, 1, 10, "gun_flash", StateEnum.BFG3, 0, 0),
     # S_BFG3
-    State(SpriteEnum.BFGG, 1, 10, actions.fire_bf_g, StateEnum.BFG4, 0, 0),
+    State(SpriteEnum.BFGG, 1, 10, "fire_bf_g", StateEnum.BFG4, 0, 0),
     # S_BFG4
-    State(SpriteEnum.BFGG, 1, 20, actions.re_fire, StateEnum.BFG, 0, 0),
+    State(SpriteEnum.BFGG, 1, 20, "re_fire", StateEnum.BFG, 0, 0),
     # S_BFGFLASH1
-    State(SpriteEnum.BFGF, 32768, 11, actions.light_1, StateEnum.BFGFLASH2, 0, 0),
+    State(SpriteEnum.BFGF, 32768, 11, "light_1", StateEnum.BFGFLASH2, 0, 0),
     # S_BFGFLASH2
-    State(SpriteEnum.BFGF, 32769, 6, actions.light_2, StateEnum.LIGHTDONE, 0, 0),
+    State(SpriteEnum.BFGF, 32769, 6, "light_2", StateEnum.LIGHTDONE, 0, 0),
     # S_BLOOD1
     State(SpriteEnum.BLUD, 2, 8, None, StateEnum.BLOOD2, 0, 0),
     # S_BLOOD2
@@ -1525,7 +1533,7 @@ states = (
     # S_BFGLAND2
     State(SpriteEnum.BFE1, 32769, 8, None, StateEnum.BFGLAND3, 0, 0),
     # S_BFGLAND3
-    State(SpriteEnum.BFE1, 32770, 8, actions.b_f_g_spray, StateEnum.BFGLAND4, 0, 0),
+    State(SpriteEnum.BFE1, 32770, 8, "b_f_g_spray", StateEnum.BFGLAND4, 0, 0),
     # S_BFGLAND4
     State(SpriteEnum.BFE1, 32771, 8, None, StateEnum.BFGLAND5, 0, 0),
     # S_BFGLAND5
@@ -1541,7 +1549,7 @@ states = (
     # S_BFGEXP4
     State(SpriteEnum.BFE2, 32771, 8, None, StateEnum.NULL, 0, 0),
     # S_EXPLODE1
-    State(SpriteEnum.MISL, 32769, 8, actions.explode, StateEnum.EXPLODE2, 0, 0),
+    State(SpriteEnum.MISL, 32769, 8, "explode", StateEnum.EXPLODE2, 0, 0),
     # S_EXPLODE2
     State(SpriteEnum.MISL, 32770, 6, None, StateEnum.EXPLODE3, 0, 0),
     # S_EXPLODE3
@@ -1601,13 +1609,13 @@ states = (
     # S_PLAY_PAIN
     State(SpriteEnum.PLAY, 6, 4, None, StateEnum.PLAY_PAIN2, 0, 0),
     # S_PLAY_PAIN2
-    State(SpriteEnum.PLAY, 6, 4, actions.pain, StateEnum.PLAY, 0, 0),
+    State(SpriteEnum.PLAY, 6, 4, "pain", StateEnum.PLAY, 0, 0),
     # S_PLAY_DIE1
     State(SpriteEnum.PLAY, 7, 10, None, StateEnum.PLAY_DIE2, 0, 0),
     # S_PLAY_DIE2
-    State(SpriteEnum.PLAY, 8, 10, actions.player_scream, StateEnum.PLAY_DIE3, 0, 0),
+    State(SpriteEnum.PLAY, 8, 10, "player_scream", StateEnum.PLAY_DIE3, 0, 0),
     # S_PLAY_DIE3
-    State(SpriteEnum.PLAY, 9, 10, actions.fall, StateEnum.PLAY_DIE4, 0, 0),
+    State(SpriteEnum.PLAY, 9, 10, "fall", StateEnum.PLAY_DIE4, 0, 0),
     # S_PLAY_DIE4
     State(SpriteEnum.PLAY, 10, 10, None, StateEnum.PLAY_DIE5, 0, 0),
     # S_PLAY_DIE5
@@ -1619,9 +1627,9 @@ states = (
     # S_PLAY_XDIE1
     State(SpriteEnum.PLAY, 14, 5, None, StateEnum.PLAY_XDIE2, 0, 0),
     # S_PLAY_XDIE2
-    State(SpriteEnum.PLAY, 15, 5, actions.x_scream, StateEnum.PLAY_XDIE3, 0, 0),
+    State(SpriteEnum.PLAY, 15, 5, "x_scream", StateEnum.PLAY_XDIE3, 0, 0),
     # S_PLAY_XDIE3
-    State(SpriteEnum.PLAY, 16, 5, actions.fall, StateEnum.PLAY_XDIE4, 0, 0),
+    State(SpriteEnum.PLAY, 16, 5, "fall", StateEnum.PLAY_XDIE4, 0, 0),
     # S_PLAY_XDIE4
     State(SpriteEnum.PLAY, 17, 5, None, StateEnum.PLAY_XDIE5, 0, 0),
     # S_PLAY_XDIE5
@@ -1635,41 +1643,41 @@ states = (
     # S_PLAY_XDIE9
     State(SpriteEnum.PLAY, 22, -1, None, StateEnum.NULL, 0, 0),
     # S_POSS_STND
-    State(SpriteEnum.POSS, 0, 10, actions.look, StateEnum.POSS_STND2, 0, 0),
+    State(SpriteEnum.POSS, 0, 10, "look", StateEnum.POSS_STND2, 0, 0),
     # S_POSS_STND2
-    State(SpriteEnum.POSS, 1, 10, actions.look, StateEnum.POSS_STND, 0, 0),
+    State(SpriteEnum.POSS, 1, 10, "look", StateEnum.POSS_STND, 0, 0),
     # S_POSS_RUN1
-    State(SpriteEnum.POSS, 0, 4, actions.chase, StateEnum.POSS_RUN2, 0, 0),
+    State(SpriteEnum.POSS, 0, 4, "chase", StateEnum.POSS_RUN2, 0, 0),
     # S_POSS_RUN2
-    State(SpriteEnum.POSS, 0, 4, actions.chase, StateEnum.POSS_RUN3, 0, 0),
+    State(SpriteEnum.POSS, 0, 4, "chase", StateEnum.POSS_RUN3, 0, 0),
     # S_POSS_RUN3
-    State(SpriteEnum.POSS, 1, 4, actions.chase, StateEnum.POSS_RUN4, 0, 0),
+    State(SpriteEnum.POSS, 1, 4, "chase", StateEnum.POSS_RUN4, 0, 0),
     # S_POSS_RUN4
-    State(SpriteEnum.POSS, 1, 4, actions.chase, StateEnum.POSS_RUN5, 0, 0),
+    State(SpriteEnum.POSS, 1, 4, "chase", StateEnum.POSS_RUN5, 0, 0),
     # S_POSS_RUN5
-    State(SpriteEnum.POSS, 2, 4, actions.chase, StateEnum.POSS_RUN6, 0, 0),
+    State(SpriteEnum.POSS, 2, 4, "chase", StateEnum.POSS_RUN6, 0, 0),
     # S_POSS_RUN6
-    State(SpriteEnum.POSS, 2, 4, actions.chase, StateEnum.POSS_RUN7, 0, 0),
+    State(SpriteEnum.POSS, 2, 4, "chase", StateEnum.POSS_RUN7, 0, 0),
     # S_POSS_RUN7
-    State(SpriteEnum.POSS, 3, 4, actions.chase, StateEnum.POSS_RUN8, 0, 0),
+    State(SpriteEnum.POSS, 3, 4, "chase", StateEnum.POSS_RUN8, 0, 0),
     # S_POSS_RUN8
-    State(SpriteEnum.POSS, 3, 4, actions.chase, StateEnum.POSS_RUN1, 0, 0),
+    State(SpriteEnum.POSS, 3, 4, "chase", StateEnum.POSS_RUN1, 0, 0),
     # S_POSS_ATK1
-    State(SpriteEnum.POSS, 4, 10, actions.face_target, StateEnum.POSS_ATK2, 0, 0),
+    State(SpriteEnum.POSS, 4, 10, "face_target", StateEnum.POSS_ATK2, 0, 0),
     # S_POSS_ATK2
-    State(SpriteEnum.POSS, 5, 8, actions.pos_attack, StateEnum.POSS_ATK3, 0, 0),
+    State(SpriteEnum.POSS, 5, 8, "pos_attack", StateEnum.POSS_ATK3, 0, 0),
     # S_POSS_ATK3
     State(SpriteEnum.POSS, 4, 8, None, StateEnum.POSS_RUN1, 0, 0),
     # S_POSS_PAIN
     State(SpriteEnum.POSS, 6, 3, None, StateEnum.POSS_PAIN2, 0, 0),
     # S_POSS_PAIN2
-    State(SpriteEnum.POSS, 6, 3, actions.pain, StateEnum.POSS_RUN1, 0, 0),
+    State(SpriteEnum.POSS, 6, 3, "pain", StateEnum.POSS_RUN1, 0, 0),
     # S_POSS_DIE1
     State(SpriteEnum.POSS, 7, 5, None, StateEnum.POSS_DIE2, 0, 0),
     # S_POSS_DIE2
-    State(SpriteEnum.POSS, 8, 5, actions.scream, StateEnum.POSS_DIE3, 0, 0),
+    State(SpriteEnum.POSS, 8, 5, "scream", StateEnum.POSS_DIE3, 0, 0),
     # S_POSS_DIE3
-    State(SpriteEnum.POSS, 9, 5, actions.fall, StateEnum.POSS_DIE4, 0, 0),
+    State(SpriteEnum.POSS, 9, 5, "fall", StateEnum.POSS_DIE4, 0, 0),
     # S_POSS_DIE4
     State(SpriteEnum.POSS, 10, 5, None, StateEnum.POSS_DIE5, 0, 0),
     # S_POSS_DIE5
@@ -1677,9 +1685,9 @@ states = (
     # S_POSS_XDIE1
     State(SpriteEnum.POSS, 12, 5, None, StateEnum.POSS_XDIE2, 0, 0),
     # S_POSS_XDIE2
-    State(SpriteEnum.POSS, 13, 5, actions.x_scream, StateEnum.POSS_XDIE3, 0, 0),
+    State(SpriteEnum.POSS, 13, 5, "x_scream", StateEnum.POSS_XDIE3, 0, 0),
     # S_POSS_XDIE3
-    State(SpriteEnum.POSS, 14, 5, actions.fall, StateEnum.POSS_XDIE4, 0, 0),
+    State(SpriteEnum.POSS, 14, 5, "fall", StateEnum.POSS_XDIE4, 0, 0),
     # S_POSS_XDIE4
     State(SpriteEnum.POSS, 15, 5, None, StateEnum.POSS_XDIE5, 0, 0),
     # S_POSS_XDIE5
@@ -1701,41 +1709,41 @@ states = (
     # S_POSS_RAISE4
     State(SpriteEnum.POSS, 7, 5, None, StateEnum.POSS_RUN1, 0, 0),
     # S_SPOS_STND
-    State(SpriteEnum.SPOS, 0, 10, actions.look, StateEnum.SPOS_STND2, 0, 0),
+    State(SpriteEnum.SPOS, 0, 10, "look", StateEnum.SPOS_STND2, 0, 0),
     # S_SPOS_STND2
-    State(SpriteEnum.SPOS, 1, 10, actions.look, StateEnum.SPOS_STND, 0, 0),
+    State(SpriteEnum.SPOS, 1, 10, "look", StateEnum.SPOS_STND, 0, 0),
     # S_SPOS_RUN1
-    State(SpriteEnum.SPOS, 0, 3, actions.chase, StateEnum.SPOS_RUN2, 0, 0),
+    State(SpriteEnum.SPOS, 0, 3, "chase", StateEnum.SPOS_RUN2, 0, 0),
     # S_SPOS_RUN2
-    State(SpriteEnum.SPOS, 0, 3, actions.chase, StateEnum.SPOS_RUN3, 0, 0),
+    State(SpriteEnum.SPOS, 0, 3, "chase", StateEnum.SPOS_RUN3, 0, 0),
     # S_SPOS_RUN3
-    State(SpriteEnum.SPOS, 1, 3, actions.chase, StateEnum.SPOS_RUN4, 0, 0),
+    State(SpriteEnum.SPOS, 1, 3, "chase", StateEnum.SPOS_RUN4, 0, 0),
     # S_SPOS_RUN4
-    State(SpriteEnum.SPOS, 1, 3, actions.chase, StateEnum.SPOS_RUN5, 0, 0),
+    State(SpriteEnum.SPOS, 1, 3, "chase", StateEnum.SPOS_RUN5, 0, 0),
     # S_SPOS_RUN5
-    State(SpriteEnum.SPOS, 2, 3, actions.chase, StateEnum.SPOS_RUN6, 0, 0),
+    State(SpriteEnum.SPOS, 2, 3, "chase", StateEnum.SPOS_RUN6, 0, 0),
     # S_SPOS_RUN6
-    State(SpriteEnum.SPOS, 2, 3, actions.chase, StateEnum.SPOS_RUN7, 0, 0),
+    State(SpriteEnum.SPOS, 2, 3, "chase", StateEnum.SPOS_RUN7, 0, 0),
     # S_SPOS_RUN7
-    State(SpriteEnum.SPOS, 3, 3, actions.chase, StateEnum.SPOS_RUN8, 0, 0),
+    State(SpriteEnum.SPOS, 3, 3, "chase", StateEnum.SPOS_RUN8, 0, 0),
     # S_SPOS_RUN8
-    State(SpriteEnum.SPOS, 3, 3, actions.chase, StateEnum.SPOS_RUN1, 0, 0),
+    State(SpriteEnum.SPOS, 3, 3, "chase", StateEnum.SPOS_RUN1, 0, 0),
     # S_SPOS_ATK1
-    State(SpriteEnum.SPOS, 4, 10, actions.face_target, StateEnum.SPOS_ATK2, 0, 0),
+    State(SpriteEnum.SPOS, 4, 10, "face_target", StateEnum.SPOS_ATK2, 0, 0),
     # S_SPOS_ATK2
-    State(SpriteEnum.SPOS, 32773, 10, actions.s_pos_attack, StateEnum.SPOS_ATK3, 0, 0),
+    State(SpriteEnum.SPOS, 32773, 10, "s_pos_attack", StateEnum.SPOS_ATK3, 0, 0),
     # S_SPOS_ATK3
     State(SpriteEnum.SPOS, 4, 10, None, StateEnum.SPOS_RUN1, 0, 0),
     # S_SPOS_PAIN
     State(SpriteEnum.SPOS, 6, 3, None, StateEnum.SPOS_PAIN2, 0, 0),
     # S_SPOS_PAIN2
-    State(SpriteEnum.SPOS, 6, 3, actions.pain, StateEnum.SPOS_RUN1, 0, 0),
+    State(SpriteEnum.SPOS, 6, 3, "pain", StateEnum.SPOS_RUN1, 0, 0),
     # S_SPOS_DIE1
     State(SpriteEnum.SPOS, 7, 5, None, StateEnum.SPOS_DIE2, 0, 0),
     # S_SPOS_DIE2
-    State(SpriteEnum.SPOS, 8, 5, actions.scream, StateEnum.SPOS_DIE3, 0, 0),
+    State(SpriteEnum.SPOS, 8, 5, "scream", StateEnum.SPOS_DIE3, 0, 0),
     # S_SPOS_DIE3
-    State(SpriteEnum.SPOS, 9, 5, actions.fall, StateEnum.SPOS_DIE4, 0, 0),
+    State(SpriteEnum.SPOS, 9, 5, "fall", StateEnum.SPOS_DIE4, 0, 0),
     # S_SPOS_DIE4
     State(SpriteEnum.SPOS, 10, 5, None, StateEnum.SPOS_DIE5, 0, 0),
     # S_SPOS_DIE5
@@ -1743,9 +1751,9 @@ states = (
     # S_SPOS_XDIE1
     State(SpriteEnum.SPOS, 12, 5, None, StateEnum.SPOS_XDIE2, 0, 0),
     # S_SPOS_XDIE2
-    State(SpriteEnum.SPOS, 13, 5, actions.x_scream, StateEnum.SPOS_XDIE3, 0, 0),
+    State(SpriteEnum.SPOS, 13, 5, "x_scream", StateEnum.SPOS_XDIE3, 0, 0),
     # S_SPOS_XDIE3
-    State(SpriteEnum.SPOS, 14, 5, actions.fall, StateEnum.SPOS_XDIE4, 0, 0),
+    State(SpriteEnum.SPOS, 14, 5, "fall", StateEnum.SPOS_XDIE4, 0, 0),
     # S_SPOS_XDIE4
     State(SpriteEnum.SPOS, 15, 5, None, StateEnum.SPOS_XDIE5, 0, 0),
     # S_SPOS_XDIE5
@@ -1769,53 +1777,53 @@ states = (
     # S_SPOS_RAISE5
     State(SpriteEnum.SPOS, 7, 5, None, StateEnum.SPOS_RUN1, 0, 0),
     # S_VILE_STND
-    State(SpriteEnum.VILE, 0, 10, actions.look, StateEnum.VILE_STND2, 0, 0),
+    State(SpriteEnum.VILE, 0, 10, "look", StateEnum.VILE_STND2, 0, 0),
     # S_VILE_STND2
-    State(SpriteEnum.VILE, 1, 10, actions.look, StateEnum.VILE_STND, 0, 0),
+    State(SpriteEnum.VILE, 1, 10, "look", StateEnum.VILE_STND, 0, 0),
     # S_VILE_RUN1
-    State(SpriteEnum.VILE, 0, 2, actions.vile_chase, StateEnum.VILE_RUN2, 0, 0),
+    State(SpriteEnum.VILE, 0, 2, "vile_chase", StateEnum.VILE_RUN2, 0, 0),
     # S_VILE_RUN2
-    State(SpriteEnum.VILE, 0, 2, actions.vile_chase, StateEnum.VILE_RUN3, 0, 0),
+    State(SpriteEnum.VILE, 0, 2, "vile_chase", StateEnum.VILE_RUN3, 0, 0),
     # S_VILE_RUN3
-    State(SpriteEnum.VILE, 1, 2, actions.vile_chase, StateEnum.VILE_RUN4, 0, 0),
+    State(SpriteEnum.VILE, 1, 2, "vile_chase", StateEnum.VILE_RUN4, 0, 0),
     # S_VILE_RUN4
-    State(SpriteEnum.VILE, 1, 2, actions.vile_chase, StateEnum.VILE_RUN5, 0, 0),
+    State(SpriteEnum.VILE, 1, 2, "vile_chase", StateEnum.VILE_RUN5, 0, 0),
     # S_VILE_RUN5
-    State(SpriteEnum.VILE, 2, 2, actions.vile_chase, StateEnum.VILE_RUN6, 0, 0),
+    State(SpriteEnum.VILE, 2, 2, "vile_chase", StateEnum.VILE_RUN6, 0, 0),
     # S_VILE_RUN6
-    State(SpriteEnum.VILE, 2, 2, actions.vile_chase, StateEnum.VILE_RUN7, 0, 0),
+    State(SpriteEnum.VILE, 2, 2, "vile_chase", StateEnum.VILE_RUN7, 0, 0),
     # S_VILE_RUN7
-    State(SpriteEnum.VILE, 3, 2, actions.vile_chase, StateEnum.VILE_RUN8, 0, 0),
+    State(SpriteEnum.VILE, 3, 2, "vile_chase", StateEnum.VILE_RUN8, 0, 0),
     # S_VILE_RUN8
-    State(SpriteEnum.VILE, 3, 2, actions.vile_chase, StateEnum.VILE_RUN9, 0, 0),
+    State(SpriteEnum.VILE, 3, 2, "vile_chase", StateEnum.VILE_RUN9, 0, 0),
     # S_VILE_RUN9
-    State(SpriteEnum.VILE, 4, 2, actions.vile_chase, StateEnum.VILE_RUN10, 0, 0),
+    State(SpriteEnum.VILE, 4, 2, "vile_chase", StateEnum.VILE_RUN10, 0, 0),
     # S_VILE_RUN10
-    State(SpriteEnum.VILE, 4, 2, actions.vile_chase, StateEnum.VILE_RUN11, 0, 0),
+    State(SpriteEnum.VILE, 4, 2, "vile_chase", StateEnum.VILE_RUN11, 0, 0),
     # S_VILE_RUN11
-    State(SpriteEnum.VILE, 5, 2, actions.vile_chase, StateEnum.VILE_RUN12, 0, 0),
+    State(SpriteEnum.VILE, 5, 2, "vile_chase", StateEnum.VILE_RUN12, 0, 0),
     # S_VILE_RUN12
-    State(SpriteEnum.VILE, 5, 2, actions.vile_chase, StateEnum.VILE_RUN1, 0, 0),
+    State(SpriteEnum.VILE, 5, 2, "vile_chase", StateEnum.VILE_RUN1, 0, 0),
     # S_VILE_ATK1
-    State(SpriteEnum.VILE, 32774, 0, actions.vile_start, StateEnum.VILE_ATK2, 0, 0),
+    State(SpriteEnum.VILE, 32774, 0, "vile_start", StateEnum.VILE_ATK2, 0, 0),
     # S_VILE_ATK2
-    State(SpriteEnum.VILE, 32774, 10, actions.face_target, StateEnum.VILE_ATK3, 0, 0),
+    State(SpriteEnum.VILE, 32774, 10, "face_target", StateEnum.VILE_ATK3, 0, 0),
     # S_VILE_ATK3
-    State(SpriteEnum.VILE, 32775, 8, actions.vile_target, StateEnum.VILE_ATK4, 0, 0),
+    State(SpriteEnum.VILE, 32775, 8, "vile_target", StateEnum.VILE_ATK4, 0, 0),
     # S_VILE_ATK4
-    State(SpriteEnum.VILE, 32776, 8, actions.face_target, StateEnum.VILE_ATK5, 0, 0),
+    State(SpriteEnum.VILE, 32776, 8, "face_target", StateEnum.VILE_ATK5, 0, 0),
     # S_VILE_ATK5
-    State(SpriteEnum.VILE, 32777, 8, actions.face_target, StateEnum.VILE_ATK6, 0, 0),
+    State(SpriteEnum.VILE, 32777, 8, "face_target", StateEnum.VILE_ATK6, 0, 0),
     # S_VILE_ATK6
-    State(SpriteEnum.VILE, 32778, 8, actions.face_target, StateEnum.VILE_ATK7, 0, 0),
+    State(SpriteEnum.VILE, 32778, 8, "face_target", StateEnum.VILE_ATK7, 0, 0),
     # S_VILE_ATK7
-    State(SpriteEnum.VILE, 32779, 8, actions.face_target, StateEnum.VILE_ATK8, 0, 0),
+    State(SpriteEnum.VILE, 32779, 8, "face_target", StateEnum.VILE_ATK8, 0, 0),
     # S_VILE_ATK8
-    State(SpriteEnum.VILE, 32780, 8, actions.face_target, StateEnum.VILE_ATK9, 0, 0),
+    State(SpriteEnum.VILE, 32780, 8, "face_target", StateEnum.VILE_ATK9, 0, 0),
     # S_VILE_ATK9
-    State(SpriteEnum.VILE, 32781, 8, actions.face_target, StateEnum.VILE_ATK10, 0, 0),
+    State(SpriteEnum.VILE, 32781, 8, "face_target", StateEnum.VILE_ATK10, 0, 0),
     # S_VILE_ATK10
-    State(SpriteEnum.VILE, 32782, 8, actions.vile_attack, StateEnum.VILE_ATK11, 0, 0),
+    State(SpriteEnum.VILE, 32782, 8, "vile_attack", StateEnum.VILE_ATK11, 0, 0),
     # S_VILE_ATK11
     State(SpriteEnum.VILE, 32783, 20, None, StateEnum.VILE_RUN1, 0, 0),
     # S_VILE_HEAL1
@@ -1827,13 +1835,13 @@ states = (
     # S_VILE_PAIN
     State(SpriteEnum.VILE, 16, 5, None, StateEnum.VILE_PAIN2, 0, 0),
     # S_VILE_PAIN2
-    State(SpriteEnum.VILE, 16, 5, actions.pain, StateEnum.VILE_RUN1, 0, 0),
+    State(SpriteEnum.VILE, 16, 5, "pain", StateEnum.VILE_RUN1, 0, 0),
     # S_VILE_DIE1
     State(SpriteEnum.VILE, 16, 7, None, StateEnum.VILE_DIE2, 0, 0),
     # S_VILE_DIE2
-    State(SpriteEnum.VILE, 17, 7, actions.scream, StateEnum.VILE_DIE3, 0, 0),
+    State(SpriteEnum.VILE, 17, 7, "scream", StateEnum.VILE_DIE3, 0, 0),
     # S_VILE_DIE3
-    State(SpriteEnum.VILE, 18, 7, actions.fall, StateEnum.VILE_DIE4, 0, 0),
+    State(SpriteEnum.VILE, 18, 7, "fall", StateEnum.VILE_DIE4, 0, 0),
     # S_VILE_DIE4
     State(SpriteEnum.VILE, 19, 7, None, StateEnum.VILE_DIE5, 0, 0),
     # S_VILE_DIE5
@@ -1849,65 +1857,65 @@ states = (
     # S_VILE_DIE10
     State(SpriteEnum.VILE, 25, -1, None, StateEnum.NULL, 0, 0),
     # S_FIRE1
-    State(SpriteEnum.FIRE, 32768, 2, actions.start_fire, StateEnum.FIRE2, 0, 0),
+    State(SpriteEnum.FIRE, 32768, 2, "start_fire", StateEnum.FIRE2, 0, 0),
     # S_FIRE2
-    State(SpriteEnum.FIRE, 32769, 2, actions.fire, StateEnum.FIRE3, 0, 0),
+    State(SpriteEnum.FIRE, 32769, 2, "fire", StateEnum.FIRE3, 0, 0),
     # S_FIRE3
-    State(SpriteEnum.FIRE, 32768, 2, actions.fire, StateEnum.FIRE4, 0, 0),
+    State(SpriteEnum.FIRE, 32768, 2, "fire", StateEnum.FIRE4, 0, 0),
     # S_FIRE4
-    State(SpriteEnum.FIRE, 32769, 2, actions.fire, StateEnum.FIRE5, 0, 0),
+    State(SpriteEnum.FIRE, 32769, 2, "fire", StateEnum.FIRE5, 0, 0),
     # S_FIRE5
-    State(SpriteEnum.FIRE, 32770, 2, actions.fire_crackle, StateEnum.FIRE6, 0, 0),
+    State(SpriteEnum.FIRE, 32770, 2, "fire_crackle", StateEnum.FIRE6, 0, 0),
     # S_FIRE6
-    State(SpriteEnum.FIRE, 32769, 2, actions.fire, StateEnum.FIRE7, 0, 0),
+    State(SpriteEnum.FIRE, 32769, 2, "fire", StateEnum.FIRE7, 0, 0),
     # S_FIRE7
-    State(SpriteEnum.FIRE, 32770, 2, actions.fire, StateEnum.FIRE8, 0, 0),
+    State(SpriteEnum.FIRE, 32770, 2, "fire", StateEnum.FIRE8, 0, 0),
     # S_FIRE8
-    State(SpriteEnum.FIRE, 32769, 2, actions.fire, StateEnum.FIRE9, 0, 0),
+    State(SpriteEnum.FIRE, 32769, 2, "fire", StateEnum.FIRE9, 0, 0),
     # S_FIRE9
-    State(SpriteEnum.FIRE, 32770, 2, actions.fire, StateEnum.FIRE10, 0, 0),
+    State(SpriteEnum.FIRE, 32770, 2, "fire", StateEnum.FIRE10, 0, 0),
     # S_FIRE10
-    State(SpriteEnum.FIRE, 32771, 2, actions.fire, StateEnum.FIRE11, 0, 0),
+    State(SpriteEnum.FIRE, 32771, 2, "fire", StateEnum.FIRE11, 0, 0),
     # S_FIRE11
-    State(SpriteEnum.FIRE, 32770, 2, actions.fire, StateEnum.FIRE12, 0, 0),
+    State(SpriteEnum.FIRE, 32770, 2, "fire", StateEnum.FIRE12, 0, 0),
     # S_FIRE12
-    State(SpriteEnum.FIRE, 32771, 2, actions.fire, StateEnum.FIRE13, 0, 0),
+    State(SpriteEnum.FIRE, 32771, 2, "fire", StateEnum.FIRE13, 0, 0),
     # S_FIRE13
-    State(SpriteEnum.FIRE, 32770, 2, actions.fire, StateEnum.FIRE14, 0, 0),
+    State(SpriteEnum.FIRE, 32770, 2, "fire", StateEnum.FIRE14, 0, 0),
     # S_FIRE14
-    State(SpriteEnum.FIRE, 32771, 2, actions.fire, StateEnum.FIRE15, 0, 0),
+    State(SpriteEnum.FIRE, 32771, 2, "fire", StateEnum.FIRE15, 0, 0),
     # S_FIRE15
-    State(SpriteEnum.FIRE, 32772, 2, actions.fire, StateEnum.FIRE16, 0, 0),
+    State(SpriteEnum.FIRE, 32772, 2, "fire", StateEnum.FIRE16, 0, 0),
     # S_FIRE16
-    State(SpriteEnum.FIRE, 32771, 2, actions.fire, StateEnum.FIRE17, 0, 0),
+    State(SpriteEnum.FIRE, 32771, 2, "fire", StateEnum.FIRE17, 0, 0),
     # S_FIRE17
-    State(SpriteEnum.FIRE, 32772, 2, actions.fire, StateEnum.FIRE18, 0, 0),
+    State(SpriteEnum.FIRE, 32772, 2, "fire", StateEnum.FIRE18, 0, 0),
     # S_FIRE18
-    State(SpriteEnum.FIRE, 32771, 2, actions.fire, StateEnum.FIRE19, 0, 0),
+    State(SpriteEnum.FIRE, 32771, 2, "fire", StateEnum.FIRE19, 0, 0),
     # S_FIRE19
-    State(SpriteEnum.FIRE, 32772, 2, actions.fire_crackle, StateEnum.FIRE20, 0, 0),
+    State(SpriteEnum.FIRE, 32772, 2, "fire_crackle", StateEnum.FIRE20, 0, 0),
     # S_FIRE20
-    State(SpriteEnum.FIRE, 32773, 2, actions.fire, StateEnum.FIRE21, 0, 0),
+    State(SpriteEnum.FIRE, 32773, 2, "fire", StateEnum.FIRE21, 0, 0),
     # S_FIRE21
-    State(SpriteEnum.FIRE, 32772, 2, actions.fire, StateEnum.FIRE22, 0, 0),
+    State(SpriteEnum.FIRE, 32772, 2, "fire", StateEnum.FIRE22, 0, 0),
     # S_FIRE22
-    State(SpriteEnum.FIRE, 32773, 2, actions.fire, StateEnum.FIRE23, 0, 0),
+    State(SpriteEnum.FIRE, 32773, 2, "fire", StateEnum.FIRE23, 0, 0),
     # S_FIRE23
-    State(SpriteEnum.FIRE, 32772, 2, actions.fire, StateEnum.FIRE24, 0, 0),
+    State(SpriteEnum.FIRE, 32772, 2, "fire", StateEnum.FIRE24, 0, 0),
     # S_FIRE24
-    State(SpriteEnum.FIRE, 32773, 2, actions.fire, StateEnum.FIRE25, 0, 0),
+    State(SpriteEnum.FIRE, 32773, 2, "fire", StateEnum.FIRE25, 0, 0),
     # S_FIRE25
-    State(SpriteEnum.FIRE, 32774, 2, actions.fire, StateEnum.FIRE26, 0, 0),
+    State(SpriteEnum.FIRE, 32774, 2, "fire", StateEnum.FIRE26, 0, 0),
     # S_FIRE26
-    State(SpriteEnum.FIRE, 32775, 2, actions.fire, StateEnum.FIRE27, 0, 0),
+    State(SpriteEnum.FIRE, 32775, 2, "fire", StateEnum.FIRE27, 0, 0),
     # S_FIRE27
-    State(SpriteEnum.FIRE, 32774, 2, actions.fire, StateEnum.FIRE28, 0, 0),
+    State(SpriteEnum.FIRE, 32774, 2, "fire", StateEnum.FIRE28, 0, 0),
     # S_FIRE28
-    State(SpriteEnum.FIRE, 32775, 2, actions.fire, StateEnum.FIRE29, 0, 0),
+    State(SpriteEnum.FIRE, 32775, 2, "fire", StateEnum.FIRE29, 0, 0),
     # S_FIRE29
-    State(SpriteEnum.FIRE, 32774, 2, actions.fire, StateEnum.FIRE30, 0, 0),
+    State(SpriteEnum.FIRE, 32774, 2, "fire", StateEnum.FIRE30, 0, 0),
     # S_FIRE30
-    State(SpriteEnum.FIRE, 32775, 2, actions.fire, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.FIRE, 32775, 2, "fire", StateEnum.NULL, 0, 0),
     # S_SMOKE1
     State(SpriteEnum.PUFF, 1, 4, None, StateEnum.SMOKE2, 0, 0),
     # S_SMOKE2
@@ -1919,9 +1927,9 @@ states = (
     # S_SMOKE5
     State(SpriteEnum.PUFF, 3, 4, None, StateEnum.NULL, 0, 0),
     # S_TRACER
-    State(SpriteEnum.FATB, 32768, 2, actions.tracer, StateEnum.TRACER2, 0, 0),
+    State(SpriteEnum.FATB, 32768, 2, "tracer", StateEnum.TRACER2, 0, 0),
     # S_TRACER2
-    State(SpriteEnum.FATB, 32769, 2, actions.tracer, StateEnum.TRACER, 0, 0),
+    State(SpriteEnum.FATB, 32769, 2, "tracer", StateEnum.TRACER, 0, 0),
     # S_TRACEEXP1
     State(SpriteEnum.FBXP, 32768, 8, None, StateEnum.TRACEEXP2, 0, 0),
     # S_TRACEEXP2
@@ -1929,61 +1937,61 @@ states = (
     # S_TRACEEXP3
     State(SpriteEnum.FBXP, 32770, 4, None, StateEnum.NULL, 0, 0),
     # S_SKEL_STND
-    State(SpriteEnum.SKEL, 0, 10, actions.look, StateEnum.SKEL_STND2, 0, 0),
+    State(SpriteEnum.SKEL, 0, 10, "look", StateEnum.SKEL_STND2, 0, 0),
     # S_SKEL_STND2
-    State(SpriteEnum.SKEL, 1, 10, actions.look, StateEnum.SKEL_STND, 0, 0),
+    State(SpriteEnum.SKEL, 1, 10, "look", StateEnum.SKEL_STND, 0, 0),
     # S_SKEL_RUN1
-    State(SpriteEnum.SKEL, 0, 2, actions.chase, StateEnum.SKEL_RUN2, 0, 0),
+    State(SpriteEnum.SKEL, 0, 2, "chase", StateEnum.SKEL_RUN2, 0, 0),
     # S_SKEL_RUN2
-    State(SpriteEnum.SKEL, 0, 2, actions.chase, StateEnum.SKEL_RUN3, 0, 0),
+    State(SpriteEnum.SKEL, 0, 2, "chase", StateEnum.SKEL_RUN3, 0, 0),
     # S_SKEL_RUN3
-    State(SpriteEnum.SKEL, 1, 2, actions.chase, StateEnum.SKEL_RUN4, 0, 0),
+    State(SpriteEnum.SKEL, 1, 2, "chase", StateEnum.SKEL_RUN4, 0, 0),
     # S_SKEL_RUN4
-    State(SpriteEnum.SKEL, 1, 2, actions.chase, StateEnum.SKEL_RUN5, 0, 0),
+    State(SpriteEnum.SKEL, 1, 2, "chase", StateEnum.SKEL_RUN5, 0, 0),
     # S_SKEL_RUN5
-    State(SpriteEnum.SKEL, 2, 2, actions.chase, StateEnum.SKEL_RUN6, 0, 0),
+    State(SpriteEnum.SKEL, 2, 2, "chase", StateEnum.SKEL_RUN6, 0, 0),
     # S_SKEL_RUN6
-    State(SpriteEnum.SKEL, 2, 2, actions.chase, StateEnum.SKEL_RUN7, 0, 0),
+    State(SpriteEnum.SKEL, 2, 2, "chase", StateEnum.SKEL_RUN7, 0, 0),
     # S_SKEL_RUN7
-    State(SpriteEnum.SKEL, 3, 2, actions.chase, StateEnum.SKEL_RUN8, 0, 0),
+    State(SpriteEnum.SKEL, 3, 2, "chase", StateEnum.SKEL_RUN8, 0, 0),
     # S_SKEL_RUN8
-    State(SpriteEnum.SKEL, 3, 2, actions.chase, StateEnum.SKEL_RUN9, 0, 0),
+    State(SpriteEnum.SKEL, 3, 2, "chase", StateEnum.SKEL_RUN9, 0, 0),
     # S_SKEL_RUN9
-    State(SpriteEnum.SKEL, 4, 2, actions.chase, StateEnum.SKEL_RUN10, 0, 0),
+    State(SpriteEnum.SKEL, 4, 2, "chase", StateEnum.SKEL_RUN10, 0, 0),
     # S_SKEL_RUN10
-    State(SpriteEnum.SKEL, 4, 2, actions.chase, StateEnum.SKEL_RUN11, 0, 0),
+    State(SpriteEnum.SKEL, 4, 2, "chase", StateEnum.SKEL_RUN11, 0, 0),
     # S_SKEL_RUN11
-    State(SpriteEnum.SKEL, 5, 2, actions.chase, StateEnum.SKEL_RUN12, 0, 0),
+    State(SpriteEnum.SKEL, 5, 2, "chase", StateEnum.SKEL_RUN12, 0, 0),
     # S_SKEL_RUN12
-    State(SpriteEnum.SKEL, 5, 2, actions.chase, StateEnum.SKEL_RUN1, 0, 0),
+    State(SpriteEnum.SKEL, 5, 2, "chase", StateEnum.SKEL_RUN1, 0, 0),
     # S_SKEL_FIST1
-    State(SpriteEnum.SKEL, 6, 0, actions.face_target, StateEnum.SKEL_FIST2, 0, 0),
+    State(SpriteEnum.SKEL, 6, 0, "face_target", StateEnum.SKEL_FIST2, 0, 0),
     # S_SKEL_FIST2
-    State(SpriteEnum.SKEL, 6, 6, actions.skel_whoosh, StateEnum.SKEL_FIST3, 0, 0),
+    State(SpriteEnum.SKEL, 6, 6, "skel_whoosh", StateEnum.SKEL_FIST3, 0, 0),
     # S_SKEL_FIST3
-    State(SpriteEnum.SKEL, 7, 6, actions.face_target, StateEnum.SKEL_FIST4, 0, 0),
+    State(SpriteEnum.SKEL, 7, 6, "face_target", StateEnum.SKEL_FIST4, 0, 0),
     # S_SKEL_FIST4
-    State(SpriteEnum.SKEL, 8, 6, actions.skel_fist, StateEnum.SKEL_RUN1, 0, 0),
+    State(SpriteEnum.SKEL, 8, 6, "skel_fist", StateEnum.SKEL_RUN1, 0, 0),
     # S_SKEL_MISS1
-    State(SpriteEnum.SKEL, 32777, 0, actions.face_target, StateEnum.SKEL_MISS2, 0, 0),
+    State(SpriteEnum.SKEL, 32777, 0, "face_target", StateEnum.SKEL_MISS2, 0, 0),
     # S_SKEL_MISS2
-    State(SpriteEnum.SKEL, 32777, 10, actions.face_target, StateEnum.SKEL_MISS3, 0, 0),
+    State(SpriteEnum.SKEL, 32777, 10, "face_target", StateEnum.SKEL_MISS3, 0, 0),
     # S_SKEL_MISS3
-    State(SpriteEnum.SKEL, 10, 10, actions.skel_missile, StateEnum.SKEL_MISS4, 0, 0),
+    State(SpriteEnum.SKEL, 10, 10, "skel_missile", StateEnum.SKEL_MISS4, 0, 0),
     # S_SKEL_MISS4
-    State(SpriteEnum.SKEL, 10, 10, actions.face_target, StateEnum.SKEL_RUN1, 0, 0),
+    State(SpriteEnum.SKEL, 10, 10, "face_target", StateEnum.SKEL_RUN1, 0, 0),
     # S_SKEL_PAIN
     State(SpriteEnum.SKEL, 11, 5, None, StateEnum.SKEL_PAIN2, 0, 0),
     # S_SKEL_PAIN2
-    State(SpriteEnum.SKEL, 11, 5, actions.pain, StateEnum.SKEL_RUN1, 0, 0),
+    State(SpriteEnum.SKEL, 11, 5, "pain", StateEnum.SKEL_RUN1, 0, 0),
     # S_SKEL_DIE1
     State(SpriteEnum.SKEL, 11, 7, None, StateEnum.SKEL_DIE2, 0, 0),
     # S_SKEL_DIE2
     State(SpriteEnum.SKEL, 12, 7, None, StateEnum.SKEL_DIE3, 0, 0),
     # S_SKEL_DIE3
-    State(SpriteEnum.SKEL, 13, 7, actions.scream, StateEnum.SKEL_DIE4, 0, 0),
+    State(SpriteEnum.SKEL, 13, 7, "scream", StateEnum.SKEL_DIE4, 0, 0),
     # S_SKEL_DIE4
-    State(SpriteEnum.SKEL, 14, 7, actions.fall, StateEnum.SKEL_DIE5, 0, 0),
+    State(SpriteEnum.SKEL, 14, 7, "fall", StateEnum.SKEL_DIE5, 0, 0),
     # S_SKEL_DIE5
     State(SpriteEnum.SKEL, 15, 7, None, StateEnum.SKEL_DIE6, 0, 0),
     # S_SKEL_DIE6
@@ -2011,63 +2019,63 @@ states = (
     # S_FATSHOTX3
     State(SpriteEnum.MISL, 32771, 4, None, StateEnum.NULL, 0, 0),
     # S_FATT_STND
-    State(SpriteEnum.FATT, 0, 15, actions.look, StateEnum.FATT_STND2, 0, 0),
+    State(SpriteEnum.FATT, 0, 15, "look", StateEnum.FATT_STND2, 0, 0),
     # S_FATT_STND2
-    State(SpriteEnum.FATT, 1, 15, actions.look, StateEnum.FATT_STND, 0, 0),
+    State(SpriteEnum.FATT, 1, 15, "look", StateEnum.FATT_STND, 0, 0),
     # S_FATT_RUN1
-    State(SpriteEnum.FATT, 0, 4, actions.chase, StateEnum.FATT_RUN2, 0, 0),
+    State(SpriteEnum.FATT, 0, 4, "chase", StateEnum.FATT_RUN2, 0, 0),
     # S_FATT_RUN2
-    State(SpriteEnum.FATT, 0, 4, actions.chase, StateEnum.FATT_RUN3, 0, 0),
+    State(SpriteEnum.FATT, 0, 4, "chase", StateEnum.FATT_RUN3, 0, 0),
     # S_FATT_RUN3
-    State(SpriteEnum.FATT, 1, 4, actions.chase, StateEnum.FATT_RUN4, 0, 0),
+    State(SpriteEnum.FATT, 1, 4, "chase", StateEnum.FATT_RUN4, 0, 0),
     # S_FATT_RUN4
-    State(SpriteEnum.FATT, 1, 4, actions.chase, StateEnum.FATT_RUN5, 0, 0),
+    State(SpriteEnum.FATT, 1, 4, "chase", StateEnum.FATT_RUN5, 0, 0),
     # S_FATT_RUN5
-    State(SpriteEnum.FATT, 2, 4, actions.chase, StateEnum.FATT_RUN6, 0, 0),
+    State(SpriteEnum.FATT, 2, 4, "chase", StateEnum.FATT_RUN6, 0, 0),
     # S_FATT_RUN6
-    State(SpriteEnum.FATT, 2, 4, actions.chase, StateEnum.FATT_RUN7, 0, 0),
+    State(SpriteEnum.FATT, 2, 4, "chase", StateEnum.FATT_RUN7, 0, 0),
     # S_FATT_RUN7
-    State(SpriteEnum.FATT, 3, 4, actions.chase, StateEnum.FATT_RUN8, 0, 0),
+    State(SpriteEnum.FATT, 3, 4, "chase", StateEnum.FATT_RUN8, 0, 0),
     # S_FATT_RUN8
-    State(SpriteEnum.FATT, 3, 4, actions.chase, StateEnum.FATT_RUN9, 0, 0),
+    State(SpriteEnum.FATT, 3, 4, "chase", StateEnum.FATT_RUN9, 0, 0),
     # S_FATT_RUN9
-    State(SpriteEnum.FATT, 4, 4, actions.chase, StateEnum.FATT_RUN10, 0, 0),
+    State(SpriteEnum.FATT, 4, 4, "chase", StateEnum.FATT_RUN10, 0, 0),
     # S_FATT_RUN10
-    State(SpriteEnum.FATT, 4, 4, actions.chase, StateEnum.FATT_RUN11, 0, 0),
+    State(SpriteEnum.FATT, 4, 4, "chase", StateEnum.FATT_RUN11, 0, 0),
     # S_FATT_RUN11
-    State(SpriteEnum.FATT, 5, 4, actions.chase, StateEnum.FATT_RUN12, 0, 0),
+    State(SpriteEnum.FATT, 5, 4, "chase", StateEnum.FATT_RUN12, 0, 0),
     # S_FATT_RUN12
-    State(SpriteEnum.FATT, 5, 4, actions.chase, StateEnum.FATT_RUN1, 0, 0),
+    State(SpriteEnum.FATT, 5, 4, "chase", StateEnum.FATT_RUN1, 0, 0),
     # S_FATT_ATK1
-    State(SpriteEnum.FATT, 6, 20, actions.fat_raise, StateEnum.FATT_ATK2, 0, 0),
+    State(SpriteEnum.FATT, 6, 20, "fat_raise", StateEnum.FATT_ATK2, 0, 0),
     # S_FATT_ATK2
-    State(SpriteEnum.FATT, 32775, 10, actions.fat_attack_1, StateEnum.FATT_ATK3, 0, 0),
+    State(SpriteEnum.FATT, 32775, 10, "fat_attack_1", StateEnum.FATT_ATK3, 0, 0),
     # S_FATT_ATK3
-    State(SpriteEnum.FATT, 8, 5, actions.face_target, StateEnum.FATT_ATK4, 0, 0),
+    State(SpriteEnum.FATT, 8, 5, "face_target", StateEnum.FATT_ATK4, 0, 0),
     # S_FATT_ATK4
-    State(SpriteEnum.FATT, 6, 5, actions.face_target, StateEnum.FATT_ATK5, 0, 0),
+    State(SpriteEnum.FATT, 6, 5, "face_target", StateEnum.FATT_ATK5, 0, 0),
     # S_FATT_ATK5
-    State(SpriteEnum.FATT, 32775, 10, actions.fat_attack_2, StateEnum.FATT_ATK6, 0, 0),
+    State(SpriteEnum.FATT, 32775, 10, "fat_attack_2", StateEnum.FATT_ATK6, 0, 0),
     # S_FATT_ATK6
-    State(SpriteEnum.FATT, 8, 5, actions.face_target, StateEnum.FATT_ATK7, 0, 0),
+    State(SpriteEnum.FATT, 8, 5, "face_target", StateEnum.FATT_ATK7, 0, 0),
     # S_FATT_ATK7
-    State(SpriteEnum.FATT, 6, 5, actions.face_target, StateEnum.FATT_ATK8, 0, 0),
+    State(SpriteEnum.FATT, 6, 5, "face_target", StateEnum.FATT_ATK8, 0, 0),
     # S_FATT_ATK8
-    State(SpriteEnum.FATT, 32775, 10, actions.fat_attack_3, StateEnum.FATT_ATK9, 0, 0),
+    State(SpriteEnum.FATT, 32775, 10, "fat_attack_3", StateEnum.FATT_ATK9, 0, 0),
     # S_FATT_ATK9
-    State(SpriteEnum.FATT, 8, 5, actions.face_target, StateEnum.FATT_ATK10, 0, 0),
+    State(SpriteEnum.FATT, 8, 5, "face_target", StateEnum.FATT_ATK10, 0, 0),
     # S_FATT_ATK10
-    State(SpriteEnum.FATT, 6, 5, actions.face_target, StateEnum.FATT_RUN1, 0, 0),
+    State(SpriteEnum.FATT, 6, 5, "face_target", StateEnum.FATT_RUN1, 0, 0),
     # S_FATT_PAIN
     State(SpriteEnum.FATT, 9, 3, None, StateEnum.FATT_PAIN2, 0, 0),
     # S_FATT_PAIN2
-    State(SpriteEnum.FATT, 9, 3, actions.pain, StateEnum.FATT_RUN1, 0, 0),
+    State(SpriteEnum.FATT, 9, 3, "pain", StateEnum.FATT_RUN1, 0, 0),
     # S_FATT_DIE1
     State(SpriteEnum.FATT, 10, 6, None, StateEnum.FATT_DIE2, 0, 0),
     # S_FATT_DIE2
-    State(SpriteEnum.FATT, 11, 6, actions.scream, StateEnum.FATT_DIE3, 0, 0),
+    State(SpriteEnum.FATT, 11, 6, "scream", StateEnum.FATT_DIE3, 0, 0),
     # S_FATT_DIE3
-    State(SpriteEnum.FATT, 12, 6, actions.fall, StateEnum.FATT_DIE4, 0, 0),
+    State(SpriteEnum.FATT, 12, 6, "fall", StateEnum.FATT_DIE4, 0, 0),
     # S_FATT_DIE4
     State(SpriteEnum.FATT, 13, 6, None, StateEnum.FATT_DIE5, 0, 0),
     # S_FATT_DIE5
@@ -2081,7 +2089,7 @@ states = (
     # S_FATT_DIE9
     State(SpriteEnum.FATT, 18, 6, None, StateEnum.FATT_DIE10, 0, 0),
     # S_FATT_DIE10
-    State(SpriteEnum.FATT, 19, -1, actions.boss_death, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.FATT, 19, -1, "boss_death", StateEnum.NULL, 0, 0),
     # S_FATT_RAISE1
     State(SpriteEnum.FATT, 17, 5, None, StateEnum.FATT_RAISE2, 0, 0),
     # S_FATT_RAISE2
@@ -2099,43 +2107,43 @@ states = (
     # S_FATT_RAISE8
     State(SpriteEnum.FATT, 10, 5, None, StateEnum.FATT_RUN1, 0, 0),
     # S_CPOS_STND
-    State(SpriteEnum.CPOS, 0, 10, actions.look, StateEnum.CPOS_STND2, 0, 0),
+    State(SpriteEnum.CPOS, 0, 10, "look", StateEnum.CPOS_STND2, 0, 0),
     # S_CPOS_STND2
-    State(SpriteEnum.CPOS, 1, 10, actions.look, StateEnum.CPOS_STND, 0, 0),
+    State(SpriteEnum.CPOS, 1, 10, "look", StateEnum.CPOS_STND, 0, 0),
     # S_CPOS_RUN1
-    State(SpriteEnum.CPOS, 0, 3, actions.chase, StateEnum.CPOS_RUN2, 0, 0),
+    State(SpriteEnum.CPOS, 0, 3, "chase", StateEnum.CPOS_RUN2, 0, 0),
     # S_CPOS_RUN2
-    State(SpriteEnum.CPOS, 0, 3, actions.chase, StateEnum.CPOS_RUN3, 0, 0),
+    State(SpriteEnum.CPOS, 0, 3, "chase", StateEnum.CPOS_RUN3, 0, 0),
     # S_CPOS_RUN3
-    State(SpriteEnum.CPOS, 1, 3, actions.chase, StateEnum.CPOS_RUN4, 0, 0),
+    State(SpriteEnum.CPOS, 1, 3, "chase", StateEnum.CPOS_RUN4, 0, 0),
     # S_CPOS_RUN4
-    State(SpriteEnum.CPOS, 1, 3, actions.chase, StateEnum.CPOS_RUN5, 0, 0),
+    State(SpriteEnum.CPOS, 1, 3, "chase", StateEnum.CPOS_RUN5, 0, 0),
     # S_CPOS_RUN5
-    State(SpriteEnum.CPOS, 2, 3, actions.chase, StateEnum.CPOS_RUN6, 0, 0),
+    State(SpriteEnum.CPOS, 2, 3, "chase", StateEnum.CPOS_RUN6, 0, 0),
     # S_CPOS_RUN6
-    State(SpriteEnum.CPOS, 2, 3, actions.chase, StateEnum.CPOS_RUN7, 0, 0),
+    State(SpriteEnum.CPOS, 2, 3, "chase", StateEnum.CPOS_RUN7, 0, 0),
     # S_CPOS_RUN7
-    State(SpriteEnum.CPOS, 3, 3, actions.chase, StateEnum.CPOS_RUN8, 0, 0),
+    State(SpriteEnum.CPOS, 3, 3, "chase", StateEnum.CPOS_RUN8, 0, 0),
     # S_CPOS_RUN8
-    State(SpriteEnum.CPOS, 3, 3, actions.chase, StateEnum.CPOS_RUN1, 0, 0),
+    State(SpriteEnum.CPOS, 3, 3, "chase", StateEnum.CPOS_RUN1, 0, 0),
     # S_CPOS_ATK1
-    State(SpriteEnum.CPOS, 4, 10, actions.face_target, StateEnum.CPOS_ATK2, 0, 0),
+    State(SpriteEnum.CPOS, 4, 10, "face_target", StateEnum.CPOS_ATK2, 0, 0),
     # S_CPOS_ATK2
-    State(SpriteEnum.CPOS, 32773, 4, actions.c_pos_attack, StateEnum.CPOS_ATK3, 0, 0),
+    State(SpriteEnum.CPOS, 32773, 4, "c_pos_attack", StateEnum.CPOS_ATK3, 0, 0),
     # S_CPOS_ATK3
-    State(SpriteEnum.CPOS, 32772, 4, actions.c_pos_attack, StateEnum.CPOS_ATK4, 0, 0),
+    State(SpriteEnum.CPOS, 32772, 4, "c_pos_attack", StateEnum.CPOS_ATK4, 0, 0),
     # S_CPOS_ATK4
-    State(SpriteEnum.CPOS, 5, 1, actions.c_pos_refire, StateEnum.CPOS_ATK2, 0, 0),
+    State(SpriteEnum.CPOS, 5, 1, "c_pos_refire", StateEnum.CPOS_ATK2, 0, 0),
     # S_CPOS_PAIN
     State(SpriteEnum.CPOS, 6, 3, None, StateEnum.CPOS_PAIN2, 0, 0),
     # S_CPOS_PAIN2
-    State(SpriteEnum.CPOS, 6, 3, actions.pain, StateEnum.CPOS_RUN1, 0, 0),
+    State(SpriteEnum.CPOS, 6, 3, "pain", StateEnum.CPOS_RUN1, 0, 0),
     # S_CPOS_DIE1
     State(SpriteEnum.CPOS, 7, 5, None, StateEnum.CPOS_DIE2, 0, 0),
     # S_CPOS_DIE2
-    State(SpriteEnum.CPOS, 8, 5, actions.scream, StateEnum.CPOS_DIE3, 0, 0),
+    State(SpriteEnum.CPOS, 8, 5, "scream", StateEnum.CPOS_DIE3, 0, 0),
     # S_CPOS_DIE3
-    State(SpriteEnum.CPOS, 9, 5, actions.fall, StateEnum.CPOS_DIE4, 0, 0),
+    State(SpriteEnum.CPOS, 9, 5, "fall", StateEnum.CPOS_DIE4, 0, 0),
     # S_CPOS_DIE4
     State(SpriteEnum.CPOS, 10, 5, None, StateEnum.CPOS_DIE5, 0, 0),
     # S_CPOS_DIE5
@@ -2147,9 +2155,9 @@ states = (
     # S_CPOS_XDIE1
     State(SpriteEnum.CPOS, 14, 5, None, StateEnum.CPOS_XDIE2, 0, 0),
     # S_CPOS_XDIE2
-    State(SpriteEnum.CPOS, 15, 5, actions.x_scream, StateEnum.CPOS_XDIE3, 0, 0),
+    State(SpriteEnum.CPOS, 15, 5, "x_scream", StateEnum.CPOS_XDIE3, 0, 0),
     # S_CPOS_XDIE3
-    State(SpriteEnum.CPOS, 16, 5, actions.fall, StateEnum.CPOS_XDIE4, 0, 0),
+    State(SpriteEnum.CPOS, 16, 5, "fall", StateEnum.CPOS_XDIE4, 0, 0),
     # S_CPOS_XDIE4
     State(SpriteEnum.CPOS, 17, 5, None, StateEnum.CPOS_XDIE5, 0, 0),
     # S_CPOS_XDIE5
@@ -2171,53 +2179,53 @@ states = (
     # S_CPOS_RAISE7
     State(SpriteEnum.CPOS, 7, 5, None, StateEnum.CPOS_RUN1, 0, 0),
     # S_TROO_STND
-    State(SpriteEnum.TROO, 0, 10, actions.look, StateEnum.TROO_STND2, 0, 0),
+    State(SpriteEnum.TROO, 0, 10, "look", StateEnum.TROO_STND2, 0, 0),
     # S_TROO_STND2
-    State(SpriteEnum.TROO, 1, 10, actions.look, StateEnum.TROO_STND, 0, 0),
+    State(SpriteEnum.TROO, 1, 10, "look", StateEnum.TROO_STND, 0, 0),
     # S_TROO_RUN1
-    State(SpriteEnum.TROO, 0, 3, actions.chase, StateEnum.TROO_RUN2, 0, 0),
+    State(SpriteEnum.TROO, 0, 3, "chase", StateEnum.TROO_RUN2, 0, 0),
     # S_TROO_RUN2
-    State(SpriteEnum.TROO, 0, 3, actions.chase, StateEnum.TROO_RUN3, 0, 0),
+    State(SpriteEnum.TROO, 0, 3, "chase", StateEnum.TROO_RUN3, 0, 0),
     # S_TROO_RUN3
-    State(SpriteEnum.TROO, 1, 3, actions.chase, StateEnum.TROO_RUN4, 0, 0),
+    State(SpriteEnum.TROO, 1, 3, "chase", StateEnum.TROO_RUN4, 0, 0),
     # S_TROO_RUN4
-    State(SpriteEnum.TROO, 1, 3, actions.chase, StateEnum.TROO_RUN5, 0, 0),
+    State(SpriteEnum.TROO, 1, 3, "chase", StateEnum.TROO_RUN5, 0, 0),
     # S_TROO_RUN5
-    State(SpriteEnum.TROO, 2, 3, actions.chase, StateEnum.TROO_RUN6, 0, 0),
+    State(SpriteEnum.TROO, 2, 3, "chase", StateEnum.TROO_RUN6, 0, 0),
     # S_TROO_RUN6
-    State(SpriteEnum.TROO, 2, 3, actions.chase, StateEnum.TROO_RUN7, 0, 0),
+    State(SpriteEnum.TROO, 2, 3, "chase", StateEnum.TROO_RUN7, 0, 0),
     # S_TROO_RUN7
-    State(SpriteEnum.TROO, 3, 3, actions.chase, StateEnum.TROO_RUN8, 0, 0),
+    State(SpriteEnum.TROO, 3, 3, "chase", StateEnum.TROO_RUN8, 0, 0),
     # S_TROO_RUN8
-    State(SpriteEnum.TROO, 3, 3, actions.chase, StateEnum.TROO_RUN1, 0, 0),
+    State(SpriteEnum.TROO, 3, 3, "chase", StateEnum.TROO_RUN1, 0, 0),
     # S_TROO_ATK1
-    State(SpriteEnum.TROO, 4, 8, actions.face_target, StateEnum.TROO_ATK2, 0, 0),
+    State(SpriteEnum.TROO, 4, 8, "face_target", StateEnum.TROO_ATK2, 0, 0),
     # S_TROO_ATK2
-    State(SpriteEnum.TROO, 5, 8, actions.face_target, StateEnum.TROO_ATK3, 0, 0),
+    State(SpriteEnum.TROO, 5, 8, "face_target", StateEnum.TROO_ATK3, 0, 0),
     # S_TROO_ATK3
-    State(SpriteEnum.TROO, 6, 6, actions.troop_attack, StateEnum.TROO_RUN1, 0, 0),
+    State(SpriteEnum.TROO, 6, 6, "troop_attack", StateEnum.TROO_RUN1, 0, 0),
     # S_TROO_PAIN
     State(SpriteEnum.TROO, 7, 2, None, StateEnum.TROO_PAIN2, 0, 0),
     # S_TROO_PAIN2
-    State(SpriteEnum.TROO, 7, 2, actions.pain, StateEnum.TROO_RUN1, 0, 0),
+    State(SpriteEnum.TROO, 7, 2, "pain", StateEnum.TROO_RUN1, 0, 0),
     # S_TROO_DIE1
     State(SpriteEnum.TROO, 8, 8, None, StateEnum.TROO_DIE2, 0, 0),
     # S_TROO_DIE2
-    State(SpriteEnum.TROO, 9, 8, actions.scream, StateEnum.TROO_DIE3, 0, 0),
+    State(SpriteEnum.TROO, 9, 8, "scream", StateEnum.TROO_DIE3, 0, 0),
     # S_TROO_DIE3
     State(SpriteEnum.TROO, 10, 6, None, StateEnum.TROO_DIE4, 0, 0),
     # S_TROO_DIE4
-    State(SpriteEnum.TROO, 11, 6, actions.fall, StateEnum.TROO_DIE5, 0, 0),
+    State(SpriteEnum.TROO, 11, 6, "fall", StateEnum.TROO_DIE5, 0, 0),
     # S_TROO_DIE5
     State(SpriteEnum.TROO, 12, -1, None, StateEnum.NULL, 0, 0),
     # S_TROO_XDIE1
     State(SpriteEnum.TROO, 13, 5, None, StateEnum.TROO_XDIE2, 0, 0),
     # S_TROO_XDIE2
-    State(SpriteEnum.TROO, 14, 5, actions.x_scream, StateEnum.TROO_XDIE3, 0, 0),
+    State(SpriteEnum.TROO, 14, 5, "x_scream", StateEnum.TROO_XDIE3, 0, 0),
     # S_TROO_XDIE3
     State(SpriteEnum.TROO, 15, 5, None, StateEnum.TROO_XDIE4, 0, 0),
     # S_TROO_XDIE4
-    State(SpriteEnum.TROO, 16, 5, actions.fall, StateEnum.TROO_XDIE5, 0, 0),
+    State(SpriteEnum.TROO, 16, 5, "fall", StateEnum.TROO_XDIE5, 0, 0),
     # S_TROO_XDIE5
     State(SpriteEnum.TROO, 17, 5, None, StateEnum.TROO_XDIE6, 0, 0),
     # S_TROO_XDIE6
@@ -2237,43 +2245,43 @@ states = (
     # S_TROO_RAISE5
     State(SpriteEnum.TROO, 8, 6, None, StateEnum.TROO_RUN1, 0, 0),
     # S_SARG_STND
-    State(SpriteEnum.SARG, 0, 10, actions.look, StateEnum.SARG_STND2, 0, 0),
+    State(SpriteEnum.SARG, 0, 10, "look", StateEnum.SARG_STND2, 0, 0),
     # S_SARG_STND2
-    State(SpriteEnum.SARG, 1, 10, actions.look, StateEnum.SARG_STND, 0, 0),
+    State(SpriteEnum.SARG, 1, 10, "look", StateEnum.SARG_STND, 0, 0),
     # S_SARG_RUN1
-    State(SpriteEnum.SARG, 0, 2, actions.chase, StateEnum.SARG_RUN2, 0, 0),
+    State(SpriteEnum.SARG, 0, 2, "chase", StateEnum.SARG_RUN2, 0, 0),
     # S_SARG_RUN2
-    State(SpriteEnum.SARG, 0, 2, actions.chase, StateEnum.SARG_RUN3, 0, 0),
+    State(SpriteEnum.SARG, 0, 2, "chase", StateEnum.SARG_RUN3, 0, 0),
     # S_SARG_RUN3
-    State(SpriteEnum.SARG, 1, 2, actions.chase, StateEnum.SARG_RUN4, 0, 0),
+    State(SpriteEnum.SARG, 1, 2, "chase", StateEnum.SARG_RUN4, 0, 0),
     # S_SARG_RUN4
-    State(SpriteEnum.SARG, 1, 2, actions.chase, StateEnum.SARG_RUN5, 0, 0),
+    State(SpriteEnum.SARG, 1, 2, "chase", StateEnum.SARG_RUN5, 0, 0),
     # S_SARG_RUN5
-    State(SpriteEnum.SARG, 2, 2, actions.chase, StateEnum.SARG_RUN6, 0, 0),
+    State(SpriteEnum.SARG, 2, 2, "chase", StateEnum.SARG_RUN6, 0, 0),
     # S_SARG_RUN6
-    State(SpriteEnum.SARG, 2, 2, actions.chase, StateEnum.SARG_RUN7, 0, 0),
+    State(SpriteEnum.SARG, 2, 2, "chase", StateEnum.SARG_RUN7, 0, 0),
     # S_SARG_RUN7
-    State(SpriteEnum.SARG, 3, 2, actions.chase, StateEnum.SARG_RUN8, 0, 0),
+    State(SpriteEnum.SARG, 3, 2, "chase", StateEnum.SARG_RUN8, 0, 0),
     # S_SARG_RUN8
-    State(SpriteEnum.SARG, 3, 2, actions.chase, StateEnum.SARG_RUN1, 0, 0),
+    State(SpriteEnum.SARG, 3, 2, "chase", StateEnum.SARG_RUN1, 0, 0),
     # S_SARG_ATK1
-    State(SpriteEnum.SARG, 4, 8, actions.face_target, StateEnum.SARG_ATK2, 0, 0),
+    State(SpriteEnum.SARG, 4, 8, "face_target", StateEnum.SARG_ATK2, 0, 0),
     # S_SARG_ATK2
-    State(SpriteEnum.SARG, 5, 8, actions.face_target, StateEnum.SARG_ATK3, 0, 0),
+    State(SpriteEnum.SARG, 5, 8, "face_target", StateEnum.SARG_ATK3, 0, 0),
     # S_SARG_ATK3
-    State(SpriteEnum.SARG, 6, 8, actions.sarg_attack, StateEnum.SARG_RUN1, 0, 0),
+    State(SpriteEnum.SARG, 6, 8, "sarg_attack", StateEnum.SARG_RUN1, 0, 0),
     # S_SARG_PAIN
     State(SpriteEnum.SARG, 7, 2, None, StateEnum.SARG_PAIN2, 0, 0),
     # S_SARG_PAIN2
-    State(SpriteEnum.SARG, 7, 2, actions.pain, StateEnum.SARG_RUN1, 0, 0),
+    State(SpriteEnum.SARG, 7, 2, "pain", StateEnum.SARG_RUN1, 0, 0),
     # S_SARG_DIE1
     State(SpriteEnum.SARG, 8, 8, None, StateEnum.SARG_DIE2, 0, 0),
     # S_SARG_DIE2
-    State(SpriteEnum.SARG, 9, 8, actions.scream, StateEnum.SARG_DIE3, 0, 0),
+    State(SpriteEnum.SARG, 9, 8, "scream", StateEnum.SARG_DIE3, 0, 0),
     # S_SARG_DIE3
     State(SpriteEnum.SARG, 10, 4, None, StateEnum.SARG_DIE4, 0, 0),
     # S_SARG_DIE4
-    State(SpriteEnum.SARG, 11, 4, actions.fall, StateEnum.SARG_DIE5, 0, 0),
+    State(SpriteEnum.SARG, 11, 4, "fall", StateEnum.SARG_DIE5, 0, 0),
     # S_SARG_DIE5
     State(SpriteEnum.SARG, 12, 4, None, StateEnum.SARG_DIE6, 0, 0),
     # S_SARG_DIE6
@@ -2291,31 +2299,31 @@ states = (
     # S_SARG_RAISE6
     State(SpriteEnum.SARG, 8, 5, None, StateEnum.SARG_RUN1, 0, 0),
     # S_HEAD_STND
-    State(SpriteEnum.HEAD, 0, 10, actions.look, StateEnum.HEAD_STND, 0, 0),
+    State(SpriteEnum.HEAD, 0, 10, "look", StateEnum.HEAD_STND, 0, 0),
     # S_HEAD_RUN1
-    State(SpriteEnum.HEAD, 0, 3, actions.chase, StateEnum.HEAD_RUN1, 0, 0),
+    State(SpriteEnum.HEAD, 0, 3, "chase", StateEnum.HEAD_RUN1, 0, 0),
     # S_HEAD_ATK1
-    State(SpriteEnum.HEAD, 1, 5, actions.face_target, StateEnum.HEAD_ATK2, 0, 0),
+    State(SpriteEnum.HEAD, 1, 5, "face_target", StateEnum.HEAD_ATK2, 0, 0),
     # S_HEAD_ATK2
-    State(SpriteEnum.HEAD, 2, 5, actions.face_target, StateEnum.HEAD_ATK3, 0, 0),
+    State(SpriteEnum.HEAD, 2, 5, "face_target", StateEnum.HEAD_ATK3, 0, 0),
     # S_HEAD_ATK3
-    State(SpriteEnum.HEAD, 32771, 5, actions.head_attack, StateEnum.HEAD_RUN1, 0, 0),
+    State(SpriteEnum.HEAD, 32771, 5, "head_attack", StateEnum.HEAD_RUN1, 0, 0),
     # S_HEAD_PAIN
     State(SpriteEnum.HEAD, 4, 3, None, StateEnum.HEAD_PAIN2, 0, 0),
     # S_HEAD_PAIN2
-    State(SpriteEnum.HEAD, 4, 3, actions.pain, StateEnum.HEAD_PAIN3, 0, 0),
+    State(SpriteEnum.HEAD, 4, 3, "pain", StateEnum.HEAD_PAIN3, 0, 0),
     # S_HEAD_PAIN3
     State(SpriteEnum.HEAD, 5, 6, None, StateEnum.HEAD_RUN1, 0, 0),
     # S_HEAD_DIE1
     State(SpriteEnum.HEAD, 6, 8, None, StateEnum.HEAD_DIE2, 0, 0),
     # S_HEAD_DIE2
-    State(SpriteEnum.HEAD, 7, 8, actions.scream, StateEnum.HEAD_DIE3, 0, 0),
+    State(SpriteEnum.HEAD, 7, 8, "scream", StateEnum.HEAD_DIE3, 0, 0),
     # S_HEAD_DIE3
     State(SpriteEnum.HEAD, 8, 8, None, StateEnum.HEAD_DIE4, 0, 0),
     # S_HEAD_DIE4
     State(SpriteEnum.HEAD, 9, 8, None, StateEnum.HEAD_DIE5, 0, 0),
     # S_HEAD_DIE5
-    State(SpriteEnum.HEAD, 10, 8, actions.fall, StateEnum.HEAD_DIE6, 0, 0),
+    State(SpriteEnum.HEAD, 10, 8, "fall", StateEnum.HEAD_DIE6, 0, 0),
     # S_HEAD_DIE6
     State(SpriteEnum.HEAD, 11, -1, None, StateEnum.NULL, 0, 0),
     # S_HEAD_RAISE1
@@ -2341,49 +2349,49 @@ states = (
     # S_BRBALLX3
     State(SpriteEnum.BAL7, 32772, 6, None, StateEnum.NULL, 0, 0),
     # S_BOSS_STND
-    State(SpriteEnum.BOSS, 0, 10, actions.look, StateEnum.BOSS_STND2, 0, 0),
+    State(SpriteEnum.BOSS, 0, 10, "look", StateEnum.BOSS_STND2, 0, 0),
     # S_BOSS_STND2
-    State(SpriteEnum.BOSS, 1, 10, actions.look, StateEnum.BOSS_STND, 0, 0),
+    State(SpriteEnum.BOSS, 1, 10, "look", StateEnum.BOSS_STND, 0, 0),
     # S_BOSS_RUN1
-    State(SpriteEnum.BOSS, 0, 3, actions.chase, StateEnum.BOSS_RUN2, 0, 0),
+    State(SpriteEnum.BOSS, 0, 3, "chase", StateEnum.BOSS_RUN2, 0, 0),
     # S_BOSS_RUN2
-    State(SpriteEnum.BOSS, 0, 3, actions.chase, StateEnum.BOSS_RUN3, 0, 0),
+    State(SpriteEnum.BOSS, 0, 3, "chase", StateEnum.BOSS_RUN3, 0, 0),
     # S_BOSS_RUN3
-    State(SpriteEnum.BOSS, 1, 3, actions.chase, StateEnum.BOSS_RUN4, 0, 0),
+    State(SpriteEnum.BOSS, 1, 3, "chase", StateEnum.BOSS_RUN4, 0, 0),
     # S_BOSS_RUN4
-    State(SpriteEnum.BOSS, 1, 3, actions.chase, StateEnum.BOSS_RUN5, 0, 0),
+    State(SpriteEnum.BOSS, 1, 3, "chase", StateEnum.BOSS_RUN5, 0, 0),
     # S_BOSS_RUN5
-    State(SpriteEnum.BOSS, 2, 3, actions.chase, StateEnum.BOSS_RUN6, 0, 0),
+    State(SpriteEnum.BOSS, 2, 3, "chase", StateEnum.BOSS_RUN6, 0, 0),
     # S_BOSS_RUN6
-    State(SpriteEnum.BOSS, 2, 3, actions.chase, StateEnum.BOSS_RUN7, 0, 0),
+    State(SpriteEnum.BOSS, 2, 3, "chase", StateEnum.BOSS_RUN7, 0, 0),
     # S_BOSS_RUN7
-    State(SpriteEnum.BOSS, 3, 3, actions.chase, StateEnum.BOSS_RUN8, 0, 0),
+    State(SpriteEnum.BOSS, 3, 3, "chase", StateEnum.BOSS_RUN8, 0, 0),
     # S_BOSS_RUN8
-    State(SpriteEnum.BOSS, 3, 3, actions.chase, StateEnum.BOSS_RUN1, 0, 0),
+    State(SpriteEnum.BOSS, 3, 3, "chase", StateEnum.BOSS_RUN1, 0, 0),
     # S_BOSS_ATK1
-    State(SpriteEnum.BOSS, 4, 8, actions.face_target, StateEnum.BOSS_ATK2, 0, 0),
+    State(SpriteEnum.BOSS, 4, 8, "face_target", StateEnum.BOSS_ATK2, 0, 0),
     # S_BOSS_ATK2
-    State(SpriteEnum.BOSS, 5, 8, actions.face_target, StateEnum.BOSS_ATK3, 0, 0),
+    State(SpriteEnum.BOSS, 5, 8, "face_target", StateEnum.BOSS_ATK3, 0, 0),
     # S_BOSS_ATK3
-    State(SpriteEnum.BOSS, 6, 8, actions.bruis_attack, StateEnum.BOSS_RUN1, 0, 0),
+    State(SpriteEnum.BOSS, 6, 8, "bruis_attack", StateEnum.BOSS_RUN1, 0, 0),
     # S_BOSS_PAIN
     State(SpriteEnum.BOSS, 7, 2, None, StateEnum.BOSS_PAIN2, 0, 0),
     # S_BOSS_PAIN2
-    State(SpriteEnum.BOSS, 7, 2, actions.pain, StateEnum.BOSS_RUN1, 0, 0),
+    State(SpriteEnum.BOSS, 7, 2, "pain", StateEnum.BOSS_RUN1, 0, 0),
     # S_BOSS_DIE1
     State(SpriteEnum.BOSS, 8, 8, None, StateEnum.BOSS_DIE2, 0, 0),
     # S_BOSS_DIE2
-    State(SpriteEnum.BOSS, 9, 8, actions.scream, StateEnum.BOSS_DIE3, 0, 0),
+    State(SpriteEnum.BOSS, 9, 8, "scream", StateEnum.BOSS_DIE3, 0, 0),
     # S_BOSS_DIE3
     State(SpriteEnum.BOSS, 10, 8, None, StateEnum.BOSS_DIE4, 0, 0),
     # S_BOSS_DIE4
-    State(SpriteEnum.BOSS, 11, 8, actions.fall, StateEnum.BOSS_DIE5, 0, 0),
+    State(SpriteEnum.BOSS, 11, 8, "fall", StateEnum.BOSS_DIE5, 0, 0),
     # S_BOSS_DIE5
     State(SpriteEnum.BOSS, 12, 8, None, StateEnum.BOSS_DIE6, 0, 0),
     # S_BOSS_DIE6
     State(SpriteEnum.BOSS, 13, 8, None, StateEnum.BOSS_DIE7, 0, 0),
     # S_BOSS_DIE7
-    State(SpriteEnum.BOSS, 14, -1, actions.boss_death, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.BOSS, 14, -1, "boss_death", StateEnum.NULL, 0, 0),
     # S_BOSS_RAISE1
     State(SpriteEnum.BOSS, 14, 8, None, StateEnum.BOSS_RAISE2, 0, 0),
     # S_BOSS_RAISE2
@@ -2399,43 +2407,43 @@ states = (
     # S_BOSS_RAISE7
     State(SpriteEnum.BOSS, 8, 8, None, StateEnum.BOSS_RUN1, 0, 0),
     # S_BOS2_STND
-    State(SpriteEnum.BOS2, 0, 10, actions.look, StateEnum.BOS2_STND2, 0, 0),
+    State(SpriteEnum.BOS2, 0, 10, "look", StateEnum.BOS2_STND2, 0, 0),
     # S_BOS2_STND2
-    State(SpriteEnum.BOS2, 1, 10, actions.look, StateEnum.BOS2_STND, 0, 0),
+    State(SpriteEnum.BOS2, 1, 10, "look", StateEnum.BOS2_STND, 0, 0),
     # S_BOS2_RUN1
-    State(SpriteEnum.BOS2, 0, 3, actions.chase, StateEnum.BOS2_RUN2, 0, 0),
+    State(SpriteEnum.BOS2, 0, 3, "chase", StateEnum.BOS2_RUN2, 0, 0),
     # S_BOS2_RUN2
-    State(SpriteEnum.BOS2, 0, 3, actions.chase, StateEnum.BOS2_RUN3, 0, 0),
+    State(SpriteEnum.BOS2, 0, 3, "chase", StateEnum.BOS2_RUN3, 0, 0),
     # S_BOS2_RUN3
-    State(SpriteEnum.BOS2, 1, 3, actions.chase, StateEnum.BOS2_RUN4, 0, 0),
+    State(SpriteEnum.BOS2, 1, 3, "chase", StateEnum.BOS2_RUN4, 0, 0),
     # S_BOS2_RUN4
-    State(SpriteEnum.BOS2, 1, 3, actions.chase, StateEnum.BOS2_RUN5, 0, 0),
+    State(SpriteEnum.BOS2, 1, 3, "chase", StateEnum.BOS2_RUN5, 0, 0),
     # S_BOS2_RUN5
-    State(SpriteEnum.BOS2, 2, 3, actions.chase, StateEnum.BOS2_RUN6, 0, 0),
+    State(SpriteEnum.BOS2, 2, 3, "chase", StateEnum.BOS2_RUN6, 0, 0),
     # S_BOS2_RUN6
-    State(SpriteEnum.BOS2, 2, 3, actions.chase, StateEnum.BOS2_RUN7, 0, 0),
+    State(SpriteEnum.BOS2, 2, 3, "chase", StateEnum.BOS2_RUN7, 0, 0),
     # S_BOS2_RUN7
-    State(SpriteEnum.BOS2, 3, 3, actions.chase, StateEnum.BOS2_RUN8, 0, 0),
+    State(SpriteEnum.BOS2, 3, 3, "chase", StateEnum.BOS2_RUN8, 0, 0),
     # S_BOS2_RUN8
-    State(SpriteEnum.BOS2, 3, 3, actions.chase, StateEnum.BOS2_RUN1, 0, 0),
+    State(SpriteEnum.BOS2, 3, 3, "chase", StateEnum.BOS2_RUN1, 0, 0),
     # S_BOS2_ATK1
-    State(SpriteEnum.BOS2, 4, 8, actions.face_target, StateEnum.BOS2_ATK2, 0, 0),
+    State(SpriteEnum.BOS2, 4, 8, "face_target", StateEnum.BOS2_ATK2, 0, 0),
     # S_BOS2_ATK2
-    State(SpriteEnum.BOS2, 5, 8, actions.face_target, StateEnum.BOS2_ATK3, 0, 0),
+    State(SpriteEnum.BOS2, 5, 8, "face_target", StateEnum.BOS2_ATK3, 0, 0),
     # S_BOS2_ATK3
-    State(SpriteEnum.BOS2, 6, 8, actions.bruis_attack, StateEnum.BOS2_RUN1, 0, 0),
+    State(SpriteEnum.BOS2, 6, 8, "bruis_attack", StateEnum.BOS2_RUN1, 0, 0),
     # S_BOS2_PAIN
     State(SpriteEnum.BOS2, 7, 2, None, StateEnum.BOS2_PAIN2, 0, 0),
     # S_BOS2_PAIN2
-    State(SpriteEnum.BOS2, 7, 2, actions.pain, StateEnum.BOS2_RUN1, 0, 0),
+    State(SpriteEnum.BOS2, 7, 2, "pain", StateEnum.BOS2_RUN1, 0, 0),
     # S_BOS2_DIE1
     State(SpriteEnum.BOS2, 8, 8, None, StateEnum.BOS2_DIE2, 0, 0),
     # S_BOS2_DIE2
-    State(SpriteEnum.BOS2, 9, 8, actions.scream, StateEnum.BOS2_DIE3, 0, 0),
+    State(SpriteEnum.BOS2, 9, 8, "scream", StateEnum.BOS2_DIE3, 0, 0),
     # S_BOS2_DIE3
     State(SpriteEnum.BOS2, 10, 8, None, StateEnum.BOS2_DIE4, 0, 0),
     # S_BOS2_DIE4
-    State(SpriteEnum.BOS2, 11, 8, actions.fall, StateEnum.BOS2_DIE5, 0, 0),
+    State(SpriteEnum.BOS2, 11, 8, "fall", StateEnum.BOS2_DIE5, 0, 0),
     # S_BOS2_DIE5
     State(SpriteEnum.BOS2, 12, 8, None, StateEnum.BOS2_DIE6, 0, 0),
     # S_BOS2_DIE6
@@ -2457,17 +2465,17 @@ states = (
     # S_BOS2_RAISE7
     State(SpriteEnum.BOS2, 8, 8, None, StateEnum.BOS2_RUN1, 0, 0),
     # S_SKULL_STND
-    State(SpriteEnum.SKUL, 32768, 10, actions.look, StateEnum.SKULL_STND2, 0, 0),
+    State(SpriteEnum.SKUL, 32768, 10, "look", StateEnum.SKULL_STND2, 0, 0),
     # S_SKULL_STND2
-    State(SpriteEnum.SKUL, 32769, 10, actions.look, StateEnum.SKULL_STND, 0, 0),
+    State(SpriteEnum.SKUL, 32769, 10, "look", StateEnum.SKULL_STND, 0, 0),
     # S_SKULL_RUN1
-    State(SpriteEnum.SKUL, 32768, 6, actions.chase, StateEnum.SKULL_RUN2, 0, 0),
+    State(SpriteEnum.SKUL, 32768, 6, "chase", StateEnum.SKULL_RUN2, 0, 0),
     # S_SKULL_RUN2
-    State(SpriteEnum.SKUL, 32769, 6, actions.chase, StateEnum.SKULL_RUN1, 0, 0),
+    State(SpriteEnum.SKUL, 32769, 6, "chase", StateEnum.SKULL_RUN1, 0, 0),
     # S_SKULL_ATK1
-    State(SpriteEnum.SKUL, 32770, 10, actions.face_target, StateEnum.SKULL_ATK2, 0, 0),
+    State(SpriteEnum.SKUL, 32770, 10, "face_target", StateEnum.SKULL_ATK2, 0, 0),
     # S_SKULL_ATK2
-    State(SpriteEnum.SKUL, 32771, 4, actions.skull_attack, StateEnum.SKULL_ATK3, 0, 0),
+    State(SpriteEnum.SKUL, 32771, 4, "skull_attack", StateEnum.SKULL_ATK3, 0, 0),
     # S_SKULL_ATK3
     State(SpriteEnum.SKUL, 32770, 4, None, StateEnum.SKULL_ATK4, 0, 0),
     # S_SKULL_ATK4
@@ -2475,63 +2483,63 @@ states = (
     # S_SKULL_PAIN
     State(SpriteEnum.SKUL, 32772, 3, None, StateEnum.SKULL_PAIN2, 0, 0),
     # S_SKULL_PAIN2
-    State(SpriteEnum.SKUL, 32772, 3, actions.pain, StateEnum.SKULL_RUN1, 0, 0),
+    State(SpriteEnum.SKUL, 32772, 3, "pain", StateEnum.SKULL_RUN1, 0, 0),
     # S_SKULL_DIE1
     State(SpriteEnum.SKUL, 32773, 6, None, StateEnum.SKULL_DIE2, 0, 0),
     # S_SKULL_DIE2
-    State(SpriteEnum.SKUL, 32774, 6, actions.scream, StateEnum.SKULL_DIE3, 0, 0),
+    State(SpriteEnum.SKUL, 32774, 6, "scream", StateEnum.SKULL_DIE3, 0, 0),
     # S_SKULL_DIE3
     State(SpriteEnum.SKUL, 32775, 6, None, StateEnum.SKULL_DIE4, 0, 0),
     # S_SKULL_DIE4
-    State(SpriteEnum.SKUL, 32776, 6, actions.fall, StateEnum.SKULL_DIE5, 0, 0),
+    State(SpriteEnum.SKUL, 32776, 6, "fall", StateEnum.SKULL_DIE5, 0, 0),
     # S_SKULL_DIE5
     State(SpriteEnum.SKUL, 9, 6, None, StateEnum.SKULL_DIE6, 0, 0),
     # S_SKULL_DIE6
     State(SpriteEnum.SKUL, 10, 6, None, StateEnum.NULL, 0, 0),
     # S_SPID_STND
-    State(SpriteEnum.SPID, 0, 10, actions.look, StateEnum.SPID_STND2, 0, 0),
+    State(SpriteEnum.SPID, 0, 10, "look", StateEnum.SPID_STND2, 0, 0),
     # S_SPID_STND2
-    State(SpriteEnum.SPID, 1, 10, actions.look, StateEnum.SPID_STND, 0, 0),
+    State(SpriteEnum.SPID, 1, 10, "look", StateEnum.SPID_STND, 0, 0),
     # S_SPID_RUN1
-    State(SpriteEnum.SPID, 0, 3, actions.metal, StateEnum.SPID_RUN2, 0, 0),
+    State(SpriteEnum.SPID, 0, 3, "metal", StateEnum.SPID_RUN2, 0, 0),
     # S_SPID_RUN2
-    State(SpriteEnum.SPID, 0, 3, actions.chase, StateEnum.SPID_RUN3, 0, 0),
+    State(SpriteEnum.SPID, 0, 3, "chase", StateEnum.SPID_RUN3, 0, 0),
     # S_SPID_RUN3
-    State(SpriteEnum.SPID, 1, 3, actions.chase, StateEnum.SPID_RUN4, 0, 0),
+    State(SpriteEnum.SPID, 1, 3, "chase", StateEnum.SPID_RUN4, 0, 0),
     # S_SPID_RUN4
-    State(SpriteEnum.SPID, 1, 3, actions.chase, StateEnum.SPID_RUN5, 0, 0),
+    State(SpriteEnum.SPID, 1, 3, "chase", StateEnum.SPID_RUN5, 0, 0),
     # S_SPID_RUN5
-    State(SpriteEnum.SPID, 2, 3, actions.metal, StateEnum.SPID_RUN6, 0, 0),
+    State(SpriteEnum.SPID, 2, 3, "metal", StateEnum.SPID_RUN6, 0, 0),
     # S_SPID_RUN6
-    State(SpriteEnum.SPID, 2, 3, actions.chase, StateEnum.SPID_RUN7, 0, 0),
+    State(SpriteEnum.SPID, 2, 3, "chase", StateEnum.SPID_RUN7, 0, 0),
     # S_SPID_RUN7
-    State(SpriteEnum.SPID, 3, 3, actions.chase, StateEnum.SPID_RUN8, 0, 0),
+    State(SpriteEnum.SPID, 3, 3, "chase", StateEnum.SPID_RUN8, 0, 0),
     # S_SPID_RUN8
-    State(SpriteEnum.SPID, 3, 3, actions.chase, StateEnum.SPID_RUN9, 0, 0),
+    State(SpriteEnum.SPID, 3, 3, "chase", StateEnum.SPID_RUN9, 0, 0),
     # S_SPID_RUN9
-    State(SpriteEnum.SPID, 4, 3, actions.metal, StateEnum.SPID_RUN10, 0, 0),
+    State(SpriteEnum.SPID, 4, 3, "metal", StateEnum.SPID_RUN10, 0, 0),
     # S_SPID_RUN10
-    State(SpriteEnum.SPID, 4, 3, actions.chase, StateEnum.SPID_RUN11, 0, 0),
+    State(SpriteEnum.SPID, 4, 3, "chase", StateEnum.SPID_RUN11, 0, 0),
     # S_SPID_RUN11
-    State(SpriteEnum.SPID, 5, 3, actions.chase, StateEnum.SPID_RUN12, 0, 0),
+    State(SpriteEnum.SPID, 5, 3, "chase", StateEnum.SPID_RUN12, 0, 0),
     # S_SPID_RUN12
-    State(SpriteEnum.SPID, 5, 3, actions.chase, StateEnum.SPID_RUN1, 0, 0),
+    State(SpriteEnum.SPID, 5, 3, "chase", StateEnum.SPID_RUN1, 0, 0),
     # S_SPID_ATK1
-    State(SpriteEnum.SPID, 32768, 20, actions.face_target, StateEnum.SPID_ATK2, 0, 0),
+    State(SpriteEnum.SPID, 32768, 20, "face_target", StateEnum.SPID_ATK2, 0, 0),
     # S_SPID_ATK2
-    State(SpriteEnum.SPID, 32774, 4, actions.s_pos_attack, StateEnum.SPID_ATK3, 0, 0),
+    State(SpriteEnum.SPID, 32774, 4, "s_pos_attack", StateEnum.SPID_ATK3, 0, 0),
     # S_SPID_ATK3
-    State(SpriteEnum.SPID, 32775, 4, actions.s_pos_attack, StateEnum.SPID_ATK4, 0, 0),
+    State(SpriteEnum.SPID, 32775, 4, "s_pos_attack", StateEnum.SPID_ATK4, 0, 0),
     # S_SPID_ATK4
-    State(SpriteEnum.SPID, 32775, 1, actions.spid_refire, StateEnum.SPID_ATK2, 0, 0),
+    State(SpriteEnum.SPID, 32775, 1, "spid_refire", StateEnum.SPID_ATK2, 0, 0),
     # S_SPID_PAIN
     State(SpriteEnum.SPID, 8, 3, None, StateEnum.SPID_PAIN2, 0, 0),
     # S_SPID_PAIN2
-    State(SpriteEnum.SPID, 8, 3, actions.pain, StateEnum.SPID_RUN1, 0, 0),
+    State(SpriteEnum.SPID, 8, 3, "pain", StateEnum.SPID_RUN1, 0, 0),
     # S_SPID_DIE1
-    State(SpriteEnum.SPID, 9, 20, actions.scream, StateEnum.SPID_DIE2, 0, 0),
+    State(SpriteEnum.SPID, 9, 20, "scream", StateEnum.SPID_DIE2, 0, 0),
     # S_SPID_DIE2
-    State(SpriteEnum.SPID, 10, 10, actions.fall, StateEnum.SPID_DIE3, 0, 0),
+    State(SpriteEnum.SPID, 10, 10, "fall", StateEnum.SPID_DIE3, 0, 0),
     # S_SPID_DIE3
     State(SpriteEnum.SPID, 11, 10, None, StateEnum.SPID_DIE4, 0, 0),
     # S_SPID_DIE4
@@ -2549,53 +2557,53 @@ states = (
     # S_SPID_DIE10
     State(SpriteEnum.SPID, 18, 30, None, StateEnum.SPID_DIE11, 0, 0),
     # S_SPID_DIE11
-    State(SpriteEnum.SPID, 18, -1, actions.boss_death, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.SPID, 18, -1, "boss_death", StateEnum.NULL, 0, 0),
     # S_BSPI_STND
-    State(SpriteEnum.BSPI, 0, 10, actions.look, StateEnum.BSPI_STND2, 0, 0),
+    State(SpriteEnum.BSPI, 0, 10, "look", StateEnum.BSPI_STND2, 0, 0),
     # S_BSPI_STND2
-    State(SpriteEnum.BSPI, 1, 10, actions.look, StateEnum.BSPI_STND, 0, 0),
+    State(SpriteEnum.BSPI, 1, 10, "look", StateEnum.BSPI_STND, 0, 0),
     # S_BSPI_SIGHT
     State(SpriteEnum.BSPI, 0, 20, None, StateEnum.BSPI_RUN1, 0, 0),
     # S_BSPI_RUN1
-    State(SpriteEnum.BSPI, 0, 3, actions.baby_metal, StateEnum.BSPI_RUN2, 0, 0),
+    State(SpriteEnum.BSPI, 0, 3, "baby_metal", StateEnum.BSPI_RUN2, 0, 0),
     # S_BSPI_RUN2
-    State(SpriteEnum.BSPI, 0, 3, actions.chase, StateEnum.BSPI_RUN3, 0, 0),
+    State(SpriteEnum.BSPI, 0, 3, "chase", StateEnum.BSPI_RUN3, 0, 0),
     # S_BSPI_RUN3
-    State(SpriteEnum.BSPI, 1, 3, actions.chase, StateEnum.BSPI_RUN4, 0, 0),
+    State(SpriteEnum.BSPI, 1, 3, "chase", StateEnum.BSPI_RUN4, 0, 0),
     # S_BSPI_RUN4
-    State(SpriteEnum.BSPI, 1, 3, actions.chase, StateEnum.BSPI_RUN5, 0, 0),
+    State(SpriteEnum.BSPI, 1, 3, "chase", StateEnum.BSPI_RUN5, 0, 0),
     # S_BSPI_RUN5
-    State(SpriteEnum.BSPI, 2, 3, actions.chase, StateEnum.BSPI_RUN6, 0, 0),
+    State(SpriteEnum.BSPI, 2, 3, "chase", StateEnum.BSPI_RUN6, 0, 0),
     # S_BSPI_RUN6
-    State(SpriteEnum.BSPI, 2, 3, actions.chase, StateEnum.BSPI_RUN7, 0, 0),
+    State(SpriteEnum.BSPI, 2, 3, "chase", StateEnum.BSPI_RUN7, 0, 0),
     # S_BSPI_RUN7
-    State(SpriteEnum.BSPI, 3, 3, actions.baby_metal, StateEnum.BSPI_RUN8, 0, 0),
+    State(SpriteEnum.BSPI, 3, 3, "baby_metal", StateEnum.BSPI_RUN8, 0, 0),
     # S_BSPI_RUN8
-    State(SpriteEnum.BSPI, 3, 3, actions.chase, StateEnum.BSPI_RUN9, 0, 0),
+    State(SpriteEnum.BSPI, 3, 3, "chase", StateEnum.BSPI_RUN9, 0, 0),
     # S_BSPI_RUN9
-    State(SpriteEnum.BSPI, 4, 3, actions.chase, StateEnum.BSPI_RUN10, 0, 0),
+    State(SpriteEnum.BSPI, 4, 3, "chase", StateEnum.BSPI_RUN10, 0, 0),
     # S_BSPI_RUN10
-    State(SpriteEnum.BSPI, 4, 3, actions.chase, StateEnum.BSPI_RUN11, 0, 0),
+    State(SpriteEnum.BSPI, 4, 3, "chase", StateEnum.BSPI_RUN11, 0, 0),
     # S_BSPI_RUN11
-    State(SpriteEnum.BSPI, 5, 3, actions.chase, StateEnum.BSPI_RUN12, 0, 0),
+    State(SpriteEnum.BSPI, 5, 3, "chase", StateEnum.BSPI_RUN12, 0, 0),
     # S_BSPI_RUN12
-    State(SpriteEnum.BSPI, 5, 3, actions.chase, StateEnum.BSPI_RUN1, 0, 0),
+    State(SpriteEnum.BSPI, 5, 3, "chase", StateEnum.BSPI_RUN1, 0, 0),
     # S_BSPI_ATK1
-    State(SpriteEnum.BSPI, 32768, 20, actions.face_target, StateEnum.BSPI_ATK2, 0, 0),
+    State(SpriteEnum.BSPI, 32768, 20, "face_target", StateEnum.BSPI_ATK2, 0, 0),
     # S_BSPI_ATK2
-    State(SpriteEnum.BSPI, 32774, 4, actions.bspi_attack, StateEnum.BSPI_ATK3, 0, 0),
+    State(SpriteEnum.BSPI, 32774, 4, "bspi_attack", StateEnum.BSPI_ATK3, 0, 0),
     # S_BSPI_ATK3
     State(SpriteEnum.BSPI, 32775, 4, None, StateEnum.BSPI_ATK4, 0, 0),
     # S_BSPI_ATK4
-    State(SpriteEnum.BSPI, 32775, 1, actions.spid_refire, StateEnum.BSPI_ATK2, 0, 0),
+    State(SpriteEnum.BSPI, 32775, 1, "spid_refire", StateEnum.BSPI_ATK2, 0, 0),
     # S_BSPI_PAIN
     State(SpriteEnum.BSPI, 8, 3, None, StateEnum.BSPI_PAIN2, 0, 0),
     # S_BSPI_PAIN2
-    State(SpriteEnum.BSPI, 8, 3, actions.pain, StateEnum.BSPI_RUN1, 0, 0),
+    State(SpriteEnum.BSPI, 8, 3, "pain", StateEnum.BSPI_RUN1, 0, 0),
     # S_BSPI_DIE1
-    State(SpriteEnum.BSPI, 9, 20, actions.scream, StateEnum.BSPI_DIE2, 0, 0),
+    State(SpriteEnum.BSPI, 9, 20, "scream", StateEnum.BSPI_DIE2, 0, 0),
     # S_BSPI_DIE2
-    State(SpriteEnum.BSPI, 10, 7, actions.fall, StateEnum.BSPI_DIE3, 0, 0),
+    State(SpriteEnum.BSPI, 10, 7, "fall", StateEnum.BSPI_DIE3, 0, 0),
     # S_BSPI_DIE3
     State(SpriteEnum.BSPI, 11, 7, None, StateEnum.BSPI_DIE4, 0, 0),
     # S_BSPI_DIE4
@@ -2605,7 +2613,7 @@ states = (
     # S_BSPI_DIE6
     State(SpriteEnum.BSPI, 14, 7, None, StateEnum.BSPI_DIE7, 0, 0),
     # S_BSPI_DIE7
-    State(SpriteEnum.BSPI, 15, -1, actions.boss_death, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.BSPI, 15, -1, "boss_death", StateEnum.NULL, 0, 0),
     # S_BSPI_RAISE1
     State(SpriteEnum.BSPI, 15, 5, None, StateEnum.BSPI_RAISE2, 0, 0),
     # S_BSPI_RAISE2
@@ -2635,43 +2643,43 @@ states = (
     # S_ARACH_PLEX5
     State(SpriteEnum.APBX, 32772, 5, None, StateEnum.NULL, 0, 0),
     # S_CYBER_STND
-    State(SpriteEnum.CYBR, 0, 10, actions.look, StateEnum.CYBER_STND2, 0, 0),
+    State(SpriteEnum.CYBR, 0, 10, "look", StateEnum.CYBER_STND2, 0, 0),
     # S_CYBER_STND2
-    State(SpriteEnum.CYBR, 1, 10, actions.look, StateEnum.CYBER_STND, 0, 0),
+    State(SpriteEnum.CYBR, 1, 10, "look", StateEnum.CYBER_STND, 0, 0),
     # S_CYBER_RUN1
-    State(SpriteEnum.CYBR, 0, 3, actions.hoof, StateEnum.CYBER_RUN2, 0, 0),
+    State(SpriteEnum.CYBR, 0, 3, "hoof", StateEnum.CYBER_RUN2, 0, 0),
     # S_CYBER_RUN2
-    State(SpriteEnum.CYBR, 0, 3, actions.chase, StateEnum.CYBER_RUN3, 0, 0),
+    State(SpriteEnum.CYBR, 0, 3, "chase", StateEnum.CYBER_RUN3, 0, 0),
     # S_CYBER_RUN3
-    State(SpriteEnum.CYBR, 1, 3, actions.chase, StateEnum.CYBER_RUN4, 0, 0),
+    State(SpriteEnum.CYBR, 1, 3, "chase", StateEnum.CYBER_RUN4, 0, 0),
     # S_CYBER_RUN4
-    State(SpriteEnum.CYBR, 1, 3, actions.chase, StateEnum.CYBER_RUN5, 0, 0),
+    State(SpriteEnum.CYBR, 1, 3, "chase", StateEnum.CYBER_RUN5, 0, 0),
     # S_CYBER_RUN5
-    State(SpriteEnum.CYBR, 2, 3, actions.chase, StateEnum.CYBER_RUN6, 0, 0),
+    State(SpriteEnum.CYBR, 2, 3, "chase", StateEnum.CYBER_RUN6, 0, 0),
     # S_CYBER_RUN6
-    State(SpriteEnum.CYBR, 2, 3, actions.chase, StateEnum.CYBER_RUN7, 0, 0),
+    State(SpriteEnum.CYBR, 2, 3, "chase", StateEnum.CYBER_RUN7, 0, 0),
     # S_CYBER_RUN7
-    State(SpriteEnum.CYBR, 3, 3, actions.metal, StateEnum.CYBER_RUN8, 0, 0),
+    State(SpriteEnum.CYBR, 3, 3, "metal", StateEnum.CYBER_RUN8, 0, 0),
     # S_CYBER_RUN8
-    State(SpriteEnum.CYBR, 3, 3, actions.chase, StateEnum.CYBER_RUN1, 0, 0),
+    State(SpriteEnum.CYBR, 3, 3, "chase", StateEnum.CYBER_RUN1, 0, 0),
     # S_CYBER_ATK1
-    State(SpriteEnum.CYBR, 4, 6, actions.face_target, StateEnum.CYBER_ATK2, 0, 0),
+    State(SpriteEnum.CYBR, 4, 6, "face_target", StateEnum.CYBER_ATK2, 0, 0),
     # S_CYBER_ATK2
-    State(SpriteEnum.CYBR, 5, 12, actions.cyber_attack, StateEnum.CYBER_ATK3, 0, 0),
+    State(SpriteEnum.CYBR, 5, 12, "cyber_attack", StateEnum.CYBER_ATK3, 0, 0),
     # S_CYBER_ATK3
-    State(SpriteEnum.CYBR, 4, 12, actions.face_target, StateEnum.CYBER_ATK4, 0, 0),
+    State(SpriteEnum.CYBR, 4, 12, "face_target", StateEnum.CYBER_ATK4, 0, 0),
     # S_CYBER_ATK4
-    State(SpriteEnum.CYBR, 5, 12, actions.cyber_attack, StateEnum.CYBER_ATK5, 0, 0),
+    State(SpriteEnum.CYBR, 5, 12, "cyber_attack", StateEnum.CYBER_ATK5, 0, 0),
     # S_CYBER_ATK5
-    State(SpriteEnum.CYBR, 4, 12, actions.face_target, StateEnum.CYBER_ATK6, 0, 0),
+    State(SpriteEnum.CYBR, 4, 12, "face_target", StateEnum.CYBER_ATK6, 0, 0),
     # S_CYBER_ATK6
-    State(SpriteEnum.CYBR, 5, 12, actions.cyber_attack, StateEnum.CYBER_RUN1, 0, 0),
+    State(SpriteEnum.CYBR, 5, 12, "cyber_attack", StateEnum.CYBER_RUN1, 0, 0),
     # S_CYBER_PAIN
-    State(SpriteEnum.CYBR, 6, 10, actions.pain, StateEnum.CYBER_RUN1, 0, 0),
+    State(SpriteEnum.CYBR, 6, 10, "pain", StateEnum.CYBER_RUN1, 0, 0),
     # S_CYBER_DIE1
     State(SpriteEnum.CYBR, 7, 10, None, StateEnum.CYBER_DIE2, 0, 0),
     # S_CYBER_DIE2
-    State(SpriteEnum.CYBR, 8, 10, actions.scream, StateEnum.CYBER_DIE3, 0, 0),
+    State(SpriteEnum.CYBR, 8, 10, "scream", StateEnum.CYBER_DIE3, 0, 0),
     # S_CYBER_DIE3
     State(SpriteEnum.CYBR, 9, 10, None, StateEnum.CYBER_DIE4, 0, 0),
     # S_CYBER_DIE4
@@ -2679,7 +2687,7 @@ states = (
     # S_CYBER_DIE5
     State(SpriteEnum.CYBR, 11, 10, None, StateEnum.CYBER_DIE6, 0, 0),
     # S_CYBER_DIE6
-    State(SpriteEnum.CYBR, 12, 10, actions.fall, StateEnum.CYBER_DIE7, 0, 0),
+    State(SpriteEnum.CYBR, 12, 10, "fall", StateEnum.CYBER_DIE7, 0, 0),
     # S_CYBER_DIE7
     State(SpriteEnum.CYBR, 13, 10, None, StateEnum.CYBER_DIE8, 0, 0),
     # S_CYBER_DIE8
@@ -2687,43 +2695,43 @@ states = (
     # S_CYBER_DIE9
     State(SpriteEnum.CYBR, 15, 30, None, StateEnum.CYBER_DIE10, 0, 0),
     # S_CYBER_DIE10
-    State(SpriteEnum.CYBR, 15, -1, actions.boss_death, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.CYBR, 15, -1, "boss_death", StateEnum.NULL, 0, 0),
     # S_PAIN_STND
-    State(SpriteEnum.PAIN, 0, 10, actions.look, StateEnum.PAIN_STND, 0, 0),
+    State(SpriteEnum.PAIN, 0, 10, "look", StateEnum.PAIN_STND, 0, 0),
     # S_PAIN_RUN1
-    State(SpriteEnum.PAIN, 0, 3, actions.chase, StateEnum.PAIN_RUN2, 0, 0),
+    State(SpriteEnum.PAIN, 0, 3, "chase", StateEnum.PAIN_RUN2, 0, 0),
     # S_PAIN_RUN2
-    State(SpriteEnum.PAIN, 0, 3, actions.chase, StateEnum.PAIN_RUN3, 0, 0),
+    State(SpriteEnum.PAIN, 0, 3, "chase", StateEnum.PAIN_RUN3, 0, 0),
     # S_PAIN_RUN3
-    State(SpriteEnum.PAIN, 1, 3, actions.chase, StateEnum.PAIN_RUN4, 0, 0),
+    State(SpriteEnum.PAIN, 1, 3, "chase", StateEnum.PAIN_RUN4, 0, 0),
     # S_PAIN_RUN4
-    State(SpriteEnum.PAIN, 1, 3, actions.chase, StateEnum.PAIN_RUN5, 0, 0),
+    State(SpriteEnum.PAIN, 1, 3, "chase", StateEnum.PAIN_RUN5, 0, 0),
     # S_PAIN_RUN5
-    State(SpriteEnum.PAIN, 2, 3, actions.chase, StateEnum.PAIN_RUN6, 0, 0),
+    State(SpriteEnum.PAIN, 2, 3, "chase", StateEnum.PAIN_RUN6, 0, 0),
     # S_PAIN_RUN6
-    State(SpriteEnum.PAIN, 2, 3, actions.chase, StateEnum.PAIN_RUN1, 0, 0),
+    State(SpriteEnum.PAIN, 2, 3, "chase", StateEnum.PAIN_RUN1, 0, 0),
     # S_PAIN_ATK1
-    State(SpriteEnum.PAIN, 3, 5, actions.face_target, StateEnum.PAIN_ATK2, 0, 0),
+    State(SpriteEnum.PAIN, 3, 5, "face_target", StateEnum.PAIN_ATK2, 0, 0),
     # S_PAIN_ATK2
-    State(SpriteEnum.PAIN, 4, 5, actions.face_target, StateEnum.PAIN_ATK3, 0, 0),
+    State(SpriteEnum.PAIN, 4, 5, "face_target", StateEnum.PAIN_ATK3, 0, 0),
     # S_PAIN_ATK3
-    State(SpriteEnum.PAIN, 32773, 5, actions.face_target, StateEnum.PAIN_ATK4, 0, 0),
+    State(SpriteEnum.PAIN, 32773, 5, "face_target", StateEnum.PAIN_ATK4, 0, 0),
     # S_PAIN_ATK4
-    State(SpriteEnum.PAIN, 32773, 0, actions.pain_attack, StateEnum.PAIN_RUN1, 0, 0),
+    State(SpriteEnum.PAIN, 32773, 0, "pain_attack", StateEnum.PAIN_RUN1, 0, 0),
     # S_PAIN_PAIN
     State(SpriteEnum.PAIN, 6, 6, None, StateEnum.PAIN_PAIN2, 0, 0),
     # S_PAIN_PAIN2
-    State(SpriteEnum.PAIN, 6, 6, actions.pain, StateEnum.PAIN_RUN1, 0, 0),
+    State(SpriteEnum.PAIN, 6, 6, "pain", StateEnum.PAIN_RUN1, 0, 0),
     # S_PAIN_DIE1
     State(SpriteEnum.PAIN, 32775, 8, None, StateEnum.PAIN_DIE2, 0, 0),
     # S_PAIN_DIE2
-    State(SpriteEnum.PAIN, 32776, 8, actions.scream, StateEnum.PAIN_DIE3, 0, 0),
+    State(SpriteEnum.PAIN, 32776, 8, "scream", StateEnum.PAIN_DIE3, 0, 0),
     # S_PAIN_DIE3
     State(SpriteEnum.PAIN, 32777, 8, None, StateEnum.PAIN_DIE4, 0, 0),
     # S_PAIN_DIE4
     State(SpriteEnum.PAIN, 32778, 8, None, StateEnum.PAIN_DIE5, 0, 0),
     # S_PAIN_DIE5
-    State(SpriteEnum.PAIN, 32779, 8, actions.pain_die, StateEnum.PAIN_DIE6, 0, 0),
+    State(SpriteEnum.PAIN, 32779, 8, "pain_die", StateEnum.PAIN_DIE6, 0, 0),
     # S_PAIN_DIE6
     State(SpriteEnum.PAIN, 32780, 8, None, StateEnum.NULL, 0, 0),
     # S_PAIN_RAISE1
@@ -2739,47 +2747,47 @@ states = (
     # S_PAIN_RAISE6
     State(SpriteEnum.PAIN, 7, 8, None, StateEnum.PAIN_RUN1, 0, 0),
     # S_SSWV_STND
-    State(SpriteEnum.SSWV, 0, 10, actions.look, StateEnum.SSWV_STND2, 0, 0),
+    State(SpriteEnum.SSWV, 0, 10, "look", StateEnum.SSWV_STND2, 0, 0),
     # S_SSWV_STND2
-    State(SpriteEnum.SSWV, 1, 10, actions.look, StateEnum.SSWV_STND, 0, 0),
+    State(SpriteEnum.SSWV, 1, 10, "look", StateEnum.SSWV_STND, 0, 0),
     # S_SSWV_RUN1
-    State(SpriteEnum.SSWV, 0, 3, actions.chase, StateEnum.SSWV_RUN2, 0, 0),
+    State(SpriteEnum.SSWV, 0, 3, "chase", StateEnum.SSWV_RUN2, 0, 0),
     # S_SSWV_RUN2
-    State(SpriteEnum.SSWV, 0, 3, actions.chase, StateEnum.SSWV_RUN3, 0, 0),
+    State(SpriteEnum.SSWV, 0, 3, "chase", StateEnum.SSWV_RUN3, 0, 0),
     # S_SSWV_RUN3
-    State(SpriteEnum.SSWV, 1, 3, actions.chase, StateEnum.SSWV_RUN4, 0, 0),
+    State(SpriteEnum.SSWV, 1, 3, "chase", StateEnum.SSWV_RUN4, 0, 0),
     # S_SSWV_RUN4
-    State(SpriteEnum.SSWV, 1, 3, actions.chase, StateEnum.SSWV_RUN5, 0, 0),
+    State(SpriteEnum.SSWV, 1, 3, "chase", StateEnum.SSWV_RUN5, 0, 0),
     # S_SSWV_RUN5
-    State(SpriteEnum.SSWV, 2, 3, actions.chase, StateEnum.SSWV_RUN6, 0, 0),
+    State(SpriteEnum.SSWV, 2, 3, "chase", StateEnum.SSWV_RUN6, 0, 0),
     # S_SSWV_RUN6
-    State(SpriteEnum.SSWV, 2, 3, actions.chase, StateEnum.SSWV_RUN7, 0, 0),
+    State(SpriteEnum.SSWV, 2, 3, "chase", StateEnum.SSWV_RUN7, 0, 0),
     # S_SSWV_RUN7
-    State(SpriteEnum.SSWV, 3, 3, actions.chase, StateEnum.SSWV_RUN8, 0, 0),
+    State(SpriteEnum.SSWV, 3, 3, "chase", StateEnum.SSWV_RUN8, 0, 0),
     # S_SSWV_RUN8
-    State(SpriteEnum.SSWV, 3, 3, actions.chase, StateEnum.SSWV_RUN1, 0, 0),
+    State(SpriteEnum.SSWV, 3, 3, "chase", StateEnum.SSWV_RUN1, 0, 0),
     # S_SSWV_ATK1
-    State(SpriteEnum.SSWV, 4, 10, actions.face_target, StateEnum.SSWV_ATK2, 0, 0),
+    State(SpriteEnum.SSWV, 4, 10, "face_target", StateEnum.SSWV_ATK2, 0, 0),
     # S_SSWV_ATK2
-    State(SpriteEnum.SSWV, 5, 10, actions.face_target, StateEnum.SSWV_ATK3, 0, 0),
+    State(SpriteEnum.SSWV, 5, 10, "face_target", StateEnum.SSWV_ATK3, 0, 0),
     # S_SSWV_ATK3
-    State(SpriteEnum.SSWV, 32774, 4, actions.c_pos_attack, StateEnum.SSWV_ATK4, 0, 0),
+    State(SpriteEnum.SSWV, 32774, 4, "c_pos_attack", StateEnum.SSWV_ATK4, 0, 0),
     # S_SSWV_ATK4
-    State(SpriteEnum.SSWV, 5, 6, actions.face_target, StateEnum.SSWV_ATK5, 0, 0),
+    State(SpriteEnum.SSWV, 5, 6, "face_target", StateEnum.SSWV_ATK5, 0, 0),
     # S_SSWV_ATK5
-    State(SpriteEnum.SSWV, 32774, 4, actions.c_pos_attack, StateEnum.SSWV_ATK6, 0, 0),
+    State(SpriteEnum.SSWV, 32774, 4, "c_pos_attack", StateEnum.SSWV_ATK6, 0, 0),
     # S_SSWV_ATK6
-    State(SpriteEnum.SSWV, 5, 1, actions.c_pos_refire, StateEnum.SSWV_ATK2, 0, 0),
+    State(SpriteEnum.SSWV, 5, 1, "c_pos_refire", StateEnum.SSWV_ATK2, 0, 0),
     # S_SSWV_PAIN
     State(SpriteEnum.SSWV, 7, 3, None, StateEnum.SSWV_PAIN2, 0, 0),
     # S_SSWV_PAIN2
-    State(SpriteEnum.SSWV, 7, 3, actions.pain, StateEnum.SSWV_RUN1, 0, 0),
+    State(SpriteEnum.SSWV, 7, 3, "pain", StateEnum.SSWV_RUN1, 0, 0),
     # S_SSWV_DIE1
     State(SpriteEnum.SSWV, 8, 5, None, StateEnum.SSWV_DIE2, 0, 0),
     # S_SSWV_DIE2
-    State(SpriteEnum.SSWV, 9, 5, actions.scream, StateEnum.SSWV_DIE3, 0, 0),
+    State(SpriteEnum.SSWV, 9, 5, "scream", StateEnum.SSWV_DIE3, 0, 0),
     # S_SSWV_DIE3
-    State(SpriteEnum.SSWV, 10, 5, actions.fall, StateEnum.SSWV_DIE4, 0, 0),
+    State(SpriteEnum.SSWV, 10, 5, "fall", StateEnum.SSWV_DIE4, 0, 0),
     # S_SSWV_DIE4
     State(SpriteEnum.SSWV, 11, 5, None, StateEnum.SSWV_DIE5, 0, 0),
     # S_SSWV_DIE5
@@ -2787,9 +2795,9 @@ states = (
     # S_SSWV_XDIE1
     State(SpriteEnum.SSWV, 13, 5, None, StateEnum.SSWV_XDIE2, 0, 0),
     # S_SSWV_XDIE2
-    State(SpriteEnum.SSWV, 14, 5, actions.x_scream, StateEnum.SSWV_XDIE3, 0, 0),
+    State(SpriteEnum.SSWV, 14, 5, "x_scream", StateEnum.SSWV_XDIE3, 0, 0),
     # S_SSWV_XDIE3
-    State(SpriteEnum.SSWV, 15, 5, actions.fall, StateEnum.SSWV_XDIE4, 0, 0),
+    State(SpriteEnum.SSWV, 15, 5, "fall", StateEnum.SSWV_XDIE4, 0, 0),
     # S_SSWV_XDIE4
     State(SpriteEnum.SSWV, 16, 5, None, StateEnum.SSWV_XDIE5, 0, 0),
     # S_SSWV_XDIE5
@@ -2819,7 +2827,7 @@ states = (
     # S_COMMKEEN2
     State(SpriteEnum.KEEN, 1, 6, None, StateEnum.COMMKEEN3, 0, 0),
     # S_COMMKEEN3
-    State(SpriteEnum.KEEN, 2, 6, actions.scream, StateEnum.COMMKEEN4, 0, 0),
+    State(SpriteEnum.KEEN, 2, 6, "scream", StateEnum.COMMKEEN4, 0, 0),
     # S_COMMKEEN4
     State(SpriteEnum.KEEN, 3, 6, None, StateEnum.COMMKEEN5, 0, 0),
     # S_COMMKEEN5
@@ -2835,61 +2843,61 @@ states = (
     # S_COMMKEEN10
     State(SpriteEnum.KEEN, 9, 6, None, StateEnum.COMMKEEN11, 0, 0),
     # S_COMMKEEN11
-    State(SpriteEnum.KEEN, 10, 6, actions.keen_die, StateEnum.COMMKEEN12, 0, 0),
+    State(SpriteEnum.KEEN, 10, 6, "keen_die", StateEnum.COMMKEEN12, 0, 0),
     # S_COMMKEEN12
     State(SpriteEnum.KEEN, 11, -1, None, StateEnum.NULL, 0, 0),
     # S_KEENPAIN
     State(SpriteEnum.KEEN, 12, 4, None, StateEnum.KEENPAIN2, 0, 0),
     # S_KEENPAIN2
-    State(SpriteEnum.KEEN, 12, 8, actions.pain, StateEnum.KEENSTND, 0, 0),
+    State(SpriteEnum.KEEN, 12, 8, "pain", StateEnum.KEENSTND, 0, 0),
     # S_BRAIN
     State(SpriteEnum.BBRN, 0, -1, None, StateEnum.NULL, 0, 0),
     # S_BRAIN_PAIN
-    State(SpriteEnum.BBRN, 1, 36, actions.brain_pain, StateEnum.BRAIN, 0, 0),
+    State(SpriteEnum.BBRN, 1, 36, "brain_pain", StateEnum.BRAIN, 0, 0),
     # S_BRAIN_DIE1
-    State(SpriteEnum.BBRN, 0, 100, actions.brain_scream, StateEnum.BRAIN_DIE2, 0, 0),
+    State(SpriteEnum.BBRN, 0, 100, "brain_scream", StateEnum.BRAIN_DIE2, 0, 0),
     # S_BRAIN_DIE2
     State(SpriteEnum.BBRN, 0, 10, None, StateEnum.BRAIN_DIE3, 0, 0),
     # S_BRAIN_DIE3
     State(SpriteEnum.BBRN, 0, 10, None, StateEnum.BRAIN_DIE4, 0, 0),
     # S_BRAIN_DIE4
-    State(SpriteEnum.BBRN, 0, -1, actions.brain_die, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.BBRN, 0, -1, "brain_die", StateEnum.NULL, 0, 0),
     # S_BRAINEYE
-    State(SpriteEnum.SSWV, 0, 10, actions.look, StateEnum.BRAINEYE, 0, 0),
+    State(SpriteEnum.SSWV, 0, 10, "look", StateEnum.BRAINEYE, 0, 0),
     # S_BRAINEYESEE
-    State(SpriteEnum.SSWV, 0, 181, actions.brain_awake, StateEnum.BRAINEYE1, 0, 0),
+    State(SpriteEnum.SSWV, 0, 181, "brain_awake", StateEnum.BRAINEYE1, 0, 0),
     # S_BRAINEYE1
-    State(SpriteEnum.SSWV, 0, 150, actions.brain_spit, StateEnum.BRAINEYE1, 0, 0),
+    State(SpriteEnum.SSWV, 0, 150, "brain_spit", StateEnum.BRAINEYE1, 0, 0),
     # S_SPAWN1
-    State(SpriteEnum.BOSF, 32768, 3, actions.spawnsound, StateEnum.SPAWN2, 0, 0),
+    State(SpriteEnum.BOSF, 32768, 3, "spawnsound", StateEnum.SPAWN2, 0, 0),
     # S_SPAWN2
-    State(SpriteEnum.BOSF, 32769, 3, actions.spawn_fly, StateEnum.SPAWN3, 0, 0),
+    State(SpriteEnum.BOSF, 32769, 3, "spawn_fly", StateEnum.SPAWN3, 0, 0),
     # S_SPAWN3
-    State(SpriteEnum.BOSF, 32770, 3, actions.spawn_fly, StateEnum.SPAWN4, 0, 0),
+    State(SpriteEnum.BOSF, 32770, 3, "spawn_fly", StateEnum.SPAWN4, 0, 0),
     # S_SPAWN4
-    State(SpriteEnum.BOSF, 32771, 3, actions.spawn_fly, StateEnum.SPAWN1, 0, 0),
+    State(SpriteEnum.BOSF, 32771, 3, "spawn_fly", StateEnum.SPAWN1, 0, 0),
     # S_SPAWNFIRE1
-    State(SpriteEnum.FIRE, 32768, 4, actions.fire, StateEnum.SPAWNFIRE2, 0, 0),
+    State(SpriteEnum.FIRE, 32768, 4, "fire", StateEnum.SPAWNFIRE2, 0, 0),
     # S_SPAWNFIRE2
-    State(SpriteEnum.FIRE, 32769, 4, actions.fire, StateEnum.SPAWNFIRE3, 0, 0),
+    State(SpriteEnum.FIRE, 32769, 4, "fire", StateEnum.SPAWNFIRE3, 0, 0),
     # S_SPAWNFIRE3
-    State(SpriteEnum.FIRE, 32770, 4, actions.fire, StateEnum.SPAWNFIRE4, 0, 0),
+    State(SpriteEnum.FIRE, 32770, 4, "fire", StateEnum.SPAWNFIRE4, 0, 0),
     # S_SPAWNFIRE4
-    State(SpriteEnum.FIRE, 32771, 4, actions.fire, StateEnum.SPAWNFIRE5, 0, 0),
+    State(SpriteEnum.FIRE, 32771, 4, "fire", StateEnum.SPAWNFIRE5, 0, 0),
     # S_SPAWNFIRE5
-    State(SpriteEnum.FIRE, 32772, 4, actions.fire, StateEnum.SPAWNFIRE6, 0, 0),
+    State(SpriteEnum.FIRE, 32772, 4, "fire", StateEnum.SPAWNFIRE6, 0, 0),
     # S_SPAWNFIRE6
-    State(SpriteEnum.FIRE, 32773, 4, actions.fire, StateEnum.SPAWNFIRE7, 0, 0),
+    State(SpriteEnum.FIRE, 32773, 4, "fire", StateEnum.SPAWNFIRE7, 0, 0),
     # S_SPAWNFIRE7
-    State(SpriteEnum.FIRE, 32774, 4, actions.fire, StateEnum.SPAWNFIRE8, 0, 0),
+    State(SpriteEnum.FIRE, 32774, 4, "fire", StateEnum.SPAWNFIRE8, 0, 0),
     # S_SPAWNFIRE8
-    State(SpriteEnum.FIRE, 32775, 4, actions.fire, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.FIRE, 32775, 4, "fire", StateEnum.NULL, 0, 0),
     # S_BRAINEXPLODE1
     State(SpriteEnum.MISL, 32769, 10, None, StateEnum.BRAINEXPLODE2, 0, 0),
     # S_BRAINEXPLODE2
     State(SpriteEnum.MISL, 32770, 10, None, StateEnum.BRAINEXPLODE3, 0, 0),
     # S_BRAINEXPLODE3
-    State(SpriteEnum.MISL, 32771, 10, actions.brain_explode, StateEnum.NULL, 0, 0),
+    State(SpriteEnum.MISL, 32771, 10, "brain_explode", StateEnum.NULL, 0, 0),
     # S_ARM1
     State(SpriteEnum.ARM1, 0, 6, None, StateEnum.ARM1A, 0, 0),
     # S_ARM1A
@@ -2905,11 +2913,11 @@ states = (
     # S_BEXP
     State(SpriteEnum.BEXP, 32768, 5, None, StateEnum.BEXP2, 0, 0),
     # S_BEXP2
-    State(SpriteEnum.BEXP, 32769, 5, actions.scream, StateEnum.BEXP3, 0, 0),
+    State(SpriteEnum.BEXP, 32769, 5, "scream", StateEnum.BEXP3, 0, 0),
     # S_BEXP3
     State(SpriteEnum.BEXP, 32770, 5, None, StateEnum.BEXP4, 0, 0),
     # S_BEXP4
-    State(SpriteEnum.BEXP, 32771, 10, actions.explode, StateEnum.BEXP5, 0, 0),
+    State(SpriteEnum.BEXP, 32771, 10, "explode", StateEnum.BEXP5, 0, 0),
     # S_BEXP5
     State(SpriteEnum.BEXP, 32772, 10, None, StateEnum.NULL, 0, 0),
     # S_BBAR1
@@ -0,0 +1,624 @@
+"""
+Packed data of :mod:`pink_doom.misc.tables`.
+
+``fine_sine``, ``fine_tangent`` and ``tan_to_angle`` one after the other,
+as little-endian 32 bit integers, compressed with zlib and base64 encoded.
+"""
+TABLES = (
+    b"eNqc3Vd0lWXX9v1F6ITee+8dpQmiiID0YkDpvSSEXkLo0kMInUCkFykaIr1IURBBmkiXLk3pnfS1OL//"
+    b"HPfhGM/Wt/Fu/Mbzvt6arKx1rauc5zHnzOfxeJpjArbiHnKm8HgaIxTRuIUsfh5PA4zERlyFf0qPpx6G"
+    b"YC0uIU0qj6c2BmAl/kSK1B7Ph+iHKJyCF1XSeDw9sQjHkIDyaT2eLpiLI3iLUuk8nq8RjoN4gaLpPZ4A"
+    b"TMdePEaBDB5PK3yDHXiAPP4eT1OMQwz+RvaMHk9DhGAzbiBTJo/nUwzDelxGusweTx0MxCqcQ8osHk8N"
+    b"9Me3OA0fqmb1eHphMY4jAeWzeTxdMQ9H8BalsvO3YBYO4gWK5vB4vsQ07MEj5M/p8bTEJGzHfeTK5fF8"
+    b"gTGIxi1kye3xfIaR2IiryJDH4/kYg7EGF5Aqr8dTE4FYhjN4j6r5eN1YjONIQPn8fAaYi8N4g5IFPJ6v"
+    b"EIb9eIbCBT2eNpiCXfgXeQt5PM0wHj/iDrIV9ng+xyhswjX4F+HYwRCsxUWkKsprRCCW4Qzeo2oxjhMs"
+    b"wjHEo1xxj6cTIvAzXqF4CY4JTMdePEaBkh5PC0zENtxDjlIeTyOMxmZcR8bSHs8nGIK1uIhUZXg9CMS3"
+    b"OA0fKpf1eHpgIY4iFqXLeTwdEI4DeI7C5Xl/MAU78Q9yV/B4mmAMonETmSty7GEY1uESUlfyeGohEMtw"
+    b"Gj5UrszvxgL8incoVYVjCmHYj6coWJXvAiZhG+4hRzWOe4RgE64iwwceT10MxEr8Cc+HHk819MJiHEMc"
+    b"ylT3eDoiHAfwDIVqeDyt8Q224x5y1OT3YBQ24irS1+K7hGCswB94jyq1+XuwAL/iLUp+5PG0xwzsxSPk"
+    b"q8NxhXHYglvIXJf3DUOwBufh9zEvH30QiWOIQ5l6fD6Yhf14ggKfcGxgAmJwG1k+5WdiKNbiAvzq8zPR"
+    b"B4txDLEo/RnvO2ZiHx4hXwNeJ8YiGjeQ8XO+jxiElTiL96jS0OPpjnk4jFco1sjjaYvJ2IF7yNGY7w9G"
+    b"4DtcQqovPJ7q6ItIHEMsSjfhe4oZ2IOHyNOU8wZGYxP+QtpmnKcRiCicQALKcjHogDDswyPkbcExi1Bs"
+    b"xlWka8l/j0BE4QTiUaYV7wlmYi8eIndrricIwUZcQeo2nEfRF5H4De9Qsi3fYUzFTtxD9i85x2EY1uIc"
+    b"PAG8f+iOufgZz1GoHZ8pxiMaN5ChvcfzEYIQhROIR+mveK8wHbtwHzm+5jqHYViLc3Co3IFzOSJwEE+R"
+    b"vyPXFoRiE64gdSc+F/TGQhzBKxTpzPcRE7AFN5ChC68LgViK43iHEl25HmAytuE2MnXjGEIwvsUJxKNU"
+    b"d4+nHaZiO+4gSw/OrRiIZTiJeJTuyb+LqdiOO8jci38XwfgWJxCHUr15izEZ23AbGfvwHUYQluIY3qJY"
+    b"X85zmIgtuI50/Th3og8W4jBeoGB/vh8IxUZcgl8g53h0QwT24xFyB3HcYxhW4w8ko+wAPjdMw3b8jUzB"
+    b"vDYEYgmO4jUKD+R4wFhswmX4DeL3oSvCsQ//IMdgj6c+BmE5TiAWJYbw92ECfsBVpB7q8XyA7ojAfjxE"
+    b"zmEcqxiM5TiBWBQfznkS4/E9riDlCF4HumIW9uA+so7kM0EQluAoXqHgKI43hGAd/oQXZUM4X2IyfsR1"
+    b"pB3NOQs9EIGf8A+yh3KdwwAsxVG8RMExfMcxEmvwBxJRaiznI0zAD7gCv3F8H9AJM7ADt5FhPJ85emEu"
+    b"9uNfZOPmsh6CEIkjeIa8E7lOYCiW43e8ReFJHCMIwVr8gQSU/Ib3EOOwERfgQ7nJHNeYhGhcQYopHk8l"
+    b"dMBU/IjrSD2V9xydMQPbcRNpp/F+oRtmYRf+RvrpfJ/RHeHYjTvwn8Hfih6YjT24C/+Z/HP0xGzswV34"
+    b"h/HP0QOzsRt3kGEW50F0Rzh24TbSh/N60BVh2IGbSDObazM6Yzq24hpSRvD34mtMRjQuw6HcHL7LmIBN"
+    b"OI9klJzLOQmhWIfTiEWReRxnGI4VOIaXyDefcyMGIhK/4BGyLeAeAn0wF3txBxkW8jegC6ZjK64ixSLu"
+    b"MRGA8diAs4hH0cX8bgzHcvyG58gdyXUZgZiPn3AP/kv4HeiC6YjBFTiUWcr3FqFYi5N4g/xRnFcQjEU4"
+    b"iAfI+C2fBbpiOmJwBe9RehnvFUKwCsfxArmX831CP8zFHtxGmhV8R9AeE7ABf+AdCq7kuMdALMIB3EOG"
+    b"VXy26IhvsBl/Ih6FV3PPikFYjAO4jwxr+G/QAZOwCWcRi4Jr+TsxAAuwD38jzTqOFbTDOKzFCbxE7vVc"
+    b"Z9Ab4diGv/AeJb/jWRHDEIWf8Q/8N3AuRAdMxAacxmvk3cj7gz4Ixzb8BR9KbOKzxhBE4gDuIu1mXh8C"
+    b"EIpV+A1PkPV7PiN0xmRsxBm8QZ4fOM+gF8IQg4tIQOFo3gsEYi524ip8KLGFcx8GYSH24iZSxPC5ozmG"
+    b"IhL78TdS/cj3Cq0wAktxEHeRhgfp8miNEYjCIdxFmm38b2iNEViKg7iDVNv5mWiJYViC/bgNvx28FjTD"
+    b"YCzEHlzHexTfyT0WBmAuduAyElFoF9ck9EEYtuBPvEXu3Vw30RWT8R1O4Cky7+FzRXuEYjl+wT2k3st1"
+    b"B80xGAuwC38hCYX2cS1Fb8zA9ziDF8j2E+dUfIUxWIGfcRcp9/N3ogmCMQfbcAHvkOcA90zojIlYg1/x"
+    b"AGkO8prQDIMwD9txAe+Q+xD3rOiE8ViFX3AXKX/m+EZjBGIWonEGL5DlF75n+BIjEYk9uIpE5D/MORBd"
+    b"MBGrcRh34XeEYwwN0RczsAkn8Ajpf+WYQHMEIwIx+AMvkOUo97pog6FYgO04jzfI/hufEwIwAouwExfx"
+    b"DjmP8X6jHUZiMXbhEt4ix3HOoQjACCzEDlzAa2T7nb8dbTAU87AVZ/ECmU54PBXRAsEIx/c4iUdIe5LP"
+    b"FI3QB1OxDkdwBw6FT/HdRWeMxbfYhyuIRc7T/I1oiyGYiy04jcdIe4bfgYbohclYjUO4gUTk+YNrMNph"
+    b"OOYjBqfxGGnPcr+Dz9EDE7EC+/EXYpH9T+4f0BLBCMNGHMUdvEeBcxxn+AojMB8xOIWHSHWee2Z8gs4I"
+    b"RSR24E88RboLvBY0QDeMw1Lswnk8R4aL/M1ogO4Yh6XYhXN4hnSXOK7xGbpiDCKxHX/gMVJf5rqLj9EB"
+    b"IzEf0fgd9/Ee+a9w7kVbDEQY1uNnXEcssv7FsYAv0AsTEIWdOIsnSHWVewzUQXsMxWxsxBHcQByyXfN4"
+    b"KqAxemAcIrENp/APHPJd5/hGKwRiClZiL87jKVLf4HfiIwRgEGZiLfbjEl4g3U0+G9RFOwxGGNbiAC7h"
+    b"OdLe4j3DRwjAQEzHKuzDeTxByttch1EDrdAfkxCF7TiF+0hGzr+57qERuiEE87AJh3EVr5H+Dq8RdfAl"
+    b"BmAKlmEHTuEekpD9LucWNEAnDEc41uEnnMfju/9b+M2LKvgC3RCCOdiAg7iIp/C7z3uOqvgC3RGCOfgO"
+    b"B3ABj+GQ+wF/FxqiM4YhDKuxG2dwD4nI8g/HND7GlwjCJEQiGr/iKl4g1b8ck6iKxuiC4QjDKuzESfyN"
+    b"WGR4yGeGmmiOnghBBNZiD87gLuKQ8RHvM2qiOXpgFMKxGrtwErfxFukec91DNTRGZwzBNHyLGPyKK3gK"
+    b"hxxPuGbhY7RBH4zBHKzFbpzELbxG6qe896iEz9AOgRiP+ViPvTiN23iD1M/4b1ARnyIA/TAGEViDnTiO"
+    b"a3gGh+zPOQehNpqjG4ZhKpbgexzAWdzFW6R5wXGECqiH1uiFkZiBbxGNQ/gTd/EWqV9yfkY51EVLdMcw"
+    b"TMFibMRenMQNPMN7ZHnF54QP8Dnaox9GYxaWIRoH8Qdu4yU8rznHoDg+REO0Q1+EYCaWYjP24SSu4QmS"
+    b"4P+Gcz0q4GO0QBcMxHhEYAVicAhncBPP4EXGt5wbUAF10RydMABjMAtR2Iy9+B1X8A9ikeodxw+Koxrq"
+    b"ozW6YRDGYzaW4Xvsw3FcxgO8QYpY3j8URkXURVN0QD+MxBQswGrE4ABO4i/8g7dIEcfPQSFUQG00Rjv0"
+    b"whBMQDiisAE7cRhncQOPEIuU8VxHUAjlUQsN0RbdEIxQTMdCrEI09uEYzuM2niAeKRP4eSiIsqiBz9AS"
+    b"ndAPwzER4ViCdfgR+3EcF3ALjxGLFIl8fsiLEqiCumiMtuiKQIzAJIQjEmsQjb34FX/gKu7jORKQMol7"
+    b"b+RDCVTGR/gcrdABvTEIoZiCCCzFWkRjNw7jFC7hNh7hDbxIncznhXwogUqoifpohgB0RT8MxRhMRQQi"
+    b"sQqbsR37cRRncBm38RCvkAg/L98V5ERBlEJl1MSnaII26IieCMJwjMUUzMYiLMd6RGMnDuAoTuMibuA+"
+    b"nuINkuDn43qJbMiHoiiLKqiJT9AILdAOndELQRiK0ZiEGYjAIizDWmzGVuzGQRzFSZzDFdzCfTzBK8TD"
+    b"h5TveU3IitwoiOIoi8qojjqoj8Zojrb4Gl3RC4EYhBEIxURMxSzMxSJ8i1VYj82IwQ7sxUEcwXGcxjlc"
+    b"xnXcxn08wjO8RhyS4JDScf+DjMiKnMiHQiiGUiiHSqiGGvgI9fAZGqEJWqANAvA1OqMbeqEvgjAQQzAC"
+    b"IRiD8fgGUzEDsxCBeViISCzFMqzEGqzDBmzGD4jBVuzALuzFTziAn3EYv+I3HMcJnMIZnMU5XMAlXMFV"
+    b"XMMN3MJt3MFd3McD/IuHeIwneIpneIGXeIXXeIO3eIdYxCFeEpCIJEkWr/jk/f/h/h/935/x38/97/f8"
+    b"93v/ex2Jem3/vc44vfZ3+lve6G97pb/1hf72p3ovHuu9+Vfv1X29d3f0Xt7Se3tN7/UVvfcX9Fmc1Wdz"
+    b"Sp/VcX12v+qz/Fmf7U/6rHfps9+qY+EHHRsbdKys0bGzTMdSpI6teTrWZunYm6pjcbyOzRAdq0N07Abp"
+    b"WO6lY7uzjvUAHfst9F1opO9GPX1Xaui7U0nfpVL6bhXSdy2nvnsZ9V2076TTdzRO39ln+g7f13f6ur7j"
+    b"5/SdP65zwEGdE3boHLFZ54xVOocs0jllls4xE3XOGaFzUKDOSV11jmqrc1ZjncPq6JxWWee44jrn5dY5"
+    b"0M6Fdk706Rz5SufM+zqHXtE59aTOsQd1zt2qc/BanZMX6Rw9Q+fs0TqHB+mc3lnn+BY653+ia0AVXROK"
+    b"6hqRTdcMu3Yk6VryVNeWG7rWnNa154CuRdG6Ni3XtWq2rl1jdS0L0rWtg651TXTtq6lrYSldG3PqWmnX"
+    b"zERdQx/qmnpZ19ijuuZu1zV4la7JEbpGj9E1u5+u4QG6ptfXNb6Srvn5dA9g9wJe3Rs80r3CJd07HNa9"
+    b"RLTuLZbqXmOK7j0G6V6kg+5NPte9SmXdu+TTvYzd0yToHue+7nn+0D3QXt0TrdE9UrjumUboHqqr7qka"
+    b"6x6riu658uoezO7FYnVvdkv3asd17/aj7uWW6N5uou71+uner6XuBWvo3rCg7hXtnjFe95C3dU95TPeY"
+    b"0brnXKh70FDdk3bTPWpD3bOW1z2s3cvaPW2s7nFv6J73sO6BN+ieOFz3yEN0z9xO99C1dU9dSPfYdq/9"
+    b"Vvfef+le/IDuzVfrXn2K7t376V6+qe7tK+pe3+757d7/jZ4FLuvZYJ+eFZbp2WG8niW66dmivp41iuvZ"
+    b"w55BYvVMckXPKHv1zBKlZ5gxeqbppGecunrmsWcfewby6pnopp6RDumZaYWeocbrmaqLnrE+1jOXPXvZ"
+    b"M1iSnsmu6Rltn57ZluoZLkTPdO30jPehnvns2c+eAV/qmfAPPSNG65lxlp4h++mZ8nM9Y9qzpj1zvtcz"
+    b"6A09k+7VM+piPbMO0zNsSz3TltMzrj3rvtWz7596Fo7Ws/EMPSv30rNzPT1L2zO1PVu/1bP2WT17f69n"
+    b"8al6Nu+mZ/Xaena3Z3inZ/presbfqWf+CK0B9NOawKdaI7C1AlszeKM1hNNaU1ivNYbxWnNopzWISlqT"
+    b"sLWJ11qrOKm1i7VayxijtY02WuuwNQ9b+3BaC7mitZEYrZVM09pJZ62lVNPaiq2xvNWay0mtwazWmswo"
+    b"rdE015qNrd3YGk6c1nTOaI1nrdZ8QrQG1FxrQrY2ZGtEsVozOqk1pFVaUxquNabGWnOytSdbg3qhNalf"
+    b"tUYVqTWrIK1hfaw1LVvbStRa1xmtfa3WWtgwrY011FqZrZk5raFd0Jrad1pjC9Ga2xdag7O1OFuTe6o1"
+    b"uoNas5ujNbxuWtOrojU+W+t7rLW/n7QWGK61wU5aK7Q1Q1s7TNJa4imtLS7TWuMArT3W0VqkrUm+1hrl"
+    b"Ya1ZztMaZjetadrapq1xJmvN85TWQKO0Jtpfa6Q1tGZqa6dPtJa6T2ur07XWGqC1V1uDtbXY51qbPaC1"
+    b"2jCt3bbTWq6t6dra7gut9e7X2u9MrQUHaG3Y1ohtrfip1o73ai15itaWW2mt2dacndagT2lNOlJr1D20"
+    b"Zm1r17aGHac17SNa456tNe/2WgO3tXBbE3+iNfKdWjOfoDX0L7SmbmvrsVpr/1lr72Fai2+rtXlbo3+v"
+    b"NfvftYY/X2v6HbTGb2v9tub/WHsA27UnMEZ7BJ9pz8D2Dp5pL2GX9hbGaa+hgfYebA/iufYkdmmPYpz2"
+    b"LBpoD8P2Mp5qb2OH9jpCtffxifZCbE/kofZIYrRnMkJ7KLaXYnsq77XHclR7LmHag2mpPRnbm4nVXs1+"
+    b"7d1M1F7O59rbsT2ex9rzidEe0HDtCdnekO0RJWrP6JD2kCZrT6mh9phsr+mx9p62aC9qiPambI/K9qpi"
+    b"tXe1T3tZY7W3ZXtcttfltPd1RHthU7U31kh7ZbZn9kh7aN9rTy1Ye2y212Z7bi+0B7dVe3JDtUdne3W2"
+    b"Z/dae3g7tKc3Qnt8ttdne35vtQe4S3uCI7VHaHuFtmf4TnuIO7WnOEJ7jLbXaHuOb7QHuV17kkO1R2l7"
+    b"lbZn+UJ7mDHa0wzWHqftddqe5yPtgW7Snmhf7ZHaXqntmd7VHupq7al20R6r7bUmau91j/ZiR2pv1vZo"
+    b"ba/2hfZuo7WXG6i9Xdvjtb3eu9r7XaW94E7aG7Y94nfaM96mPeRB2lO2vWXbY36gPec12oPurD1p25t+"
+    b"p73qbdq7DtZetu1p2972Xe11r9De91faC7c98RfaI/9ee+a9tYdue+lJ2lvfpb32wdp7tz1424u/p735"
+    b"5dqrb6+9e9vDf6o9/e+0x99Ve/629/9WWYAtygb0UVbAMgOJyhDsUKZggDIGljV4r+zBHmURBiubYBkF"
+    b"yyrcVnZhibIMLZVtsIzDHWUelioD0VqZCMtG3FVWIkrZidbKUlim4q4yFkuVuWilDIZlMf5WNiNSWY3m"
+    b"ym5YhuOmMh0LlfGwrIdlPnzKgOxUJiRQGRHLiiQoOxKjLEkvZUssY/JGmZONyqB0VibFsilPlFVZpexK"
+    b"gLIslmm5q4xLpDIvln2xDIxPmZhtysj0UWbGsjOvlaXZoGxNB2VtLHPzjzI4UcrkWDbHMjrvldnZpgxP"
+    b"b2V6LNvzUlmftcr+tFMWyDJBfysjtECZIcsOWYYoVpkiyxZ9o6yRZY4se3RfWaTFyiZZRsmySvHKLm1W"
+    b"lqmjsk2WcbqnzNMiZaAsC2WZqHfKSG1QZqq9MlSWpbqtbNVcZa0sc2XZqxfKYq1SNssyWpbVeq/sVoyy"
+    b"XF2V7bKM1wNlvhYpA2ZZMMuEvVFGbK0yY5YdswyZU6YsRhmzLsqcWfbsnrJo85VNs4yaZdWeK7u2XFk2"
+    b"y7RZti1eWbcNyr4FKAtnmbiryshNV2bOsnOWobujTN1cZewsa2eZu0fK4EUqk2fZPMvovVRmb4UyfJbl"
+    b"s0yfZfvOKOsXquyfZQCTlQncpIygZQUtM+iUIYxWpvBrZQwta3hN2cPpyiJaJtGyiTeVVQxTdtEyjJZl"
+    b"vK1sY7iyjpZ5tOzjHWUhZysbaRlJy0reVXZytrKUlqm0bOVdZS1nK3tpGUzLYt5RNjNcWU3LbFp2829l"
+    b"OWcp22kZT8t63lT2c4ayoJYJtWzodWVFpyo7ahlSy5JeUbZ0krKmljn1KYO6UZlUy6ZaRjVBmdW1yrBa"
+    b"ltUyrW+VcV2uzKtlXy0D+0yZ2EhlZC0ra5nZf5WhnatMrWVrLWN7W5nbGcrgWhbXMrlXlNGdoMyuZXcT"
+    b"leVdo2yvZXwt6/tS2d+lygJbJtiywf8oKxyh7LBliC1LfF3Z4snKGlvm2KsM8jplki2bbBnlV8osL1GG"
+    b"2bLMlmm+r4zzLGWeLftsGegrykSPV0bastKxyk4vV5baMtWWrX6orHWEsteWwbYs9lVlsycoq22Z7Vhl"
+    b"uJcr023Zbst4/6PMd7gy4JYFt0z4ZWXExyozbtnx18qSL1G23DLmljX/W9nzacqiWyY9WRn11cqsW3bd"
+    b"MuyPlGmPUMbdsu6Web+kDHyoMvGWjX+hrPxCZectQ29Z+uvK1k9U1t4y92+VwV+qTL5l8y2jf1uZ/cnK"
+    b"8FuWP07Z/m+V9bfMv2X/76gWYKpqA6xGIF41A8tUQ2C1BFZTcEc1BlNVc2C1B/GqRfhWtQlWo2C1CrdV"
+    b"uzBZtQxW0/BONQ5LVfNgtQ9WA3FDNRETVCNhtRKvVDuxULUUVlNhtRVXVGsRqtoLq8F4qpqMCNVoWK2G"
+    b"U+3GWtVyWE2H1XbcV63HdNV+WA1IvGpColQjYrUiVjNyQzUk41VTYrUlz1VrMle1J1aDYrUo51SbMky1"
+    b"Klazck81LFNV02K1Le9U6xKp2hergbFamCuqjQlRrYzVzDxUDc1M1dRYbU28am2iVHtjNThWi3NVtTmh"
+    b"qtWxmp1HquEJU02P1fYkqNYnSrU/VgNktUB/qTZotGqFrGbooWqIZqimyGqLYlVrFKnaI6tBslqkS6pN"
+    b"GqFaJatZuqcapsmqabLapleqdZqn2iergXqvmqiVqpGyWimrmbqhGqqxqqmy2qpHqrWaqdorq8GKVU3W"
+    b"YtVoWa2W1WxdUA3XUNV0WW3XbdV6TVDtl9WAPVFN2CzViFmtWJxqxyJVS2Y1ZVZbdl61ZkNUe2Y1aLdU"
+    b"kzZONWpWq/ZItWszVMtmNW1vVeO2QDVvVvv2XrVwK1QbZzVyVit3VbVzo1RLZzV191RjZ7V2rWr8r/bu"
+    b"mWrxwlWbZzV6carZW6waPqvls5q+P1XjN1A1f1b7d1W1gCGqDbQawXuqGZykGkKrJXyq2sIw1RpazeE7"
+    b"1SAuUE2i1Sb6VKu4TLWLVsNotYyXVNs4TLWOVvN4UzWQY1QTabWR/6hWcopqJ62G8rlqKsNVY2m1lrGq"
+    b"vVyoWkyryfSpRvNb1Wxa7abVcF5UTecQ1Xhared11X6OVi2o1YTeU43oRNWMWu3oY9WSTldtqdWYvlLN"
+    b"aYRqUK0WNV61qYtUq2o1q+9Vw7pMNa1W22o1rhdV8zpENbBWC3tNtbGjVCtrNbN3VEM7XjW1Vlv7r2pt"
+    b"p6j21mpwn6kmN0w1ular+0a1u3NVy2s1vQmq8V2sml+r/X2vWuBlqg22GmGrFb6g2uHBqiW2muKrqjEe"
+    b"qZpjqz2+pVrkMapNthrl+6pZnqQaZqtlfqTa5mmqdbaa5xeqgZ6lmmirjX6rWul5qp22GuoE1VQvVo21"
+    b"1Vr7VHv9rWqxrSbbarPPqVZ7oGq3rYb7smq6h6nG22q9b6j2O0S14FYT/rdqxMepZtxqxx+olvwb1ZZb"
+    b"jflj1ZxPVw261aK/UG16uGrVrWb9rWrY56qm3WrbE1Trvki171YD71VNfJRq5K1W3mrm/1QN/QDV1Ftt"
+    b"/SXV2g9R7b3V4F9VTf5I1ehbrf4t1e6HqpbfavrvqcZ/gmr++fg9D51zuzEVbVEYz947tx9haI8SeO1z"
+    b"7mdEoBPKItbr3FEsQHdURFKycyewBL1RDS7JuT+wDIGoiVQ4n+jcagxCXaTDlQTnvsNwfIpMuBHv3PcI"
+    b"QUNkx50452IwDk2RBw9induBb9AKBfH4nXN7MR0BKIYXb507iHB0QCm8fePcEcxDV1RAwmvnjmMxeqEq"
+    b"fK+cO41v0R81kBLnXjq3CgNRB+lw5YVz6zEMnyITbjznb8FoNER23Hnm3I8Yj2bIi3+fOrcTk9EahfD0"
+    b"iXM/YSbaowReP3buF0SgE8oi7pFzv2EheqAyvHzQpxCFfqgOP5z7l9eNgaiDdLjyD58BhqM+MuPmA+d+"
+    b"QCgaIyfu3XduGyaiBfLj0T3n9mAavkRRvLzr3CHMRkeUQewdjh0sQHdUgvdvXiOi0A/V4YdztzlOMAh1"
+    b"kR5/3XJuI0aiAbLi9k2OCYxDU+TBPzec24UpaIPCeH7duQOYhQ4ojXfXnPsVC9AdleC9yutBFPqjBlLi"
+    b"wl/OrcFg1IM/rl9xbjNC0Ag5cO8y7w8moiUK4Mkl5/ZhJtqjJN5c5NjDPHRDRSRfcO4kotAPNZASF87z"
+    b"uzEEnyAjbpzjmEIoGiMXHvzJdwGT0QaF8fwsxz3C0RFlEfeHc8ewGL1RDR78eYbjAgNRFxlw7bRzmxCC"
+    b"RsiJ+6ec245v0BqF8fwkvwez0QllEX+C7xIi0Qcfwg/nf+fvwRB8gky4edy5aIxFU+TFw2McV5iOdiiB"
+    b"N7/xvmEBeqAK3h/lXIMVCEZdZMC1X/l8MBqNkRv/HOHYwFQEoDheH+ZnYj66ozLe/8LPxAoMRF344/rP"
+    b"vO8YgybIi4eHeJ2YgfYohXcH+T5iEXrjA/jh/AHn1mIY6iMr/t7v3FZMQisUxvOf+P5gDrqgIrz7nDuD"
+    b"5QhGXfjj+l6+pxiLZsiHx3s4b2AWOqIcEjnpn0AUAlEb6XB1F+8TQtEEefFoJ8cswtABZZGwg/8eUQhE"
+    b"baTHte28JxiDpsiHJ9u4niAcnVAeyVs5j2I5gvExMuLmj3yHMQEtURgvYjjHYR66oyo8OL+F9w/D0QA5"
+    b"cD+azxTT0B6lEPeDc79jKQJRG+lx/XveK4xDCxTC881c5zAP3VEVKXBhE+dyjERD5MK/G7m2IAwdUR7J"
+    b"G/hcsBKD8Smy4u53fB8xFe1QCnHreV2IQhDqICNureN6gElog+J4u5ZjCJHoj9pIjxtrnNuCCWiNoni9"
+    b"mnMrFqMfaiE9rq/i38UEtEZRvFnJv4tI9EdtZMCNFXwOmIQ2KI53y/kOYymCUBeZ8PcyznOYgnYojYRv"
+    b"OXdiBQajPrLjQRTfD4ShEyri/VLO8ViHkWiMvHiyhOMe89ATHyI1rkbyuWE8WqMY3i7mtSEKA1APWXBv"
+    b"EccDZqAjKuD9Qn4f1iMETVAAzxc4dxiL0Be14Y9b8/n7MBVfoSyS5zl3FmsxEo2RD8/mcqxiIfqiNvxx"
+    b"ew7nSUzD1ygPXwSvA+sxGs1QCK9m85lgKQagHrLiQTjHG8LRDdWQCldncb7EJHyJ0kgM45yFNRiJL1AA"
+    b"L2ZyncMSBKEesuHBDL7jiEAPfIi0uDGd8xGm4iuUx/tpfB+wEWPRCsURx03kKazCcDRGfrycwt+DpQjG"
+    b"p8iJR5O5TmA++uIjZMK9bzhGEI7u+BDpcHMS7yGmoxMqIyX+mshxjcloj/JwE5y7iM2YgC9RGsnjec+x"
+    b"AWPRGiWROI73C+swGi1QDPFj+T5jLULQHEURO4a/FWswCs1QBLGh/HOsxig0QxHEjuafYw1GoTmKIi6E"
+    b"8yDWIgQtUBzxo3g9WI9QtEJJJI3k2owNGIe2KAPfCP5efI9JaI8KSIG/hvNdxlR0RBWkxs1hnJMQhm6o"
+    b"AX/cHcpxhrnog7rIhodDODdiMYLxGfLi5WDuIbACw9EURRE3iL8B32Ec2qIs3EDuMRGDaeiMD5Aed4L5"
+    b"3ZiLvvgYOfBkANdlRGEovkBhxAbxO/AdxiEA5ZEC1wL53iIM3VELmfFvf84riMQgNERBvOvHZ4H1GIcA"
+    b"lIcfrvflvUI4eqEOsuNJH75PWIbhaIbiSOrNdwTRmIrO+BAZ8aAXxz0iMQiNUBhxPflssQnfoAOqIT3u"
+    b"9eCeFYswEI1QCHHd+W+wGZPRER/AHw+68XdiCYagCYohqSvHCrZgOrqjNrLhSReuM1iJELRBOfjhZmee"
+    b"FTEPgWiAAojtxLkQmzEFnVEDWfCoI+8PViAEbVAOKXGrA581FiAYjVAEiV/z+hCDMPTCx8iNV1/xGWED"
+    b"JqETqiMzHrfnPINVCEUAKiEd7rXjvUAUhqMlyiIlbgVw7sMiDEZTlIT7ks8duzEfwWiMYvDysPwXdmAO"
+    b"gtAQRZDUhuMb2zEHgfgcRZDUmv8N2zEHQWiIovC24mdiJ+ZhABqjON635LVgDxZiMJqhNPxwuwX3WFiC"
+    b"4WiFCkiL+825JmEFQtEO1ZAJT5px3cR6TEIX1EYuvGnK54pohKEvPkNhJDfhuoPdWIghaIFySIP7X3At"
+    b"xUqMxdeojux42ZhzKn7ATPRBAxSBrxF/J/YhEiPQBpWREY8bcs+EDZiCHvgEBZH0Oa8Je7AYw9AGlZER"
+    b"Txpwz4qNmIZe+AxF4PuM4xv7EYXRaI/qyI7X9fme4UdEIBjNUBZp8e+nnAPxHaagJ+qjCN5/wjGGg1iO"
+    b"seiI2siL+HocE9iNSIxEAD5Edrz+mHtdbMN8DEFrVEFmvKjL54QYzMEgtEQlZMSzOrzf2IIIDEQLVEQm"
+    b"PP+IcyhiMAeD0QqVkQUva/O3YxvmYxja4gNkx9tazl3CLkQiBF+jFvIisSafKQ5gBSagGz5FUaTAvRp8"
+    b"d7EBM9AfTVAe/nhWnb8RW7EAw9EONZAHiR/yO3AQqzAJPfE5SiEtHn/ANRhbMBdDEYAayIPEatzv4BDW"
+    b"YAr6oDHKwR8vqnL/gJ2IRCg6oR6Kwg//VOE4ww+Yg6EIQE3kg7cy98z4FRsQhmC0QjXkQkIlXgt+xjpM"
+    b"RxBaoApyIK4ifzN+xlpMRxBaoCpyIqECxzV+wXrMRDBa40PkQXJ5rrv4DZsRgaFoj49QCH74txznXmzF"
+    b"YoSiKxqgNPzxqizHAn7CKkxFIFriA+SGtwz3GDiOaMzHKHTCpyiFDHhZ2rnL2I81mI5gtEFNFEAKPCzF"
+    b"8Y0diMJE9EZTVEEuJJfkd+J3xGARxqA7GqMisiOhBJ8NjmELFiIU3dEIFZEDicV5z/A7YrAY49ALTVAF"
+    b"ueErxnUYp7ED32IyAtEaNVEIqfGsKNc9HMA6hGMYOqI+yiIL4ovwGnEcP2IJJqIfWqEmCiMNXhTm3IKf"
+    b"sRFzEYJu+AJVkAcePCrEeQY/YR3CMQKd0RCVkAvvC/Ke4xx+wlqEYwS6oBEqIw9S4EkB/i4cxAbMQyh6"
+    b"ojmqozDS4nV+jmn8hh+xFJMRjPb4BGWRHd58HJM4h/34DnMRil5oiVooBn/E5eUzwynsxmqEYyS6oxmq"
+    b"owgy4F0e3mecwm6swWyEoCdaoBaKIxMScnPdw5/Yjw1YgPHojwB8gvLIhRR4notrFn7DNqzATIxAdzRH"
+    b"LZRAFiTn5L3HRfyCLYjCNAxFVzRFDRRHZiTn4L/BJRxBDJZhJkaiB1qiDsogJ1LgRXbOQTiB3ViHeZiA"
+    b"AfgajfABiiATkrJxHOEyjmI7ViECY9Ef7fE5qqEIMiE5K+dn/IVj2Im1mIeJGIhOaIpaKIWc8MPrLHxO"
+    b"OItDiMYyzMJo9EN7NMSHKI5s8OBlZu6d8AcOYguWIxxjEIQOaIJaKIPcSIPYTJzrcRm/YRe+w2JMw0j0"
+    b"QQA+R3WURE6kwruMnBtwGcewGxuxBDMxGoHogKb4COVRAP7w+nP84Db+xGFsxzoswjSMQj98jSaogwoo"
+    b"iMxwGXj/cA+XcAx7sRnLEIGJGIKeCEAj1EI5FEAmuPT8HNzHZZzAfmzBKizAVIQgEJ3REvXxAUohL/zh"
+    b"S8d1BPdxBSdxEFuxDpEIwzgMRi+0RxPURRUUR26khy8tPw8PcBWn8Qt2YiOWYS6mIAQD0A1fojHqoDJK"
+    b"IA/84dLw+eERbuE8jmE/tmI9ojAHkxGCYPRAezTFJ/gQZVEIOZAOvtTce+MhbuECfsch7MBmrMQihGEi"
+    b"RiII3dEezVEfNVERxZEXmZEKyan4vPAQt3ARp3AYexCD9ViG+ZiJCRiJYPRCB7RGY9RDdVRAceRDVqTF"
+    b"+5R8V/AMD3ADF3AKR7AP27AJq7EUczEDEzEKg9AXXdEeLdEI9VADlVAKhZALmZEG7/24XuIlHuIOruI8"
+    b"TuFXHMAubMEGrMJSzMcsTMZYjMQg9EN3dEBbNEdD1EMtVEV5lEAh5EZWpEdK+FLwmvAKT/AAt3EVF3AG"
+    b"x3EY+7EbW/E91mMVorAIcxCGKZiA0RiOQeiPXuiKDghAKzRFQ3yKOqiBqqiA0iiOQsiLnMiCDEiDFPB5"
+    b"uP/BO7zCMzzEffyNG/gLF/EnTuN3HMUvOIB92IVtiMH32IB1WIXlWIrFWIA5CMdMTMM3mICxGI2RGIbB"
+    b"CEYQ+qE3eqAbOqMDvkIA2qIVWqApvkAjNEB9fIKPUQe1URPV8QGqojIqojzKogxKoQSKoyiKoBAKIj/y"
+    b"IQ9yIxdyIjuyISuyIDMyISP8kQHpJR3SIo2kllSSUvz+jxT/j/7vz/jv5/73e/77vf+9jrR6bf+9zgx6"
+    b"7Rn1t2TW35ZVf2t2/e259F7k0XuTX+9VIb13RfVeltB7W0bvdXm995X1WXygz6amPqs6+uw+0WfZQJ/t"
+    b"F/qsW+izb6tj4SsdG511rPTQsdNPx1Kwjq1hOtZG69iboGNxmo7NcB2rC3TsLtWxvErH9gYd6zE69nfp"
+    b"u3BA342j+q6c1nfnor5LN/Tduq/v2jN9997pu2jfyRT6jmbQdzanvsOF9J0ure94VX3n6+gc0FDnhFY6"
+    b"R3TQOaOXziGDdE4ZrXPMFJ1z5ugcFKVz0nqdo7bqnLVf57DjOqdd0Dnuts55T3QOtHOhnRNT6hyZVefM"
+    b"QjqHltc5tZbOsQ11zm2rc3B3nZMH6Rw9VufsWTqHL9U5fYPO8bt0zv9V14Dzuibc0TXipa4Zdu1Io2tJ"
+    b"Ll1bSulaU0PXnka6FrXXtamvrlWjdO2aoWvZUl3bNulat0/XvlO6Ft7QtfGZrpV2zUyra2g+XVMr6Bpb"
+    b"T9fc1roG99I1eaSu0TN1zV6ma3iMrumHdY2/qGv+Q90D2L1AKt0b5NW9QkXdO9TXvUR73VsE6V5jou49"
+    b"FuleZLPuTQ7pXuWC7l0e6l7G7mnS6R6nkO55PtQ9UFPdE/XQPVKI7pnm6B5qve6p9use67zuuR7pHszu"
+    b"xfx1b1ZC92p1dO/2pe7lBujeboru9Zbp3m+n7gVP697wge4V7Z4xve4hi+uesq7uMdvrnnOw7kHDdE+6"
+    b"TveoB3XPekX3sHYva/e0/rrHLaV73vq6B+6se+IQ3SMv0D3zFt1Dn9A99X3dY9u9dibde5fTvXgj3Zv3"
+    b"1L36RN27L9O9/F7d21/Svb7d89u9f2Y9C1TQs0ETPSv007PDND1LrNOzxWE9a9zWs4c9g/jrmaS8nlGa"
+    b"6pklUM8wM/VMs1HPOMf0zGPPPvYMlErPRCX1jPS5npn66Blqmp6pvtMz1m965rJnL3sGS6NnsjJ6Rmui"
+    b"Z7YgPcOF65lui57x/tAznz37efQsWFzPhg31rNhPz46z9CwZrWfLs3rWtGdOPz2DltIzaVM9ow7UM+s8"
+    b"PcPu1DPtX3rGtWfdTHr2raZn4fZ6Nh6rZ+VVenY+qmdpe6a2Z+tMetb+QM/eX+tZfIKezdfpWf2Ent3t"
+    b"GT6FnunL6Bm/pZ75R2oNYJnWBI5ojcDWCmzNILPWEGpoTaGr1himac1hi9YgLmpNwtYmsmitopbWLrpr"
+    b"LWOm1ja2aa3D1jxs7SOF1kLKa20kQGsl47V2skFrKX9qbcXWWDJpzaWW1mB6ak1mttZodmvNxtZubA0n"
+    b"g9Z0qmuNp7vWfMK1BmRrQae1NmRrRP5aM6qlNaReWlOaqzWm/VpzsrUnW4PKrjWpT7RGFaw1q6Vaw/pN"
+    b"a1q2tpVWa13VtfbVU2th87Q2dlBrZbZmlkJraJW1ptZFa2zhWnP7SWtwthZna3K5tEbXUGt2I7SGt05r"
+    b"era2Z2t8Hq35VdEaYDetCc7VGuHPWjO0tcM0WkusqbXFflprXKK1x+Nai7Q1ySxao6yvNcthWsNcpzVN"
+    b"W9u0Nc7UWvOsqTXQQK2Jfqs10tNaM7W109xaS22itdVxWmuN0dqrrcHaWmwOrc020lptqNZut2gt19Z0"
+    b"bW03u9Z6G2vtd4zWgmO0NmxrxLZWnEtrx021ljxRa8s7tNZsa84ptAZdU2vSwVqjXqM1a1u7tjXsDFrT"
+    b"/lRr3KO05h2tNXBbC7c18dxaI2+pNfOpWkP/SWvqtrbur7X2Blp7D9Va/FatzdsavZ/W7D/SGv5Qrelv"
+    b"1hq/rfXbmn8e7QG01p7ATO0R/KI9A9s7yKm9hBbaW5iuvYaftfdgexA5tCfRQnsU07Vn8bP2MGwvI5f2"
+    b"NlppryNMex+/ai/E9kTyaY8kQHsmc7SHYnsptqfipz2WetpzCdUezE7tydjejL/2ahpr72aK9nIOaW/H"
+    b"9njyaM8nQHtAc7UnZHtDtkeUVntGn2sPaZL2lA5qj8n2mvJo76md9qIWaG/K9qhsr8pfe1dNtJc1Q3tb"
+    b"tsdle10ptPf1qfbCJmhv7ID2ymzPLK/20L7Wnlqk9thsr8323LJrD66t9uTma4/O9upszy6L9vBaaU9v"
+    b"jvb4bK/P9vwyaQ+whfYEI7RHaHuFtmeYUXuILbWnOEd7jLbXaHuOmbUH2Vp7kvO1R2l7lbZnmV17mAHa"
+    b"04zUHqftddqeZ17tgXbUnuhy7ZHaXqntmRbRHmpP7al+pz1W22tNq73XZtqLjdDerO3R2l5tdu3dttde"
+    b"bpT2dm2P1/Z6i2jvt5f2gjdqb9j2iDNqz7i19pAXaU/Z9pZtj7mg9px7aA96g/akbW86o/aq22jvOlJ7"
+    b"2banbXvbRbTX3Ud73z9oL9z2xG1vvIb2ysdq79z20G0vPY321ltor32h9t5tD9724gtrb76v9uqjtXdv"
+    b"e/i5tKffRXv867Xnb3v/mZQFaK9swAplBSwzkFYZglbKFCxRxsCyBn7KHjRTFmGhsgmWUbCsQnFlFwYo"
+    b"y7BT2QbLOBRV5iFIGYjtykRYNqKIshKByk5sV5bCMhVFlLEIUuZihzIYlsUopmxGsLIau5XdsAxHSWU6"
+    b"BivjYVkPy3ykVAakpTIhUcqIWFYknbIjAcqSrFK2xDImmZU56aQMygZlUiybkltZlV7KrsQoy2KZliLK"
+    b"uAQr82LZF8vApFQmpo0yMiuUmbHsTBZlaTorW7NZWRvL3BRQBidQmRzL5lhGx0+ZnTbK8KxUpseyPdmU"
+    b"9emu7M8WZYEsE1RMGaEhygxZdsgyRP7KFHVUxmizMkeWPSqkLNJAZZMso2RZpfTKLnVQlmmTsk2WcSqs"
+    b"zNMgZaAsC2WZqIzKSHVWZipaGSrLUhVXtmq4slaWubLsVXZlsXopm2UZLctq+Sm7FaAs13pluyzjVVCZ"
+    b"r0HKgFkWzDJhmZUR667MmGXHLEOWQpmyAGXMvlPmzLJnhZVFG6psmmXULKuWQ9m1vsqyWabNsm3plXXr"
+    b"rOxbjLJwlomzbNyXysp9p+ycZeiKKlM3XBk7y9pZ5i6vMnjByuRZNs8yetmU2eujDJ9l+SzTZ9m+6sr6"
+    b"hSn7ZxnA1MoEdlRG0LKClhlMoQxhe2UKv1fG0LKGZZQ9HKcsomUSLZtYUlnFUGUXLcNoWcbiyjaGKOto"
+    b"mUfLPhZVFnKUspGWkbSsZBFlJ0cpS2mZSstWFlHWcpSyl5bBtCxmUWUzQ5TVtMymZTeLKcs5WtlOy3ha"
+    b"1rOksp9jlQW1TKhlQ0srKzpB2VHLkFqWtLyypZOVNbXMaUplUDspk2rZVMuoplNmtbsyrJZltUxrJmVc"
+    b"+yrzatlXy8DmVCY2WBlZy8paZja/MrTDlam1bK1lbIsrcztWGVzL4lomt7wyulOV2bXsblpleXso22sZ"
+    b"X8v6ZlP2N0hZYMsEWza4gLLCI5UdtgyxZYlLK1s8SVljyxynUga5mzLJlk22jHJWZZYHKMNsWWbLNBdS"
+    b"xnm0Ms+WfbYMdHlloqcpI21ZaX9lp/sqS22ZastW51PWeqSy15bBtix2WWWzpyqrbZltf2W4+yrTbdlu"
+    b"y3gXUOY7RBlwy4JbJryCMuIzlBm37HgWZckHKFtuGXPLmhdT9ny8suiWSU+tjHpPZdYtu24Z9rzKtI9U"
+    b"xt2y7pZ5r6gMfJgy8ZaNz66s/GBl5y1Db1n60srWT1HW3jL3mZTBD1Im37L5ltEvrsz+JGX4LcufQdn+"
+    b"/sr6W+bfsv9FVQswQbUBViOQXjUD/VRDYLUEVlNQVDUGE1RzYLUH6VWL0F+1CVajYLUKxVW7MEm1DFbT"
+    b"kFE1DkGqebDaB6uBKKWaiKmqkbBaiayqnRisWgqrqbDaivKqtQhT7YXVYORSTcZI1WhYrUYK1W70UC2H"
+    b"1XRYbUch1XqMU+2H1YCkV01IoGpErFbEakZKqYZkmmpKrLYkh2pNhqv2xGpQPKpJ6a4aFatVsZqVwqph"
+    b"maCaFqttyahal2DVvlgNjNXClFdtTLhqZaxmJp9qaMaopsZqa9Kr1iZQtTdWg2O1OGVVmxOmWh2r2cmr"
+    b"Gp5Q1fRYbU861foEqvbHaoCsFqicaoNmqVbIaobyqYZorGqKrLbIX7VGwao9shokq0WqqNqkOapVspql"
+    b"wqphmqSaJqttyqpap2GqfbIaKD/VRPVWjZTVSlnNVCnVUM1QTZXVVuVVrdUY1V5ZDZa/arIGqkbLarWs"
+    b"Zquyarjmq6bLaruKq9Zrqmq/rAYst2rCRqtGzGrFMqh2LFi1ZFZTZrVlVVRrtkC1Z1aDVkI1adNVo2a1"
+    b"anlVuzZWtWxW05ZJNW5DVPNmtW9+qoXro9o4q5GzWrmyqp2brVo6q6krrBq7b1RzZ7V3OVWLF6LaPKvR"
+    b"y6CavYGq4bNaPo9q+3qr1s9q/qz2r6xqAcNVG2g1goVVMzhZNYRWS2g1hV+oxtBqDa3mMKNqEIeoJtFq"
+    b"E1OqVrGfahethtFqGSuqtnGeah2t5rGkaiBnqibSaiMLqFZyomonrYYyh2oqQ1RjabWW/qq9HKxaTKvJ"
+    b"TKkazf6q2bTaTavhrKSazgWq8bRaz9Kq/ZylWlCrCS2sGtEpqhm12tE8qiUdp9pSqzHNqprTkapBtVrU"
+    b"9KpNHaRaVatZ9VMNaz/VtFptq9W4VlLN6wLVwFotbBnVxs5WrazVzBZVDe001dRabW1+1dpOVO2t1eDm"
+    b"VE1uqGp0rVY3s2p3h6uW12p606nGd6Bqfq3210+1wP1UG2w1wlYrXFm1wwtVS2w1xWVVYzxHNcdWe1xC"
+    b"tcgzVZtsNcqFVLM8WTXMVsucV7XN41XrbDXP2VUDPVo10VYbnUm10sNUO2011OlUUz1QNdZWa51Stdf9"
+    b"VYttNdlWm11VtdqLVbttNdwVVNM9TzXeVutdSrXf4aoFt5rwYqoRn66acasdL6ha8m9UW2415nlUcz5O"
+    b"NehWi55dtekhqlW3mvVMqmEfrpp2q21Pp1r3Qap9txr4VKqJD1SNvNXKW818NdXQL1FNvdXWV1St/QLV"
+    b"3lsNflnV5EeoRt9q9Uuodj9MtfxW019YNf5TVfNvtf/51AtggnoDWI+AnOoZEKoeAtZLIIt6C4xUrwHr"
+    b"OeCvHgRD1JPAehOkUa+CAepdYD0MUqinQT/1OLBeB9bzoIp6ICxSTwTrjVBevRLmqneC9VAopZ4K4eqx"
+    b"YL0Wiqr3wnT1YrCeDAXUo+Eb9Wyw3g151MthnHo7WI+H7Or5EKIeENYLIpN6QwxTr4grmf7XO6KOeklY"
+    b"TwnrLZFSvSb6q/eE9aCwXhRV1ZtisXpVWM+K8uphMU89Lay3RSn1upil3hfWA6OoemJMU48M65WRX70z"
+    b"JqmXhvXUyKUeG2PUc8N6b2RRL44R6s1hPToyqGfHYPXwsF4eqdTbI1C9Pqznh/X+qKpeIIvVG8R6hJRX"
+    b"z5C56iFivURKqrdImHqNWM+RwupBMkU9Saw3SV71Khmv3iXWwySbepqMUo8T63Xir94nQ9QLxXqipFKP"
+    b"lED1TLHeKdZDpap6qixSjxXrtVJOvVci1IvFerIUV4+W6erZYr1bCqiXy0T1drEeLznU82W0esBYL5iM"
+    b"6g0zRL1irGdMKvWQCVRPGestYz1mKqvnzEL1oLFeNKXVmyZcvWqsZ01h9bCZop421tsmt3rdjFHvG+uB"
+    b"k1k9cYapR471ykmt3jmB6qVjPXWst05l9dpZoN471oOnlHryhKlHj/XqKajePZPUy8d6+uRQj58Q9fyx"
+    b"3j8Z1AtooHoDWY8gj3oG9VIPIeslZD2FyqjHULh6DlnvIetB1Fo9iaw3kfUoyqGeRaPUw8h6GaVXb6Ng"
+    b"9TqynkfW+6iKeiEtUG8k65FUUj2TZqiHkvVSyqfeSuPUa8l6LmVWD6Yh6slkvZn81Kupj3o3WQ8n6+VU"
+    b"Rr2dZqnXk/V8KqAeUBPUE8p6Q2VRr6ih6h1lPaT81FOqj3pMWa8p6zlVWj2oZqonlfWmyqdeVWPVu8p6"
+    b"WGVUT6tB6nFlva6s51UV9cCap55Y1hurmHplTVbvLOuhlUM9tUaox5b12kql3lt91YvLenJZb67S6tU1"
+    b"Q727rIdXHvX0Gq0eX9brK616fwWqF5j1BLPeYGXVKyxMvcOsh1he9RQLVY8x6zWWTr3HAtWLzHqSWW+y"
+    b"MupVNlO9y6yHWW71NAtRjzPrdZZavc/6qhea9USz3mgl1SttqnqnWQ+17OqpNkw91qzXmke917qrF5v1"
+    b"ZLPebIXUq228erdZD7cM6ukWpB5v1uvNer6VVg+46eoJZ73hcqhXnPWMW6MectZLrrJ6y0Wo15z1nMuv"
+    b"HnSh6klnvelSq1ddb/Wusx521suuiHrbTVCvO+t5l0E98ALVE89641mPvBLqmTdZPfSsl14m9dYLVq89"
+    b"67lnvfdKqRffVPXmsx59WdSzb6B6+FkvP+vpV1o9/qaq55/1/susXoDB6g1oPQKtV2Ap9Q6crF6C1lMw"
+    b"o3oMBqnnoPUetB6ExdSTcKJ6FFqvwnTqXdhHvQytp6H1NiyoXoeh6n1oPRD91BOxm3okWq9E65mYWz0U"
+    b"h6mnovVWtB6LZdVzcZp6MFovxkzqzRioXo3Ws9F6NxZWL8ex6u1oPR791POxq3pAWi9I6wmZQz0iB6ln"
+    b"pPWOtB6SJdRTcoJ6TFqvydTqPdldvSitJ6X1psypXpWD1bvSelhaL8vi6m05Xr0uredlSvXA7KqemNYb"
+    b"03pkZlXPzCD10LRemtZTs6B6bIao56b13rQenGXVk3OyenTeCPlfz87q6uEZoZ6e1tszu3p9DlDvT+sB"
+    b"ar1AC6o36Ej1CrWeodY7tJR6iU5Qb1HrMeqnnqOd1IPUepFaT9IM6lHaSz1LrXep9TDNpp6mQepxar1O"
+    b"redpXvVAHaqeqNYb1XqkFlbP1BD1ULVeqtZTtaR6rI5Tz1XrvWo9WMupJ+sk9Wi1Xq0p1Lu1g3q5Wk9X"
+    b"6+2aWr1eO6v3q/WAtV6wadUbtpt6xVrPWOsdm169ZLurt6z1mLVes/7qPdtDvWitJ631pvVXr9qe6l1r"
+    b"PWytl62/etv2UK9b63lrvW8zqBdud/XGtR651is3vXrndlUvXeupa71106jXbmf13rUevNaLN6V6836t"
+    b"Xr3R6t1rPXzLqafvBPX4tV6/1vO3pHoAh6onsPUGth7BRdQzeLh6CFsvYespnE89hgeq57D1HrYexNnU"
+    b"k7iPehRbr2LrWZxBPYy7qKex9Ta2Hscp1PM4QD2QN6gnsvVGLqpeycPVO9l6KFsv5dzqrRyoXsvWc9l6"
+    b"L/urF3MX9WaOUa9m69lcRj2cQ9XT2Xo7W4/n/Or5HKwe0NYL2npCZ1SP6K7qGR2jHtLWS7q0ekuHqNe0"
+    b"9Zy23tO51Yu6n3pTW49q61WdRr2r26uX9Qb1trYe1wXV8zpYPbCtF7b1xM6gHtkd1TN7s3poWy/twuqt"
+    b"PUi9tq3ntvXezqBe3NaTe5J6dFuvbuvZXVA9vAeop7f19rYe32nU87udeoCvVU9w6w2eW73Ce6t3+Db1"
+    b"Eree4iXVY3yYeo5b73HrQe6vnuQd1KN8g3qWW+/yvOpl3ke9zbep17n1PC+hHuhD1BPdeqNbj/S06pke"
+    b"oB7qq9RT3XqrZ1Wv9c7qvb5RvditJ3se9WjvpZ7tMerhbr3cC6u3e6B6ve9U73frAV9CPeEHqUe89Yq3"
+    b"nvEp1EO+uXrKR6rHvPWaT6Xe863Ui36petNbj/o06lnfWj3so9TT3nrbp1Gv+9bqfb9UvfCtJ34q9chv"
+    b"qZ75S9RD33rp+6m3fjP12l+o3vvWg9968RdXb/4B6tW/Q737rYd/IfX076Me/1vU8996/+fWLICumg3w"
+    b"nWYF2MyAzJoh0F4zBZZrxoDNGkit2QPNNYtggWYT2IwCm1VQSLMLemuWwfeabWAzDrJp5sFXmoGwQjMR"
+    b"bDZCSs1KaKLZCXM0S8FmKsTu/9+MhY80c2GiZjDYLAabyZBGMxqaaWaDzW7YrlkONtMht2Y8dNLMh1Wa"
+    b"AWGzIFJqNkRjzYqYpdkRNkPCZklk0WyJLzVrIlKzJ2wGhc2iyK/ZFF00q2K1ZlfYDAs/zbRoqBkXMzTz"
+    b"wmZf2AyM9JqJ0VwzMiI0M8NmZ9gMjSyaqdFGMzbma+aGzd6wGRzZNZMjQDM6Fmlmh83usBkeOTXTo51m"
+    b"fCzWzA+b/WEzQHJoJkiAZoQs1MwQmx1iM0SyaaZIG80YmaeZIzZ7xGaQZNJMkhaaURKumSU2u8RmmKTV"
+    b"TJNGmnEyVTNPjmgGis1CKazZKJ01K+VbzU6xGSo2SyWnZqu01ayVuZq9YjNYbBZLWs1maahZLZM1u+WQ"
+    b"ZrnYTJc8mvHSTjNf5msGjM2CsZkwaTUj5nPNjJmoGTL7NVPGZstk16yZlpo9E6ZZNEc1m8Zm1BTQzJqv"
+    b"NMNmvmba2Gwbm3GTSjNvPtEMnFDNxNmhGTk2KyedZuc00Cwdm6kTpRk7NmvHZu5k0AyeBprJM04zenZp"
+    b"Zo/N7rEZPqU006erZvxEauaPzf6xGUCpNRPoY80IGqmZQdGaIWSzhGymUH7NGGqrmUNhmkH0s2YS2Wyi"
+    b"rJpV9IVmF03QLKOdmm1kM45SaeZRHc1AGqqZSBs1I8lmJdnMpGyaodRYM5XGacbSNs1cstlLNoMpn2Yy"
+    b"tdKMpima2bRXM5xsllNqzXb6SLOeBmn201rNgrKZUDYbKp1mRdXV7KjBmiW1VrOlbMaUzZpKq9lTH2kW"
+    b"1UDNplqlWVU2s8pmV6XULKsamm3VX7OuojT76pRmYdlMrJyakdVIM7NCNENrk2Zq2Wwtm7GVXjO36mgG"
+    b"1wDN5FqmGV2nNLPLZndl1yyvBprtNVyzvtZp9pfNALNZYB7NBquiWWHdNDtsjmaJHdRsMZsx5qeZY1U1"
+    b"g6y7ZpLN0YyyA5pZZrPLbIZZbs00a6gZZ8M082y1ZqCd0Uw0m42WRbPSPtbstCDNUovUbLVfNWvNZq6l"
+    b"0gy2qprJ1kUz2sI0s22nZrjZLDeb6ZZBM95qauZbT82Ai9BMuD2aEWez4mxmXEbNkKupmXI9NGMuXDPn"
+    b"dmkGnc2is5l06TSjrppm1nXWDLtpmmkXoxl3VzTzzmbf5dAsvI81G6+PZuXN0ey83ZqlZzP1bLZeas3a"
+    b"q6TZe+00i2+8ZvOt16y+05rdZzP8UmumX0XN+AvQzL8xmgG4RjMBj2tGoM0KtJmB2TVDsLZmCnbTjMGp"
+    b"mjn4vWYQntVMQptNmEazCitodmFrzTIcqdmG32rW4SHNPrQZiDYLMbVmI5bTrMSWmp04TLMUF2u24l7N"
+    b"Wryh2Ys2gzGLZjJ+oBmN7TWzcbRmOC7TTMeDmvFosx5t5qNHMyCLayZkQ82I7KuZkTM1Q3KzZkqe1IxJ"
+    b"mzVpMyf9NYOygmZSttCMyoGaWRmhGZYxmml5RjMubdalzbzMqBmYFTQTs7lmZA7QzMxZmqG5WTM1f9eM"
+    b"TZu1aTM3U2kGZ3HN5KyvGZ3dNLNzvGZ4LtNMz32a8XlZMz9t9mcKzQItrNmgdTUrtINmh47ULNEFmi0a"
+    b"o1mjJzV71GaQ2izSFJpNWkizSmtrdmk7zTIdotmm4Zp1ukGzTw9rFuoNzUa1GakpNTO1kGao1tJM1baa"
+    b"sRqsmavTNYN1lWay7tOM1vOa2WqzW22Ga0rNdC2oGa81NPO1pWbA9tNM2ImaEbtEM2N/1AzZ45ope0sz"
+    b"Zm3WbArNns2rWbRVNJu2sWbVdtXs2hGaZRuu2bZrNOt2r2bf/qFZuPc1G9dm5KbUzNx8mqFbWTN1P9eM"
+    b"3Q6auTtIM3inaCbvUs3ojdbM3sOa4XtJM30facavzfpNrdm/+TQLuJJmA9fXrOAAzQ7up1nCYzRbOEKz"
+    b"hldp9vB2zSI+qtnElzWr+KFmF9sMYz/NNM6pGcelNPO4pmYgN9FM5A6akRykmcljNUN5tmYqL9eM5WjN"
+    b"XD6gGcynNZP5hmY0P9XMZpvd7KdZztk027moZj1X0eznTzQLuoVmQ3fWrOggzY4erVnSMzRbepFmTa/V"
+    b"7OmtmkV9ULOpT2pW9RXNrr6vWdavNNvaZlyn1MzrrJqBXVAzsctqRnZ1zcyurxnazTVT+2vN2O6lmduD"
+    b"NIM7VDO5p2pG91zN7P5WM7zXa6Z3jGZ879XM7yOaAX5aM8Eva0b4bc0Mf6QZ4q81U9xmi9uM8ZSaOZ5R"
+    b"M8hzaiZ5Ic0oL6WZ5ZU0w7yGZprX04zzRpp53kIz0AM0E72zZqT30sz0IM1QH6KZ6iGasT5eM9enagb7"
+    b"LM1kn6cZ7ZGa2b5MM9zXaKb7Bs14/0Ez37dqBvwuzYT/STPif9bM+F81Q/64Zsqf0oz5s5o5f0Ez6K9o"
+    b"Jv01zai/pZn1dzTD/r5m2v+rGfePNfP+KZ7hBV7iFV7jDd7iHWIRh3hJQCKSJFm84pP3/4f7/7Gm0LnY"
+    b"sGPLvJtD43zjx81+7/389vtsb7K7BQNqufblvnT5VvZzy38NcScvTXXp1s51KXYude8Hrnblcm90be5H"
+    b"u1HebW74N7vdmJk/uV9LHnK/9z/sinU96spnOe7GzjjhPj91yi26c8YtPHvWbYg65xY1uODW/XnRfd/g"
+    b"siu+6oqr++AvdzP3Nbev1nXXqskNF9f0prtb75YrVuq22+L52/U8/7dLG3XHtW9/171Kf88N3nPPfd35"
+    b"viufeN+1nf/ANSz2j+uy5R/3ttq/rtOOf93tSg/db989dK3yPHL7pj9yH7165NJ+/dh9uf+x+yL/E5d1"
+    b"9BN35dwTd7DMU/dw3FMX8sdTF1bwmfso6JnbuPOZ+zf5mcvR4Ln7fMZzF37iuXPpXrgdX7xwe6e9cEUO"
+    b"v3BJiS/c1x+8dA2DXrrzq1669BdfuqTUr9yPtV65DwNfuYVLX7nLx165tG9fuQ+KvHZdm712C0a+dn+t"
+    b"fO1qHn/t9jx/7brnfONq1nnjPu/+xs2e+sbl3vTGPTz5xqV99saFZnrrPqv81vVr9dY9H/TWXY9466pF"
+    b"v3XxJ966Kv++dbf83rk0Rd65mDrv3KX279zkoe/cnvB3btR379zRQ+/cuivvXK6X71zhtLHuSGGOnpqx"
+    b"7laLWNepd6wbNybWfTYv1m39LtYd/ynWhZ2NdQn3Yl3e+Fj3KEOcG1g4zm2oFuciG8a5j7+OcyuD4tz+"
+    b"cXFu0Zw4V2F1nJuyLc4tOxLnRl2Icznux7nRb+PcmpTxbkGOeNe8RLw7+0G8K9Ag3tVoy//tEe/ODY53"
+    b"ARPi3cbZ8e7kt/Hul03xbsbueFf8KP/NuXh35Va8e/Uk3t2Lj3c/pEpwzbMluGOFElze8gmucc0E17pB"
+    b"gvuwVYJ72zHBLeib4DIOS3B9xye4lTMT3K6FCS56ZYKbsjnB1dmZ4C4d4t8/keBiLiS4FzcTXI6HCa7A"
+    b"6wSXLjnBXUuV6OZnTnQV8ya6rcUSXd4Kia5/9US3ql6iO9Q40f3WOtHt7JDoZvdMdC0GJLr44fy/xyW6"
+    b"9NMS3fCIRHd8caJLvTLRVdmQ6BrFJLomuxNdzUOJLtuxRHftTKKbeynRVb2Z6A7fT3SfPE10P7zh309K"
+    b"dK1SJLkZ6ZLcj1mS3LHcSe50oSR3pGSS21whyU38IMk1+ijJ+T5NchsbJ7n6LfnfA5LcF52S3O4eSS53"
+    b"/yQXOCjJbRmR5O6PSXIZv0lyZWckuVoRSe6jhUmuSlSSy7sqyb1bn+R++z7JhW3lZ+xOcs/2J7mIw0mu"
+    b"2PEk98PpJFfufJJbcSXJpbqZ5HreTXI7/01yyU+TXO3XSS44LsktTk5yOziD/J462V3IkOwuZkl2p3Im"
+    b"u735kt2KwsludIlk16RssstWKdmdq5bsZtZMdtXrJrtrnya7kIbJLn3TZBfZMtnl/TLZLfoq2aXunOyG"
+    b"dudn9U52lQKT3TcDk93pocku86hk12xMsps4IdlFT05256cnu5ezkl2aucku98JkV2RJsiu2LNkVXJXs"
+    b"sq5Ldu83JLsH3ye7YzHJbtX2ZDdsd7L75Kdkl+pQsvvtMD/nt2T3wYlk9/dpXtOfya7sRf75lWTX6Xqy"
+    b"e3wr2Y24m+wSHvD6HyW7V0+TXe+X/M43ya5OXLJbmZjskr3Jrh1nzE0pvS42jdd9ksHrpmTyuiNZvS45"
+    b"h9dVzeN1PfJ73exCXrejqNddLOF1r0p7XbryXlewktdVqOp1NT70uro1ve7jj7zuo4+97oNPva50A6/L"
+    b"3cjrUjTxusfNvO5MS6+LbuN10wO8rstXXle5o9f5Onvd7928bm5Pr2vbx+uy9Pe6U0FeN3mg11Uf4nUP"
+    b"hnnd/JFeV3u0190c43UTxntd/klet3Oy1zWd5nU3ZnjdgFleFzfb6ybO9Tq/BV43dRG/c4nXjY/yurfL"
+    b"vK7/Sq/7a7XXNVrn5fvOa9rkdWO/57+N5uf+6HWLtnnd0x1e9+lur1uw1+v+/om/6aDXjfjZ63467HXe"
+    b"X/m7jnndmN/5vSf5d097XdGzvN5zvM4LXhdziZ9/xeveX/W6Eje8ruEtr+vzt9d9c9frlt3nPfuHv/Gh"
+    b"1117zPvwlNf6nNf3yusyvPG6rO+8Lkec1+VM4P8m8f/38s/f83dw5YpP4XNPUvrcjdQ+dyqtz+1J73Nr"
+    b"/X1uViafG5zF577M5nMf5vC5HLl87lVunzud1+fW5/e5sQV9rnVhnyte1OfeFPO5IyV8bk4pn+tQxueK"
+    b"lvO5h+V9LroiP6Oyz1Wu6nPPq/ncDx/6XN8aPle4ls9dru1z4XV87pOPfe5lPZ9b/anPtfzM5xIb8PMb"
+    b"+lyLxvzcL3xuaVOfq9vc52628LnxrXwufxteY1ufaxvA627nc5O/8rk8HfhdHX2uXmefO9vF57p287mn"
+    b"3X1udE+fS9Gb39PH57L142f197kCQT63cgCvYaDPrRrkcwWH+FzUUP6+4bz+ET6XepTPjQvhbx3tc33G"
+    b"+NyVsT73xXh+5wSfKznJ5xZ843PeyT7Xbyq/a5rP1Zjhc8tn+pwL87le4T7322z+vTn/H3V3+R41FvYP"
+    b"/E7GteM+Q3CHwha3wWWR4iwa3Ba2uEMWd7q4E1hci2shuENxh+DFi2snv+9eT1881/Mf/F58rraZ5Mh9"
+    b"7nOSeXHSTGXM9Ezl4Qy06Z9MZcFM9GVWpvL7nExlxdxM5ds89HVBpiIuxPFFmUrVJZnKrKWZyqNlmUrR"
+    b"5ah/RaZy4t9MxbYK8VyN2KzJVJ6tzVQKrkc8N2QqWzdmKh83YVy2ZCp9UzKVlK2I77ZMJf8OtHkn+rcL"
+    b"7d6dqVj2ZirV9mUqQ/ZnKpsOZCpyKvp5CMekTKX/YbTlSKaSdjRTyTyGa09kKk1OZiojT2Uqq0+jb2cy"
+    b"lc9nEa/zmUr0QqbS8WKmMj4tU1l7KVM5fTlTeXElU9Ffy1TyXEf7b2Qq7W4iJ25lKnNuZyqb76D9dzOV"
+    b"+/cylU/3MxWjnKlke4j2PspUajxGn55kKt2fol3PkGfPMS7pmcqqF5nKtpeZysFXKP91pnLlTaZy722m"
+    b"8vQd+paBct5nKj8+IM4fMxX150xF9wXlfs1UzN/Qz++ZivUHfv7E379wPBNti+E85X+ezH7CZyamvGVj"
+    b"ynNVTHmgjinXNTHlnDamHNHFlN36mLLBEFOWGWPKP6aYMsYcUwZYYkpna0xpGhdTqtliym/2mMI5YorF"
+    b"GVO+w1NXTElzx5R9npiy0htTpvlwjT+mtA7ElKrBmJI/FFPiwjHlE9yMxJT92WLKUi6mCNljSoccOCdn"
+    b"TMmZK6aocseURyDlwed5Y8qwfDGleX7UVyCmWAvGlBdwtFBMWVwY5ReJKfWKxpTc8THlF1wuFlPWFo8p"
+    b"I36LKY0SYkqeEjHlB5wrib6Uiil9SseUKmViiqMs6oBt5WLK3+VjSoMKMSVcMaa8hN2V0N9oTKlfOab4"
+    b"q8SUJ7C5akwZVC2mRKvHFEMN9BPm14wpbWuh7tq4DlLqxJT+v8eU0nXRFjhUL6aMro9YNYgp2sSYchIm"
+    b"NowptRrFFF3jmHICxjVBv5vGFKZZTDkIw5rHlFItYspH2PxHTOneEjFpFVPuwbzWMSWxTUzRt0VsYHC7"
+    b"mFKUjynPYHF79LcDyu0YUw5AUqeYkqsz4gxTusSUCl1jyjtY3i2mNO6OGPeIKTugU8+Y4voT8YS+vTCe"
+    b"vWPKBRj2V0zJlxRTrsHffWJK4b4x5RaM7RdTivTH7zB6QEwpNBDnwMhBiPVgXAsDhsSU0FCUCd2HYcyH"
+    b"oy5oOSKmxODfkTGl5ijEDKYJMSX+75hyBQaMjineMTFlD/wxFuMGC8fFlLLjUR8MmYDPJ8aUXdBkUkz5"
+    b"ADMmow1TYspp6DwVcZwWU5ZA6ekoE3rPQLySY8oKKP8P2gq9Z2I8ZiEfoNRstBm6zIkpmTBrLvJ0HsYO"
+    b"ms5HG2HUAsRoIfIKyi/C2EOnxTHlK0xegr4uxVhBdBnyDzqKyHEYuzymuFfElFWQ8G9MOQaNVyLvIGlV"
+    b"TFFg2uqYEliDsqHE2phyGOqviym3oct69BFGbEAfNqJtEN6Ec6HYZswfqLYF7YdmKZjD0HUrxhkGbUOs"
+    b"Yfz2mGLegWshsDOmiJB7F+Y2xO+OKTuh7B70F6ruRY7C7/tQJjTaj3hB8wNoD7ROjSn3gT8YUx5Ch0Mx"
+    b"5TF0kjD3ofNh/ITORzBnoONRfA7tj8UUGdoejyl3oeUJ5CU0PYl4QYNTmJ9Q6zRiBNEzyGEofTambIci"
+    b"52LKOsh5HusB+C7E8F0O/bqI+QMxGJQWUzKg+yW0Df64HFMuQe0rmCtQ+mpM2QJ5rmGugPN6TJkECgy4"
+    b"EVNeAX8T/YU6txAP+O02Yg2hOzElGdR3UQ+8grb3UD5Uu498hHwPYsoisMiYC5AB7R+if1D1EfIfcj+O"
+    b"KXNA8wR1wlNo+hR9hoRnmBfgeI71EN5Bm/SYchbKvIgpa8D9EnMO3kHrV8h5KPkauQ1xbzBn4Tk0fou1"
+    b"BAq8Q31AGTGlJ1yH6HuMPbg/IK/hBTT+iHhDnk+YT/AN2n9G+VD8C+YgqL6iDLgCZb+hTjB8Rx7DDaj4"
+    b"A3kO5p9YR+AmVPyF+wAYM3EeXINyMeQgaJSY0gMuwG9Z76j7Ce0YRTkKeVlFmQJv/3vHmkpRdoJPrSjD"
+    b"st4b9t87wVb89x5RraJ0hdNQQKcoU+EtNNArSgrYDYrSF65AglFRZsNnaGpCmeA2K8qArHdBJWS94+kj"
+    b"NLIqylawxSnKX3AeCtkUZTKkQw27oqwE1oE2QyoEnIoyGK5BcZeizIBXUMuNc7PeM9QG9v73viGvovSB"
+    b"c5DPpyhj4AGU9SvKHMiA3wNYIoCCitISdkJcSFG6w1EIhxVlIKRB/gjKgLtQIpuiTIfnUIlTlPmQAbWz"
+    b"K8py+A4NcyjKOmByKsofkAL6rPfR7AJLbkXpBPvBkUdRusEhcOdVlD/hCPjyKUpvOAb+/IgTHIdAAfwO"
+    b"xyFQEL/DUfAVUpRecBg8hRWlR9b7WZxFMIawD6xFFaUD7AJDvKK0hhRQFVOUZrAOfkGD4ugLfIIavynK"
+    b"AngFFRIQd3gIv5VQlHFwHfKVVJQhcBZCpdAOOAhxpRWFh63AlsG4w7/wEaqWRT7AE0gopyhj4QrkLK8o"
+    b"/eBI1vtF2kMKUEW0C5bCGyhXCfkCtyBvFGMFx7LeC9IetmS9B+T3KhgjeAYJVRXlb7iY9Y6PHrAb1NUx"
+    b"ZrAUXkHpGmgPXIJwTZwHu4CthTbAIngOv9VWlFFwBjx1EFvYBN+h2u+IFdyGPHWRj3AAtPVQFyyG51Cs"
+    b"voLvGYpyAmwNFKUVrIJ3UCYReQfnwdMQsYT18BEqNFKU8XAR/I1RN2yAT1ChCT6DC+BtiutgLbyHMs0U"
+    b"ZTScAUdz5D6sgJdQvIWiDIUjYPgD7YT5IEPelsg12AWZUK0V1hC4DP7WqAPWwBtIaIO1BA6Drq2i1IfZ"
+    b"cBu4dshH2AQfoTSvKCPhGBjbI74wB24D10FROsN6yIASHdE+OATqTphzMB0ug7cz8hlEeAr5u2D+wDb4"
+    b"AmW7oh44CrpuyAuYDpfB0x1xgCXwEHL1wJyEDfAOivfEOgZ74CdU/BN5BMdA10tR6sA0uAiO3lj/YB7c"
+    b"htBfitIWlsNjyJ2E/sM6eAWF+yCusBU+/vf+hr7IZdgD36FcP+QHpIIC0f6oG46AeoCiVIfxcBJ0A7Ee"
+    b"wiQ4A8asdy9MhXNgGawo9WAaXADrEIwNTIcLEDcU8YfpcAGsw/A5TM96r4JlOK6HqXAOTCNQPkyG06Af"
+    b"ifphApwAzSjkCYyBI8AIWDNhJKTCLyj7N9YO2A1fIGE0uglbs96RUHgM1kRYD+mQZyzWTlgBMkTGYdxh"
+    b"AdwA93isM5AMF8A0AW2C8XAUmIkYPxgGe+AL/DZJUZJgE7yEvJNRB4hwDwJTFKU5zII0sExF7sF4OAIK"
+    b"lJumKINgB2RAoenIIVgJDyE8A/cCmAOXwJyMdsFYkOAXlPoHfYct8BLyzMRaBkvgJrhmYXxgMhwHZrai"
+    b"lIdBsA3eQL45itIRlsItcM3FNTAZjoECZechn2HLf/+DD3LNx70JFsBVsC5A/2AMpGa9n6D4QowDrAYZ"
+    b"AosUpQlMh1PALkZbYCCkwEvItQT3ZJgHl/77v4NLkQ8wEnbDeyiwDLGGJXAdbCLqhtGwHz5Dkaz3D4hw"
+    b"CxwrkHcwFlLhCxT9F/GG5XALHCtxDoyFA/AZiqxSlC6wDG78938bV2MM4G/YC+//+x+Pa7CWwkK4Aqa1"
+    b"uFfBMNgOryDnOqzTMAvOgmo9xh/6wQZ4DMENyEOYDEfgBxTbiOeLrPcK3ATbJkWpCaNgV9Y7BXJvRj7D"
+    b"bDgL7BaMF/SBtfAAvCmYlzAODsDH//7n5lbkCsyHi6DdhvsA9IcN8Ah825ELMB5S4SMU2IHrYB5cAM1O"
+    b"9AX6wlp4AO5dilIXRsMeeAe5dyMGMBNOQQwSst4bsBxugGUvYgdDYAs8g9A+xAUmQip8hPz7kX8wB84C"
+    b"cwBzAf6EFXATrKkoC4bAFngCgYPoD4yDfZABuQ+hXZAMJ+AnFJMw7rAILoH2MPoIfWA13AFb1jsChkHK"
+    b"f/87FgJHUT6Mhb3wFnIeU5QWMA2OwFcodBwxhLlwFugE7lXQHZbCFdCfxHhAH1gNdyDuFOYDDIFN8Ai8"
+    b"p5G3IMAOeAHhM4gZjIf98A5ynkU7YCochs+Q/xzuNTATTsAPKJr1ToB5cPa///17AeME3WAxpIH6Iu7D"
+    b"8Ccsh2tgSEN7oQ+sgltguaQolaE/rIW7YLuMPsBg2AgyOK8gr2EYbIHH4LmK+ySMhG3wFPxZ7wIQYAc8"
+    b"/+9/KF9HzGE07IIXEL6BZxEYC3vgFWS7iZjAeNgLr4G7pSiNYQLsgzeQ/TbWKZiY9R6At5DjDu7RMBH2"
+    b"wzvIcRfHYCIcgHeQ4x6OwUQ4AO8gx30cg4mwH95Cjgc4BhNhP7yF7DLqhQmwD94A9xDtg/GwF15Dtqx3"
+    b"AIyDPfAKwo8VJRHGwC54AaEniAuMhh3wHAJPET8QYDs8Bd8z5A+MhBR4DJ7nWFNhGGyGh+BKR77DENgI"
+    b"98H+AmMJA2Ed3AXrS4w59IPVcAtMr3APhST4F66D/jXmFPQCES6D5g3yCnrAErgI7FvkH3SFBXAOYlDs"
+    b"HfIU5sIp+AmFM7AuwEw4Bl8h/3usjzAdJPgIuT9gLsBkSIV3kP0j4g/jYQ+8gvAnxBVGww54Dv7PiBeM"
+    b"hBR4BO4vyF8YAhvhPti+Yv2BAbAGboP5G+IAfeBfuJa1/78s/Pm/9v+rfmA9+F/7/8/9n/3/c/4/3P/f"
+    b"8//s/0/4X/v/z0Lm/9r/PxtOZO3/L6gjagMz4Ah8gjx6oj9gCqRCBuQwEDWBCbAXXkHESJQIo2EnPAe/"
+    b"iagujIQUeAxuM1EtGAob4QHYLURVYSCshTtgsRJFoS+shBtgiCMqD71hOVwBjQ19hh6wBC4Ca0efoSss"
+    b"gHMQg2IOoo4wF07BTyjiJOJhFhyHb1DAhThAMhyBz5DXTdQSpsEh+AC5PETNYTIcgHeQw4vYwATYB68h"
+    b"m4+oEYyD3fASwhj8RBgNOyEdggGieiDAdngG/iBiCCNhKzwBb4ioDoyAFHgM7jDiCsOy9v4/BFeEqCYM"
+    b"hU0ggzMb8guGwEZ4AA6OqDoMhg1wHxzZcQwGwwa4D/YcRNVgMGyA+2DPiWMwGDbAfbDnwrUwGDbAfXBk"
+    b"7fsfDBvhATjzoC0wBDaBDK68aDMMhc3wENz50DcYDlvgMXjzIwYwErbCU/AXQKxAyNrz/xyCBYnqw2jY"
+    b"BS8hXIioIYyDvfAGuMIYN5gIByADchUhagFT4RB8hLxFiVrBDDgKX6FgPFE7mA2n4BfEFyPqBPPhHFBx"
+    b"ohLQPWuv/yXQ/kZUFnrDCrgBpgSiStAf1sI9sJdA7GAobIbH4C2JvoIAO+EFREoRNYYJcADeQ+7SyFuY"
+    b"AUfhGxQuQ9QB5sFZoLJoG/SAZXAVDOWIKkI/WAv3wFEeYwPDYSs8g2AF5DGMy9rbnwG5K6JOmAHH4QcU"
+    b"rUTUGRbCRdBEUS0kwSq4A7bKyAcYBlvhGYSqYKxgAqTCB8hXlagtzIbToECJalj3YDncAEt1rCkwGDbD"
+    b"EwjUQFkwAVLhI+SvibHL2sd/DthaWE+gN6yCO2CvjfyDkbADXkH2OsgNmA7H4ScUx2LeHZbBdbDURRtg"
+    b"KGyFdIjUI2oKU+Eo/IBi9Ym6wTK4DpYGmFMwDLbBC8ieiPpgBpyA2H97+BsS/Qkr4U7WXv068DfshQzI"
+    b"l7VPfx5cBG0TjCsMhM3wFMJN0SaYBschE0o0I+oFq+AeuJtjbYJxkAqfoXAL3FdgKVyHuD+QHzAK9kAG"
+    b"5G+J+wwshMtgaoW+wXDYCW8hb2u0EebDJTC2QdxgOOyEt5C3LdbprP33l8HUDnMCRsJuyIACPNZ3WAzX"
+    b"Ia49UW0YDQfgCxTtgDGCf+EueDoif2EyHIMYlO6E+w5shGfAdUY+w2y4kLW/viqMgN3wAQp1xf0GlsNd"
+    b"8HRDrsEUOAFMd9y7YCBshdeQtwfmISyBm+DsibUKJsExUKDcn7gGtsJryNcLfYRlcBs8vVEPTIPToP4L"
+    b"900YDnvgExRNwtyANfAYsvUhag3z4SrY+mItgUlwHJh+yBEYCrvh43975fsjH2AdPIOcAzAesBhugWcg"
+    b"1h5IhvNgHIQ5A+PgCChQYTDKhD3wGYoPwfyHzfAK8g9FDGElPAJuGOY5LIbb4BtO1Axmw5Wsve0NYBqc"
+    b"A+NIjDdMgBOgHoVxgtFwGBSoKGDc4AD8hLJ/4/4De+AblBqNeMNO+AwJY7AWw3b4OOZ/9qn3hW3wAYqP"
+    b"w9+wFd5D8fH4G7bBByg+AWsobIePkDAR5WXtQf/y3770SUSDYA98hzKTESPYD7+g4hTMJ5CAmYr+wFg4"
+    b"DrppiDFMhnNgmY54wD9wBdwz8HwCC+AOhJMxz2AFPIE8/2AuwAZ4C8Vmoq2wC75D+VmoG46AZjbqgilw"
+    b"AexzsGbAfLgL2eYiL2E1vIQi8xAH2AnfocJ8jAOcAOMC5DnMhBsQXIhcgpXwAooswrWwG35B5cVE4+Es"
+    b"2JYgB2ARyJBnKXIbtsIXKL8M9cApsIjISVgAMuRZjvUStsF3qLQC+QnnwPkvnnNBhOdQZCXRADgAqlVY"
+    b"V+EfuAXcaqzXsAW+/rfHeg3aBxfAsxY5C6vhLZRchzUKTkLceqzhIMILKL4BYw1HwbwR8YSl8ByKbcJn"
+    b"cBQsm9FnEOEl/IYvCyPgJNhT8DwCqyADym5FfsBF8G/DMwhsgR9QbTvuH3Ab8uwg6gMHQLcTcYKl8BJK"
+    b"7sI9BM6Dfzfu27AVYlBnD56f4TEU3Yt1Bk6Bex/WMtgCv6D2fpyXtTe42AHkEZyDQCpiBzuz9v02hGVZ"
+    b"+3zLH0Iuwy3IK2EewnFwHkbZsBXoCNZrWJa1P7fiUcx/uAeFj6E9cA5CxzHWkAqWE3ieh80QgwYnEUt4"
+    b"D1VO4dkfnkCJ01g74CYUOIP7L5yHbGcRKzgK7nNYo2AfmM9jPsFWUF/AXIP1kAmJF5HP8BXqpCG28AFq"
+    b"XEI+wptL/7O/dC68hEpX0A5IhwpXkWvwDMpdw+/wDMpdx+/wHMrfwPyBdKh4E2sivILKtzAn4S1Uv421"
+    b"Ez5Cnaz9lt8g8S7uBaBA83sYM9DdR19gN9geYIzgMPhlzEU4C7keIu/gBsTjy+pkeAwVHuP5At7D70+Q"
+    b"+0BPkZewE2zPMEfhBGR/jjLgJiSkIx/hFdR8gXty1r681i+xHoL7FeIOF6DgazybwzOo+gZ9gRi0foux"
+    b"+G/f2zvkC1yF3zIQJ8iABu8x7mDJ2hv23z6w//Z8TYFX/+37+oT1D0yf8Tmcg8Jf8FwH7yDxK8YXHN+w"
+    b"bsN1KPUdYwi/oG3WXp//9vGMg3T4/RdiCo5MrCFwCyrE0GbQZO2tOK/895WAobnwE3iGoeNQkGUoGb5A"
+    b"axVDRyCfmqHp8AlaaXAM8mtxHnyFtjqGTkBhPUNzIBO6GBi6AKWMDC0DvYmhPnAbqpkZ2gReC0N/wyto"
+    b"amVIggJxKAPIxlBPuA5V7Dgf/A6GxsF7aOtk6AyUcjG0EuxuhkbCK/jDw9BJKOFl6F+w+xgS4C208TN0"
+    b"DsoHGNoAwSBDU+An9AwxdAfqhhlKhSIRtB1s2RgaDR+hM8fQTaiTnaEDUDQHQyvAnZOhSfALknIx9ARa"
+    b"5GboPFTOw9AuKJiXIRHc+VAnMPkZGgRvoFMBxAYaFmToFEQLMbQbihZmaA1kK8LQPLAVRT3AxjM0DD5B"
+    b"72IMpUOH4gzdg+a/MXQZ6iWgLKhWArGF8iUZ2gMJpRjaCkVKIwaQrwxDqyFXWfQFuHLoN4TLM7QEQhUY"
+    b"WgTBivgJwUoMLYZwlKGlkK0y+gU5qmAsIE9VhtZBwWoMbYbi1RnaCWVqIK5QuSbyBX6vxVAaNK2NuANf"
+    b"h6Fn0Ot39AuG1kU/66G/YK/P0ALI3oCh9VA8EfGH6g0ZuggtGjH0GHo1ZugbjGnCkLUpQwshTzOGtkGl"
+    b"5gydhRYtUA/0+wNj0BJ5DJFWyDEo3xr5Aa3aIJdgeFuGzO0QByjCI47QqD3GFwZ2YMjQEbGA+E4MHYMW"
+    b"nRl6DX93YcjTFfGFyt0YugG9ujOk6oE2QfGeDJ2G9n8y9ANm9kK8eqMMaPsX+gAzkzCn+mAMoWNfhhRY"
+    b"1A8535+hq9BnAPo4kKGNUGcQQy9gwmCG8g5BfKHLUIa0w5A/UGs4PocpI1DmSMQd+o1CGwWG9kKbvxHr"
+    b"0cgDqDsGcwzmjWWowjj0FaaMR5snIEdh9ES0dRLaACMno74pyDcYPhW/T2PoCoyajnNmYK7AuGRc+w9D"
+    b"MkyfiTJnIUaweDbqmoP1AjbNZajdPIzzfIaOwoAFyMuFDN2F5EXI4cUMfYfNSzBXljIUWMbQJZgoYq4s"
+    b"R7wgZQVD3f9lKOdKzAOYtwpjtZohyxrEGsatxVqyDnGE1PWYPxsYKrsR5cKeTQwN3owc3YLxgAMp6NtW"
+    b"jN02htTbMQYwdQdDiTsRs13IV1ixm6FuezD2e7EOgrQPubofdR7AnEll6DlsO8jQiEMM1ZZw3WHkKGw9"
+    b"gvgcZaj+MeTdcaxLcPAEQzNOIh9OYX6exridQaxh81nk8jnk1Xnk3wW05SLqhu1pGJNLiMVlxPMK1tKr"
+    b"DH2A89cw966jrzewHtxEbG6hjtuIMdy7g37fxZy9h/XwPj5/gPkjI84PkeOPMOZw4zHOeYJ5/BTlP0OO"
+    b"PMd9IJ2hGi/Qz5eY+68Y0r3GWgjyG9T3FrF6hzzPQG6+xzUf0N+PDP31CX35jLn9BX3/ylDFb+jXd6zv"
+    b"PzCHf2It/8Xg/sSQKcbgnoT1nlj6Bd8YFvcelj6pWPqoZumDBj+1+FuH43qWvhtwnpElxsyS1sKS2cqS"
+    b"M46loI2lnHaWCjtYKuVkqYqLpfpullp5WOruZWmQj6UJfpbmBVhaG2RpX4il82GWHkZQbjaUk52lHDlY"
+    b"KpuTpUa5WOqZm6XxeVhanpel1Hws3c6PthVgyVsI5RdmqUURloYWZWlJPEtSMZaeFmfJlMBS8RIstSzJ"
+    b"0uhSLG0szdKNMiypyrEUX56lthVYmlqRpQOVWHoTZYmrwlLjqmhXNRyrjn7WYKlALZY61mZpcR1c+zv6"
+    b"Vo+lxPosTW+A9iayZGnEUoPGLM1swtK1piwFmrPUvgX69AdLGS3R/tYsjWvD0qW2LEV4lnq1R/s7sGTt"
+    b"xBLfmaXtXVjSd0NburO0sweO/8lS114sHe3NUrYklkb0YeluX5bK92dp6QDEeRBLnQezdHYI+jaMpYXD"
+    b"WVKPZOmvUThPYKnOaJb2jkG7x6HN41myTUT9k1j6OZmlflPRz2ksdZvB4vseSx1msvRoFvo3B/Gai3GZ"
+    b"z9K7BSwNXMSSspilSUtZcoss/bscdf2LNq1kqelqll6sYWnUOpY8G1jashF1bmbp2RYW3zNYyrWdpeM7"
+    b"UNYu9GUPSzv2stRmP0u6VPT1IGIjsWQ/wtKRo6jnOEsFT6INp1hadIalZucQ3wssXb6IeF5CXVdY8l9j"
+    b"Sb6OeN5E+2+zVOkuyr3P0v0HLG19iJx4jPKfslTiOfr6Av17iXF5zdLmtygjA3n2gaV2n9DGLyyV/MZS"
+    b"7h9o9y+WDDGWYgpyjVFRhkpFbzQqeq3DTwP+Nqnoi0VFSpyKjA4VeV0qyutRURmfiuoHVNQlpCIhoqLF"
+    b"nIoO5FDRvVwqYvOqKH9+FTUuqKJRhVW0paiK5GIqcieoqF5JFU0oraJjZVWkrqCimpVUNK2yiq5VVVH2"
+    b"Gir6q5aKDtfBufVU1KuBik41VFHuJioa30xFL1uoqGErFe1vg/J5FS3ooCJLZxWN7Yr2dVfRiD9VFOut"
+    b"otF90Nb+Kpo7ENcOUdHuYah3pIqeCSoaM0ZFucaj3IkqSpqiotB0FZ1LRjtnqajkXBW9n4/2LlJR36Xo"
+    b"43IVqVaq6PJqFa1cp6JhG1XUdIuKErYhDjtR5260aZ+Kbqeq6IKkopNH0a8TKjp+WkVnz6FPF1X05LKK"
+    b"vl1Tke2WigrfRcweqGjAIxWJT1WUlq4izWsVVXqnopEfVHTks4pM31X0xy8VbVTwmUpNHbVqOmFQU1GL"
+    b"mpbY1GRzqWmSV036oJqmRdTkzaGm1bnVVD6/mm4WUtOQeDVlT1DThVJqGl0Oxyup6VcVNR2poaYZddTU"
+    b"ob6ayjVSU6iZmtiWaspoo8bzgpoedFbTw+5qetlLTT/6qMk+EHUOVVPTkShntJp2jVfTh8lqKjFDTcIs"
+    b"NV2Zp6Yii9WULKrp50o19VqnpvRNauq5TU1fd6lp8n41vqeq8X0TbTqtpvgLanp3WU17bqD9d9XU6aGa"
+    b"aj9TU8lXaiqcgbI+q6nMDzXVV9T0p1pDcwwaOmXVkMaloXp+DZ51NXh+1VCn/Bq6UURDzRI09KCMhvpX"
+    b"0pCruoakOhoanKih8s00ZG6tofT2GrrUVUMne2nodD8N3RyioU+jNBQer6EmUzU0f6aGXs7X0O/LNLR3"
+    b"lYZKbEQZ2zTUcq+GVJKG9p/Q0OjzGmpxVUOV7uDzRxoq90JDjTI0NPSrhrbFNPRTo6VmFi0dcWkpGtJS"
+    b"Wk4t9S2opby/aeldWS2dqaKlPXW0tL+Rli611NLPDloq21NL0/tp6eswLQ0YqyXDNC3tmIPfl2qp3hot"
+    b"lU/RUtW9WupwREsLzmop/aqWGt7X0tXnWkp6j7J/aumbWkdPrTp649ORI6eOGhfW4ZlZR4Wq6OhEXR2N"
+    b"bK6jph10VLeXjjoO1tGiMTr6NF1Hfy3UkWW1js5vxfmpOtp3Wkfp13RU7pGOdr7VUbOfOoro9WRz66lA"
+    b"Dj39VVRP98vraWgdPVVuoadSXfTUsr+eNo3WU/w/enq6TE9nN+Nnqp6Kn9fTzru45rWe+F96mmQ20JuQ"
+    b"gaYUNlCXigYa2cBA13gD9eproBpjDdRxroGOrTVQz/0GanXBQLMfGsj32UDpeiPpw0YaXMxIZWsYMd+N"
+    b"dCjJSOPGG2n1YiPl3G4kOmOkSg+N9OibkV7ZTNQ2v4kqVDHRlFYmqjPARKNmmKjQehM1Pm6iH7KJcmaa"
+    b"6JLfTIZSZrrYxEx5+pnJOdNMC7ea6dAlM038YKbvTgv5S1qwxlhowHALpYoWOnPcQstfWaiOw0pnylgp"
+    b"fwcr/TXFSv/utNIF2UrfzXFUsGwc9e4WR+fnxVGjU3Gk/RFHXwvZqGh7Gx2Ya6N1522k1drpYSU71R5m"
+    b"p/p77MR8tdPAUg5KHeKgN6kOCqid1LKuk07OddLgx06aXNxF/rEuqnbTRQWKuiljopv2PnXT5uoe+r7W"
+    b"QyfjvFRrqJe2pXupfCsf5bjso9X1/GS54KeVjQN04H6AtvwVpOvaEK1bGaKZtcNk+xKmDesj9L1rNlpW"
+    b"hKMmCkcPbmenbEdykHFXTtq2OxfVOpWbcr3IQ8eD+eh++/zUPLUAtY0vRL1SC1OrrkXxXa4Y9cr2G6WW"
+    b"KEHjh5Si6xll6MGK8lRmfiWqeKcKnu9r0PRRdWiKqgGlhJrQjRd/EDuLJ6VuN/rWtg+VKjicOleYRM87"
+    b"LKAN1zfRX3NO0TvLG1Ljy+rYsf2ZFhMM7OCynVX8o6IYZKJzXsxT/NqxZhwVaeei7wP9dGR6hKaszkmN"
+    b"D+Yj//XCdP9NcVquKU0dwxUoZ4kqJNetSYs71aWmwxuSaXYzOrShFSUd5SlypzOd+tCDkoxJ5MwxgHaU"
+    b"GUqJDUfRi25jaYQwiSzzp9P8LbMo28n5tPz+Eop8WUFzLWvJkHsTDSq/je433k2Vex6gJaMP08cFJ6jq"
+    b"1rM07VQapT24Ruavt6mKVaak3E9pfvmXtKfxO7rU4xM9+vs7vZofo9dbVMyzE3rm+j0Lc/CTg1lq8jED"
+    b"c4SZamVyMMbEvMyJLoWYwSOKMdzskoy0vhzT7HCUeXSjOtPhbR3mtjqRqRFsyqwthi+Ctdoxddt2Yqb2"
+    b"784cmdybeS32Y8y7BzOR8yOYPI9HM9z3CYwtbhrzIddM5lTZeUxy4mKmfpflzK9hq5ml/2xgEtakMAcO"
+    b"7GQSLu9jxOeHmNivY0x9xxkmOe9F5lj5q0x6w1tMrMt9Rj38MfMrOZ15tuoNc3DfB2bixa9MlSe/mNd4"
+    b"AJ5o0bG2HGZ2akk7+6mOh63bLsjO7sex5ybkZj8tKsDqU4qy5mMJ7C88XN59VZFdq1RlOzlrs7a89dm1"
+    b"ZRuzheq3YMX2eAgc0IGtO7ErO3bRn+zGzX3YA4cHsgeuDmPXPhdY4cc4tpplCvspWzI7tfgc1lV9ITu2"
+    b"+TL2SfeVbL7h69jW0zezg8XtrLBtD9v/WCqbeP0I60s/yZ76fo7tZLrMpodusE2K3GU3VnrIvk58xro6"
+    b"vGJz9ctgubGfWfWcH+y5VQor7FKrQicNKvGGVWVOd6r4bz7VfH1EdcCXU3UsXz7VjtKFVVNrFVfValFK"
+    b"9bpreVX/QZVV6eNrqMrP/V01eFWiavGOpqqVR1uqki+3U3V62EkVyuiu2oOHj/KW/ioxOET1Ov9IVaj0"
+    b"GFV8jYmqfE2mqfCAqZL+mqfqNGKx6vXk5aom81erxFUbVGnbUlRPDu1U3T23T7Xj1iHVn8+OqcwfT6sm"
+    b"KhdUr01XVYV8t1RNct1XtYh/rIqWT1fpa71R7Wj8QVW+3VfV2h6/VN8GMGrub606fqpJ7ZtnU6cvd6vn"
+    b"bwyoud3Z1MmHc6lvnsWDwfUiapv8m/rbi9Jq6WMFdbfMKup0bS11oq2eOtnfSJ2So7k6pWBr9cSE9upo"
+    b"hS7qm9V7qmvVT1LPbzZAfartUPXNLqPUUu+xamHgJDU3crpaHDdL/W3qfHX87CXq6KIV6nwr1qgz1m5U"
+    b"z9+yVe3btUuddGC/eu0RSb3n1HG1eOGMutvVi2r97atq4cEtddqT+3jIeKzWv0tXp398oxa/fVCXzvyq"
+    b"XstkqtM1rEZv1GnIatbctNs1gtujIX9Q0yLEaSZmy62Zn6OAZnDuopr4fAkaqUAZTb7CFTXdilbVCMVq"
+    b"aZJ+q6eJL9FIc6pkc020dGuNUKa9RizbRTO/XE8NXz5JQxUGaJIqDNVIFUZp5ApjNWkVJmnECtM10Qqz"
+    b"NCnl52u+lVui8ZVbodGXXaNJK71R063UVs3NErs0voT9mnzFJY0t/rgmrfAZDV/wokbKd1XzLfctDeW8"
+    b"r7mZ7bFmYihdo/e/0bRwf9AMtn/VJFl+aUobGG2aWqstTSbt4J9x2olfXFr+vV9rex3RJj/LqU2X82n1"
+    b"dwprv10trt1zoZQ28VR5bcrhylp5Xw1t+vbftXs2JmpbrGqqPbWkpVY/t53WN72T9tu47lpxRG8tN6Cf"
+    b"ttufg7VCxxHabi1Ha30NJ2jn15yqzajwj1afMFf7Lf8ibUo2UVvavUo70bheu1bZrJ3/abs28cUe7c17"
+    b"qdp8l49oa504qS2975w2Y9MlbdLy61pp9h3tzQmyVhr6VDu410ttRrt32tKNPmkTq33XxpeMaW/mVelq"
+    b"+fW6iUaLLvmnXce/9ujoXlDX7Tynm5+aW5e8qYCuxZKiuvSpCbrSw8voWvSsqIu2rKr7VquWLqlUPV1K"
+    b"7kY6ydlcl8y01sW/43Xz73bWSad76Pbs+kuX9G9/3bcZQ3TR4SN1id3G6OKbTNSlVZqmK11wpq6bZ56u"
+    b"BbNY53st6uZfX6WTpfW6jPVbdKdm79DxI/fqpK4HdemJR3U3y5zSTcxxXkemy7rSH6/rSt+5o6Ojsm7i"
+    b"+qe6m/+81GUMfqc71e6Tjq/xXXeqUEyX4VDp077p9MJ9sz7jqF3PrfPouelBfVpfTp/YPLc+uVwBvZit"
+    b"qJ5XJegznpXWx5+poI9uqqK3JdfUi33r6qlpQ72tVDN9hq+VXvjRTi/f6aSn1O56eUlvvTCyn15uO1hP"
+    b"lUbo5chofXJsvD7j3hS9LTVZn7Fojl4culBPfyzTc6VW6m3udfqUD5v0trRtKH+3npt8QC91Oaznqp7Q"
+    b"R7Od1XM/L+ql61f13LZb+ui0+3qu22N9SpV0vS38Rs99fa/PSPuiF9b/1KeNIYPcWmNIKWE0xFvjDMIz"
+    b"p0E46DNE54YNUq8choxqeQ0ZwUIG8UO8wXa6hCF+WVkDN6CSQapTzcBxtQ3Rz/UMtjONDClLmxuoX2sD"
+    b"1WxvSAt0MSS+7WEQDv9lEGb3N8R3HWIQy4w0SKYxBvHeBEN0y1SDKPxjSGk415CUY5GBPi4zRI+uNMTP"
+    b"WmeQO2w2JBbfbhCYPYbEtAOGjKWHDdFeJwyJ5c4abIY0Q/L1qwbp31uGlKT7hsQKjw0phnSDdO21IXn5"
+    b"ewPX64uBL/3TkIivcXRBbeTnG4xCB6sxsZDTKH/2GrlDISM3MbsxLTGPMeovaEx8WNQYvy7BKCWVMVLp"
+    b"isaMWBWjeLymkabWNXKNGhozvM2Mwr2WxpQV7Yxi104op7sxJaOXUdrR1ygMHmSk8sON8Ypg5I6MM6aM"
+    b"nWykmjOMZJhtlM7MN8ZPXWJMrLfCyFnXGFMubDBmTE8xyvV3GgXrPqN8/qBRnnrUKP5+ymgznjdGT10y"
+    b"2sZfN4pV7xhlko1pqU+MwtAXxrSSb43yhw/G5M1fjdTjl5HLzZhI1piEhUZTSpM4k2h1maKnfCbh77BJ"
+    b"KJvDFP8xjyl5Q0GT2DHelBQsYZIvlzHR5IomOVrVxH+taRI31TUJHRuaOH8zE3+hpYkf085EpTuZ+Nfd"
+    b"TEliLxPXpK8pWTfIlLJvmCmpl2DKyDbOZLs8yZQxZropqcQsk/hsnil53mITV2u5if+2ypS4dr0po/kW"
+    b"U1S3wxTdtceU0SnVlOg8Yko8fMJk++usKSmUZhJOXzVFB94ypeS4b0q78MgkDn1usuV5bYpeyjDZhn82"
+    b"Jef5YZLSYqbkoSozl0tvTjxvNscPtJuliMeccSJglntnMyd5cplTUvOZxU6FzfGm4mZha0lzUvNyZltm"
+    b"JXPiimrmaM3aZvlVPXN8ciNzfEJzc9qNVmZuGG+2RTqbJam72daxt5k0/cwpqweZqdZwc0a6YBYnjTNn"
+    b"5J9slk9PNyd3n2WW9fPN8prFZqHGcnPak1VmafR6M89tQb3bzSkt95gTvx4wJ886bBaKnjBzZ8+Yk7pc"
+    b"NPPMVXPGopvm+JL3zFzaQ3NK92fmDPaVOW3ROzOf8MksnvtmFjplmukXY4mfpbXYCpgsyVKcJaWZyyK8"
+    b"9llodNjCeXNYMjbksfDRgpakq0Ut8d0SLOLP0paU6RUsfPYqFml7DUta9d8tSTcaWNK6NbFI31tYkia3"
+    b"saQEOljE9V0s0bI9LUmn/7LwLfpb5GeDLbYBIywZ7GhLUvJ4S3J4iiVx/QyLVHK2RT4y3yLWX2Kh28st"
+    b"1Hm1JeXdegsN3WIh9Q6LOG2PRfakWqRlhy2J+U5YklPOWPjSFy3yoSsWqnnTknb+riW+yUNL4u2nFuJf"
+    b"Wvinby18j48WevfVEu33yxL/lazSUI2VYgZrmmC1Jqqc1qRxXmtUF7KKEzlriiG3lZ+c35piLGJNmVzc"
+    b"mmgsZU2eVM6apI9aM8ZXs3Ka2taM0fWsPDWyJo1oZo3/0dIqDGxnFT50tHK9u1n5F39ao536WNPuD7DS"
+    b"H0Ot0uWR1vi6Y6yJxydYqeJUa+KuZGtikTlWedUCKxdeaqXZK6yCcY1VFDZYk75ssab13GGV5T1WoWmq"
+    b"Ne30YatU4YQ1cesZq5DrojVx3hWrZLhpTRt215r8RrbKbZ9a5YsvrEnRt9aUlA9WgftqpeSfVk5RrHIv"
+    b"dVz0rj4uvo4lLm23Pc6W2xOX8U8gLikWiUvukTMu8XreuJTKheJSNsbH8d4SceLfZeKEVxXiqGmVOO5g"
+    b"jTg5z+9x0RkN4qJfG8fJbVvEcSdax1Hh9nHCrM5x4vfucYnteselHOsbl5J/UFzi9GFxwodRcXyzsXFp"
+    b"eyfGZYSmxYmj/omjR3PiMqoujBNWLY1L0f4bJ3RdE5dxckMc5UuJS5mwI46e74mTq6fGJa08HJfMnohL"
+    b"5M/EpaReiEsJXIlLHHQjLvnKnbikonKcPPlJHD1Lj0uJvomjRe/jMj59jhPq/4hLWROLE0hlk1vobHKK"
+    b"ySbobTapncsm7vLZOEvYFu2Y3SbvyW2LWgvYuI5FbNLu4jbZVMomtitno+2V8KW1mk1sUcsmr69rk34l"
+    b"2qL1m9qiy/6wUUYbWzTawcYld7GJD3rYpCJ/2YQR/Wzy2UE2yT/cxncVbMKOsTaemWST6k2zSQv+sfFP"
+    b"59jE+IU2fthSm3x8hU2OW2MT/9hgk1dssUmvttuiCXts/PADNjom2XjTcVu00WmbPB9fnB9cskm5rtuo"
+    b"x20bbblvEz8+skmlntuEYa9s8sF3Npn5ZBOqfbNJ43/ZhFNkJ6PGTr8b7OIUi10+a7eLJo+d+z1g5yZH"
+    b"7PKpHHZOl9dO1Qva+dFF7cKh3+zcr1J2vnR5O98/ape2VLPLL2vZxdz17HK7hnZpQVN79Mofdt7c1s5V"
+    b"72DnR3SxR3f2sMuve9spVz+72HKQnf4ZZpdPjLLzv8bYhWIT7dEuU+3iwmS7cGG2ndgFdq7EErvcdbk9"
+    b"unCVnTu3zi5lbrLLRbbZxXa77PKMfXb50EE7/+6IXYictEfrnbULwy7ahXVX7HTjhp1T37XL8bKda/PE"
+    b"zk1Kt4s7XtulBxl2wfjZLiV8t0ttM+3RiYyD36px0G2Dg2etjmgBh0Nq6HHIgwMOYVnEIR/P4ZBe5XFw"
+    b"9oKOaMmiDmr1myM6qpSD+7ecQzhRySG+qOqImms5hCJ1HXxiokPu08Qhz2zhELa3dkhXeIf4sZODnN0d"
+    b"VLyXQ0zs45B7D3CIU4c4aP0IB5382yE+HueQlUkOMTjdQaVmOqjRXIfw50KHOH6pgxdXOKS9qx3S5fWO"
+    b"6KvNDl613cEFdzv44vsd0dqHHFK7ow55wEmHMOWsQxYvOqSdVxzcmRuO6P07Dvn9AweneeIgX7qDL/Da"
+    b"wZfPcFD9T45ou28OSvrl4AVy8slqJ4l6J5Z2p5xqc0bPuZzcbZ9TfB5ySp84p8DkdsqW/E7JX9gZzV3M"
+    b"GY0v4aRyZZzR6hWcXIPKTqFFdafQvraT61HPyfdt6OSGNnWKf//hFCe2cXIz2jujczo7uUXdnbzYy8mv"
+    b"6uOU1w1w0uYhTmnrCCft/Nsp7x7n5PdNcvIHpjm5g/84+UNznJy0wClKS2C5MyqtwrF1zujBTU7xwFan"
+    b"sG+nk9uz1xndmeqkbYed0c3Hndz6005x1XmnJF5y8ouuOaU5t5zCjHtOmvTQSaOfOsWhL5xy3zdOscd7"
+    b"J3X47KQ/vjuFBplOqTrj4stpXFK8wSXmtri4gN0VtbpdMuN3RT+HXJTOuYTbuVzCuXwu7mAhF78l3sWJ"
+    b"CS4hubRLEMq7KCnq4tpVc8n1armi5eu6uAKJLtHbxCWpW7j4961c4r12LuF0R5e8o6tLXtbTJUz+yyX1"
+    b"7+cS2g5yyTWHueT4US7eP8YlMBNc0ReTXULadBe/e6ZLXjLXRWMXusTuS11y/RUu8bfVLs633sX92uQS"
+    b"H2x1yUd2usRVe100MdUldz/s4n8/7hIKnXZFLeddwps0F3/+qkvaeNMlT7nrEnrILqnWE5eQJ90lq167"
+    b"ZPmdi0/96BIXfHVFB/x0iYmKSyiocpNW5+Zko1vaa3XTLIdb7ulxR6sF3Hwo4pY/ZndzZ3O75eX53dHB"
+    b"hd1c/WJuKWcJt/yttFs4Xx7Ho25pQDU3V7uWOxqq65bfNnBzhxu75ZnN3XynVu5oiXZuWdPRTde7uKVV"
+    b"PdzcgN5uqtbXLTgGukV5iDu6eYRbGPa3m681zi27Jrlleapb2JjsFgfNdgtV5rtl82K3dH2Zmxf/dQvd"
+    b"17i54hvcwo/Nbv7INrc8aZdbTtznFrwH3dK9w27x3+Nu6n7aTUXOu8UPaW5p11W3MPSmW65w1y2R7I4e"
+    b"fezmxz13czVfuXn9O3f09Ae3NOmLW6r9w80bYm7xFOPhJ2g8UnWDR1JZPNHDNg8/0uXhyvk8wtegh9+e"
+    b"zSP3zumhAnk94pMCHnlpEY/UoriHc5T0cGfLeKQxFTxUvrJH+ljNw22o5eE61PWIvkSPdKGxRxjb3COV"
+    b"aeUR37b1cP928ESbd/HIxh4e7mAvD/Xp4+FzDvDw1wZ7aMJwD1da8MjpYzzRBRM80dpTPNK36R55zUyP"
+    b"2GyuR1Yv9Ejblnii/HJP1LLKQ/vWerguGz3kSPHwqds9fLfdHnLu90RTD3qo6xEPbzvhie497ZHan/fI"
+    b"hksecetVj9zipkdW7niiqx94+LqPPfThmSc676WHK//WI8jv0dbPHi7fdw9/9peH601ewab28tt0Xmpi"
+    b"8nKfrV55jsPLlfR46brfKwwIe0VXdm90ey6v0DCfl39X0CtPLeqV8//mFU6U9EodynqFWAWvvKCyV06o"
+    b"7hUu1vKK3et6eVWiV1rc2CuWaO7lLrT0Rru09VKsvRdrhpcr1N0rHvnTK7VI8vJv+3nFMYO8gm+YV944"
+    b"0itHR3uFq+O8UtdJXuHHVNSV7JUjs71CyjyvWHmRl7+8FHWu8IofVnm50eu8UfsmL4kp3miRHd7ogd1e"
+    b"qfZ+r3T9oFfoeMQrvTvuFYad9pLuvJdmpnnF0FWvvPqGV4q/4+X23fdyVR95pbNPvXLjF17pzmsv1zHD"
+    b"Sy8/esWkr17pyw+vMDzmlRnWJ43X+KImg4+fYfZxTptPmOv08X6vT14U8FEk4hOXZffJXG6ftDyfL5qj"
+    b"kC+6oqiPcvzmiy4v6SOurE9YWsEnhCr7uIXVfLy3li86+3efaGvgE6c28kX1zXz8mD980VhrnziY94kf"
+    b"Ovq4P7v6+Kc9fFzb3j7heh+fUH+Aj04M9nEVhvvk7aN80QJjfFFxvE9yT/bJk6f5RCXZJ/eb7ZOfz/Px"
+    b"rRb5hAtLfdHKK3zC9lU+Pvc6nzx3o4/0KT5p8HYfvdjlk1vs8/GnUn1CqcO+6OpjPsF1ysePPuuT313w"
+    b"UZvLPvH0NZ9c4hb6c9cXtcg+fvBjHz1+5ovWe+njdr/xidx7nzjpk4//8NUntvzpE47EfHJ+1k//aPzi"
+    b"V71fbmP2S0fj/NH8Tn90uscvf/D7o83DftrP+YVILr/4d15/9EkBv1CjiJ9fW8wvG0r45R6l/cLZcn65"
+    b"YCW/OKWKn3tV3R+tU9svr63r53SJfurc2C8caeYXs7X0R4e38Qs3eT+f0Mkvz+jqp1c9/GL13n4S+/jl"
+    b"7/39fOPBfmHjMD+nGeUX2oz28zvH+WXzJD91muqX9s3wk32Wn7rO9QsHFvhF+xI/30XE8X/9onWNP9ph"
+    b"Pc7f5Of0W/1Cyx1+fuNuP8X2+bkGB1H+YT+fcczPR0+h3rN+7sEFPxW57OeHX/PzZ276yXfXH+38wE/b"
+    b"HvmF2FO/UOeFPzr3tV94+M7PF/rolwZ+8cvSd79gzPTLjSkgLVYFok+1Ab6wMcANsAT4A7YAr3IF5Nre"
+    b"ACUHAtK1cIALZg9wfK6AtDJvQE4vEJAKFQlwScUC3PaEgPS5VIBKlwvIQyoGovsrB/hf1QJUoVYgOuL3"
+    b"QDS1fkD61TAglWsaEIa2CMh7WgWkL20DfEKHgNCncyC6uVtAfNkzIOb5KxDt0DcgLBkQiN4cHJAcwwNS"
+    b"3VEBfvzogHRoXED8NjHAFZsa4LrPCMjiTJwzJ8DFLQhI1RcH5GHLAuLWFQF6virAhdYFxMSNAXnsloC0"
+    b"Z1sg+npnIJptb4AaHQhExx4KcLuOBKTnxwOy73RArH0uQEMvBuR1lwPCrWsBSX8rIJa6G6AuDwI0+1FA"
+    b"Ovw0QO/SA3LwdYCv9S4g9P8QiIqfA+LZbwHxy89ANLsSEH5ng9EBmqC0VB+UTpqCQoY1KPkcQTHqDka7"
+    b"+YL8jGCQ2xUJCnezBwU2d5DLly/I1ysY5PoWCYpziwWlfQlB/n6poMSUC0q5KgajNSsH+e7VgtEpNYPi"
+    b"xjpB8Xy9IP82MShamwSFIs2DVL9lkOvVJihP4YPR9R2D0VNdgvLT7kFO1StIXFJQKN8vKLQYGIz2HxIU"
+    b"ZwwPiutHBbnjo4P8g3HB6PeJQdExNSgVnBHkq80MSq3nBMX+84PRqYuC/L9Lg9y+5UExbWVQfLYmyP9a"
+    b"HxTtm4NCnq1BrtyOYLTB7iB13BcUBqYGhUlSkFt8NMhvPhHkpdNB+dK5ID2+GJQ/Xg5G1deDUdetoJzz"
+    b"bjD624MgV+VRUEx8GpTapgfFP18FaejbIE14H5RmfQqS+DUob/gRFHZnBsUjFOLPq0LyDW1IfmgIia/M"
+    b"IflTXEjOdIR4rSckWv0h3hMKyeFsITlXjpBYMHeIiucLyaUKhoQKRUJSlWIhsWZCiOqWCnGJZUNy4wqh"
+    b"aPNoKNqyakhuXSPEtasdovZ1Q0KHBiGxY6OQ0KlpSO7UAlqFxE5tQ3LH9iGpQ6cQ375rSGjXI8S36RWS"
+    b"WyaF5Ob9QmKTgSFqOCRE9YaHxFqjQnLV0SGp4rhQtMzEEP/blFC08PSQmOefkJRtdoj3zQtJtoUhUb8k"
+    b"FCUxJHxdEeLfrgpJT9aG5NsbQlLa5hB3YmuI278jJG3ZHeJW7gvR/NSQOEUKSSOPhsQ+J0Jcp9OhaLNz"
+    b"Iap1McSXuRziC1wLccGbId50J8T/vBeSX8oh7vbjEJ1+FhJ2vwiJq16H+FnvQpLwIST1+hwSWn4LSTV+"
+    b"hqTisRAfYcKCQR3mP2nD9MAQ5k6bw/K2uHB0sSPMj3OHud6+sNAsGOYrRsJcnuxh3pIrHP2UJyzdzh+m"
+    b"w4XC8uqi4ejU4mG+T4kw16x0WCxbLixGKoZ5tnJYfFo1LJ6qEY5uqB0WptUN8381CMuJjcJc8aZh2dEi"
+    b"zH9sGRautAlHt/NhcWbHsNSnS5hP7B6WivwZlsx/hfmXfcLiyf5hYeWgMPf30HC0zYgwV0YIi64xYend"
+    b"uLBwZmKYVk0J06jpYanFPyh3dpgzzQvLjxeEuQOLw9zsZWGp54owVV0Vlv1rw3zG+rB4YlOYX5wSlvts"
+    b"D1PNXWE5uDcczdgf5o8dDHPzD4eFnsfCQsWTYc5+Jiw8PhcWdl4McxMuh/kW18LR/DfD8vfbYe7MvTAt"
+    b"lMNC98dhsfSzsKB7Eabrr8Lcyrco9304WulTmDd/DXO3voeFVb/CQh8lHK3ARkS9JiJe0UWiS40RoZsl"
+    b"IhS3Rbhfjgh/3B2JTvdF5GbBCGWLRORnXETYnDMiDsgTEcrnj5CqUIQ7XSQiTy8W4ZskRAR/qUj0fpmI"
+    b"uKJ8ROpSKSIUqBKR31SLyCk1I2K/OhEqWS9C3xpExL2NIjSsaYTKt4iIv1pG5ANtIvJwHmV2jEg/O0fE"
+    b"fd0i0SE9I0Kp3hH+c1KEtveLcEkDI1R4SER8MSwirRoZEdv/HeHCYyPRm+Mj3KxJEbHe1IikmxERD/+D"
+    b"smdHognzIvRmQYRftTgitFkW4d0r/l/Ddf/SBBDGAfyJqAZLiEowzOd7ZEEFwRKEGIhHUGTlL7Uwhtml"
+    b"gyBCoYwaCF4khhbRC0gZxEEx04zVajgk8xJkMBTLkkp6uTJNrUQblhRKff6LD9u+O+zOtbDxtzHNtLNo"
+    b"ibIrjbFcGWeV7GBR08na18X6SzfL6z1s9vSyWUiyephiW9HPNvM56+QguzND7Da9YT08zK7xPTu/YzP5"
+    b"mal5lKlonM3vSabID6bANJtFaaboLFPpHFvPX6b4PNMRgl2+GJRYAqrwwGZ4IRIZEOUrYL2rIOKZEGVZ"
+    b"sEuzIaI5ECUCbmEdRGQDZPFGuPRmyOYtkNIHGsuDupAP5dsGGvJDhQugcyTEs+0woR0wy3ZBte2G3VuM"
+    b"//eAvrwPlHcA9LIE9mQQcvUhqMeHIQLl0OkQzNWjUFuPwQ0cB1VWwXlPQLZWQ+88DTkShq2tAa2the04"
+    b"C7m/DnqqHqqhAS73IsTTS6CDV2BmrsE1NsHm3oB6chMmcAv6u4Gouw2dHYGO3YUougf18T7UqQcQ3kfQ"
+    b"Jg6dn4BMdcKUdcH87Iaq74Fb0wvXnoQtTEEM9kGGBiB+vYA5/wo26zVM61sI/zuo1AfI4Ce4iRGI8BjI"
+    b"MwHT9A1u/RRcbBpapuH6Z+GCczBf/4Cq50FE4h/H1/hb"
+)
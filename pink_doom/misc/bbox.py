@@ -1,22 +1,37 @@
 """Nil."""
+from enum import IntEnum
 
-from enum import IntEnum, auto
-
+from pink_doom.doom.types import MAX_INT, MIN_INT
 from pink_doom.misc.fixed import Fixed
 
 
 class BoxCoord(IntEnum):
     """Bounding box coordinate storage."""
 
-    TOP = auto()
-    BOTTOM = auto()
-    LEFT = auto()
-    RIGHT = auto()
+    TOP = 0
+    BOTTOM = 1
+    LEFT = 2
+    RIGHT = 3
 
 
 def clear_box(box: list[Fixed]) -> None:
-    """TODO."""
+    """Make ``box`` empty, so the next point added sets its edges."""
+    box[BoxCoord.TOP] = box[BoxCoord.RIGHT] = MIN_INT
+    box[BoxCoord.BOTTOM] = box[BoxCoord.LEFT] = MAX_INT
 
 
 def add_to_box(box: list[Fixed], x: Fixed, y: Fixed) -> None:
-    """TODO."""
+    """
+    Grow ``box`` to take in the point (``x``, ``y``).
+
+    Like the original, a coordinate that moves the left (bottom) edge
+    is not checked against the right (top) one.
+    """
+    if x < box[BoxCoord.LEFT]:
+        box[BoxCoord.LEFT] = x
+    elif x > box[BoxCoord.RIGHT]:
+        box[BoxCoord.RIGHT] = x
+    if y < box[BoxCoord.BOTTOM]:
+        box[BoxCoord.BOTTOM] = y
+    elif y > box[BoxCoord.TOP]:
+        box[BoxCoord.TOP] = y
@@ -1,5 +1,14 @@
-"""Fixed point, 32bit as 16.16."""
+"""
+Fixed point, 32bit as 16.16.
 
+Division is done on integers, like ``((int64_t) a << FRACBITS) / b``
+in later versions of ``m_fixed.c``, rather than through a double.
+
+Python ints don't overflow, so by default results that don't fit in 32
+bits come out whole, and a quotient too large for fixed_div2 raises.
+With :data:`vanilla_wraparound` set they wrap around as they do in C
+instead, as demos recorded with the original need.
+"""
 from pink_doom.doom.types import MAX_INT, MIN_INT
 
 FRAC_BITS = 16
@@ -7,31 +16,61 @@ FRAC_UNIT = 1 << FRAC_BITS
 
 Fixed = int
 
+vanilla_wraparound = False
+"""Whether results keep only their low 32 bits, like fixed_t does in C."""
+
+
+def wrap(value: int) -> int:
+    """Keep the low 32 bits of ``value``, as a signed number."""
+    return ((value + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+def _abs(value: int) -> int:
+    # abs(INT_MIN) overflows back to INT_MIN in C.
+    return MIN_INT if value == MIN_INT else abs(value)
+
 
 def fixed_mul(a, b):
     """Multiplies two fixed point numbers."""
+    if vanilla_wraparound:
+        return wrap((a * b) >> FRAC_BITS)
     return (a * b) >> FRAC_BITS
 
 
 def fixed_div(a, b):
     """Divides two fixed point numbers."""
+    if vanilla_wraparound:
+        if (_abs(a) >> 14) >= _abs(b):
+            return MIN_INT if a ^ b < 0 else MAX_INT
+        return fixed_div2(a, b)
     if (abs(a) >> 14) >= abs(b):
         if a ^ b < 0:
             return MIN_INT
         else:
             return MAX_INT
     else:
-        return fixed_div2(a, b)
+        # fixed_div2, without the checks this one already made.
+        c = (a << FRAC_BITS) // b
+        if c < 0 and c * b != a << FRAC_BITS:
+            c += 1
+        return c
 
 
 def fixed_div2(a, b):
     """
     Divide two fixed point numbers.
 
-    Used for case when we need to do floating point arithmetic.
+    The quotient is rounded towards zero, like C integer division.
     """
-    c = a / b * FRAC_UNIT
+    if b == 0:
+        raise ZeroDivisionError("FixedDiv: divide by zero")
+    # // rounds down, so negative quotients with a remainder are one less.
+    c = (a << FRAC_BITS) // b
+    if c < 0 and c * b != a << FRAC_BITS:
+        c += 1
+    if vanilla_wraparound:
+        return wrap(c)
     if c > MAX_INT or c < MIN_INT:
         raise ZeroDivisionError("FixedDiv: divide by zero")
     else:
-        return int(c)
+        return c
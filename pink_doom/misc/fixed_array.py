@@ -0,0 +1,74 @@
+"""
+Fixed point arithmetic on NumPy arrays, see :mod:`pink_doom.misc.fixed`.
+
+Each function takes integer arrays (or scalars) and works element-wise,
+with the same results as the function of the same name there, so a
+loop calling one per element can be replaced by a single call.
+
+Inputs are fixed_t values, which fit in 32 bits. They are widened to
+int64, so products are exact like Python ints: :func:`fixed_mul`
+returns int64, and :func:`wrap` cuts results down to int32 the way C
+arithmetic would. :data:`pink_doom.misc.fixed.vanilla_wraparound`
+applies here too.
+"""
+import numpy as np
+
+from pink_doom.doom.types import MAX_INT, MIN_INT
+from pink_doom.misc import fixed
+from pink_doom.misc.fixed import FRAC_BITS
+
+
+def wrap(values) -> np.ndarray:
+    """Wrap integers around to int32, keeping their low 32 bits."""
+    return np.asarray(values, np.int64).astype(np.int32)
+
+
+def _abs(values: np.ndarray) -> np.ndarray:
+    if fixed.vanilla_wraparound:
+        # abs(INT_MIN) overflows back to INT_MIN in C.
+        return np.where(values == MIN_INT, MIN_INT, np.abs(values))
+    return np.abs(values)
+
+
+def fixed_mul(a, b) -> np.ndarray:
+    """Multiply fixed point numbers, as int64."""
+    product = (np.asarray(a, np.int64) * np.asarray(b, np.int64)) >> FRAC_BITS
+    if fixed.vanilla_wraparound:
+        return wrap(product).astype(np.int64)
+    return product
+
+
+def fixed_div(a, b) -> np.ndarray:
+    """
+    Divide fixed point numbers, as int32.
+
+    Quotients too big for the format saturate to :data:`MIN_INT` or
+    :data:`MAX_INT`, which includes dividing by zero.
+    """
+    a = np.asarray(a, np.int64)
+    b = np.asarray(b, np.int64)
+    overflows = (_abs(a) >> 14) >= _abs(b)
+    quotient = fixed_div2(a, b, overflows)
+    saturated = np.where((a ^ b) < 0, MIN_INT, MAX_INT)
+    return np.where(overflows, saturated, quotient).astype(np.int32)
+
+
+def fixed_div2(a, b, ignore=False) -> np.ndarray:
+    """
+    Divide fixed point numbers, rounding towards zero, as int32.
+
+    Raises :class:`ZeroDivisionError` if any quotient is out of range
+    (unless :data:`~pink_doom.misc.fixed.vanilla_wraparound` is set) or
+    divides by zero, except those where ``ignore`` is true.
+    """
+    a = np.asarray(a, np.int64)
+    b = np.asarray(b, np.int64)
+    zero = b == 0
+    c = np.abs(a << FRAC_BITS) // np.where(zero, 1, np.abs(b))
+    c = np.where((a ^ b) < 0, -c, c)
+    failed = zero
+    if not fixed.vanilla_wraparound:
+        failed = failed | (c > MAX_INT) | (c < MIN_INT)
+    if (failed & ~np.asarray(ignore)).any():
+        raise ZeroDivisionError("FixedDiv: divide by zero")
+    return np.where(failed, 0, c).astype(np.int32)
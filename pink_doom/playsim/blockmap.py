@@ -0,0 +1,195 @@
+"""
+The blockmap, a grid of line lists for movement clipping.
+
+The BLOCKMAP lump is a header (origin x and y, columns, rows), one
+offset per block, and the block lists those point at: line numbers
+ended by -1. Collision checks walk the lists of every block a moving
+thing touches, so :class:`Blockmap` decodes them once into a CSR pair
+of arrays, :attr:`Blockmap.offsets` and :attr:`Blockmap.lines`, where
+the lines of each block are one contiguous slice.
+
+Lists are kept exactly as stored. Node builders start each one with
+line 0, and the original iterates over that entry too, so it is kept.
+"""
+import sys
+from dataclasses import dataclass, field
+from typing import Iterator
+
+import numpy as np
+
+from pink_doom.misc.fixed import Fixed
+from pink_doom.playsim.local import MAP_BLOCK_SHIFT
+from pink_doom.rendering.level import Level
+
+_END = 0xFFFF
+"""Ends a block list, -1 as a short."""
+
+
+@dataclass
+class Blockmap:
+    """The decoded blockmap of a level."""
+
+    origin_x: Fixed
+    origin_y: Fixed
+    width: int
+    """Columns of blocks."""
+    height: int
+    """Rows of blocks."""
+    offsets: np.ndarray
+    """Where the lines of each block start in :attr:`lines`, then the end."""
+    lines: np.ndarray
+    """Line numbers of every block in turn, row by row from the bottom."""
+    _line_view: memoryview = field(init=False, repr=False)
+    _offset_view: memoryview = field(init=False, repr=False)
+    _seen_size: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Set up what :meth:`lines_in_box` needs."""
+        # Indexing a memoryview gives Python ints without copying the
+        # arrays, and is much faster than indexing them directly.
+        self._line_view = memoryview(self.lines)
+        self._offset_view = memoryview(self.offsets)
+        self._seen_size = int(self.lines.max(initial=-1)) + 1
+
+    @classmethod
+    def from_lump(cls, lump: bytes) -> "Blockmap":
+        """Decode a BLOCKMAP lump."""
+        data = np.frombuffer(lump, "<u2", len(lump) // 2)
+        if len(data) < 4:
+            print(f"{cls.from_lump.__qualname__}: no blockmap header", file=sys.stderr)
+            exit(1)
+        origin_x, origin_y, width, height = data[:4].astype(np.int16).tolist()
+        count = width * height
+        if width < 0 or height < 0 or len(data) < 4 + count:
+            print(
+                f"{cls.from_lump.__qualname__}: {width}x{height} blocks don't fit",
+                file=sys.stderr,
+            )
+            exit(1)
+        starts = data[4 : 4 + count].astype(np.int64)
+
+        # The first -1 at or after each start ends its list.
+        ends = np.flatnonzero(data == _END)
+        ends = ends[ends >= 4 + count]
+        end_of = np.searchsorted(ends, starts)
+        stops = np.append(ends, len(data))[end_of]
+        lengths = np.maximum(stops - starts, 0)
+
+        offsets = np.zeros(count + 1, np.int32)
+        np.cumsum(lengths, out=offsets[1:])
+        # Gather every list into one array: the position of each entry
+        # is its list's start plus its place within the list.
+        positions = np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], lengths)
+        return cls(
+            origin_x << 16,
+            origin_y << 16,
+            width,
+            height,
+            offsets,
+            data[positions].astype(np.int32),
+        )
+
+    @classmethod
+    def build(cls, level: Level) -> "Blockmap":
+        """
+        Make a blockmap for a level that has none.
+
+        Each line goes into every block its bounding box touches. That is
+        more blocks than it crosses if it is diagonal, which costs a few
+        extra checks but never misses one. Lists start with line 0 like
+        those of node builders.
+        """
+        vertex_x = np.frombuffer(level.vertex_x, np.int32).astype(np.int64)
+        vertex_y = np.frombuffer(level.vertex_y, np.int32).astype(np.int64)
+        if not len(vertex_x):
+            return cls(0, 0, 0, 0, np.zeros(1, np.int32), np.zeros(0, np.int32))
+        # Whole map units, like the header stores.
+        origin_x = (int(vertex_x.min()) >> 16) << 16
+        origin_y = (int(vertex_y.min()) >> 16) << 16
+        width = ((int(vertex_x.max()) - origin_x) >> MAP_BLOCK_SHIFT) + 1
+        height = ((int(vertex_y.max()) - origin_y) >> MAP_BLOCK_SHIFT) + 1
+
+        v1 = np.frombuffer(level.line_v1, np.int32)
+        v2 = np.frombuffer(level.line_v2, np.int32)
+        x1 = (np.minimum(vertex_x[v1], vertex_x[v2]) - origin_x) >> MAP_BLOCK_SHIFT
+        x2 = (np.maximum(vertex_x[v1], vertex_x[v2]) - origin_x) >> MAP_BLOCK_SHIFT
+        y1 = (np.minimum(vertex_y[v1], vertex_y[v2]) - origin_y) >> MAP_BLOCK_SHIFT
+        y2 = (np.maximum(vertex_y[v1], vertex_y[v2]) - origin_y) >> MAP_BLOCK_SHIFT
+
+        # One (block, line) pair per block in each line's box.
+        columns = x2 - x1 + 1
+        counts = columns * (y2 - y1 + 1)
+        lines = np.repeat(np.arange(len(v1)), counts)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        bx = np.repeat(x1, counts) + within % np.repeat(columns, counts)
+        by = np.repeat(y1, counts) + within // np.repeat(columns, counts)
+        blocks = by * width + bx
+
+        # Line 0 heads every list.
+        blocks = np.concatenate([np.arange(width * height), blocks])
+        lines = np.concatenate([np.zeros(width * height, np.int64), lines])
+        order = np.lexsort((lines, blocks))
+        offsets = np.zeros(width * height + 1, np.int32)
+        np.cumsum(np.bincount(blocks, minlength=width * height), out=offsets[1:])
+        return cls(
+            origin_x, origin_y, width, height, offsets, lines[order].astype(np.int32)
+        )
+
+    def to_lump(self) -> bytes:
+        """Encode as a BLOCKMAP lump, with one list per block."""
+        count = self.width * self.height
+        lengths = np.diff(self.offsets)
+        starts = 4 + count + np.cumsum(lengths + 1) - (lengths + 1)
+        if len(self.lines) + 5 + 2 * count > _END:
+            print(
+                f"{self.to_lump.__qualname__}: too big for 16-bit offsets",
+                file=sys.stderr,
+            )
+            exit(1)
+        lists = np.insert(self.lines, self.offsets[1:], -1)
+        header = np.array(
+            [self.origin_x >> 16, self.origin_y >> 16, self.width, self.height]
+        )
+        words = np.concatenate([header, starts, lists]).astype("<i4")
+        # Wrap negative values around to their 16-bit patterns.
+        return words.astype("<u2").tobytes()
+
+    def block_of(self, x: Fixed, y: Fixed) -> tuple[int, int]:
+        """Return the column and row of the block holding (``x``, ``y``)."""
+        bx = (x - self.origin_x) >> MAP_BLOCK_SHIFT
+        by = (y - self.origin_y) >> MAP_BLOCK_SHIFT
+        return bx, by
+
+    def lines_in_block(self, bx: int, by: int) -> np.ndarray:
+        """
+        Return the lines of block (``bx``, ``by``).
+
+        The result is a view into :attr:`lines`, empty outside the map.
+        """
+        if bx < 0 or by < 0 or bx >= self.width or by >= self.height:
+            return self.lines[:0]
+        block = by * self.width + bx
+        return self.lines[self.offsets[block] : self.offsets[block + 1]]
+
+    def lines_in_box(self, bx1: int, by1: int, bx2: int, by2: int) -> Iterator[int]:
+        """
+        Yield every line in the blocks from (bx1, by1) to (bx2, by2), once.
+
+        Blocks are visited column by column like ``P_CheckPosition``
+        does. A fresh map of seen lines, a byte each, replaces the
+        ``validcount`` marks, so no state is shared between calls.
+        """
+        bx1, by1 = max(bx1, 0), max(by1, 0)
+        bx2, by2 = min(bx2, self.width - 1), min(by2, self.height - 1)
+        if bx1 > bx2 or by1 > by2:
+            return
+        seen = bytearray(self._seen_size)
+        offsets = self._offset_view
+        lines = self._line_view
+        width = self.width
+        for bx in range(bx1, bx2 + 1):
+            for block in range(by1 * width + bx, by2 * width + bx + 1, width):
+                for line in lines[offsets[block] : offsets[block + 1]]:
+                    if not seen[line]:
+                        seen[line] = 1
+                        yield line
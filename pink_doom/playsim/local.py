@@ -0,0 +1,21 @@
+"""Play functions, animation, global header."""
+from pink_doom.misc.fixed import FRAC_BITS, FRAC_UNIT
+
+# mapblocks are used to check movement
+# against lines and things
+MAP_BLOCK_UNITS = 128
+MAP_BLOCK_SIZE = MAP_BLOCK_UNITS * FRAC_UNIT
+MAP_BLOCK_SHIFT = FRAC_BITS + 7
+MAP_B_MASK = MAP_BLOCK_SIZE - 1
+MAP_B_TO_FRAC = MAP_BLOCK_SHIFT - FRAC_BITS
+
+PLAYER_RADIUS = 16 * FRAC_UNIT
+"""player radius for movement checking"""
+
+MAX_RADIUS = 32 * FRAC_UNIT
+"""
+MAXRADIUS is for precalculated sector block boxes.
+
+The spider demon is larger,
+but we do not have any moving sectors nearby.
+"""
@@ -0,0 +1,121 @@
+"""
+The reject table, a quick check before lines of sight are traced.
+
+The REJECT lump holds a bit for every ordered pair of sectors, one
+row of ``numsectors`` bits per looking sector, least significant bit
+first. A set bit means nothing in the first sector can see anything in
+the second, so ``P_CheckSight`` gives up without walking the BSP tree.
+
+Node builders often leave the lump zeroed (nothing rejected), and some
+PWADs ship it empty. :meth:`Reject.build` makes a safe table from the
+map instead: sectors that no chain of two-sided lines joins can never
+see each other.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from pink_doom.doom.data import MapLump, decode_lump
+from pink_doom.rendering.level import Level, load_level
+from pink_doom.wad import loader
+from pink_doom.wad.cache import PurgeTag
+
+
+@dataclass
+class Reject:
+    """The reject table of a level."""
+
+    numsectors: int
+    matrix: bytes
+    """The packed bits, ``numsectors ** 2`` of them, padded to whole bytes."""
+
+    @classmethod
+    def from_lump(cls, lump: bytes, numsectors: int) -> "Reject":
+        """
+        Use the contents of a REJECT lump.
+
+        A lump too short for ``numsectors`` is padded with zeroes, so the
+        missing pairs are never rejected.
+        """
+        size = (numsectors * numsectors + 7) // 8
+        matrix = bytes(lump[:size])
+        if len(matrix) < size:
+            matrix += bytes(size - len(matrix))
+        return cls(numsectors, matrix)
+
+    @classmethod
+    def build(cls, level: Level) -> "Reject":
+        """Make a table that rejects the pairs of unconnected sectors."""
+        numsectors = len(level.sector_floor_height)
+        front = np.frombuffer(level.line_frontsector, np.int32)
+        back = np.frombuffer(level.line_backsector, np.int32)
+        joined = (front != -1) & (back != -1)
+        front, back = front[joined], back[joined]
+
+        # Give every sector the lowest number in its group: spread it
+        # across lines and follow labels to their own labels until
+        # nothing changes.
+        group = np.arange(numsectors)
+        while True:
+            previous = group.copy()
+            lowest = np.minimum(group[front], group[back])
+            np.minimum.at(group, front, lowest)
+            np.minimum.at(group, back, lowest)
+            group = group[group]
+            if np.array_equal(group, previous):
+                break
+
+        rejected = group[:, None] != group[None, :]
+        return cls(numsectors, np.packbits(rejected, bitorder="little").tobytes())
+
+    def is_empty(self) -> bool:
+        """Return whether nothing is rejected."""
+        return self.matrix.count(0) == len(self.matrix)
+
+    def to_lump(self) -> bytes:
+        """Return the contents of a REJECT lump."""
+        return self.matrix
+
+    def sectors_can_see(self, a: int, b: int) -> bool:
+        """Return whether sector ``a`` might see sector ``b``."""
+        pnum = a * self.numsectors + b
+        return not self.matrix[pnum >> 3] & (1 << (pnum & 7))
+
+    def sectors_seeing(self, sector: int) -> np.ndarray:
+        """Return which sectors might see ``sector``, as a bool per sector."""
+        pnums = np.arange(self.numsectors) * self.numsectors + sector
+        bits = np.frombuffer(self.matrix, np.uint8)[pnums >> 3] >> (pnums & 7)
+        return (bits & 1) == 0
+
+    def visible_from(self, sector: int) -> np.ndarray:
+        """Return which sectors ``sector`` might see, as a bool per sector."""
+        start = sector * self.numsectors
+        first = start >> 3
+        last = (start + self.numsectors + 7) >> 3
+        row = np.unpackbits(
+            np.frombuffer(self.matrix, np.uint8, last - first, first),
+            bitorder="little",
+        )
+        skip = start & 7
+        return row[skip : skip + self.numsectors] == 0
+
+
+def load_reject(
+    map_name: str, level: Optional[Level] = None, rebuild: bool = False
+) -> Reject:
+    """
+    Get the reject table of ``map_name`` in the loaded WADs.
+
+    With ``rebuild``, a lump that rejects nothing is replaced by
+    :meth:`Reject.build` of ``level`` (loaded if not given).
+    """
+    label = loader.get_num_for_name(map_name)
+    lump, sectors = (
+        loader.cache_lump_num(label + kind.value - MapLump.LABEL.value, PurgeTag.LEVEL)
+        for kind in (MapLump.REJECT, MapLump.SECTORS)
+    )
+    reject = Reject.from_lump(lump, len(decode_lump(MapLump.SECTORS, sectors)))
+    if rebuild and reject.is_empty():
+        reject = Reject.build(level if level is not None else load_level(map_name))
+    return reject
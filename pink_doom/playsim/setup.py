@@ -0,0 +1,279 @@
+"""
+Do all the WAD I/O, get map description, set up initial state and misc. LUTs.
+
+So far this holds what ``P_LoadLineDefs`` and ``P_GroupLines`` work
+out from the map lumps: the bounding box and slope type of each line,
+the lines of each sector, and each sector's bounding box, block box and
+sound origin. :func:`group_lines` computes all of them for a level at
+once with NumPy, with the same results as the original loops.
+
+They only depend on the map lumps, so :func:`derived_data` keeps them
+in :data:`derived_cache_dir`, keyed by a hash of those lumps, and a
+level that was set up before doesn't need to compute them again.
+"""
+import hashlib
+import os
+import zipfile
+from dataclasses import dataclass, fields
+from typing import Mapping, Optional
+
+import numpy as np
+
+from pink_doom.doom.data import MapLump
+from pink_doom.doom.types import MAX_INT, MIN_INT
+from pink_doom.misc.bbox import BoxCoord
+from pink_doom.misc.fixed_array import wrap
+from pink_doom.playsim.local import MAP_BLOCK_SHIFT, MAX_RADIUS
+from pink_doom.rendering.defines import SlopeType
+from pink_doom.rendering.level import Level, load_level
+from pink_doom.wad import loader
+from pink_doom.wad.cache import PurgeTag
+
+FORMAT_VERSION = 1
+"""Bump whenever :class:`DerivedData` or the way it is computed changes."""
+
+derived_cache_dir: Optional[str] = None
+"""Directory for saved :class:`DerivedData`, or None to always compute it."""
+
+_KEY_LUMPS = (
+    MapLump.VERTEXES,
+    MapLump.LINEDEFS,
+    MapLump.SIDEDEFS,
+    MapLump.SECTORS,
+    MapLump.BLOCKMAP,
+)
+"""The map lumps :class:`DerivedData` depends on."""
+
+
+@dataclass
+class DerivedData:
+    """Line and sector data worked out at level setup, as int32 arrays."""
+
+    line_bbox: np.ndarray
+    """Four edges of each line, indexed by :class:`BoxCoord`."""
+    line_slopetype: np.ndarray
+    """The :class:`SlopeType` value of each line."""
+    sector_lines: np.ndarray
+    """Line numbers of every sector in turn, each sector's in line order."""
+    sector_line_offsets: np.ndarray
+    """Where each sector's lines start in :attr:`sector_lines`, then the end."""
+    sector_bbox: np.ndarray
+    """Four edges of each sector, indexed by :class:`BoxCoord`."""
+    sector_blockbox: np.ndarray
+    """:attr:`sector_bbox` in blockmap blocks, grown by :data:`MAX_RADIUS`."""
+    sector_soundorg: np.ndarray
+    """x and y of the sound origin of each sector, its z is always 0."""
+
+    def lines_of(self, sector: int) -> np.ndarray:
+        """Return the line numbers of ``sector``."""
+        start, stop = self.sector_line_offsets[sector : sector + 2]
+        return self.sector_lines[start:stop]
+
+
+def _column(values) -> np.ndarray:
+    return np.frombuffer(values, np.int32).astype(np.int64)
+
+
+def blockmap_bounds(level: Level, blockmap: bytes) -> tuple[int, int, int, int]:
+    """
+    Return the origin (as fixed point), width and height of the blockmap.
+
+    They come from the BLOCKMAP header. Without one, as in maps that
+    haven't been through a node builder, the grid is fitted around the
+    vertexes.
+    """
+    if len(blockmap) >= 8:
+        x, y, width, height = np.frombuffer(blockmap, "<i2", 4).tolist()
+        return x << 16, y << 16, width, height
+    if not level.vertex_x:
+        return 0, 0, 1, 1
+    vertex_x = _column(level.vertex_x)
+    vertex_y = _column(level.vertex_y)
+    x, y = int(vertex_x.min()), int(vertex_y.min())
+    width = ((int(vertex_x.max()) - x) >> MAP_BLOCK_SHIFT) + 1
+    height = ((int(vertex_y.max()) - y) >> MAP_BLOCK_SHIFT) + 1
+    return x, y, width, height
+
+
+def _box_edges(
+    values: np.ndarray, groups: np.ndarray, starts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the low and high edge of each group as :func:`add_to_box` would.
+
+    ``values`` are sorted by ``groups``, and each group, starting at
+    ``starts``, is added to a cleared box in order. A value only counts
+    towards the high edge if it didn't lower the low edge.
+    """
+    # Shift every group below all earlier ones, so the running minimum
+    # starts over at each group.
+    shift = groups.astype(np.int64) << 34
+    running = np.minimum.accumulate(values - shift) + shift
+    previous = np.empty_like(running)
+    previous[1:] = running[:-1]
+    previous[starts] = MAX_INT
+    low = np.minimum.reduceat(values, starts)
+    high = np.maximum.reduceat(np.where(values >= previous, values, MIN_INT), starts)
+    return low, high
+
+
+def group_lines(level: Level, blockmap: bytes) -> DerivedData:
+    """
+    Work out the line and sector data of ``level``.
+
+    ``blockmap`` is its BLOCKMAP lump, only the header is used.
+    """
+    numsectors = len(level.sector_floor_height)
+    numlines = len(level.line_v1)
+    vertex_x = _column(level.vertex_x)
+    vertex_y = _column(level.vertex_y)
+    v1 = np.frombuffer(level.line_v1, np.int32)
+    v2 = np.frombuffer(level.line_v2, np.int32)
+    x1, y1, x2, y2 = vertex_x[v1], vertex_y[v1], vertex_x[v2], vertex_y[v2]
+
+    line_bbox = np.empty((numlines, 4), np.int32)
+    line_bbox[:, BoxCoord.TOP] = np.maximum(y1, y2)
+    line_bbox[:, BoxCoord.BOTTOM] = np.minimum(y1, y2)
+    line_bbox[:, BoxCoord.LEFT] = np.minimum(x1, x2)
+    line_bbox[:, BoxCoord.RIGHT] = np.maximum(x1, x2)
+
+    # fixed_div(dy, dx) > 0 exactly when dy and dx have the same sign:
+    # map coordinates are whole units, so the quotient is never below 1.
+    dx = np.frombuffer(level.line_dx, np.int32)
+    dy = np.frombuffer(level.line_dy, np.int32)
+    line_slopetype = np.where(
+        dx == 0,
+        SlopeType.VERTICAL.value,
+        np.where(
+            dy == 0,
+            SlopeType.HORIZONTAL.value,
+            np.where(
+                (dx ^ dy) >= 0, SlopeType.POSITIVE.value, SlopeType.NEGATIVE.value
+            ),
+        ),
+    ).astype(np.int32)
+
+    # A line belongs to its front sector, and to its back sector too if
+    # that is another one.
+    front = np.frombuffer(level.line_frontsector, np.int32)
+    back = np.frombuffer(level.line_backsector, np.int32)
+    lines = np.arange(numlines, dtype=np.int32)
+    has_front = front != -1
+    has_back = (back != -1) & (back != front)
+    pair_sectors = np.concatenate([front[has_front], back[has_back]])
+    pair_lines = np.concatenate([lines[has_front], lines[has_back]])
+    order = np.lexsort((pair_lines, pair_sectors))
+    sector_lines = pair_lines[order]
+    pair_sectors = pair_sectors[order]
+    counts = np.bincount(pair_sectors, minlength=numsectors)
+    sector_line_offsets = np.zeros(numsectors + 1, np.int32)
+    np.cumsum(counts, out=sector_line_offsets[1:])
+
+    sector_bbox = np.empty((numsectors, 4), np.int32)
+    sector_bbox[:, [BoxCoord.TOP, BoxCoord.RIGHT]] = MIN_INT
+    sector_bbox[:, [BoxCoord.BOTTOM, BoxCoord.LEFT]] = MAX_INT
+    grouped = np.flatnonzero(counts)
+    if len(grouped):
+        # Both ends of each line, v1 first, in the order they are added.
+        groups = np.repeat(pair_sectors, 2)
+        starts = 2 * sector_line_offsets[grouped]
+        xs = np.stack([x1[sector_lines], x2[sector_lines]], axis=1).ravel()
+        ys = np.stack([y1[sector_lines], y2[sector_lines]], axis=1).ravel()
+        low, high = _box_edges(xs, groups, starts)
+        sector_bbox[grouped, BoxCoord.LEFT] = low
+        sector_bbox[grouped, BoxCoord.RIGHT] = high
+        low, high = _box_edges(ys, groups, starts)
+        sector_bbox[grouped, BoxCoord.BOTTOM] = low
+        sector_bbox[grouped, BoxCoord.TOP] = high
+
+    top, bottom, left, right = sector_bbox.astype(np.int64).T
+    # Halved with C division, which rounds towards zero.
+    sector_soundorg = np.stack(
+        [np.trunc(wrap(right + left) / 2), np.trunc(wrap(top + bottom) / 2)], axis=1
+    ).astype(np.int32)
+
+    origin_x, origin_y, width, height = blockmap_bounds(level, blockmap)
+    sector_blockbox = np.empty((numsectors, 4), np.int32)
+    sector_blockbox[:, BoxCoord.TOP] = np.minimum(
+        wrap(top - origin_y + MAX_RADIUS) >> MAP_BLOCK_SHIFT, height - 1
+    )
+    sector_blockbox[:, BoxCoord.BOTTOM] = np.maximum(
+        wrap(bottom - origin_y - MAX_RADIUS) >> MAP_BLOCK_SHIFT, 0
+    )
+    sector_blockbox[:, BoxCoord.RIGHT] = np.minimum(
+        wrap(right - origin_x + MAX_RADIUS) >> MAP_BLOCK_SHIFT, width - 1
+    )
+    sector_blockbox[:, BoxCoord.LEFT] = np.maximum(
+        wrap(left - origin_x - MAX_RADIUS) >> MAP_BLOCK_SHIFT, 0
+    )
+
+    return DerivedData(
+        line_bbox=line_bbox,
+        line_slopetype=line_slopetype,
+        sector_lines=sector_lines,
+        sector_line_offsets=sector_line_offsets,
+        sector_bbox=sector_bbox,
+        sector_blockbox=sector_blockbox,
+        sector_soundorg=sector_soundorg,
+    )
+
+
+def level_key(lumps: Mapping[MapLump, bytes]) -> str:
+    """Hash the map lumps :class:`DerivedData` is computed from."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(FORMAT_VERSION.to_bytes(4, "little"))
+    for kind in _KEY_LUMPS:
+        data = lumps[kind]
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _load(path: str) -> Optional[DerivedData]:
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            return DerivedData(**{f.name: archive[f.name] for f in fields(DerivedData)})
+    except (IOError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        # A missing or damaged file only means computing the data again.
+        return None
+
+
+def _save(path: str, derived: DerivedData) -> None:
+    """Write ``derived`` to ``path``, replacing it atomically."""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(temp_path, "wb") as handle:
+            np.savez(handle, **vars(derived))
+        os.replace(temp_path, path)
+    except IOError:
+        print(f" couldn't save the level data in {derived_cache_dir}")
+
+
+def derived_data(map_name: str, level: Optional[Level] = None) -> DerivedData:
+    """
+    Get the :class:`DerivedData` of ``map_name`` in the loaded WADs.
+
+    Loaded from :data:`derived_cache_dir` if it was saved before,
+    otherwise computed from ``level`` (loaded if not given) and saved.
+    """
+    label = loader.get_num_for_name(map_name)
+    lumps = {
+        kind: loader.cache_lump_num(
+            label + kind.value - MapLump.LABEL.value, PurgeTag.LEVEL
+        )
+        for kind in _KEY_LUMPS
+    }
+    path = None
+    if derived_cache_dir is not None:
+        path = os.path.join(derived_cache_dir, f"{level_key(lumps)}.level.npz")
+        derived = _load(path)
+        if derived is not None:
+            return derived
+
+    if level is None:
+        level = load_level(map_name)
+    derived = group_lines(level, lumps[MapLump.BLOCKMAP])
+    if path is not None:
+        _save(path, derived)
+    return derived
@@ -0,0 +1,253 @@
+"""
+Refresh module, data I/O, caching, retrieval of graphics by name.
+
+Holds the level precache: when :data:`pink_doom.doom.state.precache`
+is set, every lump a level will draw or play is read into the lump
+cache by a pool of worker threads, so it can run while the wipe or the
+intermission is still on screen.
+"""
+import re
+import struct
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass, field
+from typing import Optional
+
+from pink_doom.doom import state as doom_state
+from pink_doom.doom.data import MapLump, decode_lump
+from pink_doom.doom.info import mobjinfo, sprnames, states
+from pink_doom.misc.sounds import SfxEnum, sfx
+from pink_doom.rendering import state
+from pink_doom.wad import loader
+from pink_doom.wad.cache import PurgeTag
+from pink_doom.wad.loader import LumpNamespace
+
+lastflat = 0
+numflats = 0
+
+precache_workers = 4
+"""Number of threads :func:`precache_level` reads lumps with."""
+
+_PLAYER_STARTS = (1, 2, 3, 4, 11)
+"""Thing types that spawn a player (four coop starts, deathmatch)."""
+
+_SOUND_VARIANTS = {
+    SfxEnum.POSIT1: (SfxEnum.POSIT1, SfxEnum.POSIT2, SfxEnum.POSIT3),
+    SfxEnum.BGSIT1: (SfxEnum.BGSIT1, SfxEnum.BGSIT2),
+    SfxEnum.PODTH1: (SfxEnum.PODTH1, SfxEnum.PODTH2, SfxEnum.PODTH3),
+    SfxEnum.BGDTH1: (SfxEnum.BGDTH1, SfxEnum.BGDTH2),
+}
+"""Sight and death sounds that get picked at random from a few lumps."""
+
+
+def _lump_name(raw: bytes) -> str:
+    return raw.split(b"\x00", 1)[0].decode("latin-1").upper()
+
+
+def _namespace_bounds(namespace: LumpNamespace, caller) -> tuple[int, int]:
+    """Return the first and last lump between the outermost markers."""
+    ranges = loader.namespace_ranges(namespace)
+    if not ranges:
+        print(f"{caller.__qualname__}: no {namespace.name.lower()}", file=sys.stderr)
+        exit(1)
+    return ranges[0].start, ranges[-1].stop - 1
+
+
+def init_flats():
+    """
+    Find the flats.
+
+    Like the original, every lump from the first to the last flat is
+    numbered, so nested markers count as (empty) flats.
+    """
+    global lastflat, numflats
+    state.firstflat, lastflat = _namespace_bounds(LumpNamespace.FLATS, init_flats)
+    numflats = lastflat - state.firstflat + 1
+
+    # Create translation table for global animation.
+    state.flattranslation = list(range(numflats + 1))
+
+
+def init_sprite_lumps():
+    """Find the sprite frames."""
+    state.firstspritelump, state.lastspritelump = _namespace_bounds(
+        LumpNamespace.SPRITES, init_sprite_lumps
+    )
+    state.numspritelumps = state.lastspritelump - state.firstspritelump + 1
+
+
+def flat_num_for_name(name: str) -> int:
+    """Return the flat number of a flat, looked up among the flats only."""
+    i = loader.check_num_for_name_ns(name, LumpNamespace.FLATS)
+    if i == -1:
+        print(f"{flat_num_for_name.__qualname__}: {name} not found", file=sys.stderr)
+        exit(1)
+    return i - state.firstflat
+
+
+def texture_patches() -> dict[str, list[int]]:
+    """
+    Map each wall texture name to the patch lumps it is composed of.
+
+    Reads the TEXTURE1/TEXTURE2 definitions and the PNAMES lump,
+    patches that can't be found are left out.
+    """
+    pnames = loader.cache_lump_name("PNAMES")
+    (num_patches,) = struct.unpack_from("<i", pnames)
+    patch_lumps = [
+        loader.check_num_for_name(_lump_name(name))
+        for (name,) in struct.iter_unpack("<8s", pnames[4 : 4 + num_patches * 8])
+    ]
+
+    textures = {}
+    for texture_lump in ("TEXTURE1", "TEXTURE2"):
+        if loader.check_num_for_name(texture_lump) == -1:
+            continue
+        data = loader.cache_lump_name(texture_lump)
+        (num_textures,) = struct.unpack_from("<i", data)
+        for offset in struct.unpack_from(f"<{num_textures}i", data, 4):
+            # maptexture_t: name, masked, width, height, columndirectory, patchcount
+            name, _, _, _, _, patch_count = struct.unpack_from("<8sihhih", data, offset)
+            # Each mappatch_t is originx, originy, patch, stepdir, colormap.
+            patches = struct.unpack_from("<" + "4xh4x" * patch_count, data, offset + 22)
+            textures[_lump_name(name)] = [
+                patch_lumps[patch]
+                for patch in patches
+                if 0 <= patch < num_patches and patch_lumps[patch] != -1
+            ]
+    return textures
+
+
+def _sky_texture(map_name: str) -> str:
+    """Pick the sky texture the way ``G_InitNew`` does."""
+    match = re.fullmatch(r"E(\d)M\d", map_name, re.IGNORECASE)
+    if match:
+        return f"SKY{match.group(1)}"
+    match = re.fullmatch(r"MAP(\d\d)", map_name, re.IGNORECASE)
+    if match and int(match.group(1)) < 12:
+        return "SKY1"
+    if match and int(match.group(1)) < 21:
+        return "SKY2"
+    return "SKY3"
+
+
+def _map_lump(label: int, kind: MapLump) -> bytes:
+    return loader.cache_lump_num(label + kind.value - MapLump.LABEL.value)
+
+
+def _thing_lumps(things: bytes) -> list[int]:
+    """Find the sprite frames and sounds of everything spawned by THINGS."""
+    kinds = {kind for _, _, _, kind, _ in struct.iter_unpack("<5h", things)}
+    infos = [info for info in mobjinfo if info.doomednum in kinds]
+    if kinds.intersection(_PLAYER_STARTS):
+        infos.append(mobjinfo[0])
+
+    prefixes = set()
+    sounds = set()
+    for info in infos:
+        prefixes.add(sprnames[states[info.spawnstate.value - 1].sprite.value - 1])
+        for sound in (
+            info.seesound,
+            info.attacksound,
+            info.painsound,
+            info.deathsound,
+            info.activesound,
+        ):
+            sounds.update(_SOUND_VARIANTS.get(sound, (sound,)))
+    sounds.discard(SfxEnum.NONE)
+
+    lumps = [
+        lump
+        for lump, name in enumerate(loader.lump_info.names)
+        if loader.lump_info.namespaces[lump] == LumpNamespace.SPRITES.value
+        and name[:4].upper() in prefixes
+    ]
+    for sound in sounds:
+        info = sfx[sound.value - 1]
+        if info.link != SfxEnum.NONE:
+            info = sfx[info.link.value - 1]
+        lumps.append(loader.check_num_for_name(f"ds{info.name}"))
+    return lumps
+
+
+def level_lumps(map_name: str) -> list[int]:
+    """
+    List every lump the level ``map_name`` needs.
+
+    That is its own map lumps, the patches of all wall textures
+    (and the sky) on its sides, the flats of its sectors, and the sprite
+    frames and sounds of the things it spawns. The list is sorted and
+    has no duplicates.
+    """
+    label = loader.get_num_for_name(map_name)
+    lumps = {label + kind.value - MapLump.LABEL.value for kind in MapLump}
+
+    textures = texture_patches()
+    walls = {_sky_texture(map_name)}
+    sides = decode_lump(MapLump.SIDEDEFS, _map_lump(label, MapLump.SIDEDEFS))
+    for part in ("top_texture", "bottom_texture", "mid_texture"):
+        walls.update(_lump_name(name) for name in set(sides[part].tolist()))
+    walls.discard("-")
+    for wall in walls:
+        lumps.update(textures.get(wall, ()))
+
+    sectors = decode_lump(MapLump.SECTORS, _map_lump(label, MapLump.SECTORS))
+    flats = set(sectors["floor_pic"].tolist()) | set(sectors["ceiling_pic"].tolist())
+    for flat in flats:
+        name = _lump_name(flat)
+        lump = loader.check_num_for_name_ns(name, LumpNamespace.FLATS)
+        lumps.add(lump if lump != -1 else loader.check_num_for_name(name))
+
+    lumps.update(_thing_lumps(_map_lump(label, MapLump.THINGS)))
+    lumps.discard(-1)
+    return sorted(lumps)
+
+
+@dataclass
+class LevelPrecache:
+    """Lumps of a level being read in the background."""
+
+    lumps: list[int] = field(default_factory=list)
+    futures: list[Future] = field(default_factory=list)
+
+    def done(self) -> bool:
+        """Check whether every lump has been read."""
+        return all(future.done() for future in self.futures)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until every lump has been read, re-raising any error."""
+        wait_futures(self.futures, timeout)
+        for future in self.futures:
+            future.result(0)
+
+
+def precache_level(map_name: str, tag: PurgeTag = PurgeTag.LEVEL) -> LevelPrecache:
+    """
+    Start reading all lumps of ``map_name`` into the lump cache.
+
+    The lumps are split into :data:`precache_workers` runs of neighbouring
+    lumps, each fetched with :func:`pink_doom.wad.loader.cache_lumps`.
+    Does nothing unless :data:`pink_doom.doom.state.precache` is set.
+    Call :meth:`LevelPrecache.wait` before the level is first drawn.
+    """
+    if not doom_state.precache:
+        return LevelPrecache()
+
+    lumps = level_lumps(map_name)
+    by_position = sorted(
+        lumps,
+        key=lambda lump: (
+            loader.lump_info.wad_index[lump],
+            loader.lump_info.positions[lump],
+        ),
+    )
+    run_length = -(-len(by_position) // precache_workers)
+    pool = ThreadPoolExecutor(precache_workers, thread_name_prefix="precache")
+    futures = [
+        pool.submit(loader.cache_lumps, by_position[i : i + run_length], tag)
+        for i in range(0, len(by_position), run_length or 1)
+    ]
+    # The submitted reads still run, then the threads exit.
+    pool.shutdown(wait=False)
+    return LevelPrecache(lumps, futures)
@@ -0,0 +1,484 @@
+"""
+A level as parallel arrays instead of linked objects.
+
+:class:`Level` holds one flat array per field of the map types in
+:mod:`pink_doom.rendering.defines`, indexed by record number: vertex
+``x`` and ``y``, seg ``v1``/``v2`` vertex numbers, node partition lines,
+and so on. References between records are plain indexes, -1 for none.
+
+The arrays are :class:`array.array`, so reading an element in a loop
+gives a Python int, and ``numpy.frombuffer`` views them without copying
+for whole-level work. A big map costs a few bytes per field per record
+rather than a Python object per record.
+"""
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import Optional
+
+import numpy as np
+
+from pink_doom.doom.data import (
+    NO_INDEX,
+    LinedefAttribute,
+    MapLump,
+    NodeFlag,
+    decode_lump,
+)
+from pink_doom.misc.fixed import FRAC_BITS, fixed_mul
+from pink_doom.wad import loader
+from pink_doom.wad.cache import PurgeTag
+
+_LEVEL_LUMPS = (
+    MapLump.VERTEXES,
+    MapLump.SECTORS,
+    MapLump.SIDEDEFS,
+    MapLump.LINEDEFS,
+    MapLump.SEGS,
+    MapLump.SSECTORS,
+    MapLump.NODES,
+)
+"""The map lumps a :class:`Level` is built from."""
+
+
+def _ints(typecode: str = "i") -> array:
+    return field(default_factory=lambda: array(typecode))
+
+
+def _column(values: np.ndarray, typecode: str = "i") -> array:
+    column = array(typecode)
+    column.frombytes(np.ascontiguousarray(values, np.dtype(typecode)).tobytes())
+    return column
+
+
+def _index(values: np.ndarray) -> np.ndarray:
+    """Widen unsigned lump indexes, turning :data:`NO_INDEX` into -1."""
+    values = values.astype(np.int32)
+    values[values == NO_INDEX] = -1
+    return values
+
+
+def _fixed(values: np.ndarray) -> np.ndarray:
+    return values.astype(np.int32) << FRAC_BITS
+
+
+def _int64(values: array) -> np.ndarray:
+    return np.frombuffer(values, np.int32).astype(np.int64)
+
+
+def _node_sides(x, y, node_x, node_y, node_dx, node_dy) -> np.ndarray:
+    """Vectorized :meth:`Level.point_on_side`, a node per point."""
+    dx = x - node_x
+    dy = y - node_y
+
+    # The branches of the scalar version, the earliest one applied last.
+    left = ((node_dy >> FRAC_BITS) * dx) >> FRAC_BITS
+    right = (dy * (node_dx >> FRAC_BITS)) >> FRAC_BITS
+    side = right >= left
+    side = np.where((node_dy ^ node_dx ^ dx ^ dy) < 0, (node_dy ^ dx) < 0, side)
+    side = np.where(node_dy == 0, np.where(y <= node_y, node_dx < 0, node_dx > 0), side)
+    return np.where(node_dx == 0, np.where(x <= node_x, node_dy > 0, node_dy < 0), side)
+
+
+@dataclass
+class SubsectorGrid:
+    """
+    Where to start looking for the subsector of a point, per grid cell.
+
+    Each cell holds the deepest BSP child, a node or a subsector (with
+    :attr:`NodeFlag.SUBSECTOR` set), whose partitions put the whole cell
+    on one side. Points in a cell only need the walk below it.
+    """
+
+    origin_x: int
+    origin_y: int
+    shift: int
+    """log2 of the cell size in fixed point units."""
+    width: int
+    height: int
+    cells: array
+    """Row by row from the bottom."""
+
+    def start(self, x: int, y: int, root: int) -> int:
+        """Return where to start the walk for (x, y), ``root`` off the grid."""
+        cx = (x - self.origin_x) >> self.shift
+        cy = (y - self.origin_y) >> self.shift
+        if 0 <= cx < self.width and 0 <= cy < self.height:
+            return self.cells[cy * self.width + cx]
+        return root
+
+
+@dataclass
+class Level:
+    """The map records of a level, a flat array per field."""
+
+    vertex_x: array = _ints()
+    vertex_y: array = _ints()
+
+    sector_floor_height: array = _ints()
+    sector_ceiling_height: array = _ints()
+    sector_light_level: array = _ints()
+    sector_special: array = _ints()
+    sector_tag: array = _ints()
+
+    side_textureoffset: array = _ints()
+    side_rowoffset: array = _ints()
+    side_sector: array = _ints()
+
+    line_v1: array = _ints()
+    line_v2: array = _ints()
+    line_dx: array = _ints()
+    line_dy: array = _ints()
+    line_flags: array = _ints()
+    line_special: array = _ints()
+    line_tag: array = _ints()
+    line_sidenum: array = _ints()
+    """Two per line, front then back, the back is -1 if one-sided."""
+    line_frontsector: array = _ints()
+    line_backsector: array = _ints()
+
+    seg_v1: array = _ints()
+    seg_v2: array = _ints()
+    seg_offset: array = _ints()
+    seg_angle: array = _ints("I")
+    seg_linedef: array = _ints()
+    seg_sidedef: array = _ints()
+    seg_frontsector: array = _ints()
+    seg_backsector: array = _ints()
+
+    subsector_sector: array = _ints()
+    subsector_numlines: array = _ints()
+    subsector_firstline: array = _ints()
+
+    node_x: array = _ints()
+    node_y: array = _ints()
+    node_dx: array = _ints()
+    node_dy: array = _ints()
+    node_bbox: array = _ints()
+    """
+    Eight per node: the box of the right child, then the left one.
+
+    Each box is top, bottom, left, right.
+    """
+    node_children: array = _ints()
+    """Two per node, with :attr:`NodeFlag.SUBSECTOR` set on leaves."""
+
+    @classmethod
+    def from_lumps(cls, lumps: dict[MapLump, bytes]) -> "Level":
+        """Build a level from the contents of its map lumps, other kinds are ignored."""
+        records = {kind: decode_lump(kind, lumps[kind]) for kind in _LEVEL_LUMPS}
+        vertexes = records[MapLump.VERTEXES]
+        sectors = records[MapLump.SECTORS]
+        sides = records[MapLump.SIDEDEFS]
+        lines = records[MapLump.LINEDEFS]
+        segs = records[MapLump.SEGS]
+        subsectors = records[MapLump.SSECTORS]
+        nodes = records[MapLump.NODES]
+
+        vertex_x = _fixed(vertexes["x"])
+        vertex_y = _fixed(vertexes["y"])
+        side_sector = _index(sides["sector"])
+
+        line_v1 = _index(lines["v1"])
+        line_v2 = _index(lines["v2"])
+        sidenum = _index(lines["sidenum"])
+        front = side_sector[sidenum[:, 0]]
+        back = np.where(sidenum[:, 1] != -1, side_sector[sidenum[:, 1]], -1)
+
+        seg_linedef = _index(segs["linedef"])
+        seg_side = segs["side"].astype(np.int32)
+        seg_sidedef = sidenum[seg_linedef, seg_side]
+        two_sided = (lines["flags"] & LinedefAttribute.TWO_SIDED.value) != 0
+        seg_back = np.where(
+            two_sided[seg_linedef], sidenum[seg_linedef, seg_side ^ 1], -1
+        )
+        seg_frontsector = side_sector[seg_sidedef]
+
+        return cls(
+            vertex_x=_column(vertex_x),
+            vertex_y=_column(vertex_y),
+            sector_floor_height=_column(_fixed(sectors["floor_height"])),
+            sector_ceiling_height=_column(_fixed(sectors["ceiling_height"])),
+            sector_light_level=_column(sectors["light_level"]),
+            sector_special=_column(sectors["special"]),
+            sector_tag=_column(sectors["tag"]),
+            side_textureoffset=_column(_fixed(sides["texture_offset"])),
+            side_rowoffset=_column(_fixed(sides["row_offset"])),
+            side_sector=_column(side_sector),
+            line_v1=_column(line_v1),
+            line_v2=_column(line_v2),
+            line_dx=_column(vertex_x[line_v2] - vertex_x[line_v1]),
+            line_dy=_column(vertex_y[line_v2] - vertex_y[line_v1]),
+            line_flags=_column(lines["flags"]),
+            line_special=_column(lines["special"]),
+            line_tag=_column(lines["tag"]),
+            line_sidenum=_column(sidenum),
+            line_frontsector=_column(front),
+            line_backsector=_column(back),
+            seg_v1=_column(_index(segs["v1"])),
+            seg_v2=_column(_index(segs["v2"])),
+            seg_offset=_column(_fixed(segs["offset"])),
+            seg_angle=_column(
+                segs["angle"].astype(np.uint16).astype(np.uint32) << 16, "I"
+            ),
+            seg_linedef=_column(seg_linedef),
+            seg_sidedef=_column(seg_sidedef),
+            seg_frontsector=_column(seg_frontsector),
+            seg_backsector=_column(np.where(seg_back != -1, side_sector[seg_back], -1)),
+            subsector_sector=_column(
+                seg_frontsector[subsectors["first_seg"].astype(np.int32)]
+            ),
+            subsector_numlines=_column(subsectors["num_segs"]),
+            subsector_firstline=_column(subsectors["first_seg"]),
+            node_x=_column(_fixed(nodes["x"])),
+            node_y=_column(_fixed(nodes["y"])),
+            node_dx=_column(_fixed(nodes["dx"])),
+            node_dy=_column(_fixed(nodes["dy"])),
+            node_bbox=_column(_fixed(nodes["bbox"])),
+            node_children=_column(nodes["children"]),
+        )
+
+    @property
+    def numnodes(self) -> int:
+        """Return the number of BSP nodes, the last one is the root."""
+        return len(self.node_x)
+
+    def nbytes(self) -> int:
+        """Return the memory taken by the arrays' contents."""
+        return sum(
+            len(column) * column.itemsize
+            for column in (getattr(self, f.name) for f in fields(self))
+        )
+
+    def point_on_side(self, x: int, y: int, node: int) -> bool:
+        """Like :func:`pink_doom.rendering.main.point_on_side`, by node number."""
+        node_dx = self.node_dx[node]
+        node_dy = self.node_dy[node]
+        if node_dx == 0:
+            if x <= self.node_x[node]:
+                return node_dy > 0
+            return node_dy < 0
+        if node_dy == 0:
+            if y <= self.node_y[node]:
+                return node_dx < 0
+            return node_dx > 0
+
+        dx = x - self.node_x[node]
+        dy = y - self.node_y[node]
+
+        # Try to quickly decide by looking at sign bits.
+        if (node_dy ^ node_dx ^ dx ^ dy) < 0:
+            return (node_dy ^ dx) < 0
+
+        left = fixed_mul(node_dy >> FRAC_BITS, dx)
+        right = fixed_mul(dy, node_dx >> FRAC_BITS)
+
+        return right >= left
+
+    def point_on_seg_side(self, x: int, y: int, seg: int) -> bool:
+        """Like :func:`pink_doom.rendering.main.point_on_seg_side`, by seg number."""
+        vertex_x = self.vertex_x
+        vertex_y = self.vertex_y
+        v1 = self.seg_v1[seg]
+        v2 = self.seg_v2[seg]
+        lx = vertex_x[v1]
+        ly = vertex_y[v1]
+
+        ldx = vertex_x[v2] - lx
+        ldy = vertex_y[v2] - ly
+
+        if ldx == 0:
+            if x <= lx:
+                return ldy > 0
+            return ldy < 0
+
+        if ldy == 0:
+            if y <= ly:
+                return ldx < 0
+            return ldx > 0
+
+        dx = x - lx
+        dy = y - ly
+
+        # Try to quickly decide by looking at sign bits.
+        if (ldy ^ ldx ^ dx ^ dy) < 0:
+            return (ldy ^ dx) < 0
+
+        left = fixed_mul(ldy >> FRAC_BITS, dx)
+        right = fixed_mul(dy, ldx >> FRAC_BITS)
+
+        return right >= left
+
+    def point_on_seg_sides(
+        self, x: int, y: int, segs: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized :meth:`point_on_seg_side` for many segs at once.
+
+        Checks every seg, or those numbered in ``segs``, and returns
+        an array of sides with the same results as the scalar version.
+        """
+        vertex_x = np.frombuffer(self.vertex_x, np.int32).astype(np.int64)
+        vertex_y = np.frombuffer(self.vertex_y, np.int32).astype(np.int64)
+        v1 = np.frombuffer(self.seg_v1, np.int32)
+        v2 = np.frombuffer(self.seg_v2, np.int32)
+        if segs is not None:
+            v1 = v1[segs]
+            v2 = v2[segs]
+        lx = vertex_x[v1]
+        ly = vertex_y[v1]
+        ldx = vertex_x[v2] - lx
+        ldy = vertex_y[v2] - ly
+        dx = x - lx
+        dy = y - ly
+
+        # The branches of the scalar version, the earliest one applied last.
+        left = ((ldy >> FRAC_BITS) * dx) >> FRAC_BITS
+        right = (dy * (ldx >> FRAC_BITS)) >> FRAC_BITS
+        side = right >= left
+        side = np.where((ldy ^ ldx ^ dx ^ dy) < 0, (ldy ^ dx) < 0, side)
+        side = np.where(ldy == 0, np.where(y <= ly, ldx < 0, ldx > 0), side)
+        return np.where(ldx == 0, np.where(x <= lx, ldy > 0, ldy < 0), side)
+
+    def _node_columns(self) -> tuple[np.ndarray, ...]:
+        return tuple(
+            _int64(column)
+            for column in (self.node_x, self.node_y, self.node_dx, self.node_dy)
+        )
+
+    def build_grid(self, cell_units: int = 128) -> SubsectorGrid:
+        """
+        Make the :class:`SubsectorGrid` of the level.
+
+        ``cell_units`` is the cell size in map units, a power of two.
+        Smaller cells skip more of the tree, but take more memory.
+        """
+        shift = FRAC_BITS + cell_units.bit_length() - 1
+        leaf = NodeFlag.SUBSECTOR.value
+        if not self.node_x:
+            return SubsectorGrid(0, 0, shift, 1, 1, array("i", [leaf]))
+        bbox = _int64(self.node_bbox).reshape(-1, 4)
+        origin_x = int(bbox[:, 2].min())
+        origin_y = int(bbox[:, 1].min())
+        width = ((int(bbox[:, 3].max()) - origin_x) >> shift) + 1
+        height = ((int(bbox[:, 0].max()) - origin_y) >> shift) + 1
+
+        cy, cx = np.divmod(np.arange(width * height), width)
+        low_x = origin_x + (cx << shift)
+        low_y = origin_y + (cy << shift)
+        size = (1 << shift) - 1
+        corners_x = np.stack([low_x, low_x + size, low_x, low_x + size], axis=1)
+        corners_y = np.stack([low_y, low_y, low_y + size, low_y + size], axis=1)
+
+        node_x, node_y, node_dx, node_dy = self._node_columns()
+        node_dx = node_dx >> FRAC_BITS
+        node_dy = node_dy >> FRAC_BITS
+        children = _int64(self.node_children).reshape(-1, 2)
+        cells = np.full(width * height, self.numnodes - 1, np.int64)
+        walking = np.arange(width * height)
+        while len(walking):
+            nodes = cells[walking][:, None]
+            # What point_on_side compares, before rounding, for each
+            # corner. A whole unit away from zero, rounding can't change
+            # the side, and nothing between the corners is nearer zero
+            # than the nearest corner.
+            cross = (corners_y[walking] - node_y[nodes]) * node_dx[nodes] - (
+                corners_x[walking] - node_x[nodes]
+            ) * node_dy[nodes]
+            front = (cross <= -(1 << FRAC_BITS)).all(axis=1)
+            back = (cross >= 1 << FRAC_BITS).all(axis=1)
+            decided = front | back
+            walking = walking[decided]
+            cells[walking] = children[nodes[decided, 0], back[decided].astype(int)]
+            walking = walking[(cells[walking] & leaf) == 0]
+        return SubsectorGrid(origin_x, origin_y, shift, width, height, _column(cells))
+
+    def point_in_subsector(
+        self, x: int, y: int, grid: Optional[SubsectorGrid] = None
+    ) -> int:
+        """
+        Return the number of the subsector holding (x, y).
+
+        Like :func:`pink_doom.rendering.main.point_in_subsector`, starting
+        from ``grid`` if given.
+        """
+        if not self.node_x:
+            return 0
+        leaf = NodeFlag.SUBSECTOR.value
+        nodenum = self.numnodes - 1
+        if grid is not None:
+            nodenum = grid.start(x, y, nodenum)
+        children = self.node_children
+        while not nodenum & leaf:
+            nodenum = children[2 * nodenum + self.point_on_side(x, y, nodenum)]
+        return nodenum & ~leaf
+
+    def points_in_subsectors(
+        self, x: np.ndarray, y: np.ndarray, grid: Optional[SubsectorGrid] = None
+    ) -> np.ndarray:
+        """
+        Vectorized :meth:`point_in_subsector` for many points at once.
+
+        All points go down the tree together, a level per step, so the
+        steps are as many as the deepest walk.
+        """
+        x = np.asarray(x, np.int64)
+        y = np.asarray(y, np.int64)
+        if not self.node_x:
+            return np.zeros(len(x), np.int64)
+        leaf = NodeFlag.SUBSECTOR.value
+        current = np.full(len(x), self.numnodes - 1, np.int64)
+        if grid is not None:
+            cx = (x - grid.origin_x) >> grid.shift
+            cy = (y - grid.origin_y) >> grid.shift
+            inside = (cx >= 0) & (cx < grid.width) & (cy >= 0) & (cy < grid.height)
+            cells = np.frombuffer(grid.cells, np.int32)
+            current[inside] = cells[cy[inside] * grid.width + cx[inside]]
+        children = _int64(self.node_children)
+        columns = self._node_columns()
+        walking = np.flatnonzero((current & leaf) == 0)
+        while len(walking):
+            nodes = current[walking]
+            sides = _node_sides(
+                x[walking], y[walking], *(column[nodes] for column in columns)
+            )
+            current[walking] = children[2 * nodes + sides]
+            walking = walking[(current[walking] & leaf) == 0]
+        return current & ~leaf
+
+    def subsectors_front_to_back(self, x: int, y: int) -> list[int]:
+        """
+        List every subsector in the order the BSP walk reaches them from (x, y).
+
+        This is ``R_RenderBSPNode`` without the clipping that culls
+        hidden subtrees, walked with a stack instead of recursion.
+        """
+        if not self.node_x:
+            return [0]
+        children = self.node_children
+        leaf = NodeFlag.SUBSECTOR.value
+        order = []
+        stack = [self.numnodes - 1]
+        while stack:
+            bspnum = stack.pop()
+            if bspnum & leaf:
+                order.append(bspnum & ~leaf)
+                continue
+            # Decide which side the view point is on,
+            # the near side is walked first.
+            side = self.point_on_side(x, y, bspnum)
+            stack.append(children[2 * bspnum + (side ^ 1)])
+            stack.append(children[2 * bspnum + side])
+        return order
+
+
+def load_level(map_name: str) -> Level:
+    """Build the :class:`Level` of ``map_name`` from the loaded WADs."""
+    label = loader.get_num_for_name(map_name)
+    return Level.from_lumps(
+        {
+            kind: loader.cache_lump_num(
+                label + kind.value - MapLump.LABEL.value, PurgeTag.LEVEL
+            )
+            for kind in _LEVEL_LUMPS
+        }
+    )
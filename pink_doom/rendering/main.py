@@ -5,10 +5,13 @@ BSP, geometry, trigonometry.
 
 See :mod:`pink_doom.misc.tables`, too.
 """
-
 from typing import Callable, Optional
 
+import numpy as np
+
+from pink_doom.doom.data import NodeFlag
 from pink_doom.doom.defines import SCREEN_WIDTH
+from pink_doom.misc import fixed_array
 from pink_doom.misc.bbox import BoxCoord
 from pink_doom.misc.fixed import FRAC_BITS, FRAC_UNIT, Fixed, fixed_div, fixed_mul
 from pink_doom.misc.tables import (
@@ -18,13 +21,14 @@ from pink_doom.misc.tables import (
     ANGLE_TO_FINE_SHIFT,
     DBITS,
     FINE_ANGLES,
+    SLOPE_RANGE,
     fine_sine,
     fine_tangent,
     slope_div,
     tan_to_angle,
 )
 from pink_doom.rendering import state
-from pink_doom.rendering.defines import LightTable, Node, Seg
+from pink_doom.rendering.defines import LightTable, Node, Seg, SubSector
 
 _FIELDOFVIEW = 2048
 """Fineangles in the :var:`SCREEN_WIDTH` wide window."""
@@ -56,6 +60,16 @@ detailshift = 0
 
 clipangle = 0
 
+_fine_sine = np.frombuffer(fine_sine, np.intc)
+_tan_to_angle = np.frombuffer(tan_to_angle, np.intc)
+
+# point_to_angle's octants, by x < 0, y < 0 and whether |x| <= |y|: the
+# angle is base + sign * tan_to_angle[slope].
+_OCTANT_BASE = np.array(
+    [0, ANG90 - 1, 0, ANG270, ANG180 - 1, ANG90, ANG180, ANG270 - 1], np.int64
+)
+_OCTANT_SIGN = np.array([1, -1, -1, 1, -1, 1, 1, -1], np.int64)
+
 LIGHTLEVELS = 16
 """Now why not 32 here?"""
 LIGHTSEGSHIFT = 4
@@ -159,6 +173,20 @@ def point_on_seg_side(x: Fixed, y: Fixed, line: Seg) -> bool:
     return right >= left
 
 
+def point_in_subsector(x: Fixed, y: Fixed) -> SubSector:
+    """Find the subsector holding (x, y) by walking down the BSP tree."""
+    # single subsector is a special case
+    if not state.numnodes:
+        return state.subsectors[0]
+
+    nodenum = state.numnodes - 1
+    while not nodenum & NodeFlag.SUBSECTOR.value:
+        node = state.nodes[nodenum]
+        nodenum = node.children[point_on_side(x, y, node)]
+
+    return state.subsectors[nodenum & ~NodeFlag.SUBSECTOR.value]
+
+
 def point_to_angle(x: Fixed, y: Fixed) -> int:
     """
     Get a global angle from cartesian coordinates.
@@ -226,14 +254,59 @@ def point_to_dist(x: Fixed, y: Fixed) -> Fixed:
     return fixed_div(dx, fine_sine[angle])
 
 
+def _slope_divs(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """:func:`pink_doom.misc.tables.slope_div`, element-wise."""
+    ans = (num << 3) // np.maximum(den >> 8, 1)
+    return np.where(den < 512, SLOPE_RANGE, np.minimum(ans, SLOPE_RANGE))
+
+
+def points_to_angles(x, y, origin_x: Fixed, origin_y: Fixed) -> np.ndarray:
+    """
+    Get the global angles of points from an origin, as int64.
+
+    Gives the same angles as :func:`point_to_angle` would for each point
+    with the view at (``origin_x``, ``origin_y``).
+    """
+    x = np.asarray(x, np.int64) - origin_x
+    y = np.asarray(y, np.int64) - origin_y
+    ax = np.abs(x)
+    ay = np.abs(y)
+    steep = ax <= ay
+    slope = _slope_divs(np.where(steep, ax, ay), np.where(steep, ay, ax))
+    octant = (x < 0) * 4 + (y < 0) * 2 + steep
+    angles = _OCTANT_BASE[octant] + _OCTANT_SIGN[octant] * _tan_to_angle[slope]
+    return np.where((x == 0) & (y == 0), 0, angles)
+
+
+def points_to_dists(x, y, origin_x: Fixed, origin_y: Fixed) -> np.ndarray:
+    """
+    Get the distances of points from an origin, as int32.
+
+    Gives the same distances as :func:`point_to_dist` would for each
+    point with the view at (``origin_x``, ``origin_y``), and 0 for the
+    origin itself, which that one can't look up.
+    """
+    dx = np.abs(np.asarray(x, np.int64) - origin_x)
+    dy = np.abs(np.asarray(y, np.int64) - origin_y)
+    far = np.maximum(dx, dy)
+    near = np.minimum(dx, dy)
+    origin = far == 0
+    far = np.where(origin, 1, far)
+
+    slope = fixed_array.fixed_div(near, far) >> DBITS
+    angle = (_tan_to_angle[slope].astype(np.int64) + ANG90) >> ANGLE_TO_FINE_SHIFT
+    dist = fixed_array.fixed_div(far, _fine_sine[angle])
+    return np.where(origin, 0, dist).astype(np.int32)
+
+
 def scale_from_global_angle(visangle: int) -> Fixed:
     """
     Return the texture mapping scale for the current line at the given angle.
 
     ``rw_distance`` must be calculated first.
     """
-    anglea = ANG90 + (visangle - state.viewangle)
-    angleb = ANG90 + (visangle - state.rw_normalangle)
+    anglea = (ANG90 + (visangle - state.viewangle)) & 0xFFFFFFFF
+    angleb = (ANG90 + (visangle - state.rw_normalangle)) & 0xFFFFFFFF
 
     sinea = fine_sine[anglea >> ANGLE_TO_FINE_SHIFT]
     sineb = fine_sine[angleb >> ANGLE_TO_FINE_SHIFT]
@@ -248,6 +321,38 @@ def scale_from_global_angle(visangle: int) -> Fixed:
     return scale
 
 
+def scales_from_global_angles(visangles) -> np.ndarray:
+    """
+    Return the texture mapping scales for the current line, as int32.
+
+    Gives the same scales as :func:`scale_from_global_angle` would for
+    each of ``visangles``.
+    """
+    visangles = np.asarray(visangles, np.int64)
+    anglea = (ANG90 + (visangles - state.viewangle)) & 0xFFFFFFFF
+    angleb = (ANG90 + (visangles - state.rw_normalangle)) & 0xFFFFFFFF
+
+    sinea = _fine_sine[anglea >> ANGLE_TO_FINE_SHIFT]
+    sineb = _fine_sine[angleb >> ANGLE_TO_FINE_SHIFT]
+    num = fixed_array.fixed_mul(projection, sineb) << detailshift
+    den = fixed_array.fixed_mul(state.rw_distance, sinea)
+    scale = np.minimum(fixed_array.fixed_div(num, den), 64 * FRAC_UNIT)
+    scale = np.maximum(scale, 256)
+    return np.where(den > (num >> 16), scale, 64 * FRAC_UNIT).astype(np.int32)
+
+
+def scale_range(x1: int, x2: int) -> np.ndarray:
+    """
+    Return the texture mapping scales of screen columns ``x1`` to ``x2``.
+
+    The columns' angles are ``viewangle`` plus their
+    :data:`~pink_doom.rendering.state.xtoviewangle`, kept to 32 bits.
+    ``rw_distance`` must be calculated first.
+    """
+    xtoviewangle = np.asarray(state.xtoviewangle[x1 : x2 + 1], np.int64)
+    return scales_from_global_angles((state.viewangle + xtoviewangle) & 0xFFFFFFFF)
+
+
 def init_texture_mapping():
     """Initialize texture map globals."""
     # Use tangent table to initialize viewangletox:
@@ -2,11 +2,11 @@
 
 from typing import Optional
 
+from pink_doom.doom.defines import SCREEN_WIDTH
 from pink_doom.doom.player import Player
 from pink_doom.misc.fixed import Fixed
 from pink_doom.misc.tables import FINE_ANGLES
 from pink_doom.rendering.defines import (
-    SCREEN_WIDTH,
     LightTable,
     Line,
     Node,
@@ -0,0 +1,158 @@
+"""
+Lump statistics for whole collections of WADs.
+
+:func:`analyze_wad` only reads the header, the directory, and the
+lumps whose size matches another lump's, one at a time.
+:func:`analyze_corpus` fans files out to a process pool, keeping only a
+few of them in flight so memory stays flat however many there are.
+"""
+import hashlib
+import os
+import struct
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+
+from pink_doom.doom.data import MapLump
+from pink_doom.wad.loader import _markers, _pread, read_directory
+
+WAD_SUFFIX = ".wad"
+
+_HASH_CHUNK = 1024 * 1024
+"""Largest read done while hashing a lump."""
+
+
+def find_wads(roots: Iterable[str]) -> Iterator[str]:
+    """Yield every ``*.wad`` file below ``roots``, in directory order."""
+    for root in roots:
+        if os.path.isfile(root):
+            yield root
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith(WAD_SUFFIX):
+                    yield os.path.join(dirpath, filename)
+
+
+def _maps(names: list[str]) -> list[str]:
+    """Find map labels: any lump followed by a THINGS lump."""
+    return [
+        names[i - 1]
+        for i in range(1, len(names))
+        if names[i].upper() == MapLump.THINGS.name
+    ]
+
+
+def _marker_problems(names: list[str]) -> list[str]:
+    """
+    Report ``*_START``/``*_END`` markers that don't pair up.
+
+    They are paired the way the loader resolves namespaces.
+    """
+    problems = []
+    for i, kind, _ in _markers([name.upper() for name in names]):
+        if kind == "stray":
+            prefix = names[i].upper().partition("_")[0]
+            problems.append(f"{names[i]} without {prefix}_START")
+        elif kind == "open":
+            problems.append(f"{names[i]} not closed")
+    return problems
+
+
+def _digest(handle: BinaryIO, position: int, size: int) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    end = position + size
+    while position < end:
+        chunk = _pread(handle, min(_HASH_CHUNK, end - position), position)
+        if not chunk:
+            break
+        digest.update(chunk)
+        position += len(chunk)
+    return digest.digest()
+
+
+def analyze_wad(path: str) -> dict[str, Any]:
+    """
+    Collect lump statistics of a single WAD.
+
+    The result is JSON-serialisable. Files that can't be read or
+    aren't WADs get an ``error`` entry instead of statistics.
+    """
+    try:
+        with open(path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            header, positions, sizes, names = read_directory(f)
+            if header.identification not in (b"IWAD", b"PWAD"):
+                return {"path": path, "error": "not a WAD"}
+            if len(names) != header.num_lumps:
+                return {"path": path, "error": "truncated directory"}
+
+            out_of_range = {
+                i
+                for i in range(len(names))
+                if positions[i] < 0
+                or sizes[i] < 0
+                or positions[i] + sizes[i] > file_size
+            }
+
+            # Only lumps with a size in common can be equal, and empty
+            # ones (markers, map labels) are not worth reporting.
+            by_size = defaultdict(list)
+            for i, size in enumerate(sizes):
+                if size > 0 and i not in out_of_range:
+                    by_size[size].append(i)
+            duplicates = []
+            duplicate_bytes = 0
+            for size, lumps in by_size.items():
+                if len(lumps) < 2:
+                    continue
+                by_digest = defaultdict(list)
+                for i in lumps:
+                    by_digest[_digest(f, positions[i], size)].append(i)
+                for same in by_digest.values():
+                    if len(same) > 1:
+                        duplicates.append([names[i] for i in same])
+                        duplicate_bytes += size * (len(same) - 1)
+    except (OSError, struct.error) as e:
+        return {"path": path, "error": str(e)}
+
+    return {
+        "path": path,
+        "identification": header.identification.decode("ascii"),
+        "size": file_size,
+        "num_lumps": header.num_lumps,
+        "lump_bytes": sum(size for size in sizes if size > 0),
+        "maps": _maps(names),
+        "marker_problems": _marker_problems(names),
+        "out_of_range": [names[i] for i in sorted(out_of_range)],
+        "duplicates": duplicates,
+        "duplicate_bytes": duplicate_bytes,
+    }
+
+
+def analyze_corpus(
+    paths: Iterable[str], jobs: Optional[int] = None, backlog: int = 4
+) -> Iterator[dict[str, Any]]:
+    """
+    Analyze ``paths`` with :func:`analyze_wad` in ``jobs`` processes.
+
+    Results are yielded as soon as they are ready, not in order. At most
+    ``backlog`` files per process are queued at once, and ``paths`` is
+    consumed lazily, so a generator such as :func:`find_wads` is never
+    read into memory as a whole.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    limit = jobs * backlog
+    with ProcessPoolExecutor(jobs) as pool:
+        pending = set()
+        for path in paths:
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(analyze_wad, path))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,166 @@
+"""
+Byte-budgeted lump cache.
+
+Stands in for the purgable part of the zone memory allocator.
+Every cached lump carries a purge tag like the ``PU_*`` tags in the
+original ``z_zone.h``: lumps tagged below :attr:`PurgeTag.PURGE_LEVEL`
+stay until they are freed explicitly (see :meth:`LumpCache.free_tags`),
+the rest are evicted least recently used first once the cache is over
+its byte budget.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional, Union
+
+Lump = Union[bytes, memoryview]
+"""Lump data, either a private copy or a view into a mapped WAD."""
+
+
+class PurgeTag(IntEnum):
+    """How long a cached lump should live."""
+
+    STATIC = 1
+    """Static entire execution time."""
+    SOUND = 2
+    """Static while playing."""
+    MUSIC = 3
+    """Static while playing."""
+    LEVEL = 50
+    """Static until level exited."""
+    LEVSPEC = 51
+    """A special thinker in a level."""
+    PURGE_LEVEL = 100
+    """Tags >= this are purgable whenever needed."""
+    CACHE = 101
+
+
+DEFAULT_BUDGET = 8 * 1024 * 1024
+"""Bytes of purgable lumps to keep, about the size of the original zone."""
+
+
+@dataclass
+class CacheStats:
+    """Counters describing a :class:`LumpCache`, cheap to scrape."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    """Lumps dropped to stay within the budget."""
+    freed: int = 0
+    """Lumps dropped by :meth:`LumpCache.free_tags`."""
+    entries: int = 0
+    bytes: int = 0
+    """Total size of all cached lumps, purgable or not."""
+
+
+@dataclass
+class _Entry:
+    data: Lump
+    tag: PurgeTag
+
+
+class LumpCache:
+    """
+    An LRU cache of lump data, keyed by lump number.
+
+    All methods are safe to call from several threads.
+    """
+
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        """Create an empty cache that holds at most ``budget`` bytes."""
+        self.budget = budget
+        """Upper bound for :attr:`CacheStats.bytes`, if anything is purgable."""
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached lumps."""
+        return len(self._entries)
+
+    def __contains__(self, lump: int) -> bool:
+        """Check whether ``lump`` is cached, without touching its LRU position."""
+        return lump in self._entries
+
+    def get(self, lump: int, tag: PurgeTag = PurgeTag.CACHE) -> Optional[Lump]:
+        """
+        Return the cached data for ``lump``, or None on a miss.
+
+        A hit marks the lump as most recently used, and raises its tag
+        to ``tag`` if that one lives longer.
+        """
+        with self._lock:
+            entry = self._entries.get(lump)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            self._entries.move_to_end(lump)
+            if tag < entry.tag:
+                entry.tag = tag
+            return entry.data
+
+    def put(self, lump: int, data: Lump, tag: PurgeTag = PurgeTag.CACHE) -> None:
+        """Cache ``data`` for ``lump``, evicting old purgable lumps if needed."""
+        with self._lock:
+            old = self._entries.pop(lump, None)
+            if old is not None:
+                self._stats.bytes -= len(old.data)
+            self._entries[lump] = _Entry(data, tag)
+            self._stats.bytes += len(data)
+            self._evict(keep=lump)
+
+    def change_tag(self, lump: int, tag: PurgeTag) -> None:
+        """Retag a cached lump, e.g. to let a static lump be purged."""
+        with self._lock:
+            self._entries[lump].tag = tag
+            self._evict()
+
+    def free_tags(self, low: PurgeTag, high: PurgeTag) -> int:
+        """
+        Drop every lump tagged between ``low`` and ``high`` inclusive.
+
+        Call with ``(PurgeTag.LEVEL, PurgeTag.PURGE_LEVEL - 1)`` on level exit.
+        Returns the number of bytes released.
+        """
+        with self._lock:
+            freed = [
+                lump
+                for lump, entry in self._entries.items()
+                if low <= entry.tag <= high
+            ]
+            released = 0
+            for lump in freed:
+                released += len(self._entries.pop(lump).data)
+            self._stats.bytes -= released
+            self._stats.freed += len(freed)
+            return released
+
+    def clear(self) -> None:
+        """Forget every lump and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            entries = len(self._entries)
+            return CacheStats(**{**vars(self._stats), "entries": entries})
+
+    def _evict(self, keep: Optional[int] = None) -> None:
+        # Called with the lock held.
+        if self._stats.bytes <= self.budget:
+            return
+        # Walk from the least recently used end; unpurgable lumps are skipped.
+        for lump in list(self._entries):
+            entry = self._entries[lump]
+            if entry.tag < PurgeTag.PURGE_LEVEL or lump == keep:
+                continue
+            del self._entries[lump]
+            self._stats.bytes -= len(entry.data)
+            self._stats.evictions += 1
+            if self._stats.bytes <= self.budget:
+                return
@@ -0,0 +1,85 @@
+"""
+On-disk cache of parsed WAD directories.
+
+For a given list of WAD files, the merged lump table and name index
+built by :mod:`pink_doom.wad.loader` are saved into a single index
+file, so that the next start with the same files can skip reading
+and parsing their directories.
+
+Each WAD is identified by its absolute path, size, modification time
+and a hash of its header. If any of them changed, the index is stale
+and gets rebuilt.
+"""
+import hashlib
+import marshal
+import os
+import sys
+from typing import Any, Optional
+
+FORMAT_VERSION = 2
+"""Bump whenever the layout of the saved index changes."""
+
+FileKey = tuple[str, int, int, str]
+"""(absolute path, size, mtime in nanoseconds, header hash)"""
+
+
+def file_key(name: str) -> Optional[FileKey]:
+    """Identify the current contents of a WAD, or return None if unreadable."""
+    try:
+        with open(name, "rb") as handle:
+            stat = os.fstat(handle.fileno())
+            header = handle.read(12)
+    except IOError:
+        return None
+    return (
+        os.path.abspath(name),
+        stat.st_size,
+        stat.st_mtime_ns,
+        hashlib.sha1(header).hexdigest(),
+    )
+
+
+def index_path(cache_dir: str, keys: list[FileKey]) -> str:
+    """Return where the index for this list of WADs is stored."""
+    paths = "\0".join(key[0] for key in keys)
+    digest = hashlib.sha1(paths.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.lumpidx")
+
+
+def load(path: str, keys: list[FileKey]) -> Optional[dict[str, Any]]:
+    """
+    Read a saved index.
+
+    Returns None if there is none, or if it doesn't match ``keys``.
+    """
+    try:
+        with open(path, "rb") as handle:
+            index = marshal.load(handle)
+    except (IOError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(index, dict):
+        return None
+    if index.get("version") != (FORMAT_VERSION, sys.hexversion):
+        return None
+    if index.get("files") != [list(key) for key in keys]:
+        return None
+    return index
+
+
+def save(path: str, keys: list[FileKey], index: dict[str, Any]) -> None:
+    """
+    Write an index for the WADs identified by ``keys``.
+
+    The file is replaced atomically, so concurrent starts never see
+    half of it.
+    """
+    index = {
+        **index,
+        "version": (FORMAT_VERSION, sys.hexversion),
+        "files": [list(key) for key in keys],
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as handle:
+        marshal.dump(index, handle)
+    os.replace(temp_path, path)
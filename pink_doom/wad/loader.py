@@ -1,12 +1,21 @@
 """The Doom WAD reader."""
+import hashlib
+import mmap
+import os
 import struct
 import sys
-from dataclasses import dataclass
+import threading
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum, auto
 from io import SEEK_SET
-from os import fstat
-from typing import BinaryIO
+from types import MappingProxyType
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Optional
 
 import pink_doom.doom.state as state
+from pink_doom.wad import dircache
+from pink_doom.wad.cache import Lump, LumpCache, PurgeTag
 
 
 @dataclass
@@ -19,6 +28,18 @@ class WadInfo:
     info_table_offset: int
 
 
+@dataclass
+class DedupStats:
+    """What :data:`dedup_lumps` did since the WADs were loaded."""
+
+    hashed: int = 0
+    """Lumps whose contents were hashed."""
+    shared: int = 0
+    """Lumps found to be equal to one cached before."""
+    saved: int = 0
+    """Bytes not cached a second time thanks to that."""
+
+
 @dataclass
 class FileLump:
     """A single directory entry in the WAD."""
@@ -28,6 +49,30 @@ class FileLump:
     name: str
 
 
+class LumpNamespace(Enum):
+    """The marker-delimited sections of a WAD directory."""
+
+    GLOBAL = auto()
+    """Everything outside of a marker pair, including the markers."""
+    SPRITES = auto()
+    """Between ``S_START`` and ``S_END``."""
+    FLATS = auto()
+    """Between ``F_START`` and ``F_END``."""
+    PATCHES = auto()
+    """Between ``P_START`` and ``P_END``."""
+
+
+_NAMESPACE_MARKERS = {
+    prefix: namespace
+    for namespace, prefixes in (
+        (LumpNamespace.SPRITES, ("S", "SS")),
+        (LumpNamespace.FLATS, ("F", "FF", "F1", "F2", "F3")),
+        (LumpNamespace.PATCHES, ("P", "PP", "P1", "P2", "P3")),
+    )
+    for prefix in prefixes
+}
+
+
 @dataclass
 class LumpInfo:
     """Information about a lump in the ``lump_cache``."""
@@ -36,53 +81,339 @@ class LumpInfo:
     position: int
     size: int
     name: str
+    mapping: Optional[memoryview] = None
+    """Read-only view of the whole file, if it was memory-mapped."""
+    namespace: LumpNamespace = LumpNamespace.GLOBAL
 
 
-lump_cache = []
-lump_info: list[LumpInfo] = []
+@dataclass
+class WadFile:
+    """An open WAD file."""
+
+    name: str
+    handle: Optional[BinaryIO]
+    """None if the file only exists as :attr:`mapping`, e.g. in shared memory."""
+    mapping: Optional[memoryview] = None
+    """Read-only view of the whole file, if it was memory-mapped."""
+    identification: bytes = b"IWAD"
+
+
+@dataclass
+class LumpTable:
+    """
+    The directories of all loaded WADs, stored column by column.
+
+    Indexing it builds a :class:`LumpInfo` on demand,
+    hot paths should read the columns directly.
+    """
+
+    wads: list[WadFile] = field(default_factory=list)
+    wad_index: array = field(default_factory=lambda: array("H"))
+    """Index into :attr:`wads` for each lump."""
+    positions: array = field(default_factory=lambda: array("i"))
+    sizes: array = field(default_factory=lambda: array("i"))
+    names: list[str] = field(default_factory=list)
+    namespaces: array = field(default_factory=lambda: array("B"))
+    """:class:`LumpNamespace` values."""
+
+    def __len__(self) -> int:
+        """Return the number of lumps."""
+        return len(self.names)
+
+    def __getitem__(self, lump: int) -> LumpInfo:
+        """Gather the columns of one lump into a :class:`LumpInfo`."""
+        wad = self.wads[self.wad_index[lump]]
+        return LumpInfo(
+            wad.handle,
+            self.positions[lump],
+            self.sizes[lump],
+            self.names[lump],
+            wad.mapping,
+            LumpNamespace(self.namespaces[lump]),
+        )
+
+
+use_mmap = False
+"""
+Memory-map WAD files instead of reading lumps through the file handle.
+
+Cached lumps are then read-only views into the mapping,
+and nothing is copied until the caller asks for a copy.
+Must be set before :func:`init_multiple_files`.
+"""
+
+read_gap = 16 * 1024
+"""
+How many unrequested bytes :func:`read_lumps` reads through
+to merge two neighbouring lumps into a single read.
+"""
+
+_seek_lock = threading.Lock()
+"""Serializes seek-and-read pairs on platforms without ``os.pread``."""
+
+index_cache_dir: Optional[str] = None
+"""
+Directory for saved lump tables, see :mod:`pink_doom.wad.dircache`.
+
+If set, :func:`init_multiple_files` reuses the table saved by an earlier
+start with the same WADs instead of parsing their directories.
+"""
+
+dedup_lumps = False
+"""
+Cache lumps with identical contents only once.
+
+Only lumps whose size is shared with another lump are hashed, and only
+when they are first cached. Once two lumps turn out to be equal, both
+are served from the buffer of the one cached first, and
+:func:`canonical_lump` maps them to the same number so anything decoded
+from them can be shared too. See :func:`dedup_stats` for the savings.
+"""
+
+lump_cache = LumpCache()
+"""
+Lumps read so far.
+
+Set ``lump_cache.budget`` to change how many bytes of purgable lumps
+it keeps, and use ``lump_cache.free_tags`` to drop level data on exit.
+"""
+lump_info = LumpTable()
 num_lumps = 0
 
+_lump_hash: dict[str, int] = {}
+"""Upper-cased lump name to the index of its last occurrence."""
+_namespace_hash: dict[LumpNamespace, dict[str, int]] = {
+    namespace: {} for namespace in LumpNamespace
+}
+"""Like :data:`_lump_hash`, but only for lumps within each namespace."""
+_namespace_ranges: dict[LumpNamespace, list[range]] = {
+    namespace: [] for namespace in LumpNamespace
+}
+"""Runs of consecutive lumps in each namespace, in directory order."""
+
+_dedup_lock = threading.Lock()
+_shared_sizes: Optional[set[int]] = None
+"""Sizes of more than one lump, the only ones worth hashing."""
+_content_index: dict[tuple[int, bytes], int] = {}
+"""Size and digest of each hashed lump's contents to the first lump with them."""
+_lump_alias: dict[int, int] = {}
+"""Lumps found to be equal to an earlier hashed one, to that one."""
+_dedup_stats = DedupStats()
+
 
 def _file_length(handle: int) -> int:
-    return fstat(handle).st_size
+    return os.fstat(handle).st_size
+
+
+def read_directory(handle: BinaryIO) -> tuple[WadInfo, array, array, list[str]]:
+    """
+    Read the header and directory of a WAD.
+
+    The directory is decoded in bulk into columns of
+    lump positions, sizes and names.
+    """
+    handle.seek(0, SEEK_SET)
+    #                                 id, num_lumps, info_table_offset
+    header = WadInfo(*struct.unpack("<4s  i          i", handle.read(12)))
+    # 16 == sizeof filelump_t
+    handle.seek(header.info_table_offset, SEEK_SET)
+    file_info = handle.read(max(header.num_lumps, 0) * 16)
+    file_info = file_info[: len(file_info) - len(file_info) % 16]
+
+    # Each entry is (file_pos, size, name[8]); as int32s, file_pos and size
+    # are every fourth value starting from 0 and 1.
+    ints = array("i", file_info)
+    if sys.byteorder == "big":
+        ints.byteswap()
+    names = [
+        # convert ASCII zero-terminated string to Python string
+        entry_name.split(b"\x00", 1)[0].decode("latin-1")
+        for (entry_name,) in struct.iter_unpack("<8x8s", file_info)
+    ]
+    return header, ints[0::4], ints[1::4], names
+
+
+def _markers(keys: list[str]) -> Iterator[tuple[int, str, LumpNamespace]]:
+    """
+    Pair up the namespace markers of a directory of upper case names.
+
+    Yields (index, kind, namespace) for each marker, where kind is
+    ``"start"``, ``"end"`` if it closes the innermost open marker, which
+    must be of the same namespace (F_START may end with FF_END), or
+    ``"stray"`` if it closes nothing. The markers still open after the
+    last one are yielded again, outermost first, as ``"open"``.
+    """
+    markers = [i for i, key in enumerate(keys) if key.endswith(("_START", "_END"))]
+    opened: list[tuple[int, LumpNamespace]] = []
+    for i in markers:
+        prefix, _, marker = keys[i].partition("_")
+        namespace = _NAMESPACE_MARKERS.get(prefix)
+        if namespace is None or marker not in ("START", "END"):
+            continue
+        if marker == "START":
+            opened.append((i, namespace))
+            yield i, "start", namespace
+        elif opened and opened[-1][1] == namespace:
+            opened.pop()
+            yield i, "end", namespace
+        else:
+            yield i, "stray", namespace
+    for i, namespace in opened:
+        yield i, "open", namespace
+
+
+def _namespace_spans(keys: list[str]):
+    """
+    Split a directory into runs of lumps sharing a namespace.
+
+    Yields (namespace, start, stop) triples covering all of ``keys``.
+    Markers themselves are global, and may nest (F1_START inside F_START),
+    so a stack of the open ones is kept.
+    """
+    namespaces = [LumpNamespace.GLOBAL]
+    start = 0
+    for i, kind, namespace in _markers(keys):
+        if kind == "open":
+            continue
+        yield namespaces[-1], start, i
+        yield LumpNamespace.GLOBAL, i, i + 1
+        start = i + 1
+        if kind == "start":
+            namespaces.append(namespace)
+        elif kind == "end":
+            namespaces.pop()
+    yield namespaces[-1], start, len(keys)
+
+
+def add_wad(wad: WadFile) -> None:
+    """
+    Check a WAD's header and make its lumps readable.
+
+    Only registers the file, its directory must be added separately.
+    """
+    if wad.identification not in (b"IWAD", b"PWAD"):
+        print(f"Wad file {wad.name} doesn't have IWAD or PWAD id", file=sys.stderr)
+        exit(1)
+    if wad.identification == b"PWAD":
+        state.modified_game = True
+    lump_info.wads.append(wad)
+
+
+def _open_wad(f: BinaryIO, name: str, identification: bytes) -> None:
+    mapping = None
+    if use_mmap:
+        # The mapping outlives the file object, and the read-only access
+        # makes every slice of it a read-only memoryview.
+        mapping = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    add_wad(WadFile(name, f, mapping, identification))
+
+
+def _add_namespace_range(namespace: LumpNamespace, start: int, stop: int) -> None:
+    ranges = _namespace_ranges[namespace]
+    if ranges and ranges[-1].stop == start:
+        ranges[-1] = range(ranges[-1].start, stop)
+    else:
+        ranges.append(range(start, stop))
 
 
 def _add_file(name: str):
-    file_info = b""
     try:
-        with open(name, "rb") as f:
-            print(f" adding {name}")
-            global num_lumps, lump_info
-            start_lump = num_lumps
-            header_data = f.read(12)
-            #                                 id, num_lumps, info_table_offset
-            header = WadInfo(*struct.unpack("<4s  i          i", header_data))
-            print(header)
-            if header.identification not in (b"IWAD", b"PWAD"):
-                print(f"Wad file {name} doesn't have IWAD or PWAD id", file=sys.stderr)
-                exit(1)
-            if header.identification == b"PWAD":
-                state.modified_game = True
-            # 16 == sizeof filelump_t
-            length = header.num_lumps * 16
-            f.seek(header.info_table_offset, SEEK_SET)
-            file_info = f.read(length)
-            num_lumps += header.num_lumps
-            for i in range(header.num_lumps):
-                entry = file_info[i * 16 : (i + 1) * 16]
-                ofs, leng, entry_name = struct.unpack("<i i 8s", entry)
-                lump_info.append(
-                    LumpInfo(
-                        f,
-                        ofs,
-                        leng,
-                        # convert ASCII zero-terminated string to Python string
-                        entry_name.split("\x00")[0],
-                    )
-                )
-                print(repr(lump_info[start_lump + i].name))
+        f = open(name, "rb")
     except IOError:
         print(f" couldn't read {name}")
+        return
+
+    print(f" adding {name}")
+    global num_lumps
+    header, positions, sizes, names = read_directory(f)
+    print(header)
+    _open_wad(f, name, header.identification)
+
+    start_lump = num_lumps
+    count = len(names)
+    keys = [lump_name.upper() for lump_name in names]
+    lump_info.wad_index.extend(array("H", [len(lump_info.wads) - 1]) * count)
+    lump_info.positions.extend(positions)
+    lump_info.sizes.extend(sizes)
+    lump_info.names.extend(names)
+    # Later lumps replace earlier ones, so a later file overrides.
+    _lump_hash.update(zip(keys, range(start_lump, start_lump + count)))
+    for namespace, first, stop in _namespace_spans(keys):
+        lump_info.namespaces.extend(array("B", [namespace.value]) * (stop - first))
+        _namespace_hash[namespace].update(
+            zip(keys[first:stop], range(start_lump + first, start_lump + stop))
+        )
+        if stop > first:
+            _add_namespace_range(namespace, start_lump + first, start_lump + stop)
+    num_lumps += count
+
+
+def _load_index(filenames, keys: list[dircache.FileKey]) -> bool:
+    """Restore the lump table saved for these WADs, if it is still valid."""
+    index = dircache.load(dircache.index_path(index_cache_dir, keys), keys)
+    if index is None:
+        return False
+
+    for filename, identification in zip(filenames, index["identifications"]):
+        print(f" adding {filename} (indexed)")
+        _open_wad(open(filename, "rb"), filename, identification)
+    load_table(index)
+    return True
+
+
+def load_table(index: dict[str, Any]) -> None:
+    """
+    Add the lumps saved by :func:`save_table`.
+
+    Their WADs must have been added with :func:`add_wad` already,
+    in the same order as when the table was saved.
+    """
+    global num_lumps
+    lump_info.wad_index.frombytes(index["wad_index"])
+    lump_info.positions.frombytes(index["positions"])
+    lump_info.sizes.frombytes(index["sizes"])
+    lump_info.names.extend(index["names"])
+    lump_info.namespaces.frombytes(index["namespaces"])
+    _lump_hash.update(index["lump_hash"])
+    for namespace, names in index["namespace_hash"].items():
+        _namespace_hash[LumpNamespace(namespace)].update(names)
+    for namespace, ranges in index["namespace_ranges"].items():
+        _namespace_ranges[LumpNamespace(namespace)].extend(
+            range(start, stop) for start, stop in ranges
+        )
+    num_lumps = len(lump_info)
+    _forget_contents()
+
+
+def save_table() -> dict[str, Any]:
+    """
+    Export the lump table and name indexes of all loaded WADs.
+
+    The result only holds builtin types, ready for :mod:`marshal`.
+    """
+    return {
+        "identifications": [wad.identification for wad in lump_info.wads],
+        "wad_index": lump_info.wad_index.tobytes(),
+        "positions": lump_info.positions.tobytes(),
+        "sizes": lump_info.sizes.tobytes(),
+        "names": lump_info.names,
+        "namespaces": lump_info.namespaces.tobytes(),
+        "lump_hash": _lump_hash,
+        "namespace_hash": {
+            namespace.value: names for namespace, names in _namespace_hash.items()
+        },
+        "namespace_ranges": {
+            namespace.value: [(r.start, r.stop) for r in ranges]
+            for namespace, ranges in _namespace_ranges.items()
+        },
+    }
+
+
+def _save_index(keys: list[dircache.FileKey]) -> None:
+    try:
+        dircache.save(dircache.index_path(index_cache_dir, keys), keys, save_table())
+    except IOError:
+        print(f" couldn't save the lump index in {index_cache_dir}")
 
 
 def init_multiple_files(filenames):
@@ -90,25 +421,122 @@ def init_multiple_files(filenames):
     Initialize and read multiple WADs.
 
     Lump names can appear multiple times.
-    The name searcher looks backwards, so a later file
+    The name index keeps the last occurrence, so a later file
     does override all earlier ones.
     """
-    for filename in filenames:
-        _add_file(filename)
+    keys = None
+    if index_cache_dir is not None:
+        keys = [dircache.file_key(filename) for filename in filenames]
+        if None in keys:
+            # Unreadable files are skipped, which the index can't express.
+            keys = None
+    if keys is None or not _load_index(filenames, keys):
+        for filename in filenames:
+            _add_file(filename)
+        if keys is not None and num_lumps > 0:
+            _save_index(keys)
 
-    global num_lumps, lump_cache
     if num_lumps == 0:
         print(f"{init_multiple_files.__qualname__}: no files found", file=sys.stderr)
         exit(1)
-    lump_cache = [None for _ in range(num_lumps)]
+    lump_cache.clear()
+    _forget_contents()
+
+
+def reset():
+    """Close every WAD and forget all lumps, so a new set can be loaded."""
+    global num_lumps, lump_info
+    for wad in lump_info.wads:
+        if wad.handle is not None:
+            wad.handle.close()
+    num_lumps = 0
+    lump_info = LumpTable()
+    lump_cache.clear()
+    _lump_hash.clear()
+    for names in _namespace_hash.values():
+        names.clear()
+    for ranges in _namespace_ranges.values():
+        ranges.clear()
+    _forget_contents()
+
+
+def _forget_contents() -> None:
+    global _shared_sizes, _dedup_stats
+    with _dedup_lock:
+        _shared_sizes = None
+        _content_index.clear()
+        _lump_alias.clear()
+        _dedup_stats = DedupStats()
+
+
+def _dedup(lump: int, data: Lump) -> int:
+    """Return the first lump hashed with the same contents as ``data``."""
+    global _shared_sizes
+    if _shared_sizes is None:
+        _shared_sizes = {
+            size for size, count in Counter(lump_info.sizes).items() if count > 1
+        }
+    if len(data) == 0 or len(data) not in _shared_sizes:
+        return lump
+    key = (len(data), hashlib.blake2b(data, digest_size=16).digest())
+    with _dedup_lock:
+        _dedup_stats.hashed += 1
+        original = _content_index.setdefault(key, lump)
+        if original != lump:
+            _lump_alias[lump] = original
+            _dedup_stats.shared += 1
+            _dedup_stats.saved += len(data)
+    return original
+
+
+def canonical_lump(lump: int) -> int:
+    """
+    Return the lump whose cached buffer ``lump`` shares.
+
+    That is ``lump`` itself unless :data:`dedup_lumps` found it to be
+    equal to a lump cached before.
+    """
+    return _lump_alias.get(lump, lump)
+
+
+def dedup_stats() -> DedupStats:
+    """Return a snapshot of what :data:`dedup_lumps` saved so far."""
+    with _dedup_lock:
+        return DedupStats(**vars(_dedup_stats))
 
 
 def check_num_for_name(name: str) -> int:
     """Return -1 if lump not found."""
-    for i in range(num_lumps - 1, -1, -1):
-        if lump_info[i].name.lower() == name.lower():
-            return i
-    return -1
+    return _lump_hash.get(name.upper(), -1)
+
+
+def check_num_for_name_ns(name: str, namespace: LumpNamespace) -> int:
+    """
+    Like :func:`check_num_for_name`, but only find lumps within ``namespace``.
+
+    This keeps e.g. a flat and a wall patch with the same name apart.
+    """
+    return _namespace_hash[namespace].get(name.upper(), -1)
+
+
+def namespace_lumps(namespace: LumpNamespace) -> Mapping[str, int]:
+    """Return a read-only map of upper-cased names to lumps in ``namespace``."""
+    return MappingProxyType(_namespace_hash[namespace])
+
+
+def namespace_ranges(namespace: LumpNamespace) -> list[range]:
+    """
+    Return the runs of consecutive lumps in ``namespace``.
+
+    Nested markers (F1_START inside F_START) and every PWAD that
+    adds its own markers split a namespace into several runs.
+    """
+    return list(_namespace_ranges[namespace])
+
+
+def in_namespace(lump: int, namespace: LumpNamespace) -> bool:
+    """Check whether ``lump`` lies between the markers of ``namespace``."""
+    return lump_info.namespaces[lump] == namespace.value
 
 
 def get_num_for_name(name: str) -> int:
@@ -126,7 +554,42 @@ def lump_length(lump: int) -> int:
         print(f"{lump_length.__qualname__}: {lump} >= num_lumps", file=sys.stderr)
         exit(1)
 
-    return lump_info[lump].size
+    return lump_info.sizes[lump]
+
+
+def _lump_view(lump: int) -> Optional[memoryview]:
+    """Slice a lump out of its mapped file, or return None if not mapped."""
+    mapping = lump_info.wads[lump_info.wad_index[lump]].mapping
+    if mapping is None:
+        return None
+    position = lump_info.positions[lump]
+    return mapping[position : position + lump_info.sizes[lump]]
+
+
+def _pread(handle: BinaryIO, size: int, position: int) -> bytes:
+    """
+    Read ``size`` bytes at ``position`` without moving the file position.
+
+    Positional reads don't share any state, so lumps can be read
+    from many threads at once without locking.
+    """
+    if not hasattr(os, "pread"):
+        with _seek_lock:
+            handle.seek(position, SEEK_SET)
+            return handle.read(size)
+
+    fd = handle.fileno()
+    data = os.pread(fd, size, position)
+    if len(data) == size or not data:
+        return data
+    # Short read, e.g. a huge lump on a platform capping single reads.
+    chunks = [data]
+    while size > 0 and data:
+        size -= len(data)
+        position += len(data)
+        data = os.pread(fd, size, position)
+        chunks.append(data)
+    return b"".join(chunks)
 
 
 def read_lump(lump: int) -> bytes:
@@ -135,22 +598,111 @@ def read_lump(lump: int) -> bytes:
         print(f"{read_lump.__qualname__}: {lump} >= num_lumps", file=sys.stderr)
         exit(1)
 
-    info = lump_info[lump]
-    handle = info.handle
-    handle.seek(info.position, SEEK_SET)
-    return handle.read(info.size)
+    view = _lump_view(lump)
+    if view is not None:
+        return bytes(view)
+    handle = lump_info.wads[lump_info.wad_index[lump]].handle
+    return _pread(handle, lump_info.sizes[lump], lump_info.positions[lump])
+
+
+def read_lumps(lumps: Iterable[int]) -> list[Lump]:
+    """
+    Load many lumps at once, returned in the order they were asked for.
 
+    The requests are sorted by file and position, and lumps that lie
+    within :data:`read_gap` bytes of each other are fetched with one read.
+    Every lump comes back as a read-only view into the buffer of its read,
+    which it keeps alive as a whole.
+    """
+    lumps = list(lumps)
+    for lump in lumps:
+        if lump >= num_lumps:
+            print(f"{read_lumps.__qualname__}: {lump} >= num_lumps", file=sys.stderr)
+            exit(1)
+
+    wad_index = lump_info.wad_index
+    positions = lump_info.positions
+    sizes = lump_info.sizes
+    results: list[Lump] = [b""] * len(lumps)
+    order = sorted(
+        range(len(lumps)),
+        key=lambda i: (wad_index[lumps[i]], positions[lumps[i]]),
+    )
+
+    i = 0
+    while i < len(order):
+        # Grow a run of requests in the same file until the next one is too far.
+        wad = wad_index[lumps[order[i]]]
+        start = positions[lumps[order[i]]]
+        end = start + sizes[lumps[order[i]]]
+        j = i + 1
+        while j < len(order):
+            lump = lumps[order[j]]
+            if wad_index[lump] != wad or positions[lump] > end + read_gap:
+                break
+            end = max(end, positions[lump] + sizes[lump])
+            j += 1
+
+        mapping = lump_info.wads[wad].mapping
+        if mapping is not None:
+            buffer = mapping
+            start = 0
+        else:
+            handle = lump_info.wads[wad].handle
+            buffer = memoryview(_pread(handle, end - start, start))
+        for k in order[i:j]:
+            offset = positions[lumps[k]] - start
+            results[k] = buffer[offset : offset + sizes[lumps[k]]]
+        i = j
+    return results
+
+
+def cache_lump_num(lump: int, tag: PurgeTag = PurgeTag.CACHE) -> Lump:
+    """
+    Get the data within a lump, cached for efficiency.
 
-def cache_lump_num(lump: int) -> bytes:
-    """Get the data within a lump, cached for efficiency."""
+    ``tag`` says how long it must stay cached, see :class:`PurgeTag`.
+    With :data:`use_mmap` this is a read-only :class:`memoryview`
+    into the mapped file; use ``bytes()`` on it for a private copy.
+    """
     if lump >= num_lumps:
         print(f"{cache_lump_num.__qualname__}: {lump} >= num_lumps", file=sys.stderr)
         exit(1)
-    if lump_cache[lump] is None:
-        lump_cache[lump] = read_lump(lump)
-    return lump_cache[lump]
-
-
-def cache_lump_name(name: str) -> bytes:
+    lump = canonical_lump(lump)
+    data = lump_cache.get(lump, tag)
+    if data is None:
+        data = _lump_view(lump)
+        if data is None:
+            data = read_lump(lump)
+        data = _cache_new(lump, data, tag)
+    return data
+
+
+def _cache_new(lump: int, data: Lump, tag: PurgeTag) -> Lump:
+    """Cache freshly read ``data``, or return an equal buffer cached before."""
+    if dedup_lumps:
+        original = _dedup(lump, data)
+        if original != lump:
+            cached = lump_cache.get(original, tag)
+            if cached is not None:
+                return cached
+            lump = original
+    lump_cache.put(lump, data, tag)
+    return data
+
+
+def cache_lump_name(name: str, tag: PurgeTag = PurgeTag.CACHE) -> Lump:
     """Like :func:`cache_lump_num`, but uses a name instead of an index."""
-    return cache_lump_num(get_num_for_name(name))
+    return cache_lump_num(get_num_for_name(name), tag)
+
+
+def cache_lumps(lumps: Iterable[int], tag: PurgeTag = PurgeTag.CACHE) -> list[Lump]:
+    """Like :func:`cache_lump_num`, but fetch missing lumps with :func:`read_lumps`."""
+    lumps = [canonical_lump(lump) for lump in lumps]
+    missing = [lump for lump in dict.fromkeys(lumps) if lump not in lump_cache]
+    for lump, data in zip(missing, read_lumps(missing)):
+        if lump_info.wads[lump_info.wad_index[lump]].mapping is None:
+            # The cache counts only the lump, not the rest of the read.
+            data = bytes(data)
+        _cache_new(lump, data, tag)
+    return [cache_lump_num(lump, tag) for lump in lumps]
@@ -0,0 +1,273 @@
+"""
+Procedural maps of any size, for benchmarks.
+
+A map is a grid of square cells. Every cell edge is a linedef: the ones
+around the grid are one-sided walls, the ones inside are two-sided
+lines between neighbouring cells. Each cell belongs to one of a fixed
+number of sectors (sectors needn't be contiguous), so a map of
+``width * height`` cells has ``2 * width * height + width + height``
+linedefs but only as many sectors as asked for.
+
+The same seed and sizes always give the same bytes. The records are
+laid out like the types in :mod:`pink_doom.doom.data`; vertex and
+sidedef numbers are unsigned, as in limit-removing ports, since large
+maps need more than 32767 vertexes. SEGS, SSECTORS and NODES are left
+empty unless :mod:`pink_doom.wad.nodebuild` is asked to build them,
+BLOCKMAP is always empty, and REJECT is all zeroes (every sector can
+see every other).
+"""
+import math
+import random
+import struct
+import sys
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from pink_doom.doom.data import NO_INDEX, LinedefAttribute, MapLump
+from pink_doom.wad.nodebuild import CostModel, NodeStats, build_nodes
+from pink_doom.wad.writer import WadWriter
+
+VERTEX = struct.Struct("<hh")
+"""x, y"""
+LINEDEF = struct.Struct("<HHhhhHH")
+"""v1, v2, flags, special, tag, sidenum[0], sidenum[1]"""
+SIDEDEF = struct.Struct("<hh8s8s8sH")
+"""texture_offset, row_offset, top, bottom, mid, sector"""
+SECTOR = struct.Struct("<hh8s8shhh")
+"""floor_height, ceiling_height, floor_pic, ceiling_pic, light, special, tag"""
+THING = struct.Struct("<hhhhh")
+"""x, y, angle, type, options"""
+
+NO_SIDEDEF = NO_INDEX
+"""``sidenum[1]`` of a one-sided linedef."""
+
+MAX_CELLS = 254
+"""Most cells along each side, so the vertexes stay below 65536."""
+
+_FLOORS = (b"FLOOR4_8", b"FLOOR5_1", b"FLAT14", b"NUKAGE1", b"CEIL3_5")
+_WALLS = (b"STARTAN3", b"BROWN1", b"COMPTALL", b"STONE2", b"BIGDOOR2")
+_THING_TYPES = (3004, 3001, 2011, 2035, 2007)
+"""Zombieman, imp, stimpack, barrel, clip."""
+_PLAYER1_START = 1
+_SKILL_ALL = 0x07
+_ROW = 256
+"""Records packed per chunk handed to the writer."""
+
+
+@dataclass
+class MapSpec:
+    """Size and seed of a generated map."""
+
+    width: int
+    """Cells from west to east."""
+    height: int
+    """Cells from south to north."""
+    sectors: int = 64
+    things: int = 0
+    seed: int = 0
+    cell_size: int = 128
+    """Length of a cell side in map units."""
+
+    @property
+    def num_vertexes(self) -> int:
+        """Return the number of VERTEXES records."""
+        return (self.width + 1) * (self.height + 1)
+
+    @property
+    def num_linedefs(self) -> int:
+        """Return the number of LINEDEFS records."""
+        return 2 * self.width * self.height + self.width + self.height
+
+
+def spec_for_linedefs(linedefs: int, **kwargs) -> MapSpec:
+    """
+    Make a square-ish map with at least ``linedefs`` linedefs.
+
+    Up to about 129000 linedefs fit. Other fields of :class:`MapSpec`
+    can be passed as keywords; ``things`` defaults to one per 50 linedefs.
+    """
+    width = max(1, min(MAX_CELLS, math.ceil((math.sqrt(1 + 2 * linedefs) - 1) / 2)))
+    height = max(1, min(MAX_CELLS, math.ceil((linedefs - width) / (2 * width + 1))))
+    kwargs.setdefault("things", linedefs // 50)
+    return MapSpec(width, height, **kwargs)
+
+
+def _chunks(records: Iterator[bytes]) -> Iterator[bytes]:
+    """Join packed records into fewer, larger writes."""
+    row = []
+    for record in records:
+        row.append(record)
+        if len(row) == _ROW:
+            yield b"".join(row)
+            row.clear()
+    if row:
+        yield b"".join(row)
+
+
+def _origin(cells: int, cell_size: int) -> int:
+    """Return the lowest coordinate of a side, so the map is centered on 0."""
+    return -(cells * cell_size // 2)
+
+
+def _fits(cells: int, cell_size: int) -> bool:
+    origin = _origin(cells, cell_size)
+    return origin >= -0x8000 and origin + cells * cell_size <= 0x7FFF
+
+
+def _check(spec: MapSpec) -> None:
+    problem = None
+    if not (0 < spec.width <= MAX_CELLS and 0 < spec.height <= MAX_CELLS):
+        problem = f"at most {MAX_CELLS} cells fit on each side"
+    elif not 0 < spec.sectors <= NO_SIDEDEF // 2:
+        problem = f"sectors must be between 1 and {NO_SIDEDEF // 2}"
+    elif not (_fits(spec.width, spec.cell_size) and _fits(spec.height, spec.cell_size)):
+        problem = "the map is too large for 16-bit coordinates"
+    if problem is not None:
+        print(f"{write_map.__qualname__}: {problem}", file=sys.stderr)
+        exit(1)
+
+
+class _Generator:
+    def __init__(self, spec: MapSpec):
+        self.spec = spec
+        rng = random.Random(spec.seed)
+        self.cells = [
+            rng.randrange(spec.sectors) for _ in range(spec.width * spec.height)
+        ]
+        self.origin_x = _origin(spec.width, spec.cell_size)
+        self.origin_y = _origin(spec.height, spec.cell_size)
+
+    def vertex(self, x: int, y: int) -> int:
+        return y * (self.spec.width + 1) + x
+
+    def sector(self, x: int, y: int) -> int:
+        return self.cells[y * self.spec.width + x]
+
+    def vertexes(self) -> Iterator[bytes]:
+        size = self.spec.cell_size
+        for y in range(self.spec.height + 1):
+            for x in range(self.spec.width + 1):
+                yield VERTEX.pack(self.origin_x + x * size, self.origin_y + y * size)
+
+    def linedefs(self) -> Iterator[bytes]:
+        # Sector s has two sidedefs: 2s is a solid wall, 2s + 1 faces
+        # another cell. The front (first) side is right of v1 -> v2.
+        width, height = self.spec.width, self.spec.height
+        wall = LinedefAttribute.BLOCKING.value
+        open_line = LinedefAttribute.TWO_SIDED.value
+        for y in range(height + 1):
+            for x in range(width):
+                v1, v2 = self.vertex(x, y), self.vertex(x + 1, y)
+                if y == 0:
+                    # Westwards, so the cell to the north is in front.
+                    side = 2 * self.sector(x, y)
+                    yield LINEDEF.pack(v2, v1, wall, 0, 0, side, NO_SIDEDEF)
+                elif y == height:
+                    side = 2 * self.sector(x, y - 1)
+                    yield LINEDEF.pack(v1, v2, wall, 0, 0, side, NO_SIDEDEF)
+                else:
+                    front = 2 * self.sector(x, y - 1) + 1
+                    back = 2 * self.sector(x, y) + 1
+                    yield LINEDEF.pack(v1, v2, open_line, 0, 0, front, back)
+        for x in range(width + 1):
+            for y in range(height):
+                v1, v2 = self.vertex(x, y), self.vertex(x, y + 1)
+                if x == width:
+                    # Southwards, so the cell to the west is in front.
+                    side = 2 * self.sector(x - 1, y)
+                    yield LINEDEF.pack(v2, v1, wall, 0, 0, side, NO_SIDEDEF)
+                elif x == 0:
+                    side = 2 * self.sector(x, y)
+                    yield LINEDEF.pack(v1, v2, wall, 0, 0, side, NO_SIDEDEF)
+                else:
+                    front = 2 * self.sector(x, y) + 1
+                    back = 2 * self.sector(x - 1, y) + 1
+                    yield LINEDEF.pack(v1, v2, open_line, 0, 0, front, back)
+
+    def sidedefs(self) -> Iterator[bytes]:
+        for sector in range(self.spec.sectors):
+            texture = _WALLS[sector % len(_WALLS)]
+            yield SIDEDEF.pack(0, 0, b"-", b"-", texture, sector)
+            yield SIDEDEF.pack(0, 0, texture, texture, b"-", sector)
+
+    def sectors(self) -> Iterator[bytes]:
+        rng = random.Random(self.spec.seed + 1)
+        for _ in range(self.spec.sectors):
+            floor = rng.randrange(0, 64, 8)
+            yield SECTOR.pack(
+                floor,
+                floor + rng.randrange(96, 256, 8),
+                rng.choice(_FLOORS),
+                b"CEIL3_5",
+                rng.randrange(96, 256, 16),
+                0,
+                0,
+            )
+
+    def things(self) -> Iterator[bytes]:
+        size = self.spec.cell_size
+        half = size // 2
+        yield THING.pack(
+            self.origin_x + half, self.origin_y + half, 90, _PLAYER1_START, _SKILL_ALL
+        )
+        rng = random.Random(self.spec.seed + 2)
+        for _ in range(self.spec.things):
+            x = rng.randrange(self.spec.width)
+            y = rng.randrange(self.spec.height)
+            yield THING.pack(
+                self.origin_x + x * size + half,
+                self.origin_y + y * size + half,
+                rng.randrange(0, 360, 45),
+                rng.choice(_THING_TYPES),
+                _SKILL_ALL,
+            )
+
+
+def write_map(
+    wad: WadWriter, name: str, spec: MapSpec, nodes: Optional[CostModel] = None
+) -> Optional[NodeStats]:
+    """
+    Append the lumps of a generated map called ``name`` to ``wad``.
+
+    Lumps are generated while they are written, a few hundred records
+    at a time. If ``nodes`` is given, the BSP tree is built with it, which
+    needs the vertexes and linedefs in memory, and its statistics are
+    returned.
+    """
+    _check(spec)
+    generator = _Generator(spec)
+    lumps = {
+        MapLump.THINGS: generator.things,
+        MapLump.LINEDEFS: generator.linedefs,
+        MapLump.SIDEDEFS: generator.sidedefs,
+        MapLump.VERTEXES: generator.vertexes,
+        MapLump.SECTORS: generator.sectors,
+    }
+    built, stats = {}, None
+    if nodes is not None:
+        built, stats = build_nodes(
+            {
+                kind: b"".join(lumps[kind]())
+                for kind in (MapLump.VERTEXES, MapLump.LINEDEFS)
+            },
+            nodes,
+        )
+    wad.add_lump(name)
+    for kind in MapLump:
+        if kind in built:
+            wad.add_lump(kind.name, built[kind])
+        elif kind in lumps:
+            wad.add_lump(kind.name, _chunks(lumps[kind]()))
+        elif kind == MapLump.REJECT:
+            wad.add_lump(kind.name, bytes((spec.sectors * spec.sectors + 7) // 8))
+        elif kind != MapLump.LABEL:
+            wad.add_lump(kind.name)
+    return stats
+
+
+def generate_wad(
+    path: str, spec: MapSpec, name: str = "MAP01", nodes: Optional[CostModel] = None
+) -> Optional[NodeStats]:
+    """Write a PWAD holding a single generated map, see :func:`write_map`."""
+    with WadWriter(path) as wad:
+        return write_map(wad, name, spec, nodes)
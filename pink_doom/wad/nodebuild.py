@@ -0,0 +1,391 @@
+"""
+A BSP node builder, making the SEGS, SSECTORS and NODES of a map.
+
+Each side of a linedef starts out as a seg. A partition line is picked
+among the segs, the segs crossing it are split in two at a new vertex,
+and the segs on each side are partitioned again, until no seg of a set
+has another one behind it. Those convex sets are the subsectors.
+
+Which partition is picked is up to :class:`CostModel`. Every seg a
+partition splits adds to its cost, as does every seg more on one side
+than the other. Splits make more segs and vertexes, imbalance makes the
+tree deeper, and so every walk down it longer. :class:`NodeStats` tells
+how a map came out.
+
+Coordinates in the lumps are whole map units, so split points are
+rounded to the nearest one, like other node builders do.
+"""
+import math
+import sys
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+import numpy as np
+
+from pink_doom.doom.data import MAP_DTYPES, NO_INDEX, MapLump, NodeFlag, decode_lump
+
+_LEAF = NodeFlag.SUBSECTOR.value
+_CELLS = 1 << 20
+"""Most seg and partition pairs classified at once."""
+
+
+@dataclass
+class CostModel:
+    """How partition lines are picked, the cheapest one wins."""
+
+    split_cost: int = 8
+    """Cost of each seg the partition splits."""
+    balance_cost: int = 1
+    """Cost of each seg more on one side of the partition than the other."""
+    candidates: int = 32
+    """Most partitions tried per node, each through another linedef."""
+
+
+@dataclass
+class NodeStats:
+    """What came out of :func:`build_nodes`."""
+
+    nodes: int = 0
+    subsectors: int = 0
+    segs: int = 0
+    splits: int = 0
+    """Segs cut in two by partition lines."""
+    vertexes: int = 0
+    """Vertexes added where segs were split."""
+    max_depth: int = 0
+    """Most nodes on the way from the root to a subsector."""
+    mean_depth: float = 0.0
+    """Nodes on the way from the root to a subsector, on average."""
+
+
+@dataclass
+class _Segs:
+    """A set of segs, a column per field."""
+
+    x1: np.ndarray
+    y1: np.ndarray
+    x2: np.ndarray
+    y2: np.ndarray
+    v1: np.ndarray
+    v2: np.ndarray
+    linedef: np.ndarray
+    side: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.x1)
+
+    def take(self, which: np.ndarray) -> "_Segs":
+        return _Segs(*(column[which] for column in vars(self).values()))
+
+    @staticmethod
+    def concat(parts: list["_Segs"]) -> "_Segs":
+        return _Segs(
+            *(
+                np.concatenate([vars(part)[name] for part in parts])
+                for name in vars(parts[0])
+            )
+        )
+
+    def bbox(self) -> tuple[int, int, int, int]:
+        """Return the top, bottom, left and right of the segs."""
+        if not len(self):
+            return 0, 0, 0, 0
+        return (
+            int(max(self.y1.max(), self.y2.max())),
+            int(min(self.y1.min(), self.y2.min())),
+            int(min(self.x1.min(), self.x2.min())),
+            int(max(self.x1.max(), self.x2.max())),
+        )
+
+    def sides(self, x: int, y: int, dx: int, dy: int) -> tuple[np.ndarray, ...]:
+        """
+        Return where the ends of each seg are relative to a line.
+
+        Negative is in front (right of the line's direction), positive
+        behind it, as ``R_PointOnSide`` would put them.
+        """
+        return (
+            (self.y1 - y) * dx - (self.x1 - x) * dy,
+            (self.y2 - y) * dx - (self.x2 - x) * dy,
+        )
+
+
+def _front_of(segs: _Segs, a, b, dx, dy) -> np.ndarray:
+    """
+    Return which segs that aren't split go in front of a partition.
+
+    Segs on the partition itself go in front if they face the same way.
+    """
+    same_way = (segs.x2 - segs.x1) * dx + (segs.y2 - segs.y1) * dy > 0
+    return np.where((a == 0) & (b == 0), same_way, (a <= 0) & (b <= 0))
+
+
+class _Builder:
+    def __init__(self, vertexes: np.ndarray, linedefs: np.ndarray, cost: CostModel):
+        self.cost = cost
+        self.vertex_x = vertexes["x"].astype(np.int64).tolist()
+        self.vertex_y = vertexes["y"].astype(np.int64).tolist()
+        self.vertex_num = {}
+        for num, point in enumerate(zip(self.vertex_x, self.vertex_y)):
+            self.vertex_num.setdefault(point, num)
+        self.linedefs = linedefs
+        self.stats = NodeStats()
+        self.leaves: list[_Segs] = []
+        self.depths: list[int] = []
+        self.nodes: list[tuple] = []
+
+    def initial_segs(self) -> _Segs:
+        """Make a seg of each side of each linedef."""
+        x = np.array(self.vertex_x, np.int64)
+        y = np.array(self.vertex_y, np.int64)
+        v1 = self.linedefs["v1"].astype(np.int64)
+        v2 = self.linedefs["v2"].astype(np.int64)
+        sidenum = self.linedefs["sidenum"]
+        lines = np.arange(len(self.linedefs))
+        long = (x[v1] != x[v2]) | (y[v1] != y[v2])
+        front = long & (sidenum[:, 0] != NO_INDEX)
+        back = long & (sidenum[:, 1] != NO_INDEX)
+        start = np.concatenate([v1[front], v2[back]])
+        end = np.concatenate([v2[front], v1[back]])
+        order = np.argsort(np.concatenate([lines[front], lines[back]]), kind="stable")
+        start, end = start[order], end[order]
+        return _Segs(
+            x[start],
+            y[start],
+            x[end],
+            y[end],
+            start,
+            end,
+            np.concatenate([lines[front], lines[back]])[order],
+            np.concatenate(
+                [np.zeros(front.sum(), np.int64), np.ones(back.sum(), np.int64)]
+            )[order],
+        )
+
+    def vertex(self, x: int, y: int) -> int:
+        """Return the number of the vertex at (x, y), adding it if new."""
+        num = self.vertex_num.get((x, y))
+        if num is None:
+            num = self.vertex_num[x, y] = len(self.vertex_x)
+            self.vertex_x.append(x)
+            self.vertex_y.append(y)
+            self.stats.vertexes += 1
+        return num
+
+    def best_partition(self, segs: _Segs, candidates: np.ndarray) -> Optional[int]:
+        """Return the cheapest of ``candidates`` that divides ``segs``."""
+        best, best_cost = None, None
+        step = max(1, _CELLS // len(segs))
+        for start in range(0, len(candidates), step):
+            chosen = candidates[start : start + step]
+            x, y = segs.x1[chosen], segs.y1[chosen]
+            dx, dy = segs.x2[chosen] - x, segs.y2[chosen] - y
+            columns = _Segs(*(column[:, None] for column in vars(segs).values()))
+            a, b = columns.sides(x, y, dx, dy)
+            split = ((a < 0) & (b > 0)) | ((a > 0) & (b < 0))
+            front = ~split & _front_of(columns, a, b, dx, dy)
+            splits = split.sum(axis=0)
+            fronts = front.sum(axis=0)
+            backs = len(segs) - splits - fronts
+            cost = self.cost.split_cost * splits + self.cost.balance_cost * np.abs(
+                fronts - backs
+            )
+            # A partition that leaves nothing behind it divides nothing.
+            cost = np.where(backs + splits > 0, cost, np.iinfo(np.int64).max)
+            pick = int(np.argmin(cost))
+            if backs[pick] + splits[pick] and (best is None or cost[pick] < best_cost):
+                best, best_cost = int(chosen[pick]), cost[pick]
+        return best
+
+    def choose(self, segs: _Segs, skip: list[int]) -> Optional[int]:
+        """
+        Pick the partition for ``segs``, None if they are convex.
+
+        Partitions through the linedefs in ``skip`` aren't tried.
+        """
+        # Segs of one linedef lie on one line, so each is tried once.
+        _, lines = np.unique(segs.linedef, return_index=True)
+        lines = np.sort(lines[~np.isin(segs.linedef[lines], skip)])
+        step = max(1, len(lines) // self.cost.candidates)
+        sample = lines[::step][: self.cost.candidates]
+        best = self.best_partition(segs, sample)
+        if best is None and len(sample) < len(lines):
+            # Only convex once no line at all divides them.
+            best = self.best_partition(segs, np.setdiff1d(lines, sample))
+        return best
+
+    def divide(self, segs: _Segs, partition: int) -> tuple[_Segs, _Segs]:
+        """Split ``segs`` into those in front of ``partition`` and behind it."""
+        x, y = int(segs.x1[partition]), int(segs.y1[partition])
+        dx, dy = int(segs.x2[partition]) - x, int(segs.y2[partition]) - y
+        a, b = segs.sides(x, y, dx, dy)
+        split = ((a < 0) & (b > 0)) | ((a > 0) & (b < 0))
+        front = ~split & _front_of(segs, a, b, dx, dy)
+        fronts, backs = [segs.take(front)], [segs.take(~split & ~front)]
+
+        for seg in np.flatnonzero(split).tolist():
+            x1, y1 = int(segs.x1[seg]), int(segs.y1[seg])
+            x2, y2 = int(segs.x2[seg]), int(segs.y2[seg])
+            t = a[seg] / (a[seg] - b[seg])
+            mx, my = round(x1 + t * (x2 - x1)), round(y1 + t * (y2 - y1))
+            first_side = fronts if a[seg] < 0 else backs
+            second_side = fronts if b[seg] < 0 else backs
+            if (mx, my) == (x1, y1):
+                # Too close to an end to split, it goes with the other end.
+                second_side.append(segs.take([seg]))
+                continue
+            if (mx, my) == (x2, y2):
+                first_side.append(segs.take([seg]))
+                continue
+            self.stats.splits += 1
+            middle = self.vertex(mx, my)
+            first = segs.take([seg])
+            first.x2[:], first.y2[:], first.v2[:] = mx, my, middle
+            second = segs.take([seg])
+            second.x1[:], second.y1[:], second.v1[:] = mx, my, middle
+            first_side.append(first)
+            second_side.append(second)
+        return _Segs.concat(fronts), _Segs.concat(backs)
+
+    def leaf(self, segs: _Segs, depth: int) -> int:
+        self.leaves.append(segs)
+        self.depths.append(depth)
+        return _LEAF | (len(self.leaves) - 1)
+
+    def build(self, segs: _Segs) -> None:
+        """Partition ``segs`` into the tree, the root node last."""
+        # The children of a node are built before it, so ``work`` holds
+        # seg sets to build and nodes waiting for their children, and
+        # ``built`` the child number and bounding box of each done.
+        work: list = [(segs, 0)]
+        built: list[tuple[int, tuple]] = []
+        while work:
+            item = work.pop()
+            if isinstance(item[0], _Segs):
+                segs, depth = item
+                skip: list[int] = []
+                while len(segs):
+                    partition = self.choose(segs, skip)
+                    if partition is None:
+                        break
+                    front, back = self.divide(segs, partition)
+                    if len(back):
+                        break
+                    # The only segs behind it were too close to split,
+                    # so it divides nothing after all.
+                    skip.append(int(segs.linedef[partition]))
+                else:
+                    partition = None
+                if partition is None:
+                    built.append((self.leaf(segs, depth), segs.bbox()))
+                    continue
+                x, y = int(segs.x1[partition]), int(segs.y1[partition])
+                line = (x, y, int(segs.x2[partition]) - x, int(segs.y2[partition]) - y)
+                work.append((line, None))
+                work.append((back, depth + 1))
+                work.append((front, depth + 1))
+                continue
+
+            line, _ = item
+            back, back_box = built.pop()
+            front, front_box = built.pop()
+            self.nodes.append(line + front_box + back_box + (front, back))
+            box = (
+                max(front_box[0], back_box[0]),
+                min(front_box[1], back_box[1]),
+                min(front_box[2], back_box[2]),
+                max(front_box[3], back_box[3]),
+            )
+            built.append((len(self.nodes) - 1, box))
+
+    def seg_records(self) -> np.ndarray:
+        segs = _Segs.concat(self.leaves)
+        records = np.zeros(len(segs), MAP_DTYPES[MapLump.SEGS])
+        vertex_x = np.array(self.vertex_x, np.int64)
+        vertex_y = np.array(self.vertex_y, np.int64)
+        v1 = self.linedefs["v1"].astype(np.int64)[segs.linedef]
+        v2 = self.linedefs["v2"].astype(np.int64)[segs.linedef]
+        # Angle and offset follow the linedef side, not the rounded seg.
+        start = np.where(segs.side == 0, v1, v2)
+        end = np.where(segs.side == 0, v2, v1)
+        angle = np.arctan2(
+            vertex_y[end] - vertex_y[start], vertex_x[end] - vertex_x[start]
+        )
+        angle = np.round(angle * (0x8000 / math.pi)).astype(np.int64) & 0xFFFF
+        records["v1"] = segs.v1
+        records["v2"] = segs.v2
+        records["angle"] = np.where(angle >= 0x8000, angle - 0x10000, angle)
+        records["linedef"] = segs.linedef
+        records["side"] = segs.side
+        records["offset"] = np.round(
+            np.hypot(segs.x1 - vertex_x[start], segs.y1 - vertex_y[start])
+        )
+        return records
+
+
+def _check_limits(builder: _Builder, num_segs: int) -> None:
+    # SEGS and SSECTORS hold seg, linedef and vertex numbers in 16 bits.
+    problem = None
+    if len(builder.linedefs) > NO_INDEX:
+        problem = f"{len(builder.linedefs)} linedefs"
+    elif num_segs > NO_INDEX:
+        problem = f"{num_segs} segs"
+    elif len(builder.vertex_x) > NO_INDEX:
+        problem = f"{len(builder.vertex_x)} vertexes"
+    elif len(builder.leaves) > _LEAF:
+        problem = f"{len(builder.leaves)} subsectors"
+    elif len(builder.nodes) > _LEAF:
+        problem = f"{len(builder.nodes)} nodes"
+    if problem is not None:
+        print(f"{build_nodes.__qualname__}: too many {problem}", file=sys.stderr)
+        exit(1)
+
+
+def build_nodes(
+    lumps: Mapping[MapLump, bytes], cost: Optional[CostModel] = None
+) -> tuple[dict[MapLump, bytes], NodeStats]:
+    """
+    Build the BSP tree of a map from its VERTEXES and LINEDEFS.
+
+    Returns the new VERTEXES, with the split points added after the
+    others, SEGS, SSECTORS and NODES lumps, and the statistics.
+    Partitions are picked by ``cost``, the default :class:`CostModel`
+    if not given.
+    """
+    builder = _Builder(
+        decode_lump(MapLump.VERTEXES, lumps[MapLump.VERTEXES]),
+        decode_lump(MapLump.LINEDEFS, lumps[MapLump.LINEDEFS]),
+        cost if cost is not None else CostModel(),
+    )
+    initial = builder.initial_segs()
+    # Splits only add segs, so a map with too many is refused unbuilt.
+    _check_limits(builder, len(initial))
+    builder.build(initial)
+    _check_limits(builder, sum(len(leaf) for leaf in builder.leaves))
+
+    vertexes = np.zeros(len(builder.vertex_x), MAP_DTYPES[MapLump.VERTEXES])
+    vertexes["x"] = builder.vertex_x
+    vertexes["y"] = builder.vertex_y
+    segs = builder.seg_records()
+    subsectors = np.zeros(len(builder.leaves), MAP_DTYPES[MapLump.SSECTORS])
+    subsectors["num_segs"] = [len(leaf) for leaf in builder.leaves]
+    subsectors["first_seg"] = np.cumsum(subsectors["num_segs"]) - subsectors["num_segs"]
+    nodes = np.zeros(len(builder.nodes), MAP_DTYPES[MapLump.NODES])
+    if builder.nodes:
+        table = np.array(builder.nodes, np.int64)
+        nodes["x"], nodes["y"], nodes["dx"], nodes["dy"] = table[:, :4].T
+        nodes["bbox"] = table[:, 4:12].reshape(-1, 2, 4)
+        nodes["children"] = table[:, 12:]
+
+    stats = builder.stats
+    stats.nodes = len(nodes)
+    stats.subsectors = len(subsectors)
+    stats.segs = len(segs)
+    stats.max_depth = max(builder.depths)
+    stats.mean_depth = sum(builder.depths) / len(builder.depths)
+    return {
+        MapLump.VERTEXES: vertexes.tobytes(),
+        MapLump.SEGS: segs.tobytes(),
+        MapLump.SSECTORS: subsectors.tobytes(),
+        MapLump.NODES: nodes.tobytes(),
+    }, stats
@@ -0,0 +1,118 @@
+"""
+WADs shared between processes.
+
+One process loads its WADs as usual and calls :func:`publish`, which
+copies the files and the parsed lump table into a named shared memory
+segment. Other processes on the same host call :func:`attach` instead
+of :func:`pink_doom.wad.loader.init_multiple_files`: they read the
+lump table from the segment, and every lump they cache is a read-only
+view into it, so all of them share a single copy of the WAD data.
+"""
+import marshal
+import os
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+from pink_doom.wad import loader
+from pink_doom.wad.loader import WadFile, add_wad, load_table, save_table
+
+MAGIC = b"PDSHM\x00\x00\x01"
+"""Start of every segment, the last byte is the layout version."""
+
+_HEADER = struct.Struct("<8sQQ")
+"""Magic, then position and length of the marshalled lump table."""
+
+_ALIGN = 64
+
+_attached: list[SharedMemory] = []
+"""Segments this process reads lumps from, kept open while they are in use."""
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _ALIGN) * _ALIGN
+
+
+def publish(name: Optional[str] = None) -> SharedMemory:
+    """
+    Copy every loaded WAD and the lump table into a new shared memory segment.
+
+    ``name`` defaults to a random one, see the ``name`` of the result.
+    The caller owns the segment: it stays around until the caller
+    calls ``close()`` and ``unlink()`` on it, even after processes
+    attached to it have exited.
+    """
+    # The files come first, each at an aligned offset, then the table.
+    table = save_table()
+    table["files"] = []
+    offset = _aligned(_HEADER.size)
+    for wad in loader.lump_info.wads:
+        if wad.mapping is not None:
+            size = len(wad.mapping)
+        else:
+            size = os.fstat(wad.handle.fileno()).st_size
+        table["files"].append((wad.name, wad.identification, offset, size))
+        offset += _aligned(size)
+    meta = marshal.dumps(table)
+
+    shm = SharedMemory(name, create=True, size=offset + len(meta))
+    _HEADER.pack_into(shm.buf, 0, MAGIC, offset, len(meta))
+    shm.buf[offset : offset + len(meta)] = meta
+    for wad, (_, _, start, size) in zip(loader.lump_info.wads, table["files"]):
+        if wad.mapping is not None:
+            shm.buf[start : start + size] = wad.mapping
+        else:
+            wad.handle.seek(0)
+            wad.handle.readinto(shm.buf[start : start + size])
+    return shm
+
+
+def _open_segment(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    shm = SharedMemory(name)
+    # Before 3.13 the resource tracker would unlink the segment as soon as
+    # this process exits, pulling it away from everybody else.
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def attach(name: str) -> SharedMemory:
+    """
+    Load the WADs published as ``name``, replacing any loaded before.
+
+    Lumps are never copied out of the segment. Call :func:`detach`
+    once they are no longer needed.
+    """
+    loader.reset()
+    shm = _open_segment(name)
+    buf = shm.buf.toreadonly()
+    magic, meta_offset, meta_size = _HEADER.unpack_from(buf)
+    if magic != MAGIC:
+        buf.release()
+        shm.close()
+        print(f"{attach.__qualname__}: {name} is not a shared WAD", file=sys.stderr)
+        exit(1)
+
+    table = marshal.loads(buf[meta_offset : meta_offset + meta_size])
+    for filename, identification, start, size in table["files"]:
+        print(f" adding {filename} (shared)")
+        add_wad(WadFile(filename, None, buf[start : start + size], identification))
+    load_table(table)
+    loader.lump_cache.clear()
+    _attached.append(shm)
+    return shm
+
+
+def detach() -> None:
+    """
+    Forget the loaded WADs and close the segments they came from.
+
+    Views of their lumps must not be used any more, and closing fails
+    with :exc:`BufferError` while any of them is still referenced.
+    """
+    loader.reset()
+    while _attached:
+        _attached.pop().close()
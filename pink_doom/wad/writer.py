@@ -0,0 +1,90 @@
+"""
+The Doom WAD writer, the inverse of :mod:`pink_doom.wad.loader`.
+
+Lumps are streamed to disk as they are added, only the directory is
+kept in memory until :meth:`WadWriter.close` appends it.
+"""
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, Union
+
+_HEADER = struct.Struct("<4sii")
+"""identification, num_lumps, info_table_offset"""
+_ENTRY = struct.Struct("<ii8s")
+"""file_pos, size, name[8]"""
+
+
+class WadWriter:
+    """
+    A WAD file being written.
+
+    Use as a context manager, or call :meth:`close` when done::
+
+        with WadWriter("out.wad") as wad:
+            wad.add_lump("MAP01")
+            wad.add_lump("THINGS", things)
+    """
+
+    def __init__(self, name: str, identification: bytes = b"PWAD"):
+        """Create ``name``, replacing any file there."""
+        if identification not in (b"IWAD", b"PWAD"):
+            print(
+                f"{WadWriter.__qualname__}: {identification!r} is neither"
+                " IWAD nor PWAD",
+                file=sys.stderr,
+            )
+            exit(1)
+        self.name = name
+        self.identification = identification
+        self.handle: BinaryIO = open(name, "wb")
+        self.positions = array("i")
+        self.sizes = array("i")
+        self.names: list[bytes] = []
+        # The header is written again once the directory is known.
+        self.handle.write(_HEADER.pack(identification, 0, 0))
+        self._position = _HEADER.size
+
+    def __enter__(self) -> "WadWriter":
+        """Return the writer itself."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Finish the file, see :meth:`close`."""
+        self.close()
+
+    def add_lump(self, name: str, data: Union[bytes, Iterable[bytes]] = b"") -> int:
+        """
+        Append a lump and return its number.
+
+        ``data`` is either the whole lump or an iterable of chunks, which
+        are written one by one so a lump never has to be built in memory.
+        Leave it out for markers and map labels.
+        """
+        encoded = name.encode("ascii", "replace")
+        if not 0 < len(encoded) <= 8:
+            print(f"{self.add_lump.__qualname__}: bad name {name!r}", file=sys.stderr)
+            exit(1)
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = (data,)
+
+        size = 0
+        for chunk in data:
+            size += self.handle.write(chunk)
+        self.positions.append(self._position)
+        self.sizes.append(size)
+        self.names.append(encoded)
+        self._position += size
+        return len(self.names) - 1
+
+    def close(self) -> None:
+        """Write the directory and the real header, then close the file."""
+        if self.handle.closed:
+            return
+        for position, size, name in zip(self.positions, self.sizes, self.names):
+            self.handle.write(_ENTRY.pack(position, size, name))
+        self.handle.seek(0)
+        self.handle.write(
+            _HEADER.pack(self.identification, len(self.names), self._position)
+        )
+        self.handle.close()
@@ -0,0 +1,19 @@
+"""Fixtures shared by the tests."""
+
+import pytest
+
+from pink_doom.wad import loader
+from tests.helpers import make_wad
+
+
+@pytest.fixture
+def wads(tmp_path):
+    """Return an IWAD and a PWAD that overrides one of its lumps."""
+    iwad = make_wad(
+        tmp_path / "doom.wad",
+        [("PLAYPAL", b"\x01" * 768), ("COLORMAP", b"\x02" * 34), ("E1M1", b"")],
+        b"IWAD",
+    )
+    pwad = make_wad(tmp_path / "mod.wad", [("PLAYPAL", b"\x03" * 768)])
+    yield [iwad, pwad]
+    loader.reset()
@@ -0,0 +1,16 @@
+"""Helpers shared by the tests."""
+
+import struct
+
+
+def make_wad(path, lumps, identification=b"PWAD"):
+    """Write a minimal WAD holding ``lumps``, a list of (name, data) pairs."""
+    data = b"".join(lump for _, lump in lumps)
+    directory = b""
+    position = 12
+    for name, lump in lumps:
+        directory += struct.pack("<ii8s", position, len(lump), name.encode("ascii"))
+        position += len(lump)
+    header = struct.pack("<4sii", identification, len(lumps), 12 + len(data))
+    path.write_bytes(header + data + directory)
+    return str(path)
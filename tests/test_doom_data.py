@@ -0,0 +1,57 @@
+"""Tests for `pink_doom.doom.data`."""
+
+import struct
+
+import numpy as np
+import pytest
+
+from pink_doom.doom import data
+from pink_doom.doom.data import MapLump
+
+
+def test_dtypes_match_record_sizes():
+    """The dtypes have the sizes of the vanilla ``map*_t`` structs."""
+    sizes = {
+        MapLump.THINGS: 10,
+        MapLump.LINEDEFS: 14,
+        MapLump.SIDEDEFS: 30,
+        MapLump.VERTEXES: 4,
+        MapLump.SEGS: 12,
+        MapLump.SSECTORS: 4,
+        MapLump.NODES: 28,
+        MapLump.SECTORS: 26,
+    }
+    for kind, size in sizes.items():
+        assert data.MAP_DTYPES[kind].itemsize == size
+        assert len(data.MAP_DTYPES[kind].names) == len(
+            data.MAP_RECORDS[kind].__dataclass_fields__
+        )
+
+
+def test_decode_lump_is_zero_copy():
+    """Arrays are read-only views of the lump, partial records dropped."""
+    lump = struct.pack("<hhhh", 1, -2, 300, 40) + b"\x00"
+    vertexes = data.decode_lump(MapLump.VERTEXES, memoryview(lump))
+    assert vertexes["x"].tolist() == [1, 300]
+    assert vertexes["y"].tolist() == [-2, 40]
+    assert not vertexes.flags.writeable
+    assert np.shares_memory(vertexes, np.frombuffer(lump, np.uint8))
+
+
+def test_lump_records():
+    """Dataclass views decode names, nested fields and missing sides."""
+    linedefs = struct.pack("<HHhhhHH", 40000, 1, 4, 0, 7, 2, 0xFFFF)
+    assert data.lump_records(MapLump.LINEDEFS, linedefs) == [
+        data.MapLinedef(40000, 1, 4, 0, 7, (2, -1))
+    ]
+    sectors = struct.pack("<hh8s8shhh", 0, 128, b"FLOOR4_8", b"F_SKY1", 160, 9, 3)
+    assert data.lump_records(MapLump.SECTORS, sectors) == [
+        data.MapSector(0, 128, "FLOOR4_8", "F_SKY1", 160, 9, 3)
+    ]
+    bbox = tuple(range(8))
+    nodes = struct.pack("<4h8h2H", 1, 2, 3, 4, *bbox, 0x8000, 5)
+    (node,) = data.lump_records(MapLump.NODES, data.decode_lump(MapLump.NODES, nodes))
+    assert node.bbox == ((0, 1, 2, 3), (4, 5, 6, 7))
+    assert node.children == (0x8000, 5)
+    with pytest.raises(KeyError):
+        data.lump_records(MapLump.REJECT, b"\x00")
@@ -0,0 +1,87 @@
+"""Tests for `pink_doom.misc.fixed` and `pink_doom.misc.fixed_array`."""
+
+import numpy as np
+import pytest
+
+from pink_doom.doom.types import MAX_INT, MIN_INT
+from pink_doom.misc import fixed, fixed_array
+
+COUNT = 1_000_000
+
+
+def _operands(seed, count):
+    """Return random fixed_t pairs, a lot of them near the edge cases."""
+    rng = np.random.default_rng(seed)
+    special = np.array(
+        [0, 1, -1, 2, fixed.FRAC_UNIT, -fixed.FRAC_UNIT, 1 << 14, MAX_INT, MIN_INT],
+        np.int64,
+    )
+    values = []
+    for _ in range(2):
+        # Uniform over 32 bits, uniform in magnitude, and special values.
+        uniform = rng.integers(MIN_INT, MAX_INT, count, endpoint=True)
+        shifted = uniform >> rng.integers(0, 32, count)
+        column = np.where(rng.random(count) < 0.5, uniform, shifted)
+        picks = rng.random(count) < 0.02
+        column[picks] = rng.choice(special, picks.sum())
+        values.append(column)
+    return values
+
+
+@pytest.fixture(params=[False, True], ids=["python", "vanilla"])
+def wraparound(request, monkeypatch):
+    """Run a test with and without vanilla wraparound."""
+    monkeypatch.setattr(fixed, "vanilla_wraparound", request.param)
+    return request.param
+
+
+def test_fixed_mul_matches_scalar(wraparound):
+    """Products agree with the scalar version on a million pairs."""
+    a, b = _operands(1, COUNT)
+    expected = [fixed.fixed_mul(x, y) for x, y in zip(a.tolist(), b.tolist())]
+    assert fixed_array.fixed_mul(a, b).tolist() == expected
+    assert fixed_array.wrap(MAX_INT + 1) == MIN_INT
+
+
+def test_fixed_div_matches_scalar(wraparound):
+    """Quotients agree with the scalar version, saturation included."""
+    a, b = _operands(2, COUNT)
+    # INT_MIN / 0 isn't caught by the overflow check in C, and crashes.
+    crashes = (a == MIN_INT) & (b == 0)
+    a, b = a[~crashes], b[~crashes]
+    expected = [fixed.fixed_div(x, y) for x, y in zip(a.tolist(), b.tolist())]
+    result = fixed_array.fixed_div(a, b)
+    assert result.dtype == np.int32
+    assert result.tolist() == expected
+    assert (result == MAX_INT).any() and (result == MIN_INT).any()
+
+
+def test_fixed_div2_matches_scalar(wraparound):
+    """Truncating integer division agrees, out-of-range quotients raise."""
+    a, b = _operands(3, COUNT // 4)
+    fits = (np.abs(a) >> 14) < np.abs(b)
+    a, b = a[fits], b[fits]
+    expected = [fixed.fixed_div2(x, y) for x, y in zip(a.tolist(), b.tolist())]
+    assert fixed_array.fixed_div2(a, b).tolist() == expected
+    with pytest.raises(ZeroDivisionError):
+        fixed.fixed_div2(1, 0)
+    with pytest.raises(ZeroDivisionError):
+        fixed_array.fixed_div2([0], [0])
+    if not wraparound:
+        with pytest.raises(ZeroDivisionError):
+            fixed.fixed_div2(MAX_INT, 1)
+        with pytest.raises(ZeroDivisionError):
+            fixed_array.fixed_div2([1, MAX_INT], [1, 1])
+
+
+def test_vanilla_wraparound(monkeypatch):
+    """Overflowing results wrap around like the C code's do."""
+    assert fixed.fixed_div(MIN_INT, 1) == MIN_INT
+    assert fixed.fixed_mul(MAX_INT, MAX_INT) == (MAX_INT * MAX_INT) >> 16
+    monkeypatch.setattr(fixed, "vanilla_wraparound", True)
+    # abs(INT_MIN) is negative, so this doesn't saturate but overflows.
+    assert fixed.fixed_div(MIN_INT, 1) == 0
+    assert fixed.fixed_div(MIN_INT, MIN_INT) == MAX_INT
+    assert fixed.fixed_div2(MAX_INT, 1) == -fixed.FRAC_UNIT
+    assert fixed.fixed_mul(MAX_INT, MAX_INT) == -fixed.FRAC_UNIT
+    assert fixed_array.fixed_div([MIN_INT, 3], [1, 2]).tolist() == [0, 98304]
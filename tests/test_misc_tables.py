@@ -0,0 +1,32 @@
+"""Tests for `pink_doom.misc.tables`."""
+
+import hashlib
+import math
+import sys
+
+from pink_doom.misc import tables
+
+# Of the tables as they were written out in tuples, as little-endian int32.
+DIGEST = "d44d05ec8e01cfc4bda42a9a1ebc5ceb5fd0cd4166476ed03c86e64ae9e7b3df"
+
+
+def test_tables_unchanged():
+    """The unpacked tables hold the values of the original tuples."""
+    assert len(tables.fine_sine) == tables.FINE_ANGLES * 5 // 4
+    assert len(tables.fine_tangent) == tables.FINE_ANGLES // 2
+    assert len(tables.tan_to_angle) == tables.SLOPE_RANGE + 1
+    data = tables.fine_sine + tables.fine_tangent + tables.tan_to_angle
+    if sys.byteorder == "big":
+        data.byteswap()
+    assert hashlib.sha256(data.tobytes()).hexdigest() == DIGEST
+
+
+def test_tables_values():
+    """Spot check the tables against the functions they stand for."""
+    assert tables.fine_sine[:3].tolist() == [25, 75, 125]
+    assert tables.fine_sine[tables.FINE_ANGLES // 4] == 65535
+    assert tables.fine_tangent[tables.FINE_ANGLES // 4] == 25
+    assert tables.tan_to_angle[tables.SLOPE_RANGE] == tables.ANG45
+    for i in range(0, tables.FINE_ANGLES, 97):
+        sine = math.sin((i + 0.5) * 2 * math.pi / tables.FINE_ANGLES)
+        assert abs(tables.fine_sine[i] - sine * 65536) <= 1
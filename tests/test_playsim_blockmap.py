@@ -0,0 +1,81 @@
+"""Tests for `pink_doom.playsim.blockmap`."""
+
+import struct
+
+import pytest
+
+from pink_doom.doom.data import MapLump
+from pink_doom.playsim.blockmap import Blockmap
+from pink_doom.rendering.level import Level
+from pink_doom.wad import loader, mapgen
+
+
+def _walk(lump, bx, by):
+    """Read a block list straight from the lump, like ``P_BlockLinesIterator``."""
+    words = struct.unpack(f"<{len(lump) // 2}H", lump)
+    width, height = words[2:4]
+    if bx < 0 or by < 0 or bx >= width or by >= height:
+        return []
+    lines = []
+    position = words[4 + by * width + bx]
+    while words[position] != 0xFFFF:
+        lines.append(words[position])
+        position += 1
+    return lines
+
+
+@pytest.fixture
+def level(tmp_path):
+    """Load a generated map of 5 x 3 cells."""
+    path = str(tmp_path / "map.wad")
+    mapgen.generate_wad(path, mapgen.MapSpec(5, 3, sectors=4, cell_size=192))
+    loader.init_multiple_files([path])
+    yield Level.from_lumps(
+        {kind: loader.cache_lump_num(kind.value - 1) for kind in MapLump}
+    )
+    loader.reset()
+
+
+def test_lump_round_trip(level):
+    """Encoding and decoding again gives the same lists as the lump has."""
+    built = Blockmap.build(level)
+    lump = built.to_lump()
+    blockmap = Blockmap.from_lump(lump)
+    assert (blockmap.width, blockmap.height) == (built.width, built.height)
+    assert (blockmap.origin_x, blockmap.origin_y) == (-480 << 16, -288 << 16)
+    assert blockmap.offsets.tolist() == built.offsets.tolist()
+    for by in range(-1, blockmap.height + 1):
+        for bx in range(-1, blockmap.width + 1):
+            assert blockmap.lines_in_block(bx, by).tolist() == _walk(lump, bx, by)
+
+
+def test_shared_lists():
+    """Blocks may share one list, and lists needn't be in block order."""
+    lump = struct.pack("<4h3H5H", -64, 0, 3, 1, 10, 7, 7, 0, 2, 0xFFFF, 0, 0xFFFF)
+    blockmap = Blockmap.from_lump(lump)
+    assert blockmap.origin_x == -64 << 16
+    assert [blockmap.lines_in_block(bx, 0).tolist() for bx in range(3)] == [
+        [0],
+        [0, 2],
+        [0, 2],
+    ]
+    assert blockmap.lines_in_block(1, 0).base is not None
+    assert blockmap.block_of(100 << 16, 5 << 16) == (1, 0)
+
+
+def test_lines_in_box(level):
+    """Lines of a range of blocks come once each, in the original order."""
+    blockmap = Blockmap.build(level)
+    expected = []
+    for bx in range(0, blockmap.width):
+        for by in range(1, 3):
+            for line in blockmap.lines_in_block(bx, by).tolist():
+                if line not in expected:
+                    expected.append(line)
+    assert list(blockmap.lines_in_box(-2, 1, 99, 2)) == expected
+    assert list(blockmap.lines_in_box(2, 2, 1, 2)) == []
+    # Every line is in a block its ends are in.
+    for line in range(len(level.line_v1)):
+        v1 = level.line_v1[line]
+        bx, by = blockmap.block_of(level.vertex_x[v1], level.vertex_y[v1])
+        assert line in blockmap.lines_in_block(bx, by)
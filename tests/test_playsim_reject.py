@@ -0,0 +1,60 @@
+"""Tests for `pink_doom.playsim.reject`."""
+
+import random
+from array import array
+
+from pink_doom.playsim.reject import Reject, load_reject
+from pink_doom.rendering.level import Level
+from pink_doom.wad import loader, mapgen
+
+
+def test_queries_agree():
+    """The row and column queries match the pair query on any table."""
+    rng = random.Random(3)
+    numsectors = 13
+    lump = bytes(rng.randrange(256) for _ in range(numsectors * numsectors // 8))
+    reject = Reject.from_lump(lump, numsectors)
+    assert len(reject.to_lump()) == (numsectors * numsectors + 7) // 8
+    # The last bit was missing from the lump.
+    assert reject.sectors_can_see(numsectors - 1, numsectors - 1)
+    for sector in range(numsectors):
+        assert reject.visible_from(sector).tolist() == [
+            reject.sectors_can_see(sector, other) for other in range(numsectors)
+        ]
+        assert reject.sectors_seeing(sector).tolist() == [
+            reject.sectors_can_see(other, sector) for other in range(numsectors)
+        ]
+    pnum = 5 * numsectors + 7
+    assert reject.sectors_can_see(5, 7) == (not lump[pnum >> 3] >> (pnum & 7) & 1)
+
+
+def test_build_rejects_unconnected_sectors():
+    """Only sectors joined through two-sided lines can see each other."""
+    level = Level(
+        sector_floor_height=array("i", [0] * 5),
+        line_frontsector=array("i", [1, 0, 2, 3, 4]),
+        line_backsector=array("i", [2, -1, 0, 3, -1]),
+    )
+    reject = Reject.build(level)
+    assert not reject.is_empty()
+    assert [reject.visible_from(s).tolist() for s in (0, 3)] == [
+        [True, True, True, False, False],
+        [False, False, False, True, False],
+    ]
+
+
+def test_load_reject_rebuilds_empty_lumps(tmp_path):
+    """A zeroed lump is only replaced when asked to."""
+    path = str(tmp_path / "map.wad")
+    mapgen.generate_wad(path, mapgen.MapSpec(2, 1, sectors=4, seed=2))
+    loader.init_multiple_files([path])
+    try:
+        assert load_reject("MAP01").is_empty()
+        reject = load_reject("MAP01", rebuild=True)
+        assert not reject.is_empty()
+        assert reject.numsectors == 4
+        # Both cells are sector 0, the others have no lines at all.
+        assert reject.visible_from(0).tolist() == [True, False, False, False]
+        assert reject.sectors_can_see(2, 2)
+    finally:
+        loader.reset()
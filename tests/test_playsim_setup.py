@@ -0,0 +1,162 @@
+"""Tests for `pink_doom.playsim.setup`."""
+
+import random
+
+import pytest
+
+from pink_doom.doom.data import MapLump
+from pink_doom.doom.types import MAX_INT, MIN_INT
+from pink_doom.misc.bbox import BoxCoord, add_to_box, clear_box
+from pink_doom.misc.fixed import fixed_div
+from pink_doom.playsim import setup
+from pink_doom.playsim.local import MAP_BLOCK_SHIFT, MAX_RADIUS
+from pink_doom.rendering.defines import SlopeType
+from pink_doom.rendering.level import Level
+from pink_doom.wad import loader, mapgen
+
+
+def _group_lines(level, origin_x, origin_y, width, height):
+    """Do what ``P_LoadLineDefs`` and ``P_GroupLines`` do, one at a time."""
+    line_bbox, slopes = [], []
+    for v1, v2, dx, dy in zip(
+        level.line_v1, level.line_v2, level.line_dx, level.line_dy
+    ):
+        x1, y1 = level.vertex_x[v1], level.vertex_y[v1]
+        x2, y2 = level.vertex_x[v2], level.vertex_y[v2]
+        line_bbox.append([max(y1, y2), min(y1, y2), min(x1, x2), max(x1, x2)])
+        if dx == 0:
+            slopes.append(SlopeType.VERTICAL.value)
+        elif dy == 0:
+            slopes.append(SlopeType.HORIZONTAL.value)
+        elif fixed_div(dy, dx) > 0:
+            slopes.append(SlopeType.POSITIVE.value)
+        else:
+            slopes.append(SlopeType.NEGATIVE.value)
+
+    sector_lines, sector_bbox, soundorgs, blockboxes = [], [], [], []
+    for sector in range(len(level.sector_floor_height)):
+        box = [0] * 4
+        clear_box(box)
+        lines = []
+        for line, (front, back) in enumerate(
+            zip(level.line_frontsector, level.line_backsector)
+        ):
+            if sector in (front, back):
+                lines.append(line)
+                v1, v2 = level.line_v1[line], level.line_v2[line]
+                add_to_box(box, level.vertex_x[v1], level.vertex_y[v1])
+                add_to_box(box, level.vertex_x[v2], level.vertex_y[v2])
+        sector_lines.append(lines)
+        sector_bbox.append(box)
+        top, bottom, left, right = box
+
+        def c_half(value):
+            value = (value + 2**31) % 2**32 - 2**31
+            return int(value / 2)
+
+        def wrap(value):
+            return (value + 2**31) % 2**32 - 2**31
+
+        soundorgs.append([c_half(right + left), c_half(top + bottom)])
+        blockboxes.append(
+            [
+                min(wrap(top - origin_y + MAX_RADIUS) >> MAP_BLOCK_SHIFT, height - 1),
+                max(wrap(bottom - origin_y - MAX_RADIUS) >> MAP_BLOCK_SHIFT, 0),
+                max(wrap(left - origin_x - MAX_RADIUS) >> MAP_BLOCK_SHIFT, 0),
+                min(wrap(right - origin_x + MAX_RADIUS) >> MAP_BLOCK_SHIFT, width - 1),
+            ]
+        )
+    return line_bbox, slopes, sector_lines, sector_bbox, soundorgs, blockboxes
+
+
+@pytest.fixture
+def level(tmp_path):
+    """Load a generated map with a few diagonal and degenerate lines."""
+    path = str(tmp_path / "map.wad")
+    mapgen.generate_wad(path, mapgen.MapSpec(6, 4, sectors=5, seed=9))
+    loader.init_multiple_files([path])
+    level = Level.from_lumps(
+        {kind: loader.cache_lump_num(kind.value - 1) for kind in MapLump}
+    )
+    rng = random.Random(1)
+    for i in rng.sample(range(len(level.vertex_x)), 10):
+        level.vertex_x[i] += rng.randrange(-40, 40) << 16
+        level.vertex_y[i] += rng.randrange(-40, 40) << 16
+    for line in range(len(level.line_v1)):
+        v1, v2 = level.line_v1[line], level.line_v2[line]
+        level.line_dx[line] = level.vertex_x[v2] - level.vertex_x[v1]
+        level.line_dy[line] = level.vertex_y[v2] - level.vertex_y[v1]
+    # A line with the same sector on both sides, and one of a sector
+    # that has no other lines.
+    level.line_backsector[30] = level.line_frontsector[30]
+    level.sector_floor_height.extend([0, 0])
+    level.line_frontsector[31] = 5
+    yield level
+    loader.reset()
+
+
+def test_group_lines_matches_loops(level):
+    """The vectorized version has the results of the original loops."""
+    bounds = setup.blockmap_bounds(level, b"")
+    derived = setup.group_lines(level, b"")
+    expected = _group_lines(level, *bounds)
+    assert derived.line_bbox.tolist() == expected[0]
+    assert derived.line_slopetype.tolist() == expected[1]
+    assert [derived.lines_of(s).tolist() for s in range(7)] == expected[2]
+    assert derived.sector_bbox.tolist() == expected[3]
+    assert derived.sector_bbox[6].tolist() == [MIN_INT, MAX_INT, MAX_INT, MIN_INT]
+    assert derived.sector_soundorg.tolist() == expected[4]
+    assert derived.sector_blockbox.tolist() == expected[5]
+    assert derived.line_bbox[0, BoxCoord.LEFT] <= derived.line_bbox[0, BoxCoord.RIGHT]
+
+
+def test_blockmap_header(level):
+    """The blockmap origin and size come from its header if there is one."""
+    blockmap = (-200).to_bytes(2, "little", signed=True) + bytes.fromhex(
+        "64000300 0200"
+    )
+    assert setup.blockmap_bounds(level, blockmap) == (-200 << 16, 100 << 16, 3, 2)
+    derived = setup.group_lines(level, blockmap)
+    expected = _group_lines(level, -200 << 16, 100 << 16, 3, 2)
+    assert derived.sector_blockbox.tolist() == expected[5]
+
+
+def test_derived_data_is_cached(tmp_path, monkeypatch):
+    """A level set up before is read back instead of computed."""
+    path = str(tmp_path / "map.wad")
+    mapgen.generate_wad(path, mapgen.MapSpec(3, 3, sectors=2, seed=1))
+    monkeypatch.setattr(setup, "derived_cache_dir", str(tmp_path / "cache"))
+    loader.init_multiple_files([path])
+    try:
+        first = setup.derived_data("MAP01")
+        (saved,) = (tmp_path / "cache").iterdir()
+        assert saved.name.endswith(".level.npz")
+
+        def fail(*args):
+            raise AssertionError("computed again")
+
+        monkeypatch.setattr(setup, "group_lines", fail)
+        second = setup.derived_data("MAP01")
+        for name, value in vars(first).items():
+            assert getattr(second, name).tolist() == value.tolist()
+    finally:
+        loader.reset()
+
+
+@pytest.mark.parametrize("contents", [b"", b"PK\x03\x04 not really a zip"])
+def test_derived_data_bad_cache(tmp_path, monkeypatch, contents):
+    """A damaged cache file is computed again, not fatal."""
+    path = str(tmp_path / "map.wad")
+    mapgen.generate_wad(path, mapgen.MapSpec(3, 3, sectors=2, seed=1))
+    monkeypatch.setattr(setup, "derived_cache_dir", str(tmp_path / "cache"))
+    loader.init_multiple_files([path])
+    try:
+        expected = setup.derived_data("MAP01")
+        (saved,) = (tmp_path / "cache").iterdir()
+        saved.write_bytes(contents)
+        derived = setup.derived_data("MAP01")
+        for name, value in vars(expected).items():
+            assert getattr(derived, name).tolist() == value.tolist()
+        assert saved.read_bytes() != contents
+    finally:
+        loader.reset()
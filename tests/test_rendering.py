@@ -0,0 +1,124 @@
+"""Tests for `pink_doom.rendering`."""
+
+import struct
+
+import pytest
+
+from pink_doom.doom import state
+from pink_doom.rendering import data
+from pink_doom.rendering import state as rendering_state
+from pink_doom.wad import loader
+from tests.helpers import make_wad
+
+
+def _name(name):
+    return name.encode("ascii").ljust(8, b"\x00")
+
+
+@pytest.fixture
+def level_wad(tmp_path):
+    """Return a WAD with one level and the graphics and sounds it uses."""
+    pnames = struct.pack("<i", 3) + _name("WALL00_1") + _name("SW1_1") + _name("W94_1")
+    texture = _name("STARTAN3") + struct.pack("<ihhih", 0, 64, 128, 0, 2)
+    texture += struct.pack("<5h", 0, 0, 0, 1, 0) + struct.pack("<5h", 32, 0, 1, 1, 0)
+    sky = _name("SKY1") + struct.pack("<ihhih", 0, 256, 128, 0, 1)
+    sky += struct.pack("<5h", 0, 0, 2, 1, 0)
+    texture1 = struct.pack("<iii", 2, 12, 12 + len(texture)) + texture + sky
+    things = struct.pack("<5h", 0, 0, 90, 1, 7) + struct.pack("<5h", 64, 0, 0, 3004, 7)
+    sides = struct.pack("<hh8s8s8sh", 0, 0, b"-", b"-", _name("STARTAN3"), 0)
+    sectors = struct.pack("<hh8s8shhh", 0, 128, _name("FLOOR4_8"), b"F_SKY1", 160, 0, 0)
+    lumps = [
+        ("PNAMES", pnames),
+        ("TEXTURE1", texture1),
+        ("DSPISTOL", b"pistol"),
+        ("DSPOSIT1", b"posit1"),
+        ("DSPOSIT2", b"posit2"),
+        ("DSPOSIT3", b"posit3"),
+        ("DSPLPAIN", b"plpain"),
+        ("DSBAREXP", b"barexp"),
+        ("E1M1", b""),
+        ("THINGS", things),
+        ("LINEDEFS", b""),
+        ("SIDEDEFS", sides),
+        ("VERTEXES", b""),
+        ("SEGS", b""),
+        ("SSECTORS", b""),
+        ("NODES", b""),
+        ("SECTORS", sectors),
+        ("REJECT", b""),
+        ("BLOCKMAP", b""),
+        ("P_START", b""),
+        ("WALL00_1", b"wall"),
+        ("SW1_1", b"switch"),
+        ("W94_1", b"sky"),
+        ("P_END", b""),
+        ("S_START", b""),
+        ("POSSA1", b"possessed"),
+        ("PLAYA1", b"player"),
+        ("TROOA1", b"imp"),
+        ("S_END", b""),
+        ("F_START", b""),
+        ("FLOOR4_8", b"floor"),
+        ("F_SKY1", b"sky"),
+        ("NUKAGE1", b"nukage"),
+        ("F_END", b""),
+    ]
+    loader.init_multiple_files([make_wad(tmp_path / "doom.wad", lumps, b"IWAD")])
+    yield
+    loader.reset()
+
+
+def test_level_lumps(level_wad):
+    """Everything the level draws or plays is found, and nothing else."""
+    names = {loader.lump_info.names[lump] for lump in data.level_lumps("E1M1")}
+    assert names == {
+        "E1M1",
+        "THINGS",
+        "LINEDEFS",
+        "SIDEDEFS",
+        "VERTEXES",
+        "SEGS",
+        "SSECTORS",
+        "NODES",
+        "SECTORS",
+        "REJECT",
+        "BLOCKMAP",
+        "WALL00_1",
+        "SW1_1",
+        "W94_1",
+        "POSSA1",
+        "PLAYA1",
+        "FLOOR4_8",
+        "F_SKY1",
+        "DSPISTOL",
+        "DSPOSIT1",
+        "DSPOSIT2",
+        "DSPOSIT3",
+        "DSPLPAIN",
+    }
+
+
+def test_precache_level(level_wad, monkeypatch):
+    """Precaching fills the lump cache with level-tagged lumps."""
+    monkeypatch.setattr(state, "precache", False)
+    assert data.precache_level("E1M1").lumps == []
+
+    monkeypatch.setattr(state, "precache", True)
+    job = data.precache_level("E1M1")
+    job.wait()
+    assert job.done()
+    assert all(lump in loader.lump_cache for lump in job.lumps)
+    assert loader.check_num_for_name("TROOA1") not in loader.lump_cache
+    loader.lump_cache.free_tags(loader.PurgeTag.LEVEL, loader.PurgeTag.LEVSPEC)
+    assert not any(lump in loader.lump_cache for lump in job.lumps)
+
+
+def test_namespace_bounds(level_wad):
+    """Flats and sprite frames are numbered from their markers."""
+    data.init_flats()
+    data.init_sprite_lumps()
+    assert rendering_state.firstflat == loader.check_num_for_name("FLOOR4_8")
+    assert data.numflats == 3
+    assert data.flat_num_for_name("nukage1") == 2
+    assert rendering_state.firstspritelump == loader.check_num_for_name("POSSA1")
+    assert rendering_state.numspritelumps == 3
@@ -0,0 +1,196 @@
+"""Tests for `pink_doom.rendering.level`."""
+
+import random
+import struct
+
+import numpy as np
+import pytest
+
+from pink_doom.doom.data import MAP_DTYPES, MapLump, NodeFlag
+from pink_doom.misc.fixed import FRAC_BITS
+from pink_doom.rendering import main
+from pink_doom.rendering.defines import Node, Seg, Vertex
+from pink_doom.rendering.level import Level, load_level
+from pink_doom.wad import loader, mapgen, nodebuild
+from pink_doom.wad.writer import WadWriter
+
+LEAF = NodeFlag.SUBSECTOR.value
+
+# The two cells of a 2x1 map, their segs as (linedef, side).
+EAST_SEGS = [(1, 0), (5, 0), (3, 0), (6, 0)]
+WEST_SEGS = [(0, 0), (5, 1), (2, 0), (4, 0)]
+
+
+@pytest.fixture
+def two_cells(tmp_path):
+    """Load a map of two cells split by a single node at x = 0."""
+    spec = mapgen.MapSpec(2, 1, sectors=2, seed=5)
+    generated = str(tmp_path / "generated.wad")
+    mapgen.generate_wad(generated, spec)
+    loader.init_multiple_files([generated])
+    lumps = {kind: bytes(loader.cache_lump_num(kind.value - 1)) for kind in MapLump}
+    loader.reset()
+
+    linedefs = np.frombuffer(lumps[MapLump.LINEDEFS], MAP_DTYPES[MapLump.LINEDEFS])
+    segs = b""
+    for linedef, side in EAST_SEGS + WEST_SEGS:
+        v1, v2 = linedefs[linedef]["v1"], linedefs[linedef]["v2"]
+        if side:
+            v1, v2 = v2, v1
+        segs += struct.pack("<HHhHhh", v1, v2, 0, linedef, side, 0)
+    lumps[MapLump.SEGS] = segs
+    lumps[MapLump.SSECTORS] = struct.pack("<4H", 4, 0, 4, 4)
+    # North through x = 0, so the east cell is on the right, in front.
+    bbox = (64, -64, 0, 128) + (64, -64, -128, 0)
+    lumps[MapLump.NODES] = struct.pack("<4h8h2H", 0, -64, 0, 128, *bbox, LEAF, LEAF | 1)
+
+    path = str(tmp_path / "two_cells.wad")
+    with WadWriter(path) as wad:
+        wad.add_lump("MAP01")
+        for kind in list(MapLump)[1:]:
+            wad.add_lump(kind.name, lumps[kind])
+    loader.init_multiple_files([path])
+    yield load_level("MAP01")
+    loader.reset()
+
+
+def test_level_arrays(two_cells):
+    """Records are decoded to fixed point and linked by index."""
+    level = two_cells
+    assert len(level.vertex_x) == 6
+    assert level.vertex_x[1] == 0 and level.vertex_y[5] == 64 << FRAC_BITS
+    assert level.line_dx[4] == 0 and level.line_dy[4] == 128 << FRAC_BITS
+    assert level.line_sidenum[1] == -1 and level.line_backsector[0] == -1
+    assert level.line_backsector[5] == level.seg_frontsector[5]
+    assert list(level.subsector_firstline) == [0, 4]
+    assert level.subsector_sector[0] == level.seg_frontsector[1]
+    assert level.seg_backsector[0] == -1
+    assert list(level.node_bbox) == [v << FRAC_BITS for v in (64, -64, 0, 128)] + [
+        v << FRAC_BITS for v in (64, -64, -128, 0)
+    ]
+    assert level.nbytes() > 0
+
+
+def test_bsp_walk(two_cells):
+    """The walk visits the subsector holding the view point first."""
+    east = 100 << FRAC_BITS
+    assert two_cells.subsectors_front_to_back(east, 0) == [0, 1]
+    assert two_cells.subsectors_front_to_back(-east, 0) == [1, 0]
+
+
+def _random_fixed(rng):
+    return rng.choice((0, rng.randrange(-512, 512) << FRAC_BITS))
+
+
+def test_point_on_side_matches_object_model():
+    """The array versions agree with the ones in rendering.main."""
+    rng = random.Random(0)
+    count = 200
+    coords = [rng.randrange(-512, 512) for _ in range(4 * count)]
+    node = MAP_DTYPES[MapLump.NODES]
+    nodes = np.zeros(count, node)
+    for i in range(count):
+        nodes[i]["x"], nodes[i]["y"] = coords[4 * i], coords[4 * i + 1]
+        nodes[i]["dx"] = rng.choice((0, coords[4 * i + 2]))
+        nodes[i]["dy"] = rng.choice((0, coords[4 * i + 3]))
+    vertexes = np.array(coords, np.int16).reshape(-1, 2)
+    segs = np.zeros(count, MAP_DTYPES[MapLump.SEGS])
+    segs["v1"] = np.arange(0, 2 * count, 2)
+    segs["v2"] = np.arange(1, 2 * count, 2)
+    empty = {kind: b"" for kind in MAP_DTYPES}
+    level = Level.from_lumps(
+        {
+            **empty,
+            MapLump.VERTEXES: vertexes.tobytes(),
+            MapLump.NODES: nodes.tobytes(),
+            MapLump.LINEDEFS: np.zeros(1, MAP_DTYPES[MapLump.LINEDEFS]).tobytes(),
+            MapLump.SIDEDEFS: np.zeros(1, MAP_DTYPES[MapLump.SIDEDEFS]).tobytes(),
+            MapLump.SEGS: segs.tobytes(),
+        }
+    )
+
+    x, y = _random_fixed(rng), _random_fixed(rng)
+    sides = level.point_on_seg_sides(x, y)
+    assert sides.tolist() == [level.point_on_seg_side(x, y, i) for i in range(count)]
+    assert level.point_on_seg_sides(x, y, np.array([3, 1])).tolist() == [
+        sides[3],
+        sides[1],
+    ]
+
+    for i in range(count):
+        node_object = Node(
+            *(int(nodes[i][key]) << FRAC_BITS for key in ("x", "y", "dx", "dy")),
+            None,
+            None,
+        )
+        v1 = Vertex(level.vertex_x[2 * i], level.vertex_y[2 * i])
+        v2 = Vertex(level.vertex_x[2 * i + 1], level.vertex_y[2 * i + 1])
+        seg = Seg(v1, v2, 0, 0, None, None, None, None)
+        for _ in range(10):
+            x, y = _random_fixed(rng), _random_fixed(rng)
+            assert level.point_on_side(x, y, i) == main.point_on_side(x, y, node_object)
+            assert level.point_on_seg_side(x, y, i) == main.point_on_seg_side(x, y, seg)
+            assert level.point_on_seg_sides(x, y, [i])[0] == main.point_on_seg_side(
+                x, y, seg
+            )
+
+
+@pytest.fixture(scope="module")
+def built_level():
+    """Return a level with diagonal lines and a tree from the node builder."""
+    generator = mapgen._Generator(mapgen.MapSpec(12, 9, sectors=6, seed=2))
+    vertexes = np.frombuffer(
+        b"".join(generator.vertexes()), MAP_DTYPES[MapLump.VERTEXES]
+    ).copy()
+    rng = np.random.default_rng(2)
+    vertexes["x"] += rng.integers(-40, 40, len(vertexes))
+    vertexes["y"] += rng.integers(-40, 40, len(vertexes))
+    lumps = {
+        MapLump.VERTEXES: vertexes.tobytes(),
+        MapLump.LINEDEFS: b"".join(generator.linedefs()),
+        MapLump.SIDEDEFS: b"".join(generator.sidedefs()),
+        MapLump.SECTORS: b"".join(generator.sectors()),
+    }
+    built, _ = nodebuild.build_nodes(lumps)
+    return Level.from_lumps({**lumps, **built})
+
+
+def test_point_in_subsector(built_level):
+    """The grid and the batch walk find what the plain walk finds."""
+    level = built_level
+    grid = level.build_grid(64)
+    cells = np.frombuffer(grid.cells, np.int32)
+    assert (cells & LEAF).any()
+    assert (cells != level.numnodes - 1).mean() > 0.8
+
+    rng = random.Random(1)
+    points = [
+        (rng.randrange(-1000, 1000) << FRAC_BITS, rng.randrange(-700, 700) << FRAC_BITS)
+        for _ in range(300)
+    ]
+    # Points on partition lines and cell edges, and off by a fraction.
+    for node in range(0, level.numnodes, 7):
+        for offset in (-1, 0, 1):
+            x = level.node_x[node] + level.node_dx[node] // 2 + offset
+            y = level.node_y[node] + level.node_dy[node] // 2
+            points.append((x, y))
+    points += [(grid.origin_x + (640 << FRAC_BITS) + d, grid.origin_y) for d in (-1, 0)]
+
+    expected = [level.point_in_subsector(x, y) for x, y in points]
+    assert [level.point_in_subsector(x, y, grid) for x, y in points] == expected
+    x, y = (np.array(values) for values in zip(*points))
+    assert level.points_in_subsectors(x, y).tolist() == expected
+    assert level.points_in_subsectors(x, y, grid).tolist() == expected
+
+
+def test_point_in_subsector_object_model(two_cells, monkeypatch):
+    """The array walk agrees with R_PointInSubsector over objects."""
+    nodes = [Node(0, -64 << FRAC_BITS, 0, 128 << FRAC_BITS, None, (LEAF, LEAF | 1))]
+    monkeypatch.setattr(main.state, "numnodes", 1)
+    monkeypatch.setattr(main.state, "nodes", nodes)
+    monkeypatch.setattr(main.state, "subsectors", ["east", "west"])
+    for x in (-5 << FRAC_BITS, 0, 1, 5 << FRAC_BITS):
+        subsector = two_cells.point_in_subsector(x, 0)
+        assert main.point_in_subsector(x, 0) == ["east", "west"][subsector]
+    monkeypatch.setattr(main.state, "numnodes", 0)
+    assert main.point_in_subsector(1, 1) == "east"
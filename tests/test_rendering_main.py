@@ -0,0 +1,92 @@
+"""Tests for `pink_doom.rendering.main`."""
+
+import numpy as np
+import pytest
+
+from pink_doom.doom.defines import SCREEN_WIDTH
+from pink_doom.misc.fixed import FRAC_BITS, FRAC_UNIT, fixed_div, fixed_mul
+from pink_doom.misc.tables import ANG45, ANG90, ANGLE_TO_FINE_SHIFT, fine_sine
+from pink_doom.rendering import main
+
+
+def _points(seed, count=20000):
+    """Return random points, a lot of them on octant edges or close."""
+    rng = np.random.default_rng(seed)
+    x = rng.integers(-(1 << 28), 1 << 28, count) >> rng.integers(0, 28, count)
+    y = rng.integers(-(1 << 28), 1 << 28, count) >> rng.integers(0, 28, count)
+    edge = rng.integers(0, 4, count)
+    y = np.select([edge == 0, edge == 1, edge == 2], [x, -x, 0], y)
+    x = np.where(rng.integers(0, 8, count) == 0, 0, x)
+    return x, y
+
+
+@pytest.mark.parametrize("origin", [(0, 0), (3 << FRAC_BITS, -(1000 << FRAC_BITS))])
+def test_points_to_angles(monkeypatch, origin):
+    """The batch versions give the angles and distances of the scalar ones."""
+    x, y = _points(0)
+    x += origin[0]
+    y += origin[1]
+    monkeypatch.setattr(main, "viewx", origin[0], raising=False)
+    monkeypatch.setattr(main, "viewy", origin[1], raising=False)
+
+    angles = main.points_to_angles(x, y, *origin)
+    assert angles.tolist() == [
+        main.point_to_angle(a, b) for a, b in zip(x.tolist(), y.tolist())
+    ]
+
+    dists = main.points_to_dists(x, y, *origin)
+    away = (x != origin[0]) | (y != origin[1])
+    assert dists[away].tolist() == [
+        main.point_to_dist(a, b) for a, b in zip(x[away].tolist(), y[away].tolist())
+    ]
+    assert not dists[~away].any()
+
+
+@pytest.mark.parametrize("detailshift", [0, 1])
+def test_scale_range(monkeypatch, detailshift):
+    """The scales of a range of columns are those of each column's angle."""
+    rng = np.random.default_rng(detailshift)
+    xtoviewangle = rng.integers(0, 1 << 32, SCREEN_WIDTH + 1).tolist()
+    monkeypatch.setattr(main.state, "xtoviewangle", xtoviewangle)
+    monkeypatch.setattr(main, "projection", 160 << FRAC_BITS)
+    monkeypatch.setattr(main, "detailshift", detailshift)
+    for _ in range(50):
+        monkeypatch.setattr(main.state, "viewangle", int(rng.integers(0, 1 << 32)))
+        monkeypatch.setattr(main.state, "rw_normalangle", int(rng.integers(0, 1 << 32)))
+        distance = int(rng.integers(1, 1 << 30) >> rng.integers(0, 30))
+        monkeypatch.setattr(main.state, "rw_distance", distance)
+        x1, x2 = sorted(rng.integers(0, SCREEN_WIDTH, 2).tolist())
+
+        scales = main.scale_range(x1, x2)
+        assert scales.tolist() == [
+            main.scale_from_global_angle((main.state.viewangle + angle) & 0xFFFFFFFF)
+            for angle in xtoviewangle[x1 : x2 + 1]
+        ]
+
+
+@pytest.mark.parametrize("viewangle", [0, 1, 0xFFFFFFFF, 0x80000000])
+def test_scales_near_wrap(monkeypatch, viewangle):
+    """Angles that wrap past zero index the sines as unsigned 32 bit ones."""
+    monkeypatch.setattr(main, "projection", 160 << FRAC_BITS)
+    monkeypatch.setattr(main, "detailshift", 0)
+    monkeypatch.setattr(main.state, "viewangle", viewangle)
+    monkeypatch.setattr(main.state, "rw_normalangle", (viewangle + ANG90) % (1 << 32))
+    monkeypatch.setattr(main.state, "rw_distance", 100 << FRAC_BITS)
+    visangles = [
+        (viewangle + offset) % (1 << 32) for offset in range(-ANG45, ANG45, 1 << 22)
+    ]
+
+    def expected(visangle):
+        anglea = (ANG90 + visangle - main.state.viewangle) % (1 << 32)
+        angleb = (ANG90 + visangle - main.state.rw_normalangle) % (1 << 32)
+        num = fixed_mul(main.projection, fine_sine[angleb >> ANGLE_TO_FINE_SHIFT])
+        den = fixed_mul(
+            main.state.rw_distance, fine_sine[anglea >> ANGLE_TO_FINE_SHIFT]
+        )
+        if den > (num >> 16):
+            return max(256, min(64 * FRAC_UNIT, fixed_div(num, den)))
+        return 64 * FRAC_UNIT
+
+    scales = [expected(visangle) for visangle in visangles]
+    assert [main.scale_from_global_angle(visangle) for visangle in visangles] == scales
+    assert main.scales_from_global_angles(visangles).tolist() == scales
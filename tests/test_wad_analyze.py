@@ -0,0 +1,80 @@
+"""Tests for `pink_doom.wad.analyze` and the ``analyze`` command."""
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from pink_doom import cli
+from pink_doom.wad import analyze
+from tests.helpers import make_wad
+
+
+@pytest.mark.parametrize("pread", [True, False], ids=["pread", "seek"])
+def test_analyze_wad(tmp_path, monkeypatch, pread):
+    """Maps, unpaired markers and duplicate lumps are reported."""
+    if not pread:
+        monkeypatch.delattr(os, "pread")
+    path = make_wad(
+        tmp_path / "mod.wad",
+        [
+            ("MAP01", b""),
+            ("THINGS", b"\x00" * 10),
+            ("F_START", b""),
+            ("FLOOR1", b"\x07" * 4096),
+            ("FLOOR2", b"\x07" * 4096),
+            ("FLOOR3", b"\x08" * 4096),
+            ("SS_END", b""),
+            ("P_START", b""),
+        ],
+    )
+    result = analyze.analyze_wad(path)
+    assert result["identification"] == "PWAD"
+    assert result["num_lumps"] == 8
+    assert result["maps"] == ["MAP01"]
+    assert result["marker_problems"] == [
+        "SS_END without SS_START",
+        "F_START not closed",
+        "P_START not closed",
+    ]
+    assert result["duplicates"] == [["FLOOR1", "FLOOR2"]]
+    assert result["duplicate_bytes"] == 4096
+    assert result["out_of_range"] == []
+
+
+def test_markers_pair_like_the_loader():
+    """Any end marker of a namespace closes its innermost open marker."""
+    names = ["F_START", "F1_START", "FLOOR1", "F_END", "S_START", "S_END"]
+    assert analyze._marker_problems(names) == ["F_START not closed"]
+    assert analyze._marker_problems(["F_START", "FLOOR1", "FF_END"]) == []
+    names = ["F_START", "P_START", "F_END", "P_END", "F_END"]
+    assert analyze._marker_problems(names) == ["F_END without F_START"]
+
+
+def test_analyze_command(tmp_path):
+    """Every WAD below the root gets one JSON line, bad files an error."""
+    (tmp_path / "sub").mkdir()
+    make_wad(tmp_path / "a.wad", [("PLAYPAL", b"\x01" * 768)], b"IWAD")
+    make_wad(tmp_path / "sub" / "B.WAD", [("E1M1", b""), ("THINGS", b"")])
+    (tmp_path / "sub" / "bad.wad").write_bytes(b"nope")
+    (tmp_path / "notes.txt").write_text("not a wad")
+
+    output = tmp_path / "out.jsonl"
+    result = CliRunner().invoke(
+        cli.main, ["analyze", "-j", "2", "-o", str(output), str(tmp_path)]
+    )
+    assert result.exit_code == 0, result.output
+    lines = sorted(
+        (json.loads(line) for line in output.read_text().splitlines()),
+        key=lambda line: line["path"],
+    )
+    assert [line["path"] for line in lines] == [
+        str(tmp_path / "a.wad"),
+        str(tmp_path / "sub" / "B.WAD"),
+        str(tmp_path / "sub" / "bad.wad"),
+    ]
+    assert lines[0]["num_lumps"] == 1
+    assert lines[1]["maps"] == ["E1M1"]
+    assert "error" in lines[2]
+    assert "analyzed 3 WADs (1 failed)" in result.output
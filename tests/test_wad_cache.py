@@ -0,0 +1,45 @@
+"""Tests for `pink_doom.wad.cache`."""
+
+from pink_doom.wad.cache import LumpCache, PurgeTag
+
+
+def test_lru_eviction_within_budget():
+    """Purgable lumps are evicted least recently used first."""
+    cache = LumpCache(budget=30)
+    cache.put(0, b"a" * 10)
+    cache.put(1, b"b" * 10)
+    cache.put(2, b"c" * 10)
+    assert cache.get(0) == b"a" * 10
+    cache.put(3, b"d" * 10)
+    assert 1 not in cache
+    assert all(lump in cache for lump in (0, 2, 3))
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 0, 1)
+    assert (stats.entries, stats.bytes) == (3, 30)
+    assert cache.get(1) is None
+    assert cache.stats().misses == 1
+
+
+def test_static_and_level_lumps_are_not_evicted():
+    """Only tags at or above PURGE_LEVEL give way to the budget."""
+    cache = LumpCache(budget=10)
+    cache.put(0, b"s" * 10, PurgeTag.STATIC)
+    cache.put(1, b"l" * 10, PurgeTag.LEVEL)
+    cache.put(2, b"c" * 10)
+    cache.put(3, b"c" * 10)
+    assert all(lump in cache for lump in (0, 1, 3))
+    assert 2 not in cache
+    assert cache.stats().bytes == 30
+
+
+def test_free_tags_drops_level_lumps():
+    """Freeing the level tags keeps static lumps around."""
+    cache = LumpCache()
+    cache.put(0, b"s" * 4, PurgeTag.STATIC)
+    cache.put(1, b"l" * 8, PurgeTag.LEVEL)
+    cache.put(2, b"c" * 2)
+    # A hit with a longer-lived tag promotes the lump.
+    cache.get(2, PurgeTag.LEVEL)
+    assert cache.free_tags(PurgeTag.LEVEL, PurgeTag.PURGE_LEVEL - 1) == 10
+    assert list(cache._entries) == [0]
+    assert cache.stats().freed == 2
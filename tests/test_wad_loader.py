@@ -0,0 +1,246 @@
+"""Tests for `pink_doom.wad.loader`."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pink_doom.wad import loader
+from pink_doom.wad.cache import DEFAULT_BUDGET, PurgeTag
+from tests.helpers import make_wad
+
+
+@pytest.fixture(params=[False, True], ids=["read", "mmap"])
+def backend(request, monkeypatch):
+    """Run a test against both the file-handle and mmap backends."""
+    monkeypatch.setattr(loader, "use_mmap", request.param)
+    return request.param
+
+
+def test_lumps_and_override(wads, backend):
+    """Later files override earlier ones, and lump data is read intact."""
+    loader.init_multiple_files(wads)
+    assert loader.num_lumps == 4
+    assert loader.check_num_for_name("playpal") == 3
+    assert loader.check_num_for_name("NOTHERE") == -1
+    assert bytes(loader.cache_lump_name("PLAYPAL")) == b"\x03" * 768
+    assert bytes(loader.cache_lump_name("COLORMAP")) == b"\x02" * 34
+    assert loader.read_lump(0) == b"\x01" * 768
+    assert loader.lump_length(2) == 0
+
+
+def test_mmap_lumps_are_zero_copy_views(wads, backend):
+    """The mmap backend hands out read-only views instead of copies."""
+    loader.init_multiple_files(wads)
+    lump = loader.cache_lump_num(1)
+    assert loader.cache_lump_num(1) is lump
+    if backend:
+        assert isinstance(lump, memoryview)
+        assert lump.readonly
+        assert isinstance(loader.read_lump(1), bytes)
+    else:
+        assert isinstance(lump, bytes)
+
+
+def test_namespace_lookup(tmp_path):
+    """Namespaced lookups keep same-named flats and sprites apart."""
+    iwad = make_wad(
+        tmp_path / "doom.wad",
+        [
+            ("S_START", b""),
+            ("TROOA1", b"sprite"),
+            ("S_END", b""),
+            ("F_START", b""),
+            ("F1_START", b""),
+            ("TROOA1", b"flat"),
+            ("F1_END", b""),
+            ("NUKAGE1", b"flat"),
+            ("F_END", b""),
+        ],
+        b"IWAD",
+    )
+    pwad = make_wad(tmp_path / "mod.wad", [("nukage1", b"global")])
+    loader.init_multiple_files([iwad, pwad])
+    try:
+        sprites = loader.LumpNamespace.SPRITES
+        flats = loader.LumpNamespace.FLATS
+        assert loader.check_num_for_name("trooa1") == 5
+        assert loader.check_num_for_name_ns("TROOA1", sprites) == 1
+        assert loader.check_num_for_name_ns("TROOA1", flats) == 5
+        assert loader.check_num_for_name_ns("NUKAGE1", flats) == 7
+        assert loader.check_num_for_name("NUKAGE1") == 9
+        assert loader.check_num_for_name_ns("F_START", flats) == -1
+        assert loader.lump_info[8].namespace == loader.LumpNamespace.GLOBAL
+        assert loader.namespace_ranges(flats) == [range(5, 6), range(7, 8)]
+        assert loader.namespace_ranges(sprites) == [range(1, 2)]
+        assert loader.in_namespace(7, flats) and not loader.in_namespace(6, flats)
+        assert loader.namespace_lumps(flats) == {"TROOA1": 5, "NUKAGE1": 7}
+        with pytest.raises(TypeError):
+            loader.namespace_lumps(flats)["X"] = 0
+    finally:
+        loader.reset()
+
+
+def test_cache_budget_and_purge(wads, monkeypatch):
+    """The loader keeps level lumps until they are freed."""
+    monkeypatch.setattr(loader.lump_cache, "budget", 800)
+    loader.init_multiple_files(wads)
+    loader.cache_lump_num(1, loader.PurgeTag.LEVEL)
+    loader.cache_lump_num(0)
+    loader.cache_lump_num(3)
+    assert 0 not in loader.lump_cache
+    assert 1 in loader.lump_cache
+    loader.lump_cache.free_tags(loader.PurgeTag.LEVEL, loader.PurgeTag.LEVSPEC)
+    assert 1 not in loader.lump_cache
+
+
+def test_directory_columns(wads):
+    """The directory is kept as columns, with LumpInfo built on demand."""
+    with open(wads[0], "rb") as handle:
+        header, positions, sizes, names = loader.read_directory(handle)
+    assert header.num_lumps == 3
+    assert list(positions) == [12, 780, 814]
+    assert list(sizes) == [768, 34, 0]
+    assert names == ["PLAYPAL", "COLORMAP", "E1M1"]
+
+    loader.init_multiple_files(wads)
+    info = loader.lump_info[3]
+    assert (info.name, info.position, info.size) == ("PLAYPAL", 12, 768)
+    assert info.handle is loader.lump_info.wads[1].handle
+
+
+def test_index_cache(wads, tmp_path, monkeypatch):
+    """A warm start reuses the saved lump table until a WAD changes."""
+    monkeypatch.setattr(loader, "index_cache_dir", str(tmp_path / "index"))
+    loader.init_multiple_files(wads)
+    cold = list(loader.lump_info.names), dict(loader._lump_hash)
+    loader.reset()
+
+    def no_parsing(handle):
+        raise AssertionError("directory was parsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(loader, "read_directory", no_parsing)
+        loader.init_multiple_files(wads)
+    assert (list(loader.lump_info.names), loader._lump_hash) == cold
+    assert bytes(loader.cache_lump_name("PLAYPAL")) == b"\x03" * 768
+    sprites = loader.LumpNamespace.SPRITES
+    assert loader.check_num_for_name_ns("PLAYPAL", sprites) == -1
+    assert loader.namespace_ranges(loader.LumpNamespace.GLOBAL) == [range(0, 4)]
+    loader.reset()
+
+    make_wad(tmp_path / "mod.wad", [("PLAYPAL", b"\x04" * 768), ("DEMO1", b"")])
+    loader.init_multiple_files(wads)
+    assert loader.num_lumps == 5
+    assert bytes(loader.cache_lump_name("PLAYPAL")) == b"\x04" * 768
+
+
+def test_read_lumps_coalesces(wads, backend, monkeypatch):
+    """Batched reads match single reads, and neighbours share one read."""
+    loader.init_multiple_files(wads)
+    lumps = [3, 1, 0, 2, 1]
+    results = loader.read_lumps(lumps)
+    assert [bytes(data) for data in results] == [
+        loader.read_lump(lump) for lump in lumps
+    ]
+    assert all(isinstance(data, memoryview) for data in results)
+    assert results[1].obj is results[2].obj
+    assert results[0].obj is not results[1].obj
+
+    monkeypatch.setattr(loader, "read_gap", 0)
+    loader.lump_cache.put(1, b"cached")
+    cached = loader.cache_lumps([0, 1, 0])
+    assert bytes(cached[0]) == b"\x01" * 768 and cached[1] == b"cached"
+    assert 0 in loader.lump_cache
+
+
+def test_cache_lumps_copies_reads(tmp_path, monkeypatch):
+    """Cached lumps don't keep the rest of a batched read alive."""
+    monkeypatch.setattr(loader, "use_mmap", False)
+    size = 100_000
+    lumps = [(f"L{i}", bytes([i]) * size) for i in range(50)]
+    loader.init_multiple_files([make_wad(tmp_path / "big.wad", lumps)])
+    try:
+        cached = loader.cache_lumps(range(50), PurgeTag.LEVEL)
+        assert all(isinstance(data, bytes) and len(data) == size for data in cached)
+        loader.lump_cache.change_tag(7, PurgeTag.STATIC)
+        freed = loader.lump_cache.free_tags(PurgeTag.LEVEL, PurgeTag.PURGE_LEVEL - 1)
+        assert freed == 49 * size
+        assert loader.lump_cache.stats().bytes == size
+        assert loader.cache_lump_num(7) == bytes([7]) * size
+    finally:
+        loader.reset()
+
+
+def test_concurrent_reads(tmp_path, backend):
+    """Many threads reading lumps at once all get the right data."""
+    rng = random.Random(7)
+    lumps = [(f"L{i}", rng.randbytes(rng.randrange(1, 3000))) for i in range(200)]
+    loader.init_multiple_files([make_wad(tmp_path / "stress.wad", lumps)])
+    try:
+        loader.lump_cache.budget = 64 * 1024
+
+        def check(seed):
+            picks = random.Random(seed).choices(range(len(lumps)), k=300)
+            for lump in picks:
+                assert loader.read_lump(lump) == lumps[lump][1]
+                assert bytes(loader.cache_lump_num(lump)) == lumps[lump][1]
+            batch = loader.read_lumps(picks[:50])
+            return all(bytes(b) == lumps[n][1] for n, b in zip(picks, batch))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(check, range(32)))
+        assert loader.lump_cache.stats().bytes <= 64 * 1024
+    finally:
+        loader.lump_cache.budget = DEFAULT_BUDGET
+        loader.reset()
+
+
+def test_namespace_ranges_merge_pwads(tmp_path):
+    """PWAD markers add runs to the namespaces of the IWAD."""
+    iwad = make_wad(
+        tmp_path / "doom.wad",
+        [("S_START", b""), ("TROOA1", b"1"), ("TROOB1", b"2"), ("S_END", b"")],
+        b"IWAD",
+    )
+    pwad = make_wad(
+        tmp_path / "mod.wad",
+        [("SS_START", b""), ("TROOA1", b"3"), ("SS_END", b""), ("FF_START", b"")],
+    )
+    loader.init_multiple_files([iwad, pwad])
+    try:
+        sprites = loader.LumpNamespace.SPRITES
+        assert loader.namespace_ranges(sprites) == [range(1, 3), range(5, 6)]
+        assert loader.check_num_for_name_ns("TROOA1", sprites) == 5
+        # A start marker with nothing after it adds no flats.
+        assert loader.namespace_ranges(loader.LumpNamespace.FLATS) == []
+    finally:
+        loader.reset()
+
+
+def test_dedup_shares_equal_lumps(tmp_path, backend, monkeypatch):
+    """Equal lumps from different files are cached once."""
+    monkeypatch.setattr(loader, "dedup_lumps", True)
+    iwad = make_wad(
+        tmp_path / "doom.wad",
+        [
+            ("PLAYPAL", b"\x01" * 768),
+            ("PATCH1", b"\x02" * 64),
+            ("PATCH2", b"\x03" * 64),
+        ],
+        b"IWAD",
+    )
+    pwad = make_wad(tmp_path / "mod.wad", [("PATCH3", b"\x02" * 64), ("X", b"")])
+    loader.init_multiple_files([iwad, pwad])
+    try:
+        first = loader.cache_lump_name("PATCH1")
+        assert loader.cache_lump_name("PATCH3") is first
+        assert loader.canonical_lump(3) == 1
+        assert loader.cache_lumps([2, 3, 0])[1] is first
+        assert loader.lump_cache.stats().entries == 3
+        stats = loader.dedup_stats()
+        # PLAYPAL's size is unique, so it is never hashed.
+        assert (stats.hashed, stats.shared, stats.saved) == (3, 1, 64)
+    finally:
+        loader.reset()
+    assert loader.dedup_stats().saved == 0
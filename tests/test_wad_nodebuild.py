@@ -0,0 +1,115 @@
+"""Tests for `pink_doom.wad.nodebuild`."""
+
+import numpy as np
+import pytest
+
+from pink_doom.doom.data import MAP_DTYPES, MapLump, NodeFlag
+from pink_doom.rendering.level import Level
+from pink_doom.wad import loader, mapgen
+from pink_doom.wad.nodebuild import CostModel, build_nodes
+
+SIZE = 10
+
+
+@pytest.fixture(scope="module")
+def generated():
+    """Return a grid map with its vertexes moved off the grid lines."""
+    generator = mapgen._Generator(mapgen.MapSpec(SIZE, SIZE, sectors=5, seed=4))
+    vertexes = np.frombuffer(
+        b"".join(generator.vertexes()), MAP_DTYPES[MapLump.VERTEXES]
+    ).copy()
+    rng = np.random.default_rng(4)
+    vertexes["x"] += rng.integers(-30, 30, len(vertexes))
+    vertexes["y"] += rng.integers(-30, 30, len(vertexes))
+    lumps = {
+        MapLump.VERTEXES: vertexes.tobytes(),
+        MapLump.LINEDEFS: b"".join(generator.linedefs()),
+        MapLump.SIDEDEFS: b"".join(generator.sidedefs()),
+        MapLump.SECTORS: b"".join(generator.sectors()),
+    }
+    return generator, vertexes, lumps
+
+
+def _subsector_at(level, x, y):
+    node = level.numnodes - 1
+    while not node & NodeFlag.SUBSECTOR.value:
+        node = level.node_children[2 * node + level.point_on_side(x, y, node)]
+    return node & ~NodeFlag.SUBSECTOR.value
+
+
+@pytest.mark.parametrize(
+    "cost", [CostModel(), CostModel(balance_cost=0), CostModel(split_cost=0)]
+)
+def test_tree_is_usable(generated, cost):
+    """Subsectors are convex and the tree finds the sector of each cell."""
+    generator, vertexes, lumps = generated
+    built, stats = build_nodes(lumps, cost)
+    level = Level.from_lumps({**lumps, **built})
+    assert stats.nodes == level.numnodes == stats.subsectors - 1
+    assert stats.segs == len(level.seg_v1)
+    assert len(level.vertex_x) == len(vertexes) + stats.vertexes
+
+    for subsector in range(stats.subsectors):
+        first = level.subsector_firstline[subsector]
+        segs = range(first, first + level.subsector_numlines[subsector])
+        ends = [level.seg_v1[seg] for seg in segs] + [level.seg_v2[seg] for seg in segs]
+        for seg in segs:
+            # Nothing is behind any seg, give or take a rounded split.
+            x1, y1 = (
+                level.vertex_x[level.seg_v1[seg]],
+                level.vertex_y[level.seg_v1[seg]],
+            )
+            x2, y2 = (
+                level.vertex_x[level.seg_v2[seg]],
+                level.vertex_y[level.seg_v2[seg]],
+            )
+            length = np.hypot(x2 - x1, y2 - y1)
+            for vertex in ends:
+                x, y = level.vertex_x[vertex], level.vertex_y[vertex]
+                assert ((y - y1) * (x2 - x1) - (x - x1) * (y2 - y1)) / length < 2 << 16
+
+    for cy in range(SIZE):
+        for cx in range(SIZE):
+            corners = [
+                generator.vertex(cx + dx, cy + dy) for dx in (0, 1) for dy in (0, 1)
+            ]
+            x = int(vertexes["x"][corners].sum()) << 14
+            y = int(vertexes["y"][corners].sum()) << 14
+            subsector = _subsector_at(level, x, y)
+            assert level.subsector_sector[subsector] == generator.sector(cx, cy)
+
+
+def test_balance_makes_shallower_trees(generated):
+    """Weighing balance keeps the tree close to log2 of its subsectors deep."""
+    _, _, lumps = generated
+    _, balanced = build_nodes(lumps, CostModel(split_cost=8, balance_cost=1))
+    _, unbalanced = build_nodes(lumps, CostModel(split_cost=8, balance_cost=0))
+    assert balanced.max_depth < unbalanced.max_depth
+    assert balanced.mean_depth < np.log2(balanced.subsectors) + 4
+    assert balanced.splits > 0
+
+
+def test_generated_wad_has_nodes(tmp_path):
+    """The map generator can build the tree as it writes the map."""
+    path = str(tmp_path / "map.wad")
+    stats = mapgen.generate_wad(path, mapgen.MapSpec(4, 3), nodes=CostModel())
+    loader.init_multiple_files([path])
+    try:
+        lengths = {kind: loader.lump_length(kind.value - 1) for kind in MapLump}
+        assert lengths[MapLump.NODES] == 28 * stats.nodes
+        assert lengths[MapLump.SSECTORS] == 4 * stats.subsectors == 4 * 12
+        assert lengths[MapLump.SEGS] == 12 * stats.segs
+    finally:
+        loader.reset()
+
+
+def test_too_many_segs(capsys):
+    """A map with more segs than SSECTORS can number is refused."""
+    generator = mapgen._Generator(mapgen.MapSpec(128, 128, sectors=1))
+    lumps = {
+        MapLump.VERTEXES: b"".join(generator.vertexes()),
+        MapLump.LINEDEFS: b"".join(generator.linedefs()),
+    }
+    with pytest.raises(SystemExit):
+        build_nodes(lumps)
+    assert "too many 65536 segs" in capsys.readouterr().err
@@ -0,0 +1,36 @@
+"""Tests for `pink_doom.wad.shared`."""
+
+import multiprocessing
+
+from pink_doom.wad import loader, shared
+
+
+def _read_shared(name):
+    shared.attach(name)
+    try:
+        lump = loader.cache_lump_name("PLAYPAL")
+        result = (
+            loader.num_lumps,
+            bytes(lump),
+            isinstance(lump, memoryview) and lump.readonly,
+            loader.check_num_for_name("COLORMAP"),
+        )
+        del lump
+        return result
+    finally:
+        shared.detach()
+
+
+def test_publish_and_attach(wads):
+    """Another process reads the published WADs out of shared memory."""
+    loader.init_multiple_files(wads)
+    shm = shared.publish()
+    try:
+        expected = (4, b"\x03" * 768, True, 1)
+        assert _read_shared(shm.name) == expected
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2) as pool:
+            assert pool.map(_read_shared, [shm.name] * 2) == [expected] * 2
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,103 @@
+"""Tests for `pink_doom.wad.writer` and `pink_doom.wad.mapgen`."""
+
+import struct
+
+import pytest
+from click.testing import CliRunner
+
+from pink_doom import cli
+from pink_doom.doom.data import LinedefAttribute, MapLump
+from pink_doom.wad import loader, mapgen
+from pink_doom.wad.writer import WadWriter
+
+
+def test_writer_round_trip(tmp_path):
+    """The loader reads back what the writer streamed out."""
+    path = str(tmp_path / "out.wad")
+    with WadWriter(path, b"IWAD") as wad:
+        assert wad.add_lump("PLAYPAL", b"\x01" * 768) == 0
+        wad.add_lump("S_START")
+        wad.add_lump("TROOA1", (bytes([i]) * 100 for i in range(5)))
+        wad.add_lump("S_END")
+    try:
+        loader.init_multiple_files([path])
+        assert loader.lump_info.wads[0].identification == b"IWAD"
+        assert loader.lump_info.names == ["PLAYPAL", "S_START", "TROOA1", "S_END"]
+        assert bytes(loader.cache_lump_name("PLAYPAL")) == b"\x01" * 768
+        assert loader.read_lump(2)[95:105] == b"\x00" * 5 + b"\x01" * 5
+        assert loader.namespace_ranges(loader.LumpNamespace.SPRITES) == [range(2, 3)]
+    finally:
+        loader.reset()
+
+
+def _records(record, data):
+    return list(record.iter_unpack(data))
+
+
+def test_generated_map_is_consistent(tmp_path):
+    """Every reference in a generated map points at an existing record."""
+    spec = mapgen.MapSpec(7, 5, sectors=4, things=10, seed=42)
+    path = str(tmp_path / "map.wad")
+    mapgen.generate_wad(path, spec, "E1M1")
+    try:
+        loader.init_multiple_files([path])
+        label = loader.get_num_for_name("E1M1")
+        assert loader.lump_info.names[label:] == ["E1M1"] + [
+            kind.name for kind in list(MapLump)[1:]
+        ]
+        lump = loader.cache_lump_name
+        vertexes = _records(mapgen.VERTEX, lump("VERTEXES"))
+        linedefs = _records(mapgen.LINEDEF, lump("LINEDEFS"))
+        sidedefs = _records(mapgen.SIDEDEF, lump("SIDEDEFS"))
+        sectors = _records(mapgen.SECTOR, lump("SECTORS"))
+        things = _records(mapgen.THING, lump("THINGS"))
+        assert len(vertexes) == spec.num_vertexes
+        assert len(linedefs) == spec.num_linedefs
+        assert len(sectors) == 4 and len(things) == 11
+        assert len(lump("REJECT")) == 2
+        for v1, v2, flags, _, _, front, back in linedefs:
+            assert v1 < len(vertexes) and v2 < len(vertexes)
+            assert front < len(sidedefs)
+            two_sided = bool(flags & LinedefAttribute.TWO_SIDED.value)
+            assert two_sided == (back != mapgen.NO_SIDEDEF)
+            assert back == mapgen.NO_SIDEDEF or back < len(sidedefs)
+        assert all(sidedef[-1] < len(sectors) for sidedef in sidedefs)
+        # The front of every wall faces into the map.
+        (x0, y0), (x1, y1) = vertexes[linedefs[0][0]], vertexes[linedefs[0][1]]
+        assert x1 < x0 and y0 == y1 == -5 * 128 // 2
+    finally:
+        loader.reset()
+
+
+def test_generated_map_is_deterministic(tmp_path):
+    """The seed decides the output, byte for byte."""
+    paths = [tmp_path / name for name in ("a.wad", "b.wad", "c.wad")]
+    for path, seed in zip(paths, (1, 1, 2)):
+        mapgen.generate_wad(str(path), mapgen.spec_for_linedefs(500, seed=seed))
+    a, b, c = (path.read_bytes() for path in paths)
+    assert a == b
+    assert a != c
+
+
+def test_large_map(tmp_path):
+    """Maps of 100000 linedefs fit the format."""
+    spec = mapgen.spec_for_linedefs(100_000)
+    assert 100_000 <= spec.num_linedefs and spec.num_vertexes < 0x10000
+    path = tmp_path / "big.wad"
+    result = CliRunner().invoke(cli.main, ["genmap", str(path), "--linedefs", "100000"])
+    assert result.exit_code == 0, result.output
+    num_lumps, directory = struct.unpack_from("<ii", path.read_bytes(), 4)
+    assert num_lumps == 11
+    assert directory > spec.num_linedefs * mapgen.LINEDEF.size
+
+
+def test_map_coordinate_limits(tmp_path, capsys):
+    """Maps up to the edge of 16-bit coordinates are written, past it refused."""
+    mapgen.generate_wad(
+        str(tmp_path / "fits.wad"), mapgen.MapSpec(85, 1, cell_size=770)
+    )
+    with pytest.raises(SystemExit):
+        mapgen.generate_wad(
+            str(tmp_path / "big.wad"), mapgen.MapSpec(85, 1, cell_size=771)
+        )
+    assert "too large for 16-bit coordinates" in capsys.readouterr().err